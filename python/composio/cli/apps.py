@@ -16,7 +16,14 @@ from composio.cli.context import Context, get_context, pass_context
 from composio.cli.utils.decorators import handle_exceptions
 from composio.cli.utils.helpfulcmd import HelpfulCmdBase
 from composio.client import Composio, enums
+from composio.client.cache import schema_cache
 from composio.client.collections import ActionModel, AppModel, TriggerModel
+from composio.client.enums.index import (
+    ActionIndex,
+    SearchIndex,
+    set_action_index,
+    set_search_index,
+)
 from composio.core.cls.did_you_mean import DYMGroup
 from composio.tools.base.abs import DEPRECATED_MARKER
 from composio.tools.local import load_local_tools
@@ -115,6 +122,7 @@ def update_actions(
     client: Composio, apps: t.List[AppModel], beta: bool = False
 ) -> None:
     """Update actions and tags."""
+    schema_cache.invalidate()
     actions = sorted(
         client.actions.get(allow_all=True),
         key=lambda x: f"{x.appName}_{x.name}",
@@ -143,33 +151,29 @@ def update_triggers(
 def _update_apps(apps: t.List[AppModel]) -> None:
     """Create App enum class."""
     app_names = []
-    enums.base.APPS_CACHE.mkdir(
-        parents=True,
-        exist_ok=True,
-    )
+    records = {}
     for app in apps:
         app_names.append(
             get_enum_key(
                 name=app.key.lower().replace(" ", "_").replace("-", "_"),
             )
         )
-        enums.base.AppData(
+        records[app_names[-1]] = enums.base.AppData(
             name=app.name,
-            path=enums.base.APPS_CACHE / app_names[-1],
             is_local=False,
-        ).store()
+        ).model_dump(exclude={"path"})
 
     for tool in load_local_tools()["local"].values():
         if tool.enum in app_names:
             continue
 
         app_names.append(tool.enum)
-        enums.base.AppData(
+        records[app_names[-1]] = enums.base.AppData(
             name=tool.name,
-            path=enums.base.APPS_CACHE / app_names[-1],
             is_local=True,
-        ).store()
+        ).model_dump(exclude={"path"})
 
+    enums.base.get_metadata_store(path=enums.base.APPS_CACHE).write(records=records)
     _update_annotations(
         cls=enums.App,
         attributes=app_names,
@@ -178,9 +182,10 @@ def _update_apps(apps: t.List[AppModel]) -> None:
 
 def _update_actions(apps: t.List[AppModel], actions: t.List[ActionModel]) -> None:
     """Get Action enum."""
-    enums.base.ACTIONS_CACHE.mkdir(parents=True, exist_ok=True)
     deprecated = {}
     action_names = []
+    records = {}
+    documents = {}
     for app in sorted(apps, key=lambda x: x.key):
         for action in actions:
             if action.appName != app.key:
@@ -196,15 +201,19 @@ def _update_actions(apps: t.List[AppModel], actions: t.List[ActionModel]) -> Non
                 ).upper()
             else:
                 action_names.append(get_enum_key(name=action.name))
+                documents[action_names[-1]] = _describe(
+                    display_name=action.display_name,
+                    description=action.description,
+                    parameters=action.parameters.properties,
+                )
 
-            enums.base.ActionData(
+            records[get_enum_key(name=action.name)] = enums.base.ActionData(
                 name=action.name,
                 app=app.key,
                 tags=action.tags,
                 no_auth=app.no_auth,
                 is_local=False,
-                path=enums.base.ACTIONS_CACHE / get_enum_key(name=action.name),
-            ).store()
+            ).model_dump(exclude={"path"})
 
     processed = []
     for tool in load_local_tools()["local"].values():
@@ -214,26 +223,63 @@ def _update_actions(apps: t.List[AppModel], actions: t.List[ActionModel]) -> Non
         processed.append(tool.name)
         for actcls in tool.actions():
             action_names.append(actcls.enum)
-            enums.base.ActionData(
+            records[action_names[-1]] = enums.base.ActionData(
                 name=actcls.enum,
                 app=tool.name,
                 tags=actcls.tags(),
                 no_auth=True,
                 is_local=True,
-                path=enums.base.ACTIONS_CACHE / action_names[-1],
                 shell=False,
-            ).store()
+            ).model_dump(exclude={"path"})
+            schema = actcls.schema()
+            documents[action_names[-1]] = _describe(
+                display_name=schema["displayName"],
+                description=schema["description"],
+                parameters=schema["parameters"].get("properties", {}),
+            )
 
+    enums.base.get_metadata_store(path=enums.base.ACTIONS_CACHE).write(records=records)
     _update_annotations(
         cls=enums.Action,
         attributes=action_names,
         deprecated=deprecated,
     )
+    _update_action_index(
+        action_names=action_names,
+        records=records,
+        documents=documents,
+    )
+
+
+def _describe(
+    display_name: t.Optional[str],
+    description: t.Optional[str],
+    parameters: t.Dict[str, t.Any],
+) -> str:
+    """Text describing an action for the use case search."""
+    return " ".join([display_name or "", description or ""] + list(parameters))
+
+
+def _update_action_index(
+    action_names: t.List[str],
+    records: t.Dict[str, t.Dict],
+    documents: t.Dict[str, str],
+) -> None:
+    """Build the indexes for looking up actions by app, by tag and by use case."""
+    index = ActionIndex.build(
+        actions=action_names,
+        apps=enums.base.get_metadata_store(path=enums.base.APPS_CACHE).keys(),
+        tags=lambda slug: records[slug]["tags"] or [],
+    )
+    set_action_index(index=index, actions=enums.Action.iter())
+    set_search_index(
+        index=SearchIndex.build(documents=documents),
+        actions=enums.Action.iter(),
+    )
 
 
 def _update_tags(apps: t.List[AppModel], actions: t.List[ActionModel]) -> None:
     """Create Tag enum class."""
-    enums.base.TAGS_CACHE.mkdir(parents=True, exist_ok=True)
     tag_map: t.Dict[str, t.Set[str]] = {}
     for app in apps:
         app_name = app.key
@@ -243,21 +289,22 @@ def _update_tags(apps: t.List[AppModel], actions: t.List[ActionModel]) -> None:
             tag_map[app_name].update(action.tags or [])
 
     tag_names = ["DEFAULT"]
+    records = {
+        "DEFAULT": enums.base.TagData(
+            app="default",
+            value="important",
+        ).model_dump(exclude={"path"})
+    }
     for app_name in sorted(tag_map):
         for tag in sorted(tag_map[app_name]):
             tag_name = get_enum_key(name=f"{app_name}_{tag}")
             tag_names.append(tag_name)
-            enums.base.TagData(
+            records[tag_name] = enums.base.TagData(
                 app=app_name,
                 value=tag,
-                path=enums.base.TAGS_CACHE / tag_names[-1],
-            ).store()
+            ).model_dump(exclude={"path"})
 
-    enums.base.TagData(
-        app="default",
-        value="important",
-        path=enums.base.TAGS_CACHE / "DEFAULT",
-    )
+    enums.base.get_metadata_store(path=enums.base.TAGS_CACHE).write(records=records)
     _update_annotations(
         cls=enums.Tag,
         attributes=tag_names,
@@ -270,19 +317,19 @@ def _update_triggers(
 ) -> None:
     """Get Trigger enum."""
     trigger_names = []
-    enums.base.TRIGGERS_CACHE.mkdir(exist_ok=True)
+    records = {}
     for app in apps:
         for trigger in triggers:
             if trigger.appKey != app.key:
                 continue
 
             trigger_names.append(get_enum_key(name=trigger.name).upper())
-            enums.base.TriggerData(
+            records[trigger_names[-1]] = enums.base.TriggerData(
                 name=trigger.name,
                 app=app.key,
-                path=enums.base.TRIGGERS_CACHE / trigger_names[-1],
-            ).store()
+            ).model_dump(exclude={"path"})
 
+    enums.base.get_metadata_store(path=enums.base.TRIGGERS_CACHE).write(records=records)
     _update_annotations(
         cls=enums.Trigger,
         attributes=trigger_names,
@@ -10,6 +10,7 @@ from pathlib import Path
 
 import requests
 
+from composio.client.cache import ConnectionResolver
 from composio.client.collections import (
     AUTH_SCHEMES,
     Actions,
@@ -84,6 +85,7 @@ class Composio:
         self.active_triggers = ActiveTriggers(client=self)
         self.connected_accounts = ConnectedAccounts(client=self)
         self.logs = Logs(client=self)
+        self.connection_resolver = ConnectionResolver(client=self)
         _clients.append(self)
 
     @staticmethod
@@ -209,6 +211,34 @@ class Composio:
         return Entity(id=id, client=self)
 
 
+def _connection_not_found(
+    app: str,
+    connected_account_id: t.Optional[str],
+    entity: str,
+) -> NoItemsFound:
+    """Build the error for a missing connected account."""
+    suggestion = (
+        f"composio add {app}"
+        if entity == DEFAULT_ENTITY_ID
+        else f"composio add {app} -e {entity}"
+    )
+    note = f"Run this command to create a new connection: {suggestion}"
+    doc_note = "Read more here: https://dub.composio.dev/auth-help"
+    if sys.version_info >= (3, 11):
+        exception = NoItemsFound(
+            f"Could not find a connection with {app=},"
+            f" {connected_account_id=} and {entity=}."
+        )
+        exception.add_note(note)
+        exception.add_note(doc_note)
+    else:
+        exception = NoItemsFound(
+            f"Could not find a connection with {app=},"
+            f" {connected_account_id=} and {entity=}.\n{note}\n{doc_note}"
+        )
+    return exception
+
+
 class Entity:
     """Class to represent Entity object."""
 
@@ -297,44 +327,17 @@ class Entity:
                 connection_id=connected_account_id
             )
 
-        latest_account = None
-        latest_creation_date = datetime.fromtimestamp(0.0)
-        connected_accounts = self.client.connected_accounts.get(
-            entity_ids=[self.id],
-            active=True,
-        )
         app = str(app).lower()
-        for connected_account in connected_accounts:
-            if app == connected_account.appUniqueId:
-                creation_date = datetime.fromisoformat(
-                    connected_account.createdAt.replace("Z", "+00:00")
-                )
-                if latest_account is None or creation_date > latest_creation_date:
-                    latest_creation_date = creation_date
-                    latest_account = connected_account
-
+        latest_account = self.client.connection_resolver.get(
+            app=app,
+            entity_id=self.id,
+        )
         if latest_account is None:
-            entity = self.id
-            suggestion = (
-                f"composio add {app}"
-                if entity == DEFAULT_ENTITY_ID
-                else f"composio add {app} -e {entity}"
+            raise _connection_not_found(
+                app=app,
+                connected_account_id=connected_account_id,
+                entity=self.id,
             )
-            note = f"Run this command to create a new connection: {suggestion}"
-            doc_note = "Read more here: https://dub.composio.dev/auth-help"
-            if sys.version_info >= (3, 11):
-                exception = NoItemsFound(
-                    f"Could not find a connection with {app=},"
-                    f" {connected_account_id=} and {entity=}."
-                )
-                exception.add_note(note)
-                exception.add_note(doc_note)
-            else:
-                exception = NoItemsFound(
-                    f"Could not find a connection with {app=},"
-                    f" {connected_account_id=} and {entity=}.\n{note}\n{doc_note}"
-                )
-            raise exception
 
         return latest_account
 
@@ -433,6 +436,7 @@ class Entity:
                 force_new_integration=force_new_integration,
             )
 
+        self.client.connection_resolver.invalidate(entity_id=self.id)
         return self.client.connected_accounts.initiate(
             integration_id=t.cast(IntegrationModel, integration).id,
             entity_id=self.id,
@@ -0,0 +1,455 @@
+"""
+Async Composio SDK client.
+"""
+
+import asyncio
+import functools
+import typing as t
+import weakref
+
+from composio.client import Composio, _connection_not_found
+from composio.client.cache import schema_cache
+from composio.client.collections import (
+    ActionModel,
+    ConnectedAccountModel,
+    CustomAuthObject,
+    _build_execute_request,
+    _process_file_params,
+    _requires_schema,
+)
+from composio.client.endpoints import v1, v2
+from composio.client.enums import Action, ActionType, AppType
+from composio.client.exceptions import ComposioClientError, HTTPError
+from composio.client.http import (
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    AsyncHttpClient,
+    AsyncResponse,
+)
+from composio.constants import DEFAULT_ENTITY_ID
+from composio.utils import logging
+
+
+def _raise_if_required(
+    response: AsyncResponse, status_code: int = 200
+) -> AsyncResponse:
+    """Raise if HTTP response is not expected."""
+    if response.status_code != status_code:
+        raise HTTPError(
+            message=response.content.decode(encoding="utf-8"),
+            status_code=response.status_code,
+        )
+    return response
+
+
+class AsyncCollection(logging.WithLogger):
+    """Base class for async collections."""
+
+    def __init__(self, client: "AsyncComposio") -> None:
+        logging.WithLogger.__init__(self)
+        self.client = client
+
+
+class AsyncConnectedAccounts(AsyncCollection):
+    """Async collection of connected accounts."""
+
+    endpoint = v1 / "connectedAccounts"
+
+    def __init__(self, client: "AsyncComposio") -> None:
+        super().__init__(client=client)
+        self._locks: t.MutableMapping[
+            asyncio.AbstractEventLoop, t.Dict[t.Optional[str], asyncio.Lock]
+        ] = weakref.WeakKeyDictionary()
+
+    async def get(
+        self,
+        connection_id: t.Optional[str] = None,
+        entity_ids: t.Optional[t.Sequence[str]] = None,
+        active: bool = False,
+    ) -> t.Union[ConnectedAccountModel, t.List[ConnectedAccountModel]]:
+        """
+        Get a list of connected accounts.
+
+        :param entity_ids: List of entity IDs to filter by
+        :param connection_id: Return the connected account by a specific
+                connection ID
+        :param active: Returns account which are currently active
+        :return: List of connected accounts
+        """
+        entity_ids = entity_ids or ()
+        if connection_id is not None and len(entity_ids) > 0:
+            raise ComposioClientError(
+                message="Cannot use both `connection_id` and `entity_ids` parameters as filter"
+            )
+
+        if connection_id is not None:
+            response = _raise_if_required(
+                await self.client.http.get(url=str(self.endpoint / connection_id))
+            )
+            return ConnectedAccountModel(**response.json())
+
+        queries = {}
+        if len(entity_ids) > 0:
+            queries["user_uuid"] = ",".join(entity_ids)
+
+        if active:
+            queries["showActiveOnly"] = "true"
+
+        response = _raise_if_required(
+            await self.client.http.get(url=str(self.endpoint(queries=queries)))
+        )
+        return [
+            ConnectedAccountModel(**account)
+            for account in response.json().get("items", [])
+        ]
+
+    async def latest(
+        self,
+        app: AppType,
+        entity_id: t.Optional[str] = None,
+    ) -> t.Optional[ConnectedAccountModel]:
+        """
+        Get the latest connected account for an app.
+
+        Uses the same index as the sync client, so accounts resolved by either
+        of the clients are shared.
+
+        :param app: App name
+        :param entity_id: Entity ID, use `None` to look through connected
+            accounts for all of the entities.
+        :return: Connected account or `None` if no account is found.
+        """
+        app = str(app).lower()
+        resolver = self.client.sync.connection_resolver
+        index = resolver.cached(entity_id=entity_id)
+        if index is not None and app in index:
+            return index[app]
+
+        # Concurrent lookups for the same entity wait on a single fetch
+        async with self._lock(entity_id=entity_id):
+            index = resolver.cached(entity_id=entity_id)
+            if index is None or (
+                app not in index and resolver.refreshable(entity_id=entity_id)
+            ):
+                if entity_id is None:
+                    accounts = await self.get()
+                else:
+                    accounts = await self.get(entity_ids=[entity_id], active=True)
+                index = resolver.update(
+                    accounts=t.cast(t.List[ConnectedAccountModel], accounts),
+                    entity_id=entity_id,
+                )
+        return index.get(app)
+
+    def _lock(self, entity_id: t.Optional[str]) -> asyncio.Lock:
+        """Get the lock for fetching accounts of an entity on the running loop."""
+        locks = self._locks.setdefault(asyncio.get_running_loop(), {})
+        if entity_id not in locks:
+            locks[entity_id] = asyncio.Lock()
+        return locks[entity_id]
+
+
+class AsyncActions(AsyncCollection):
+    """Async collection of composio actions."""
+
+    endpoint = v2.actions
+
+    async def get(self, actions: t.Sequence[ActionType]) -> t.List[ActionModel]:
+        """
+        Get action models for the given actions.
+
+        :param actions: List of actions
+        :return: List of action models
+        """
+        _actions = [
+            action if isinstance(action, Action) else Action(action)
+            for action in actions
+        ]
+        if any(action.is_local for action in _actions):
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(self.client.sync.actions.get, actions=_actions),
+            )
+
+        version = self.client.sync.base_url
+        items = []
+        for action in _actions:
+            schema = schema_cache.get(slug=action.slug, version=version)
+            if schema is None:
+                break
+            items.append(ActionModel(**schema))
+        else:
+            return items
+
+        response = _raise_if_required(
+            await self.client.http.get(
+                url=str(
+                    self.endpoint(
+                        queries={
+                            "apps": ",".join(set(action.app for action in _actions))
+                        }
+                    )
+                )
+            )
+        )
+        items = [ActionModel(**action) for action in response.json().get("items")]
+        schema_cache.update(
+            schemas={item.name: item.model_dump() for item in items},
+            version=version,
+        )
+        required = [action.slug for action in _actions]
+        return [item for item in items if item.name in required]
+
+    async def execute(
+        self,
+        action: Action,
+        params: t.Dict,
+        entity_id: str = DEFAULT_ENTITY_ID,
+        connected_account: t.Optional[str] = None,
+        session_id: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+        auth: t.Optional[CustomAuthObject] = None,
+    ) -> t.Dict:
+        """
+        Execute an action on the specified entity with optional connected account.
+
+        :param action: The Action object to be executed.
+        :param params: A dictionary of parameters to be passed to the action.
+        :param entity_id: The unique identifier of the entity on which the action is executed.
+        :param connected_account: Optional connected account ID if required for the action.
+        :param session_id: ID of the current workspace session
+        :return: A dictionary containing the response from the executed action.
+        """
+        if action.is_local:
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    self.client.sync.local.execute_action,
+                    action=action,
+                    request_data=params,
+                ),
+            )
+
+        properties: t.Optional[t.Dict[str, t.Any]] = None
+        if _requires_schema(
+            action=action, params=params, version=self.client.sync.base_url
+        ):
+            actions = await self.get(actions=[action])
+            if len(actions) == 0:
+                raise ComposioClientError(f"Action {action} not found")
+
+            (action_model,) = actions
+            properties = action_model.parameters.properties
+
+        response = await self.client.http.post(
+            url=str(self.endpoint / action.slug / "execute"),
+            json=_build_execute_request(
+                action=action,
+                params=_process_file_params(params=params, properties=properties),
+                entity_id=entity_id,
+                connected_account=connected_account,
+                session_id=session_id,
+                text=text,
+                auth=auth,
+            ),
+        )
+        return _raise_if_required(response).json()
+
+
+class AsyncComposio:
+    """
+    Async Composio SDK client.
+
+    The async client shares the API key, schema cache, connected account
+    index, retry policy and circuit breaker with a sync client, and keeps a
+    pool of keep-alive connections for the requests made on the event loop.
+
+    Example:
+    ```python
+        async with AsyncComposio() as client:
+            results = await asyncio.gather(
+                *(
+                    client.get_entity().execute(action=action, params=params)
+                    for action, params in calls
+                )
+            )
+    ```
+    """
+
+    _http: t.Optional[AsyncHttpClient] = None
+
+    def __init__(
+        self,
+        api_key: t.Optional[str] = None,
+        base_url: t.Optional[str] = None,
+        runtime: t.Optional[str] = None,
+        *,
+        client: t.Optional[Composio] = None,
+        timeout: t.Optional[float] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    ) -> None:
+        """
+        Initialize async Composio SDK client
+
+        :param api_key: Authentication key for Composio server
+        :param base_url: Base URL for Composio server
+        :param runtime: Runtime specifier
+        :param client: Sync client to share the configuration with, if not
+            provided one is created using `api_key`, `base_url` and `runtime`
+        :param timeout: Request timeout
+        :param max_connections: Maximum number of open connections
+        :param max_connections_per_host: Maximum number of open connections
+            to a single host
+        :param keepalive_timeout: Number of seconds to keep an idle connection
+            open for reuse
+        """
+        self.sync = client or Composio(
+            api_key=api_key,
+            base_url=base_url,
+            runtime=runtime,
+        )
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+
+        self.actions = AsyncActions(client=self)
+        self.connected_accounts = AsyncConnectedAccounts(client=self)
+
+    @property
+    def http(self) -> AsyncHttpClient:
+        if self._http is None:
+            self._http = AsyncHttpClient(
+                base_url=self.sync.base_url,
+                api_key=self.sync.api_key,
+                runtime=self.sync.runtime,
+                timeout=self.timeout,
+                max_connections=self.max_connections,
+                max_connections_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                retry_policy=self.sync.http.retry_policy,
+                circuit_breaker=self.sync.http.circuit_breaker,
+                metrics=self.sync.http.metrics,
+            )
+        return self._http
+
+    @http.setter
+    def http(self, value: AsyncHttpClient) -> None:
+        self._http = value
+
+    def get_entity(self, id: str = DEFAULT_ENTITY_ID) -> "AsyncEntity":
+        """
+        Create async Entity object.
+
+        :param id: Entity ID
+        :return: Entity object.
+        """
+        return AsyncEntity(id=id, client=self)
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        if self._http is not None:
+            await self._http.close()
+
+    async def __aenter__(self) -> "AsyncComposio":
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.close()
+
+
+class AsyncEntity:
+    """Class to represent Entity object for the async client."""
+
+    def __init__(
+        self,
+        client: AsyncComposio,
+        id: str = DEFAULT_ENTITY_ID,
+    ) -> None:
+        """
+        Initialize Entity object.
+
+        :param client: Async Composio client object.
+        :param id: Entity ID string
+        """
+        self.client = client
+        self.id = id
+
+    async def execute(
+        self,
+        action: Action,
+        params: t.Dict,
+        connected_account_id: t.Optional[str] = None,
+        session_id: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+        auth: t.Optional[CustomAuthObject] = None,
+    ) -> t.Dict:
+        """
+        Execute an action.
+
+        :param action: Action ID (Enum)
+        :param params: Parameters for executing actions
+        :param connected_account_id: Connection ID if you want to use a specific
+                connection
+        :param session_id: ID of the current workspace session
+        :return: Dictionary containing execution result
+        """
+        if action.no_auth or auth is not None:
+            return await self.client.actions.execute(
+                action=action,
+                params=params,
+                entity_id=self.id,
+                session_id=session_id,
+                text=text,
+                auth=auth,
+            )
+
+        connected_account = await self.get_connection(
+            app=action.app,
+            connected_account_id=connected_account_id,
+        )
+        return await self.client.actions.execute(
+            action=action,
+            params=params,
+            entity_id=t.cast(str, connected_account.clientUniqueUserId),
+            connected_account=connected_account.id,
+            session_id=session_id,
+            text=text,
+        )
+
+    async def get_connection(
+        self,
+        app: t.Optional[AppType] = None,
+        connected_account_id: t.Optional[str] = None,
+    ) -> ConnectedAccountModel:
+        """
+        Get connected account for an action.
+
+        :param app: App name
+        :param connected_account_id: Connected account ID to use as filter
+        :return: Connected account object
+        :raises: If no connected account found for given entity ID
+        """
+        if connected_account_id is not None:
+            return t.cast(
+                ConnectedAccountModel,
+                await self.client.connected_accounts.get(
+                    connection_id=connected_account_id
+                ),
+            )
+
+        app = str(app).lower()
+        latest_account = await self.client.connected_accounts.latest(
+            app=app,
+            entity_id=self.id,
+        )
+        if latest_account is None:
+            raise _connection_not_found(
+                app=app,
+                connected_account_id=connected_account_id,
+                entity=self.id,
+            )
+        return latest_account
@@ -0,0 +1,441 @@
+"""
+Caches for data fetched from the Composio API server.
+"""
+
+import json
+import os
+import threading
+import time
+import typing as t
+from datetime import datetime
+from pathlib import Path
+
+from composio.__version__ import __version__
+from composio.constants import LOCAL_CACHE_DIRECTORY
+from composio.utils import logging
+
+
+if t.TYPE_CHECKING:
+    from composio.client import Composio
+    from composio.client.collections import ConnectedAccountModel
+
+
+ENV_COMPOSIO_SCHEMA_CACHE_TTL = "COMPOSIO_SCHEMA_CACHE_TTL"
+"""
+Environment variable for configuring the TTL (in seconds) of cached action schemas.
+"""
+
+ENV_COMPOSIO_SCHEMA_CACHE_PERSIST = "COMPOSIO_SCHEMA_CACHE_PERSIST"
+"""
+Environment variable for enabling the on-disk persistence of action schemas.
+"""
+
+DEFAULT_SCHEMA_CACHE_TTL = 3600.0
+"""
+Default TTL for the cached action schemas.
+"""
+
+SCHEMA_CACHE_FILE = LOCAL_CACHE_DIRECTORY / "schemas.json"
+"""
+Path to the on-disk action schema cache.
+"""
+
+ENV_COMPOSIO_CONNECTION_CACHE_TTL = "COMPOSIO_CONNECTION_CACHE_TTL"
+"""
+Environment variable for configuring the TTL (in seconds) of indexed connected accounts.
+"""
+
+DEFAULT_CONNECTION_CACHE_TTL = 300.0
+"""
+Default TTL for the indexed connected accounts.
+"""
+
+MIN_CONNECTION_REFRESH_INTERVAL = 1.0
+"""
+Minimum interval between two refreshes triggered by missing connected accounts.
+"""
+
+
+def _has_file_params(schema: t.Dict) -> bool:
+    """Check if any of the request parameters for the schema are file parameters."""
+    for param in schema.get("parameters", {}).get("properties", {}).values():
+        if not isinstance(param, dict):
+            continue
+        if param.get("file_readable", False):
+            return True
+        if param.get("title") in ("File", "FileType"):
+            return True
+    return False
+
+
+class SchemaCache:
+    """
+    TTL and version keyed cache for action schemas.
+
+    The schemas are stored as raw JSON objects so every lookup returns a fresh
+    copy which the caller is free to modify.
+    """
+
+    def __init__(
+        self,
+        ttl: t.Optional[float] = None,
+        path: t.Optional[Path] = None,
+        persist: t.Optional[bool] = None,
+        skip_if_no_file_params: bool = True,
+    ) -> None:
+        """
+        Initialize schema cache.
+
+        :param ttl: Number of seconds a cached schema is considered valid for.
+        :param path: Path to the file for persisting the cache on disk.
+        :param persist: Set `True` to persist the cache on disk.
+        :param skip_if_no_file_params: Set `True` to skip the schema lookup when
+            executing actions which are known to have no file parameters.
+        """
+        self.ttl = (
+            ttl
+            if ttl is not None
+            else float(
+                os.environ.get(ENV_COMPOSIO_SCHEMA_CACHE_TTL, DEFAULT_SCHEMA_CACHE_TTL)
+            )
+        )
+        self.path = path or SCHEMA_CACHE_FILE
+        self.persist = (
+            persist
+            if persist is not None
+            else os.environ.get(ENV_COMPOSIO_SCHEMA_CACHE_PERSIST, "false") == "true"
+        )
+        self.skip_if_no_file_params = skip_if_no_file_params
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._items: t.Dict[str, t.Tuple[float, t.Dict]] = {}
+        self._no_file_params: t.Set[str] = set()
+        self._loaded = False
+
+    def _key(self, version: t.Optional[str]) -> str:
+        return f"{__version__}:{version or ''}"
+
+    def _load(self) -> None:
+        """Load persisted schemas from the disk."""
+        self._loaded = True
+        if not self.persist or not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        if data.get("version") != __version__:
+            return
+
+        for key, (fetched_at, schema) in data.get("items", {}).items():
+            self._items[key] = (fetched_at, schema)
+            if not _has_file_params(schema=schema):
+                self._no_file_params.add(key)
+
+    def _dump(self) -> None:
+        """Persist the schemas on the disk."""
+        if not self.persist:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps({"version": __version__, "items": self._items}),
+                encoding="utf-8",
+            )
+            tmp.replace(self.path)
+        except OSError:
+            pass
+
+    def get(self, slug: str, version: t.Optional[str] = None) -> t.Optional[t.Dict]:
+        """
+        Get the cached schema for an action.
+
+        :param slug: Action slug
+        :param version: Version specifier for the schema, eg. the API server URL
+        :return: Copy of the cached schema or `None` if the schema is not
+            cached or has expired.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            item = self._items.get(f"{self._key(version)}:{slug}")
+            if item is None or time.time() - item[0] > self.ttl:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return json.loads(json.dumps(item[1]))
+
+    def set(self, slug: str, schema: t.Dict, version: t.Optional[str] = None) -> None:
+        """Cache the schema for an action."""
+        self.update(schemas={slug: schema}, version=version)
+
+    def update(self, schemas: t.Dict[str, t.Dict], version: t.Optional[str] = None):
+        """Cache schemas for multiple actions."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            now = time.time()
+            for slug, schema in schemas.items():
+                key = f"{self._key(version)}:{slug}"
+                self._items[key] = (now, schema)
+                if _has_file_params(schema=schema):
+                    self._no_file_params.discard(key)
+                else:
+                    self._no_file_params.add(key)
+            self._dump()
+
+    def has_no_file_params(self, slug: str, version: t.Optional[str] = None) -> bool:
+        """
+        Check if the action is known to have no file parameters.
+
+        This information is retained even after the cached schema expires since
+        the file parameters for an action rarely change.
+        """
+        if not self.skip_if_no_file_params:
+            return False
+
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            return f"{self._key(version)}:{slug}" in self._no_file_params
+
+    def invalidate(self, slug: t.Optional[str] = None) -> None:
+        """
+        Invalidate cached schemas.
+
+        :param slug: Action slug to invalidate, if not provided the entire cache
+            will be invalidated.
+        """
+        with self._lock:
+            if slug is None:
+                self._items.clear()
+                self._no_file_params.clear()
+            else:
+                for key in [key for key in self._items if key.endswith(f":{slug}")]:
+                    del self._items[key]
+                    self._no_file_params.discard(key)
+            self._dump()
+
+    def stats(self) -> t.Dict[str, int]:
+        """Cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._items),
+        }
+
+
+schema_cache = SchemaCache()
+"""
+Process wide action schema cache, shared by all of the clients.
+"""
+
+
+def _index_accounts(
+    accounts: t.Iterable["ConnectedAccountModel"],
+) -> t.Dict[str, "ConnectedAccountModel"]:
+    """Index connected accounts by the app name, keeping the latest account."""
+    index: t.Dict[str, "ConnectedAccountModel"] = {}
+    created: t.Dict[str, datetime] = {}
+    for account in accounts:
+        app = account.appUniqueId.lower()
+        creation_date = datetime.fromisoformat(account.createdAt.replace("Z", "+00:00"))
+        if app not in index or creation_date > created[app]:
+            index[app] = account
+            created[app] = creation_date
+    return index
+
+
+class ConnectionResolver(logging.WithLogger):
+    """
+    Indexed resolver for connected accounts.
+
+    Connected accounts are fetched once per entity and indexed by the app name,
+    keeping only the latest account for every app. Stale indexes are served
+    while they get refreshed in the background.
+    """
+
+    def __init__(self, client: "Composio", ttl: t.Optional[float] = None) -> None:
+        """
+        Initialize connection resolver.
+
+        :param client: Composio client for fetching the connected accounts.
+        :param ttl: Number of seconds after which the index for an entity is
+            refreshed.
+        """
+        logging.WithLogger.__init__(self)
+        self.client = client
+        self.ttl = (
+            ttl
+            if ttl is not None
+            else float(
+                os.environ.get(
+                    ENV_COMPOSIO_CONNECTION_CACHE_TTL,
+                    DEFAULT_CONNECTION_CACHE_TTL,
+                )
+            )
+        )
+        self._lock = threading.Lock()
+        self._index: t.Dict[
+            t.Optional[str],
+            t.Tuple[float, t.Dict[str, "ConnectedAccountModel"]],
+        ] = {}
+        self._refreshing: t.Set[t.Optional[str]] = set()
+
+    def _fetch(
+        self, entity_id: t.Optional[str]
+    ) -> t.Dict[str, "ConnectedAccountModel"]:
+        """Fetch connected accounts and index them by the app name."""
+        if entity_id is None:
+            accounts = self.client.connected_accounts.get()
+        else:
+            accounts = self.client.connected_accounts.get(
+                entity_ids=[entity_id],
+                active=True,
+            )
+
+        return _index_accounts(accounts=accounts)
+
+    def refresh(
+        self, entity_id: t.Optional[str] = None
+    ) -> t.Dict[str, "ConnectedAccountModel"]:
+        """
+        Refresh the index for an entity.
+
+        :param entity_id: Entity ID, use `None` to index connected accounts
+            for all of the entities.
+        :return: Mapping of app name to the latest connected account.
+        """
+        try:
+            index = self._fetch(entity_id=entity_id)
+        finally:
+            with self._lock:
+                self._refreshing.discard(entity_id)
+
+        with self._lock:
+            self._index[entity_id] = (time.time(), index)
+        return index
+
+    def update(
+        self,
+        accounts: t.Iterable["ConnectedAccountModel"],
+        entity_id: t.Optional[str] = None,
+    ) -> t.Dict[str, "ConnectedAccountModel"]:
+        """
+        Replace the index for an entity with connected accounts fetched by
+        the caller, used by clients which fetch the accounts on their own.
+
+        :param accounts: Connected accounts for the entity
+        :param entity_id: Entity ID, use `None` for all of the entities.
+        :return: Mapping of app name to the latest connected account.
+        """
+        index = _index_accounts(accounts=accounts)
+        with self._lock:
+            self._index[entity_id] = (time.time(), index)
+        return index
+
+    def cached(
+        self, entity_id: t.Optional[str] = None
+    ) -> t.Optional[t.Dict[str, "ConnectedAccountModel"]]:
+        """
+        Get the index for an entity without fetching the connected accounts.
+
+        :param entity_id: Entity ID, use `None` for all of the entities.
+        :return: Mapping of app name to the latest connected account or `None`
+            if the entity is not indexed or the index has expired.
+        """
+        with self._lock:
+            item = self._index.get(entity_id)
+        if item is None or time.time() - item[0] > self.ttl:
+            return None
+        return item[1]
+
+    def refreshable(self, entity_id: t.Optional[str] = None) -> bool:
+        """Check if the index for an entity can be refreshed on a missing app."""
+        with self._lock:
+            fetched_at, _ = self._index.get(entity_id, (0.0, {}))
+        return time.time() - fetched_at >= MIN_CONNECTION_REFRESH_INTERVAL
+
+    def _refresh_in_background(self, entity_id: t.Optional[str]) -> None:
+        with self._lock:
+            if entity_id in self._refreshing:
+                return
+            self._refreshing.add(entity_id)
+
+        def _refresh() -> None:
+            try:
+                self.refresh(entity_id=entity_id)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.logger.debug(f"Error refreshing connected accounts: {e}")
+
+        threading.Thread(target=_refresh, daemon=True).start()
+
+    def accounts(
+        self, entity_id: t.Optional[str] = None
+    ) -> t.Dict[str, "ConnectedAccountModel"]:
+        """
+        Get the latest connected account for every app.
+
+        :param entity_id: Entity ID, use `None` to get connected accounts for
+            all of the entities.
+        :return: Mapping of app name to the latest connected account.
+        """
+        with self._lock:
+            item = self._index.get(entity_id)
+
+        if item is None:
+            return self.refresh(entity_id=entity_id)
+
+        fetched_at, index = item
+        if time.time() - fetched_at > self.ttl:
+            self._refresh_in_background(entity_id=entity_id)
+        return index
+
+    def get(
+        self,
+        app: t.Any,
+        entity_id: t.Optional[str] = None,
+    ) -> t.Optional["ConnectedAccountModel"]:
+        """
+        Get the latest connected account for an app.
+
+        If the app is not found in the index, the index is refreshed once
+        to account for connections created since it was built.
+
+        :param app: App name
+        :param entity_id: Entity ID, use `None` to look through connected
+            accounts for all of the entities.
+        :return: Connected account or `None` if no account is found.
+        """
+        app = str(app).lower()
+        account = self.accounts(entity_id=entity_id).get(app)
+        if account is not None:
+            return account
+
+        if not self.refreshable(entity_id=entity_id):
+            return None
+        return self.refresh(entity_id=entity_id).get(app)
+
+    def invalidate(self, entity_id: t.Optional[str] = None) -> None:
+        """
+        Invalidate the indexed connected accounts.
+
+        :param entity_id: Entity ID to invalidate, if not provided indexes
+            for all of the entities are invalidated.
+        """
+        with self._lock:
+            if entity_id is None:
+                self._index.clear()
+                return
+            self._index.pop(entity_id, None)
+            self._index.pop(None, None)
@@ -10,7 +10,7 @@ import time
 import traceback
 import typing as t
 import warnings
-from concurrent.futures import Future, ThreadPoolExecutor
+from logging import DEBUG
 from unittest import mock
 
 import pysher
@@ -21,6 +21,17 @@ from pysher.channel import Channel as PusherChannel
 from pysher.connection import Connection as PusherConnection
 
 from composio.client.base import Collection
+from composio.client.cache import schema_cache
+from composio.client.dispatcher import (
+    CHUNK_BUFFER_SIZE,
+    CHUNK_TTL,
+    DISPATCHER_QUEUE_SIZE,
+    DISPATCHER_WORKERS,
+    ChunkBuffer,
+    EventDispatcher,
+    FilterIndex,
+    OverflowPolicy,
+)
 from composio.client.endpoints import v1, v2
 from composio.client.enums import (
     Action,
@@ -132,6 +143,7 @@ class ConnectionRequestModel(BaseModel):
                 connection_id=self.connectedAccountId,
             )
             if connection.status == "ACTIVE":
+                client.connection_resolver.invalidate()
                 return connection
             time.sleep(1)
 
@@ -515,13 +527,43 @@ class TriggerSubscription(logging.WithLogger):
     _connection: PusherConnection
     _alive: bool
 
-    def __init__(self, client: "Composio") -> None:
-        """Initialize subscription object."""
+    def __init__(
+        self,
+        client: "Composio",
+        workers: int = DISPATCHER_WORKERS,
+        queue_size: int = DISPATCHER_QUEUE_SIZE,
+        overflow: OverflowPolicy = "block",
+        chunk_ttl: float = CHUNK_TTL,
+        chunk_buffer_size: int = CHUNK_BUFFER_SIZE,
+    ) -> None:
+        """
+        Initialize subscription object.
+
+        :param client: Composio client.
+        :param workers: Number of threads running the callbacks.
+        :param queue_size: Number of events waiting for a worker before the
+            overflow policy applies.
+        :param overflow: `block` to wait for room in the queue, `drop_oldest`
+            to drop the oldest waiting event or `spill` to write the event to a
+            temporary file.
+        :param chunk_ttl: Seconds to wait for the remaining chunks of an event.
+        :param chunk_buffer_size: Total length of the chunks of the incomplete
+            events, the oldest events are dropped when it is exceeded.
+        """
         logging.WithLogger.__init__(self)
         self.client = client
         self._alive = False
-        self._chunks: t.Dict[str, t.Dict[int, str]] = {}
+        self.chunks = ChunkBuffer(ttl=chunk_ttl, max_size=chunk_buffer_size)
         self._callbacks: t.List[t.Tuple[TriggerCallback, _TriggerEventFilters]] = []
+        self._filter_index = FilterIndex(
+            fields=list(_TriggerEventFilters.__annotations__)
+        )
+        self.dispatcher = EventDispatcher(
+            handler=self.handle_event,
+            workers=workers,
+            queue_size=queue_size,
+            overflow=overflow,
+        )
 
     def validate_filters(self, filters: _TriggerEventFilters):
         docs_link_msg = "\nRead more here: https://docs.composio.dev/introduction/intro/quickstart_3"
@@ -629,35 +671,55 @@ class TriggerSubscription(logging.WithLogger):
 
         def _wrap(f: TriggerCallback) -> TriggerCallback:
             self._callbacks.append((f, filters or {}))
+            self._filter_index.add(
+                filters={
+                    name: str(value).lower()
+                    for name, value in (filters or {}).items()
+                    if value is not None
+                }
+            )
             return f
 
         return _wrap
 
-    def _handle_callback(
+    @staticmethod
+    def _event_values(data: TriggerEventData) -> t.Dict[str, str]:
+        """Values of the event metadata the callbacks can filter on."""
+        return {
+            name: str(value).lower()
+            for name, value in (
+                ("app_name", data.appName),
+                ("trigger_id", data.metadata.id),
+                ("connection_id", data.metadata.connectionId),
+                ("trigger_name", data.metadata.triggerName),
+                ("entity_id", data.metadata.connection.clientUniqueUserId),
+                ("integration_id", data.metadata.connection.integrationId),
+            )
+        }
+
+    def _log_skipped(
         self,
         callback: TriggerCallback,
-        data: TriggerEventData,
+        values: t.Dict[str, str],
         filters: _TriggerEventFilters,
-    ) -> t.Any:
-        """Handle callback."""
-        for name, check in (
-            ("app_name", data.appName),
-            ("trigger_id", data.metadata.id),
-            ("connection_id", data.metadata.connectionId),
-            ("trigger_name", data.metadata.triggerName),
-            ("entity_id", data.metadata.connection.clientUniqueUserId),
-            ("integration_id", data.metadata.connection.integrationId),
-        ):
-            value = filters.get(name)
-            if value is None or str(value).lower() == check.lower():
+    ) -> None:
+        """Log the filter which does not match the event."""
+        for name, value in filters.items():
+            if value is None or str(value).lower() == values[name]:
                 continue
 
             self.logger.debug(
                 f"Skipping `{callback.__name__}` since "
                 f"`{name}` filter does not match the event metadata",
             )
-            return None
+            return
 
+    def _handle_callback(
+        self,
+        callback: TriggerCallback,
+        data: TriggerEventData,
+    ) -> t.Any:
+        """Handle callback."""
         try:
             return callback(data)
         except BaseException:
@@ -677,7 +739,7 @@ class TriggerSubscription(logging.WithLogger):
             return None
 
     def handle_event(self, event: str) -> None:
-        """Filter events and call the callback function."""
+        """Filter events and call the callback functions."""
         data = self._parse_payload(event=event)
         if data is None:
             self.logger.error(f"Error parsing trigger payload: {event}")
@@ -687,31 +749,31 @@ class TriggerSubscription(logging.WithLogger):
             f"Received trigger event with trigger ID: {data.metadata.id} "
             f"and trigger name: {data.metadata.triggerName}"
         )
-        awaitables: t.List[Future] = []
-        with ThreadPoolExecutor() as executor:
-            for callback, filters in self._callbacks:
-                awaitables.append(
-                    executor.submit(
-                        self._handle_callback,
-                        callback,
-                        data,
-                        filters,
-                    )
-                )
-        _ = [future.result() for future in awaitables]
+        values = self._event_values(data=data)
+        matched = self._filter_index.match(values=values)
+        if self.logger.isEnabledFor(DEBUG):
+            for position in set(range(len(self._filter_index))) - set(matched):
+                callback, filters = self._callbacks[position]
+                self._log_skipped(callback=callback, values=values, filters=filters)
+
+        for position in matched:
+            self._handle_callback(callback=self._callbacks[position][0], data=data)
+
+    def dispatch_event(self, event: str) -> None:
+        """Queue the event for the callbacks without blocking the caller."""
+        self.dispatcher.submit(event=event)
 
     def handle_chunked_events(self, event: str) -> None:
         """Handle chunked events."""
         data = _ChunkedTriggerEventData(**json.loads(event))
-        if data.id not in self._chunks:
-            self._chunks[data.id] = {}
-
-        self._chunks[data.id][data.index] = data.chunk
-        if data.final:
-            _chunks = self._chunks.pop(data.id)
-            self.handle_event(
-                event="".join([_chunks[idx] for idx in sorted(_chunks)]),
-            )
+        payload = self.chunks.add(
+            event_id=data.id,
+            index=data.index,
+            chunk=data.chunk,
+            final=data.final,
+        )
+        if payload is not None:
+            self.dispatch_event(event=payload)
 
     def is_alive(self) -> bool:
         """Check if subscription is live."""
@@ -739,6 +801,7 @@ class TriggerSubscription(logging.WithLogger):
         """Stop the trigger listener."""
         self._connection.disconnect()
         self._alive = False
+        self.dispatcher.stop()
 
     def restart(self) -> None:
         """Restart the subscription connection"""
@@ -749,14 +812,19 @@ class TriggerSubscription(logging.WithLogger):
 class _PusherClient(logging.WithLogger):
     """Pusher client for Composio SDK."""
 
-    def __init__(self, client_id: str, client: "Composio") -> None:
+    def __init__(
+        self,
+        client_id: str,
+        client: "Composio",
+        subscription: t.Optional[TriggerSubscription] = None,
+    ) -> None:
         """Initialize pusher client."""
         super().__init__()
         self.client_id = client_id
         self.client = client
         self.api_key = self.client.api_key
         self.base_url = self.client.http.base_url
-        self.subscription = TriggerSubscription(client=self.client)
+        self.subscription = subscription or TriggerSubscription(client=self.client)
 
     def _get_connection_handler(
         self,
@@ -773,7 +841,7 @@ class _PusherClient(logging.WithLogger):
             )
             channel.bind(
                 event_name="trigger_to_client",
-                callback=subscription.handle_event,
+                callback=subscription.dispatch_event,
             )
             channel.bind(
                 event_name="chunked-trigger_to_client",
@@ -910,8 +978,23 @@ class Triggers(Collection[TriggerModel]):
         )
         return response.json()
 
-    def subscribe(self, timeout: float = 15.0) -> TriggerSubscription:
-        """Subscribe to a trigger and receive trigger events."""
+    def subscribe(
+        self,
+        timeout: float = 15.0,
+        workers: int = DISPATCHER_WORKERS,
+        queue_size: int = DISPATCHER_QUEUE_SIZE,
+        overflow: OverflowPolicy = "block",
+    ) -> TriggerSubscription:
+        """
+        Subscribe to a trigger and receive trigger events.
+
+        :param timeout: Seconds to wait for the connection.
+        :param workers: Number of threads running the callbacks.
+        :param queue_size: Number of events waiting for a worker before the
+            overflow policy applies.
+        :param overflow: `block`, `drop_oldest` or `spill`, see `EventDispatcher`.
+        :return: Trigger subscription object.
+        """
         self.logger.info("Creating trigger subscription")
         response = self._raise_if_required(
             response=self.client.http.get(
@@ -925,6 +1008,12 @@ class Triggers(Collection[TriggerModel]):
         pusher = _PusherClient(
             client_id=client_id,
             client=self.client,
+            subscription=TriggerSubscription(
+                client=self.client,
+                workers=workers,
+                queue_size=queue_size,
+                overflow=overflow,
+            ),
         )
         return pusher.connect(
             timeout=timeout,
@@ -1123,7 +1212,24 @@ class Actions(Collection[ActionModel]):
                     url=str(self.endpoint),
                 )
             )
-            return [self.model(**action) for action in response.json().get("items")]
+            items = [self.model(**action) for action in response.json().get("items")]
+            schema_cache.update(
+                schemas={item.name: item.model_dump() for item in items},
+                version=self.client.base_url,
+            )
+            return items
+
+        if (
+            len(actions) > 0
+            and len(tags) == 0
+            and limit is None
+            and not use_case
+            and len(local_apps) == 0
+            and len(local_actions) == 0
+        ):
+            cached = self._get_cached(actions=t.cast(t.List[Action], actions))
+            if cached is not None:
+                return cached
 
         queries: t.Dict[str, str] = {}
         if use_case is not None and use_case != "":
@@ -1152,6 +1258,10 @@ class Actions(Collection[ActionModel]):
 
         response_json = response.json()
         items = [self.model(**action) for action in response_json.get("items")]
+        schema_cache.update(
+            schemas={item.name: item.model_dump() for item in items},
+            version=self.client.base_url,
+        )
         if len(actions) > 0:
             required = [t.cast(Action, action).slug for action in actions]
             items = [item for item in items if item.name in required]
@@ -1176,6 +1286,16 @@ class Actions(Collection[ActionModel]):
             items = [self.model(**item) for item in local_items] + items
         return items
 
+    def _get_cached(self, actions: t.List[Action]) -> t.Optional[t.List[ActionModel]]:
+        """Get action models from the schema cache if all of them are available."""
+        items = []
+        for action in actions:
+            schema = schema_cache.get(slug=action.slug, version=self.client.base_url)
+            if schema is None:
+                return None
+            items.append(self.model(**schema))
+        return items
+
     def execute(
         self,
         action: Action,
@@ -1200,74 +1320,29 @@ class Actions(Collection[ActionModel]):
         if action.is_local:
             return self.client.local.execute_action(action=action, request_data=params)
 
-        actions = self.get(actions=[action])
-        if len(actions) == 0:
-            raise ComposioClientError(f"Action {action} not found")
-
-        (action_model,) = actions
-        action_req_schema = action_model.parameters.properties
-        modified_params: t.Dict[str, t.Union[str, t.Dict[str, str]]] = {}
-        for param, value in params.items():
-            request_param_schema = action_req_schema[param]
-            file_readable = request_param_schema.get("file_readable", False)
-            file_uploadable = _check_file_uploadable(request_param_schema)
-
-            if file_readable and isinstance(value, str) and os.path.isfile(value):
-                with open(value, "rb") as file:
-                    file_content = file.read()
-                    try:
-                        modified_params[param] = file_content.decode("utf-8")
-                    except UnicodeDecodeError:
-                        # If decoding fails, treat as binary and encode in base64
-                        modified_params[param] = base64.b64encode(file_content).decode(
-                            "utf-8"
-                        )
-            elif file_uploadable and isinstance(value, str):
-                if not os.path.isfile(value):
-                    raise ValueError(f"Attachment File with path `{value}` not found.")
-
-                with open(value, "rb") as file:
-                    file_content = file.read()
-
-                modified_params[param] = {
-                    "name": os.path.basename(value),
-                    "content": base64.b64encode(file_content).decode("utf-8"),
-                }
-            else:
-                modified_params[param] = value
-
-        if action.no_auth:
-            return self._raise_if_required(
-                self.client.http.post(
-                    url=str(self.endpoint / action.slug / "execute"),
-                    json={
-                        "appName": action.app,
-                        "input": modified_params,
-                        "text": text,
-                        "sessionInfo": {
-                            "sessionId": session_id,
-                        },
-                    },
-                )
-            ).json()
+        # The schema is only required for processing file parameters, so skip
+        # the lookup if the action is known to have none.
+        properties: t.Optional[t.Dict[str, t.Any]] = None
+        if _requires_schema(action=action, params=params, version=self.client.base_url):
+            actions = self.get(actions=[action])
+            if len(actions) == 0:
+                raise ComposioClientError(f"Action {action} not found")
 
-        if connected_account is None and auth is None:
-            raise ComposioClientError(
-                "`connected_account` cannot be `None` when executing "
-                "an app which requires authentication"
-            )
+            (action_model,) = actions
+            properties = action_model.parameters.properties
 
         return self._raise_if_required(
             self.client.http.post(
                 url=str(self.endpoint / action.slug / "execute"),
-                json={
-                    "connectedAccountId": connected_account,
-                    "entityId": entity_id,
-                    "appName": action.app,
-                    "input": modified_params,
-                    "text": text,
-                    "authConfig": self._serialize_auth(auth=auth),
-                },
+                json=_build_execute_request(
+                    action=action,
+                    params=_process_file_params(params=params, properties=properties),
+                    entity_id=entity_id,
+                    connected_account=connected_account,
+                    session_id=session_id,
+                    text=text,
+                    auth=auth,
+                ),
             )
         ).json()
 
@@ -1299,15 +1374,110 @@ class Actions(Collection[ActionModel]):
 
     @staticmethod
     def _serialize_auth(auth: t.Optional[CustomAuthObject]) -> t.Optional[t.Dict]:
-        if auth is None:
-            return None
+        return _serialize_auth(auth=auth)
+
+
+def _serialize_auth(auth: t.Optional[CustomAuthObject]) -> t.Optional[t.Dict]:
+    if auth is None:
+        return None
+
+    data = auth.model_dump(exclude_none=True)
+    data["parameters"] = [
+        {"in": d["in_"], "name": d["name"], "value": d["value"]}
+        for d in data["parameters"]
+    ]
+    return data
+
+
+def _requires_schema(action: Action, params: t.Dict, version: str) -> bool:
+    """Check if the action schema is required for processing the parameters."""
+    return len(params) > 0 and not schema_cache.has_no_file_params(
+        slug=action.slug,
+        version=version,
+    )
+
+
+def _process_file_params(
+    params: t.Dict,
+    properties: t.Optional[t.Dict[str, t.Any]],
+) -> t.Dict[str, t.Union[str, t.Dict[str, str]]]:
+    """
+    Read and encode the files referenced by the file parameters.
+
+    :param params: Action parameters
+    :param properties: Request schema properties for the action, if `None`
+        the parameters are returned as is.
+    :return: Processed action parameters
+    """
+    if properties is None:
+        return dict(params)
+
+    modified_params: t.Dict[str, t.Union[str, t.Dict[str, str]]] = {}
+    for param, value in params.items():
+        request_param_schema = properties[param]
+        file_readable = request_param_schema.get("file_readable", False)
+        file_uploadable = _check_file_uploadable(request_param_schema)
+
+        if file_readable and isinstance(value, str) and os.path.isfile(value):
+            with open(value, "rb") as file:
+                file_content = file.read()
+                try:
+                    modified_params[param] = file_content.decode("utf-8")
+                except UnicodeDecodeError:
+                    # If decoding fails, treat as binary and encode in base64
+                    modified_params[param] = base64.b64encode(file_content).decode(
+                        "utf-8"
+                    )
+        elif file_uploadable and isinstance(value, str):
+            if not os.path.isfile(value):
+                raise ValueError(f"Attachment File with path `{value}` not found.")
+
+            with open(value, "rb") as file:
+                file_content = file.read()
+
+            modified_params[param] = {
+                "name": os.path.basename(value),
+                "content": base64.b64encode(file_content).decode("utf-8"),
+            }
+        else:
+            modified_params[param] = value
+    return modified_params
+
+
+def _build_execute_request(
+    action: Action,
+    params: t.Dict,
+    entity_id: str,
+    connected_account: t.Optional[str],
+    session_id: t.Optional[str],
+    text: t.Optional[str],
+    auth: t.Optional[CustomAuthObject],
+) -> t.Dict:
+    """Build request body for executing an action."""
+    if action.no_auth:
+        return {
+            "appName": action.app,
+            "input": params,
+            "text": text,
+            "sessionInfo": {
+                "sessionId": session_id,
+            },
+        }
+
+    if connected_account is None and auth is None:
+        raise ComposioClientError(
+            "`connected_account` cannot be `None` when executing "
+            "an app which requires authentication"
+        )
 
-        data = auth.model_dump(exclude_none=True)
-        data["parameters"] = [
-            {"in": d["in_"], "name": d["name"], "value": d["value"]}
-            for d in data["parameters"]
-        ]
-        return data
+    return {
+        "connectedAccountId": connected_account,
+        "entityId": entity_id,
+        "appName": action.app,
+        "input": params,
+        "text": text,
+        "authConfig": _serialize_auth(auth=auth),
+    }
 
 
 class ExpectedFieldInput(BaseModel):
@@ -0,0 +1,424 @@
+"""
+Bounded buffers and dispatcher for the trigger events.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import traceback
+import typing as t
+from collections import OrderedDict, deque
+
+from composio.client.exceptions import ComposioSDKError
+from composio.utils import logging
+
+
+DISPATCHER_WORKERS = 8
+"""Number of threads running the trigger callbacks."""
+
+DISPATCHER_QUEUE_SIZE = 1024
+"""Number of events waiting for a worker before the overflow policy applies."""
+
+CHUNK_TTL = 300.0
+"""Seconds to wait for the remaining chunks of an event."""
+
+CHUNK_BUFFER_SIZE = 64 * 1024 * 1024
+"""Total length of the buffered chunks, bytes for the ASCII encoded payloads."""
+
+_SLOT_SIZE = 8
+"""Size of a chunk slot in the buffer, counted towards the buffer size."""
+
+OverflowPolicy = t.Literal["block", "drop_oldest", "spill"]
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "spill")
+
+
+class FilterIndex:
+    """
+    Index of the callbacks by the values of their filters.
+
+    Every field maps the filter values to the callbacks using them, so an event
+    is matched with a lookup per field instead of checking the filters of every
+    callback.
+    """
+
+    def __init__(self, fields: t.Sequence[str]) -> None:
+        """
+        Initialize filter index.
+
+        :param fields: Names of the fields the callbacks can filter on.
+        """
+        self.fields = tuple(fields)
+        self._values: t.Dict[str, t.Dict[str, t.Set[int]]] = {
+            field: {} for field in self.fields
+        }
+        self._unfiltered: t.Dict[str, t.Set[int]] = {
+            field: set() for field in self.fields
+        }
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, filters: t.Mapping[str, t.Optional[str]]) -> int:
+        """
+        Add the filters of a callback.
+
+        :param filters: Mapping of the fields to the values to match.
+        :return: Position of the callback, in the order of registration.
+        """
+        position = self._size
+        for field in self.fields:
+            value = filters.get(field)
+            if value is None:
+                self._unfiltered[field].add(position)
+            else:
+                self._values[field].setdefault(value, set()).add(position)
+        self._size += 1
+        return position
+
+    def match(self, values: t.Mapping[str, str]) -> t.List[int]:
+        """
+        Match an event against the filters.
+
+        :param values: Mapping of the fields to the values of the event.
+        :return: Positions of the callbacks with matching filters, in order.
+        """
+        matched: t.Optional[t.Set[int]] = None
+        for field in self.fields:
+            if not self._values[field]:
+                continue
+            positions = self._unfiltered[field] | self._values[field].get(
+                values[field], set()
+            )
+            matched = positions if matched is None else matched & positions
+            if not matched:
+                return []
+        if matched is None:
+            return list(range(self._size))
+        return sorted(matched)
+
+
+class _PartialEvent:
+    """Chunks of an event received so far."""
+
+    __slots__ = ("chunks", "received", "size", "final", "deadline")
+
+    def __init__(self, deadline: float) -> None:
+        self.chunks: t.List[t.Optional[str]] = []
+        self.received = 0
+        self.size = 0
+        self.final = False
+        self.deadline = deadline
+
+
+class ChunkBuffer(logging.WithLogger):
+    """
+    Reassembly buffer for chunked events.
+
+    The chunks of an event are kept in slots by their index, the slots are
+    allocated up to the highest index received so the event is joined without
+    sorting. Events which are not complete within the TTL expire, and the
+    oldest events are evicted when the chunks exceed the buffer size.
+    """
+
+    def __init__(
+        self,
+        ttl: float = CHUNK_TTL,
+        max_size: int = CHUNK_BUFFER_SIZE,
+        clock: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize chunk buffer.
+
+        :param ttl: Seconds to wait for the remaining chunks of an event.
+        :param max_size: Total length of the buffered chunks.
+        :param clock: Monotonic clock returning seconds.
+        """
+        super().__init__()
+        self.ttl = ttl
+        self.max_size = max_size
+        self.size = 0
+        self.stats = {"completed": 0, "expired": 0, "evicted": 0, "dropped": 0}
+        self._clock = clock
+        self._events: t.OrderedDict[str, _PartialEvent] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def _discard(self, event_id: str, reason: str) -> None:
+        """Remove a partial event, the lock must be held."""
+        partial = self._events.pop(event_id)
+        self.size -= partial.size
+        self.stats[reason] += 1
+        self.logger.warning(
+            f"Discarding chunked trigger event `{event_id}` ({reason}) with "
+            f"{partial.received} chunks received"
+        )
+
+    def _expire(self, now: float) -> None:
+        """Remove the expired events, the lock must be held."""
+        # Events are ordered by the arrival of their first chunk, so the
+        # deadlines are in order too
+        while self._events:
+            event_id, partial = next(iter(self._events.items()))
+            if partial.deadline > now:
+                return
+            self._discard(event_id=event_id, reason="expired")
+
+    def add(
+        self, event_id: str, index: int, chunk: str, final: bool
+    ) -> t.Optional[str]:
+        """
+        Add a chunk to the buffer.
+
+        :param event_id: ID of the chunked event.
+        :param index: Position of the chunk in the event.
+        :param chunk: Chunk of the event payload.
+        :param final: Whether this is the last chunk of the event.
+        :return: The event payload once all of the chunks are received.
+        """
+        with self._lock:
+            now = self._clock()
+            self._expire(now=now)
+
+            partial = self._events.get(event_id)
+            if partial is None:
+                partial = self._events[event_id] = _PartialEvent(
+                    deadline=now + self.ttl
+                )
+
+            # The final chunk has the last index
+            slots = max(index + 1 - len(partial.chunks), 0)
+            if (
+                index < 0
+                or (partial.final and slots > 0)
+                or (final and index + 1 < len(partial.chunks))
+            ):
+                self._discard(event_id=event_id, reason="dropped")
+                return None
+
+            previous = partial.chunks[index] if slots == 0 else None
+            growth = len(chunk) - len(previous or "") + slots * _SLOT_SIZE
+            if partial.size + growth > self.max_size:
+                self._discard(event_id=event_id, reason="dropped")
+                return None
+
+            for oldest in list(self._events):
+                if self.size + growth <= self.max_size:
+                    break
+                if oldest != event_id:
+                    self._discard(event_id=oldest, reason="evicted")
+
+            partial.chunks.extend([None] * slots)
+            partial.chunks[index] = chunk
+            if previous is None:
+                partial.received += 1
+            partial.final = partial.final or final
+            partial.size += growth
+            self.size += growth
+            if not partial.final or partial.received < len(partial.chunks):
+                return None
+
+            del self._events[event_id]
+            self.size -= partial.size
+            self.stats["completed"] += 1
+            return "".join(t.cast(t.List[str], partial.chunks))
+
+
+class _SpillFile:
+    """Temporary file holding the events which overflow the queue, in order."""
+
+    def __init__(self, directory: t.Optional[str] = None) -> None:
+        self._directory = directory
+        self._file: t.Optional[t.IO[bytes]] = None
+        self._offset = 0
+        self.size = 0
+
+    def append(self, event: str) -> None:
+        """Write an event at the end of the file."""
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self._directory)
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(json.dumps(event).encode("utf-8") + b"\n")
+        self.size += 1
+
+    def pop(self) -> str:
+        """Read the first event of the file."""
+        file = t.cast(t.IO[bytes], self._file)
+        file.seek(self._offset)
+        line = file.readline()
+        self._offset = file.tell()
+        self.size -= 1
+        if self.size == 0:
+            file.seek(0)
+            file.truncate()
+            self._offset = 0
+        return json.loads(line)
+
+
+class EventDispatcher(logging.WithLogger):
+    """
+    Run a handler for the events on a pool of long-lived worker threads.
+
+    Events wait for a worker in a bounded queue, when the queue is full a new
+    event blocks the caller, evicts the oldest waiting event or is spilled to
+    a temporary file and queued once there is room, based on the overflow
+    policy. The events are handled in the order they are submitted.
+    """
+
+    def __init__(
+        self,
+        handler: t.Callable[[str], None],
+        workers: int = DISPATCHER_WORKERS,
+        queue_size: int = DISPATCHER_QUEUE_SIZE,
+        overflow: OverflowPolicy = "block",
+        spill_dir: t.Optional[str] = None,
+    ) -> None:
+        """
+        Initialize event dispatcher.
+
+        :param handler: Callable to run for every event.
+        :param workers: Number of worker threads.
+        :param queue_size: Number of events waiting for a worker before the
+            overflow policy applies.
+        :param overflow: `block` to wait for room in the queue, `drop_oldest`
+            to evict the oldest waiting event or `spill` to write the event to
+            a temporary file.
+        :param spill_dir: Directory for the spill file, defaults to the system
+            temporary directory.
+        """
+        super().__init__()
+        if overflow not in OVERFLOW_POLICIES:
+            raise ComposioSDKError(
+                f"Invalid overflow policy {overflow!r}, "
+                f"expected one of {OVERFLOW_POLICIES}"
+            )
+        if workers < 1 or queue_size < 1:
+            raise ComposioSDKError(
+                "Expected at least one worker and a queue size of at least one"
+            )
+
+        self.handler = handler
+        self.workers = workers
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.stats = {
+            "submitted": 0,
+            "handled": 0,
+            "failed": 0,
+            "dropped": 0,
+            "spilled": 0,
+        }
+
+        self._queue: t.Deque[str] = deque()
+        self._spill = _SpillFile(directory=spill_dir)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._all_done = threading.Condition(self._lock)
+        self._unfinished = 0
+        self._threads: t.List[threading.Thread] = []
+        self._stopped = False
+
+    def _start(self) -> None:
+        """Start the missing worker threads, the lock must be held."""
+        self._stopped = False
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._run,
+                name=f"trigger-dispatcher-{len(self._threads)}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, event: str) -> None:
+        """
+        Queue an event for the handler.
+
+        :param event: Event payload.
+        """
+        with self._lock:
+            if self._stopped or len(self._threads) < self.workers:
+                self._start()
+
+            self.stats["submitted"] += 1
+            self._unfinished += 1
+            if len(self._queue) >= self.queue_size or self._spill.size > 0:
+                if self.overflow == "spill":
+                    self._spill.append(event)
+                    self.stats["spilled"] += 1
+                    return
+
+                if self.overflow == "drop_oldest":
+                    self._queue.popleft()
+                    self.stats["dropped"] += 1
+                    self._unfinished -= 1
+                else:
+                    while len(self._queue) >= self.queue_size:
+                        self._not_full.wait()
+
+            self._queue.append(event)
+            self._not_empty.notify()
+
+    def _run(self) -> None:
+        """Handle the queued events until the dispatcher is stopped."""
+        while True:
+            with self._lock:
+                while not self._queue and not self._stopped:
+                    self._not_empty.wait()
+                if not self._queue:
+                    return
+
+                event = self._queue.popleft()
+                if self._spill.size > 0:
+                    self._queue.append(self._spill.pop())
+                else:
+                    self._not_full.notify()
+
+            failed = False
+            try:
+                self.handler(event)
+            except Exception:  # pylint: disable=broad-exception-caught
+                failed = True
+                self.logger.error(
+                    f"Error dispatching trigger event:\n{traceback.format_exc()}"
+                )
+
+            with self._lock:
+                self.stats["failed" if failed else "handled"] += 1
+                self._unfinished -= 1
+                if self._unfinished == 0:
+                    self._all_done.notify_all()
+
+    def join(self, timeout: t.Optional[float] = None) -> bool:
+        """
+        Wait until all of the submitted events are handled or dropped.
+
+        :param timeout: Maximum number of seconds to wait.
+        :return: `False` if the wait timed out.
+        """
+        with self._lock:
+            return self._all_done.wait_for(
+                lambda: self._unfinished == 0,
+                timeout=timeout,
+            )
+
+    def stop(self, wait: bool = False) -> None:
+        """
+        Stop the worker threads once the queued events are handled.
+
+        :param wait: Wait for the worker threads to exit.
+        """
+        with self._lock:
+            self._stopped = True
+            self._not_empty.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
@@ -5963,6 +5963,7 @@ class Action(_AnnotatedEnum[ActionData], path=ACTIONS_CACHE):
     SHARE_POINT_SHAREPOINT_REMOVE_USER: "Action"
     SHELLTOOL_CREATE_SHELL: "Action"
     SHELLTOOL_EXEC_COMMAND: "Action"
+    SHELLTOOL_GET_COMMAND_OUTPUT: "Action"
     SHELLTOOL_SPAWN_PROCESS: "Action"
     SHELLTOOL_TEST_COMMAND: "Action"
     SHOPIFY_ADD_PRODUCT_TO_COLLECTION: "Action"
@@ -7827,6 +7828,8 @@ class Action(_AnnotatedEnum[ActionData], path=ACTIONS_CACHE):
     def TRELLO_TOKEN_GET_MEMBER_BY_TOKEN(cls) -> "Action":
         return cls.TRELLO_GET_TOKENS_MEMBER_BY_TOKEN
 
+    __slots__ = ()
+
     _deprecated: t.Dict = {
         "CLICKUP_ATTACHMENTS_UPLOAD_FILE_TO_TASK_AS_ATTACHMENT": "CLICKUP_CREATE_TASK_ATTACHMENT",
         "CLICKUP_AUTHORIZATION_GET_ACCESS_TOKEN": "CLICKUP_GET_ACCESS_TOKEN",
@@ -10,6 +10,7 @@ import typing_extensions as te  # noqa: F401
 
 from composio.client.enums._action import Action
 from composio.client.enums.base import APPS_CACHE, AppData, _AnnotatedEnum, enum
+from composio.client.enums.index import get_action_index
 
 
 @enum
@@ -276,6 +277,8 @@ class App(_AnnotatedEnum[AppData], path=APPS_CACHE):
     ZOHO_MAIL: "App"
     ZOOM: "App"
 
+    __slots__ = ()
+
     @property
     def is_local(self) -> bool:
         """The tool is local if set to `True`"""
@@ -294,6 +297,12 @@ class App(_AnnotatedEnum[AppData], path=APPS_CACHE):
         :return: Iterator object which yields `Action`
         """
         tags = tags or []
+        index = get_action_index(actions=Action.iter())
+        if index is not None:
+            for slug in index.get_actions(app=self.slug, tags=tags):
+                yield Action(slug, warn=False)
+            return
+
         app = f"{self.slug.lower()}_"
         for action in Action.all():
             if not action.slug.lower().startswith(app):
@@ -302,3 +311,14 @@ class App(_AnnotatedEnum[AppData], path=APPS_CACHE):
                 yield action
             if any((tag in action.tags for tag in tags)):
                 yield action
+
+    def get_tags(self) -> t.List[str]:
+        """
+        Get the tags of the actions of the app.
+
+        :return: List of tags in sorted order
+        """
+        index = get_action_index(actions=Action.iter())
+        if index is not None:
+            return index.get_tags(app=self.slug)
+        return sorted({tag for action in self.get_actions() for tag in action.tags})
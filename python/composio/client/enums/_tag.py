@@ -946,6 +946,8 @@ class Tag(_AnnotatedEnum[TagData], path=TAGS_CACHE):
     ZOOM_TSP: "Tag"
     ZOOM_WEBINARS: "Tag"
 
+    __slots__ = ()
+
     @property
     def app(self) -> str:
         """App name for this tag."""
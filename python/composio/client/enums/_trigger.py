@@ -52,6 +52,8 @@ class Trigger(_AnnotatedEnum[TriggerData], path=TRIGGERS_CACHE):
     ZENDESK_NEW_USER_TRIGGER: "Trigger"
     ZENDESK_NEW_ZENDESK_TICKET_TRIGGER: "Trigger"
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """Name of the trigger."""
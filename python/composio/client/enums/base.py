@@ -4,6 +4,7 @@ Enum helper base.
 
 import difflib
 import os
+import sqlite3
 import typing as t
 import warnings
 from pathlib import Path
@@ -13,9 +14,11 @@ import typing_extensions as te
 from composio.constants import LOCAL_CACHE_DIRECTORY
 from composio.exceptions import ComposioSDKError
 from composio.storage.base import LocalStorage
+from composio.storage.metadata import MetadataStore
 
 
 _model_cache: t.Dict[str, LocalStorage] = {}
+_metadata_stores: t.Dict[Path, MetadataStore] = {}
 _local_actions: t.Dict[str, "ActionData"] = {}
 _runtime_actions: t.Dict[str, "ActionData"] = {}
 
@@ -31,6 +34,33 @@ NO_REMOTE_ENUM_FETCHING = (
     os.environ.get("COMPOSIO_NO_REMOTE_ENUM_FETCHING", "false") == "true"
 )
 
+EAGER_ENUMS = os.environ.get("COMPOSIO_EAGER_ENUMS", "false") == "true"
+"""
+Set `COMPOSIO_EAGER_ENUMS=true` to instantiate all of the enum members at
+import time instead of on the first attribute access.
+"""
+
+
+def get_metadata_store(path: Path) -> MetadataStore:
+    """
+    Get the metadata store for an enum cache.
+
+    Each entity kind is stored in a single file next to its legacy cache
+    directory (eg. `~/.composio/actions.db`), records from the legacy
+    directory are migrated when the store is first opened.
+
+    :param path: Legacy cache directory for the entity kind.
+    :return: Metadata store object.
+    """
+    if path not in _metadata_stores:
+        store = MetadataStore(path=path.with_suffix(".db"))
+        try:
+            store.migrate(directory=path)
+        except (OSError, sqlite3.Error):
+            pass
+        _metadata_stores[path] = store
+    return _metadata_stores[path]
+
 
 class EnumStringNotFound(ComposioSDKError):
     """Raise when user provides invalid enum string."""
@@ -107,23 +137,39 @@ class TriggerData(LocalStorage):
     "Name of the app where this trigger belongs to."
 
 
-class _AnnotatedEnum(t.Generic[EntityType]):
+class _EnumMeta(type):
+    """Metaclass for materializing enum members on the first attribute access."""
+
+    def __getattr__(cls, name: str) -> t.Any:
+        if name == "_deprecated" or name not in cls.__dict__.get("__annotations__", {}):
+            raise AttributeError(
+                f"type object {cls.__name__!r} has no attribute {name!r}"
+            )
+
+        member = cls(name, warn=False)
+        setattr(cls, name, member)
+        return member
+
+    def __dir__(cls) -> t.Iterable[str]:
+        return sorted(
+            set(super().__dir__()) | set(cls.__dict__.get("__annotations__", {}))
+        )
+
+
+class _AnnotatedEnum(t.Generic[EntityType], metaclass=_EnumMeta):
     """Enum class that uses class annotations as values."""
 
+    __slots__ = ("_slug",)
+
     _slug: str
     _path: Path
     _model: t.Type[EntityType]
     _deprecated: t.Dict = {}
 
-    def __new__(cls, value: t.Any, warn: bool = True):
-        (base,) = t.cast(t.Tuple[t.Any], getattr(cls, "__orig_bases__"))
-        (model,) = t.get_args(base)
-        instance = super().__new__(cls)
-        instance._model = model
-        return instance
-
     def __init_subclass__(cls, path: Path) -> None:
         cls._path = path
+        (base,) = t.cast(t.Tuple[t.Any], cls.__dict__["__orig_bases__"])
+        (cls._model,) = t.get_args(base)
         return super().__init_subclass__()
 
     def __init__(
@@ -183,11 +229,9 @@ class _AnnotatedEnum(t.Generic[EntityType]):
             trigger_registry,
         )
         from composio.tools.local import (  # pylint: disable=import-outside-toplevel
-            load_local_tools,
+            get_manifest,
         )
 
-        load_local_tools()
-
         for gid, actions in action_registry.items():
             if self._slug in actions:
                 action = actions[self._slug]
@@ -219,6 +263,35 @@ class _AnnotatedEnum(t.Generic[EntityType]):
                 )
                 return _model_cache[self._slug]  # type: ignore
 
+        manifest = get_manifest()
+        if self._slug in manifest["actions"]:
+            entry = manifest["actions"][self._slug]
+            _model_cache[self._slug] = ActionData(
+                name=entry["name"],
+                app=entry["tool"],
+                tags=entry["tags"],
+                no_auth=entry["no_auth"],
+                is_local=True,
+                path=self._path / self._slug,
+            )
+            return _model_cache[self._slug]  # type: ignore
+
+        if self._slug in manifest["tools"]:
+            _model_cache[self._slug] = AppData(
+                name=manifest["tools"][self._slug]["name"],
+                is_local=True,
+                path=self._path / self._slug,
+            )
+            return _model_cache[self._slug]  # type: ignore
+
+        if self._slug in manifest["triggers"]:
+            _model_cache[self._slug] = TriggerData(
+                name=manifest["triggers"][self._slug]["name"],
+                app=manifest["triggers"][self._slug]["tool"],
+                path=self._path / self._slug,
+            )
+            return _model_cache[self._slug]  # type: ignore
+
         return None
 
     def _cache_from_remote(self) -> EntityType:
@@ -294,8 +367,11 @@ class _AnnotatedEnum(t.Generic[EntityType]):
         data = self._cache_from_local() or self._cache_from_remote()
         _model_cache[self._slug] = data
         try:
-            data.store()
-        except (OSError, PermissionError):
+            get_metadata_store(path=self._path).put(
+                key=self._slug,
+                record=data.model_dump(exclude={"path"}),
+            )
+        except (OSError, sqlite3.Error):
             pass
 
     def load(self) -> EntityType:
@@ -311,11 +387,11 @@ class _AnnotatedEnum(t.Generic[EntityType]):
         if self._slug in _runtime_actions:
             return _runtime_actions[self._slug]  # type: ignore
 
-        if not (self._path / self._slug).exists():
+        record = get_metadata_store(path=self._path).get(key=self._slug)
+        if record is None:
             self._cache()
-
-        if self._slug not in _model_cache:
-            _model_cache[self._slug] = self._model.load(self._path / self._slug)
+        else:
+            _model_cache[self._slug] = self._model.from_json(obj=record)
 
         return t.cast(EntityType, _model_cache[self._slug])
 
@@ -353,7 +429,15 @@ class _AnnotatedEnum(t.Generic[EntityType]):
 
 
 def enum(cls: ClassType) -> ClassType:
-    """Decorate class."""
+    """
+    Decorate class.
+
+    The enum members are materialized lazily on the first attribute access
+    unless `EAGER_ENUMS` is set.
+    """
+    if not EAGER_ENUMS:
+        return cls
+
     for attr in cls.__annotations__:
         if attr == "_deprecated":
             continue
@@ -0,0 +1,552 @@
+"""
+Inverted indexes for looking up actions by app, by tag and by use case.
+"""
+
+import base64
+import bisect
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+import typing as t
+from array import array
+from pathlib import Path
+
+from composio.constants import LOCAL_CACHE_DIRECTORY
+
+
+ACTIONS_INDEX = LOCAL_CACHE_DIRECTORY / "actions.index.json"
+"""Path to the action index, stored next to the enum metadata stores."""
+
+ACTIONS_SEARCH_INDEX = LOCAL_CACHE_DIRECTORY / "actions.search.json"
+"""Path to the use case search index of the actions."""
+
+SEARCH_K1 = 1.2
+"""BM25 term frequency saturation."""
+
+SEARCH_B = 0.75
+"""BM25 document length normalization."""
+
+SEARCH_NAME_WEIGHT = 2
+"""Number of times the terms of an action slug are counted."""
+
+RANK_FUSION_K = 60
+"""Rank offset for merging rankings, damps the weight of the top ranks."""
+
+_INDEX_VERSION = 1
+
+_SEARCH_INDEX_VERSION = 1
+
+_DOUBLED = frozenset("bdgmnprt")
+
+_STOPWORDS = frozenset(
+    (
+        "a an and are as at be by for from how i in into is it me my of on or "
+        "that the this to using via with"
+    ).split()
+)
+
+
+def fingerprint(actions: t.Iterable[str]) -> str:
+    """
+    Fingerprint of the action slugs an index is built for.
+
+    :param actions: Action slugs in sorted order.
+    :return: Hex digest of the slugs.
+    """
+    return hashlib.sha1("\n".join(actions).encode("utf-8")).hexdigest()
+
+
+def _encode(values: t.Iterable[int]) -> str:
+    """Encode integers for the index file."""
+    return base64.b64encode(array("I", values).tobytes()).decode()
+
+
+def _pack(positions: t.Iterable[int]) -> str:
+    """Pack action positions for the index file."""
+    return _encode(sorted(positions))
+
+
+def _unpack(data: str) -> array:
+    """Unpack action positions from the index file."""
+    positions = array("I")
+    positions.frombytes(base64.b64decode(data))
+    return positions
+
+
+def _write(path: Path, data: t.Dict) -> None:
+    """Write an index file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w",
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+        delete=False,
+        encoding="utf-8",
+    ) as fp:
+        json.dump(data, fp, separators=(",", ":"))
+    os.replace(fp.name, path)
+
+
+class ActionIndex:
+    """
+    Index of the action slugs by app and by tag.
+
+    Actions are stored once in sorted order, the apps and the tags map to the
+    positions of their actions packed as arrays which are only decoded when
+    the app or the tag is looked up.
+    """
+
+    def __init__(
+        self,
+        actions: t.List[str],
+        apps: t.Dict[str, str],
+        tags: t.Dict[str, str],
+        app_tags: t.Dict[str, t.List[str]],
+    ) -> None:
+        """
+        Initialize action index.
+
+        :param actions: Action slugs in sorted order.
+        :param apps: Mapping of app slugs to the packed positions of their actions.
+        :param tags: Mapping of tags to the packed positions of their actions.
+        :param app_tags: Mapping of app slugs to the tags of their actions.
+        """
+        self._actions = actions
+        self._apps = apps
+        self._tags = tags
+        self._app_tags = app_tags
+        self._decoded: t.Dict[t.Tuple[str, str], array] = {}
+        self.fingerprint = fingerprint(actions=actions)
+
+    @classmethod
+    def build(
+        cls,
+        actions: t.Iterable[str],
+        apps: t.Iterable[str],
+        tags: t.Callable[[str], t.Iterable[str]],
+    ) -> "ActionIndex":
+        """
+        Build the index.
+
+        An app owns the actions with the app slug as the prefix, the same as
+        `App.get_actions`.
+
+        :param actions: Action slugs.
+        :param apps: App slugs.
+        :param tags: Callable returning the tags of an action.
+        :return: Action index object.
+        """
+        slugs = sorted(set(actions))
+        tag_positions: t.Dict[str, t.List[int]] = {}
+        action_tags = []
+        for position, slug in enumerate(slugs):
+            action_tags.append(list(tags(slug)))
+            for tag in action_tags[-1]:
+                tag_positions.setdefault(tag, []).append(position)
+
+        app_positions = {}
+        app_tags = {}
+        for app in apps:
+            positions = range(*_prefix_range(actions=slugs, app=app))
+            app_positions[app] = _pack(positions)
+            app_tags[app] = sorted(
+                {tag for position in positions for tag in action_tags[position]}
+            )
+
+        return cls(
+            actions=slugs,
+            apps=app_positions,
+            tags={tag: _pack(positions) for tag, positions in tag_positions.items()},
+            app_tags=app_tags,
+        )
+
+    @classmethod
+    def load(cls, path: Path = ACTIONS_INDEX) -> t.Optional["ActionIndex"]:
+        """
+        Load the index from a file.
+
+        :param path: Path to the index file.
+        :return: Action index object or `None` if the file is missing or invalid.
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != _INDEX_VERSION:
+            return None
+        return cls(
+            actions=data["actions"],
+            apps=data["apps"],
+            tags=data["tags"],
+            app_tags=data["app_tags"],
+        )
+
+    def save(self, path: Path = ACTIONS_INDEX) -> None:
+        """
+        Write the index to a file atomically.
+
+        :param path: Path to the index file.
+        """
+        _write(
+            path=path,
+            data={
+                "version": _INDEX_VERSION,
+                "actions": self._actions,
+                "apps": self._apps,
+                "tags": self._tags,
+                "app_tags": self._app_tags,
+            },
+        )
+
+    def _positions(self, kind: str, key: str) -> array:
+        """Decode the positions of the actions of an app or a tag."""
+        if (kind, key) not in self._decoded:
+            packed = self._apps if kind == "app" else self._tags
+            if key in packed:
+                positions = _unpack(packed[key])
+            else:
+                positions = array("I")
+                if kind == "app":
+                    positions.extend(range(*_prefix_range(self._actions, app=key)))
+            self._decoded[kind, key] = positions
+        return self._decoded[kind, key]
+
+    def get_actions(
+        self,
+        app: t.Optional[str] = None,
+        tags: t.Optional[t.Sequence[str]] = None,
+    ) -> t.List[str]:
+        """
+        Get the action slugs for an app and/or the actions with any of the tags.
+
+        :param app: App slug to filter the actions by.
+        :param tags: Tags to filter the actions by.
+        :return: Action slugs in sorted order.
+        """
+        positions: t.Optional[t.Set[int]] = None
+        if tags:
+            positions = set()
+            for tag in tags:
+                positions.update(self._positions(kind="tag", key=tag))
+
+        if app is not None:
+            app_positions = self._positions(kind="app", key=app)
+            if positions is None:
+                return [self._actions[position] for position in app_positions]
+            positions.intersection_update(app_positions)
+
+        return [self._actions[position] for position in sorted(positions or ())]
+
+    def get_tags(self, app: str) -> t.List[str]:
+        """
+        Get the tags of the actions of an app.
+
+        :param app: App slug.
+        :return: Tags in sorted order.
+        """
+        if app in self._app_tags:
+            return list(self._app_tags[app])
+        return []
+
+
+def _prefix_range(actions: t.List[str], app: str) -> t.Tuple[int, int]:
+    """Range of the sorted action slugs with the app slug as the prefix."""
+    prefix = f"{app.upper()}_"
+    start = bisect.bisect_left(actions, prefix)
+    # "`" follows "_" in ASCII, so the range ends before the app slug and "`"
+    end = bisect.bisect_left(actions, f"{app.upper()}`", lo=start)
+    return start, end
+
+
+_index: t.Optional[ActionIndex] = None
+_index_valid: t.Optional[bool] = None
+_index_lock = threading.Lock()
+
+
+def get_action_index(actions: t.Iterable[str]) -> t.Optional[ActionIndex]:
+    """
+    Get the action index if it is built for the given actions.
+
+    :param actions: Action slugs in sorted order, an index built for a
+        different set of actions is stale and is not used. The actions are
+        only compared the first time the index is loaded.
+    :return: Action index object or `None` if there is no valid index.
+    """
+    global _index, _index_valid  # pylint: disable=global-statement
+    with _index_lock:
+        if _index_valid is None:
+            _index = ActionIndex.load()
+            _index_valid = _index is not None and _index.fingerprint == fingerprint(
+                actions=actions
+            )
+        return _index if _index_valid else None
+
+
+def set_action_index(index: ActionIndex, actions: t.Iterable[str]) -> None:
+    """
+    Save the action index and use it for the lookups in this process.
+
+    :param index: Action index object.
+    :param actions: Action slugs of the enum in this process, in sorted order.
+    """
+    global _index, _index_valid  # pylint: disable=global-statement
+    index.save()
+    with _index_lock:
+        _index = index
+        _index_valid = index.fingerprint == fingerprint(actions=actions)
+
+
+def _stem(word: str) -> str:
+    """Strip the common inflections from a word."""
+    for suffix, replacement, minimum in (
+        ("ies", "y", 5),
+        ("sses", "ss", 5),
+        ("ches", "ch", 5),
+        ("shes", "sh", 5),
+        ("xes", "x", 4),
+        ("ing", "", 7),
+        ("ed", "", 5),
+        ("s", "", 4),
+    ):
+        if len(word) >= minimum and word.endswith(suffix):
+            if suffix == "s" and word.endswith(("ss", "us")):
+                break
+            word = word[: -len(suffix)] + replacement
+            if (
+                suffix in ("ing", "ed")
+                and word[-1] == word[-2]
+                and word[-1] in _DOUBLED
+            ):
+                word = word[:-1]
+            break
+    if len(word) > 4 and word.endswith("e"):
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: str) -> t.List[str]:
+    """
+    Split text into search terms.
+
+    Words are split on case changes and on non-alphanumeric characters, so
+    `SEND_EMAIL`, `sendEmail` and `send email` give the same terms.
+
+    :param text: Text to split.
+    :return: Lower cased and stemmed words without the stopwords.
+    """
+    text = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", text)
+    return [
+        _stem(word)
+        for word in re.findall(r"[a-z0-9]+", text.lower())
+        if word not in _STOPWORDS
+    ]
+
+
+class SearchIndex:
+    """
+    BM25 index of the actions by the words describing them.
+
+    Actions are stored once in sorted order, the terms map to the positions of
+    the actions they occur in and the term frequencies, packed as arrays which
+    are only decoded when the term is searched for.
+    """
+
+    def __init__(
+        self,
+        actions: t.List[str],
+        lengths: str,
+        terms: t.Dict[str, str],
+    ) -> None:
+        """
+        Initialize search index.
+
+        :param actions: Action slugs in sorted order.
+        :param lengths: Packed number of terms of every action.
+        :param terms: Mapping of terms to the packed pairs of the action
+            position and the term frequency.
+        """
+        self._actions = actions
+        self._lengths = _unpack(lengths)
+        self._average = (sum(self._lengths) / len(self._lengths)) or 1.0
+        self._terms = terms
+        self._decoded: t.Dict[str, t.Tuple[array, float]] = {}
+        self.fingerprint = fingerprint(actions=actions)
+
+    @classmethod
+    def build(cls, documents: t.Mapping[str, str]) -> "SearchIndex":
+        """
+        Build the index.
+
+        The terms of the action slug are counted `SEARCH_NAME_WEIGHT` times in
+        addition to the text, so a match on the name ranks above a match in the
+        description.
+
+        :param documents: Mapping of action slugs to the text describing them,
+            usually the display name, the description and the parameter names.
+        :return: Search index object.
+        """
+        slugs = sorted(documents)
+        lengths = []
+        postings: t.Dict[str, t.List[int]] = {}
+        for position, slug in enumerate(slugs):
+            words = tokenize(slug) * SEARCH_NAME_WEIGHT + tokenize(documents[slug])
+            lengths.append(len(words))
+            frequencies: t.Dict[str, int] = {}
+            for word in words:
+                frequencies[word] = frequencies.get(word, 0) + 1
+            for word, frequency in frequencies.items():
+                postings.setdefault(word, []).extend((position, frequency))
+
+        return cls(
+            actions=slugs,
+            lengths=_encode(lengths),
+            terms={term: _encode(pairs) for term, pairs in postings.items()},
+        )
+
+    @classmethod
+    def load(cls, path: Path = ACTIONS_SEARCH_INDEX) -> t.Optional["SearchIndex"]:
+        """
+        Load the index from a file.
+
+        :param path: Path to the index file.
+        :return: Search index object or `None` if the file is missing or invalid.
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != _SEARCH_INDEX_VERSION:
+            return None
+        return cls(
+            actions=data["actions"],
+            lengths=data["lengths"],
+            terms=data["terms"],
+        )
+
+    def save(self, path: Path = ACTIONS_SEARCH_INDEX) -> None:
+        """
+        Write the index to a file atomically.
+
+        :param path: Path to the index file.
+        """
+        _write(
+            path=path,
+            data={
+                "version": _SEARCH_INDEX_VERSION,
+                "actions": self._actions,
+                "lengths": base64.b64encode(self._lengths.tobytes()).decode(),
+                "terms": self._terms,
+            },
+        )
+
+    def _postings(self, term: str) -> t.Tuple[array, float]:
+        """Decode the postings of a term along with its inverse document frequency."""
+        if term not in self._decoded:
+            postings = _unpack(self._terms[term]) if term in self._terms else array("I")
+            frequency = len(postings) // 2
+            self._decoded[term] = (
+                postings,
+                math.log(
+                    1 + (len(self._actions) - frequency + 0.5) / (frequency + 0.5)
+                ),
+            )
+        return self._decoded[term]
+
+    def search(
+        self,
+        query: str,
+        apps: t.Optional[t.Sequence[str]] = None,
+        limit: t.Optional[int] = None,
+    ) -> t.List[t.Tuple[str, float]]:
+        """
+        Rank the actions by the relevance to the query.
+
+        :param query: Use case to search for.
+        :param apps: App slugs to limit the search to.
+        :param limit: Maximum number of actions to return.
+        :return: Pairs of the action slug and the score of the matching
+            actions, the most relevant first.
+        """
+        ranges = None
+        if apps:
+            ranges = [_prefix_range(actions=self._actions, app=app) for app in apps]
+
+        scores: t.Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings, idf = self._postings(term)
+            for i in range(0, len(postings), 2):
+                position, frequency = postings[i], postings[i + 1]
+                if ranges is not None and not any(
+                    start <= position < end for start, end in ranges
+                ):
+                    continue
+                norm = SEARCH_K1 * (
+                    1 - SEARCH_B + SEARCH_B * self._lengths[position] / self._average
+                )
+                scores[position] = scores.get(position, 0.0) + idf * (
+                    frequency * (SEARCH_K1 + 1) / (frequency + norm)
+                )
+
+        ranked = sorted(
+            scores.items(), key=lambda item: (-item[1], self._actions[item[0]])
+        )
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self._actions[position], score) for position, score in ranked]
+
+
+def blend_rankings(*rankings: t.Sequence[str]) -> t.List[str]:
+    """
+    Merge rankings using reciprocal rank fusion.
+
+    :param rankings: Action slugs ranked by different searches.
+    :return: Action slugs ranked by the sum of the reciprocal ranks.
+    """
+    scores: t.Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, slug in enumerate(ranking, start=1):
+            scores[slug] = scores.get(slug, 0.0) + 1 / (RANK_FUSION_K + rank)
+    return sorted(scores, key=lambda slug: (-scores[slug], slug))
+
+
+_search_index: t.Optional[SearchIndex] = None
+_search_index_valid: t.Optional[bool] = None
+
+
+def get_search_index(actions: t.Iterable[str]) -> t.Optional[SearchIndex]:
+    """
+    Get the search index if it is built for the given actions.
+
+    :param actions: Action slugs in sorted order, an index built for a
+        different set of actions is stale and is not used. The actions are
+        only compared the first time the index is loaded.
+    :return: Search index object or `None` if there is no valid index.
+    """
+    global _search_index, _search_index_valid  # pylint: disable=global-statement
+    with _index_lock:
+        if _search_index_valid is None:
+            _search_index = SearchIndex.load()
+            _search_index_valid = (
+                _search_index is not None
+                and _search_index.fingerprint == fingerprint(actions=actions)
+            )
+        return _search_index if _search_index_valid else None
+
+
+def set_search_index(index: SearchIndex, actions: t.Iterable[str]) -> None:
+    """
+    Save the search index and use it for the searches in this process.
+
+    :param index: Search index object.
+    :param actions: Action slugs of the enum in this process, in sorted order.
+    """
+    global _search_index, _search_index_valid  # pylint: disable=global-statement
+    index.save()
+    with _index_lock:
+        _search_index = index
+        _search_index_valid = index.fingerprint == fingerprint(actions=actions)
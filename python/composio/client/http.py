@@ -2,18 +2,44 @@
 Http client implementation for Composio SDK
 """
 
+import asyncio
+import json
+import time
 import typing as t
 
-from requests import ReadTimeout
+import aiohttp
+from requests import ConnectTimeout
+from requests import ConnectionError as RequestsConnectionError
+from requests import RequestException, Response
 from requests import Session as SyncSession
+from requests import Timeout
+from urllib3.exceptions import NewConnectionError
 
 from composio.__version__ import __version__
+from composio.client.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HttpMetrics,
+    RetryPolicy,
+    endpoint_key,
+)
 from composio.utils import logging
 
 
 DEFAULT_RUNTIME = "composio"
 SOURCE_HEADER = "python_sdk"
 DEFAULT_REQUEST_TIMEOUT = 60.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 20
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+
+
+def _is_connect_error(error: Exception) -> bool:
+    """Check if a transport error occurred before the request was sent."""
+    if isinstance(error, (ConnectTimeout, aiohttp.ClientConnectorError)):
+        return True
+    reason = getattr(error.args[0], "reason", None) if len(error.args) > 0 else None
+    return isinstance(reason, NewConnectionError)
 
 
 class HttpClient(SyncSession, logging.WithLogger):
@@ -25,6 +51,9 @@ class HttpClient(SyncSession, logging.WithLogger):
         api_key: str,
         runtime: t.Optional[str] = None,
         timeout: t.Optional[float] = None,
+        retry_policy: t.Optional[RetryPolicy] = None,
+        circuit_breaker: t.Optional[CircuitBreaker] = None,
+        metrics: t.Optional[HttpMetrics] = None,
     ) -> None:
         """
         Initialize client channel for Composio API
@@ -33,6 +62,9 @@ class HttpClient(SyncSession, logging.WithLogger):
         :param api_key: API key for Composio API
         :param runtime: Runtime specifier
         :param timeout: Request timeout
+        :param retry_policy: Policy for retrying failed requests
+        :param circuit_breaker: Circuit breaker for the API endpoints
+        :param metrics: Collector for the request metrics
         """
         SyncSession.__init__(self)
         logging.WithLogger.__init__(self)
@@ -46,30 +78,333 @@ class HttpClient(SyncSession, logging.WithLogger):
             }
         )
         self.timeout = timeout or DEFAULT_REQUEST_TIMEOUT
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.metrics = metrics or HttpMetrics()
+
+    def request(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> Response:
+        """
+        Perform HTTP request, `url` is relative to the base URL.
+
+        Failed requests are retried according to the retry policy, requests
+        to endpoints with an open circuit are rejected with `CircuitOpenError`.
+        """
+        method = method.upper()
+        endpoint = endpoint_key(url=url, base_url=self.base_url)
+        self._logger.debug(f"{method} {self.base_url}{url} - {kwargs}")
+        kwargs.setdefault("timeout", self.timeout)
+        try:
+            trial = self.circuit_breaker.before_request(endpoint=endpoint)
+        except CircuitOpenError:
+            self.metrics.reject()
+            raise
+
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                start = time.monotonic()
+                try:
+                    response = SyncSession.request(
+                        self, method, f"{self.base_url}{url}", *args, **kwargs
+                    )
+                except (Timeout, RequestsConnectionError) as e:
+                    self.metrics.observe(
+                        endpoint=endpoint, latency=time.monotonic() - start
+                    )
+                    if attempt <= self.retry_policy.max_retries and (
+                        self.retry_policy.should_retry_error(
+                            method=method,
+                            connect=_is_connect_error(error=e),
+                        )
+                    ):
+                        self._logger.debug(f"Retrying {method} {url} after error: {e}")
+                        self.metrics.retry()
+                        time.sleep(self.retry_policy.backoff(attempt=attempt))
+                        continue
+
+                    self.circuit_breaker.record_failure(endpoint=endpoint)
+                    self.metrics.failure()
+                    if isinstance(e, Timeout):
+                        raise TimeoutError(
+                            "Timed out while waiting for request to complete"
+                        ) from e
+                    raise
+                except RequestException:
+                    self.metrics.observe(
+                        endpoint=endpoint, latency=time.monotonic() - start
+                    )
+                    self.circuit_breaker.record_failure(endpoint=endpoint)
+                    self.metrics.failure()
+                    raise
+
+                self.metrics.observe(
+                    endpoint=endpoint, latency=time.monotonic() - start
+                )
+                if attempt <= self.retry_policy.max_retries and (
+                    self.retry_policy.should_retry_status(
+                        method=method,
+                        status_code=response.status_code,
+                    )
+                ):
+                    self._logger.debug(
+                        f"Retrying {method} {url} after HTTP {response.status_code}"
+                    )
+                    self.metrics.retry()
+                    delay = self.retry_policy.backoff(
+                        attempt=attempt,
+                        retry_after=response.headers.get("Retry-After"),
+                    )
+                    response.close()
+                    time.sleep(delay)
+                    continue
+
+                if response.status_code >= 500:
+                    self.circuit_breaker.record_failure(endpoint=endpoint)
+                    self.metrics.failure()
+                else:
+                    self.circuit_breaker.record_success(endpoint=endpoint)
+                return response
+        finally:
+            if trial:
+                # Allows a new trial if this one was interrupted, a no-op
+                # once the outcome is recorded
+                self.circuit_breaker.release(endpoint=endpoint)
+
+
+class AsyncResponse:
+    """Buffered HTTP response returned by `AsyncHttpClient`."""
+
+    def __init__(
+        self,
+        status_code: int,
+        content: bytes,
+        headers: t.Mapping[str, str],
+    ) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(encoding="utf-8")
+
+    def json(self) -> t.Any:
+        return json.loads(self.content)
+
+
+class AsyncHttpClient(logging.WithLogger):
+    """
+    Async HTTP client for Composio.
+
+    Connections are pooled and kept alive between requests, the pool is bound
+    to the event loop it was first used on and gets recreated if the client is
+    used from a different loop.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        runtime: t.Optional[str] = None,
+        timeout: t.Optional[float] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        retry_policy: t.Optional[RetryPolicy] = None,
+        circuit_breaker: t.Optional[CircuitBreaker] = None,
+        metrics: t.Optional[HttpMetrics] = None,
+    ) -> None:
+        """
+        Initialize async client channel for Composio API
+
+        :param base_url: Base URL for Composio API
+        :param api_key: API key for Composio API
+        :param runtime: Runtime specifier
+        :param timeout: Request timeout
+        :param max_connections: Maximum number of open connections
+        :param max_connections_per_host: Maximum number of open connections
+            to a single host
+        :param keepalive_timeout: Number of seconds to keep an idle connection
+            open for reuse
+        :param retry_policy: Policy for retrying failed requests
+        :param circuit_breaker: Circuit breaker for the API endpoints
+        :param metrics: Collector for the request metrics
+        """
+        logging.WithLogger.__init__(self)
+        self.base_url = base_url
+        self.headers = {
+            "x-api-key": api_key,
+            "x-source": SOURCE_HEADER,
+            "x-runtime": runtime or DEFAULT_RUNTIME,
+            "x-composio-version": __version__,
+        }
+        self.timeout = timeout or DEFAULT_REQUEST_TIMEOUT
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.metrics = metrics or HttpMetrics()
+        self._session: t.Optional[aiohttp.ClientSession] = None
+        self._loop: t.Optional[asyncio.AbstractEventLoop] = None
+        self._closing: t.Set[asyncio.Task] = set()
+
+    def _release_session(self) -> None:
+        """Release the connection pool bound to a previous event loop."""
+        session, loop = self._session, self._loop
+        self._session = None
+        self._loop = None
+        if session is None or session.closed:
+            return
 
-    def _wrap(self, method: t.Callable) -> t.Callable:
-        """Wrap http request."""
+        if loop is not None and loop.is_running():
+            # The loop is running on another thread
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
 
-        def request(url: str, **kwargs: t.Any) -> t.Any:
-            """Perform HTTP request."""
-            self._logger.debug(
-                f"{method.__name__.upper()} {self.base_url}{url} - {kwargs}"
+        if loop is not None and not loop.is_closed():
+            # The loop is stopped, the session is closed if it runs again
+            loop.create_task(session.close())
+            return
+
+        # The connections of a closed loop are gone, so closing the session
+        # on the running loop only releases the connector
+        task = asyncio.get_running_loop().create_task(session.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get connection pool for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._release_session()
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_connections_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                ),
             )
-            retries = 0
-            while retries < 3:
+            self._loop = loop
+        return self._session
+
+    async def request(self, method: str, url: str, **kwargs: t.Any) -> AsyncResponse:
+        """Perform HTTP request, retried in the same way as `HttpClient`."""
+        method = method.upper()
+        endpoint = endpoint_key(url=url, base_url=self.base_url)
+        self._logger.debug(f"{method} {self.base_url}{url} - {kwargs}")
+        session = self._get_session()
+        try:
+            trial = self.circuit_breaker.before_request(endpoint=endpoint)
+        except CircuitOpenError:
+            self.metrics.reject()
+            raise
+
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                start = time.monotonic()
                 try:
-                    return method(
+                    async with session.request(
+                        method=method,
                         url=f"{self.base_url}{url}",
-                        timeout=self.timeout,
                         **kwargs,
+                    ) as _response:
+                        response = AsyncResponse(
+                            status_code=_response.status,
+                            content=await _response.read(),
+                            headers=_response.headers,
+                        )
+                except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                    self.metrics.observe(
+                        endpoint=endpoint, latency=time.monotonic() - start
+                    )
+                    if attempt <= self.retry_policy.max_retries and (
+                        self.retry_policy.should_retry_error(
+                            method=method,
+                            connect=_is_connect_error(error=e),
+                        )
+                    ):
+                        self._logger.debug(f"Retrying {method} {url} after error: {e}")
+                        self.metrics.retry()
+                        await asyncio.sleep(self.retry_policy.backoff(attempt=attempt))
+                        continue
+
+                    self.circuit_breaker.record_failure(endpoint=endpoint)
+                    self.metrics.failure()
+                    if isinstance(e, asyncio.TimeoutError):
+                        raise TimeoutError(
+                            "Timed out while waiting for request to complete"
+                        ) from e
+                    raise
+
+                self.metrics.observe(
+                    endpoint=endpoint, latency=time.monotonic() - start
+                )
+                if attempt <= self.retry_policy.max_retries and (
+                    self.retry_policy.should_retry_status(
+                        method=method,
+                        status_code=response.status_code,
+                    )
+                ):
+                    self._logger.debug(
+                        f"Retrying {method} {url} after HTTP {response.status_code}"
                     )
-                except ReadTimeout:
-                    retries += 1
-            raise TimeoutError("Timed out while waiting for request to complete")
+                    self.metrics.retry()
+                    await asyncio.sleep(
+                        self.retry_policy.backoff(
+                            attempt=attempt,
+                            retry_after=response.headers.get("Retry-After"),
+                        )
+                    )
+                    continue
+
+                if response.status_code >= 500:
+                    self.circuit_breaker.record_failure(endpoint=endpoint)
+                    self.metrics.failure()
+                else:
+                    self.circuit_breaker.record_success(endpoint=endpoint)
+                return response
+        finally:
+            if trial:
+                # Allows a new trial if this one was interrupted, a no-op
+                # once the outcome is recorded
+                self.circuit_breaker.release(endpoint=endpoint)
+
+    async def get(self, url: str, **kwargs: t.Any) -> AsyncResponse:
+        return await self.request("get", url=url, **kwargs)
+
+    async def post(self, url: str, **kwargs: t.Any) -> AsyncResponse:
+        return await self.request("post", url=url, **kwargs)
+
+    async def put(self, url: str, **kwargs: t.Any) -> AsyncResponse:
+        return await self.request("put", url=url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: t.Any) -> AsyncResponse:
+        return await self.request("delete", url=url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: t.Any) -> AsyncResponse:
+        return await self.request("patch", url=url, **kwargs)
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
 
-        return request
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
 
-    def __getattribute__(self, name: str) -> t.Any:
-        if name in ("get", "post", "put", "delete", "patch"):
-            return self._wrap(super().__getattribute__(name))
-        return super().__getattribute__(name)
+    async def __aexit__(self, *args: t.Any) -> None:
+        await self.close()
@@ -0,0 +1,278 @@
+"""
+Retry policy, circuit breaker and metrics for the HTTP clients.
+"""
+
+import bisect
+import random
+import threading
+import time
+import typing as t
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from composio.client.exceptions import ComposioClientError
+
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+"""HTTP methods which can be retried safely after a request reached the server."""
+
+RETRY_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+"""Response status codes which are retried for idempotent methods."""
+
+RETRY_NON_IDEMPOTENT_STATUS_CODES = frozenset((429, 503))
+"""Response status codes which mean the request was not processed and can be
+retried for any method."""
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+"""Upper bounds (in seconds) for the request latency histogram buckets."""
+
+
+class CircuitOpenError(ComposioClientError):
+    """
+    Exception class for requests rejected because the circuit for the
+    endpoint is open.
+    """
+
+    def __init__(self, endpoint: str, retry_in: float) -> None:
+        super().__init__(
+            f"Circuit for `{endpoint}` is open after repeated failures, "
+            f"retry in {retry_in:.1f}s"
+        )
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+class RetryPolicy:
+    """
+    Retry policy with exponential backoff and full jitter.
+
+    Failed requests are retried if the method is idempotent, or if the
+    failure guarantees the request was not processed by the server (eg.
+    connection errors or `429 Too Many Requests`).
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_status_codes: t.Collection[int] = RETRY_STATUS_CODES,
+        idempotent_methods: t.Collection[str] = IDEMPOTENT_METHODS,
+    ) -> None:
+        """
+        Initialize retry policy.
+
+        :param max_retries: Maximum number of retries for a request
+        :param backoff_factor: Base delay for the exponential backoff in seconds
+        :param max_backoff: Maximum delay between two attempts in seconds
+        :param jitter: Set `False` to disable randomising the delays
+        :param retry_status_codes: Response status codes to retry
+        :param idempotent_methods: HTTP methods which are safe to retry
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.idempotent_methods = frozenset(m.upper() for m in idempotent_methods)
+
+    def should_retry_status(self, method: str, status_code: int) -> bool:
+        """Check if a request should be retried for the response status code."""
+        if status_code not in self.retry_status_codes:
+            return False
+        return (
+            method.upper() in self.idempotent_methods
+            or status_code in RETRY_NON_IDEMPOTENT_STATUS_CODES
+        )
+
+    def should_retry_error(self, method: str, connect: bool) -> bool:
+        """
+        Check if a request should be retried after a transport error.
+
+        :param method: HTTP method
+        :param connect: Set `True` if the error occurred before the request
+            was sent, eg. while establishing the connection.
+        """
+        return connect or method.upper() in self.idempotent_methods
+
+    def backoff(self, attempt: int, retry_after: t.Optional[str] = None) -> float:
+        """
+        Get the delay before the next attempt.
+
+        :param attempt: Number of attempts made so far, starting from 1
+        :param retry_after: Value of the `Retry-After` response header
+        :return: Delay in seconds
+        """
+        delay = parse_retry_after(retry_after)
+        if delay is not None:
+            return min(delay, self.max_backoff)
+
+        delay = min(self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+def parse_retry_after(value: t.Optional[str]) -> t.Optional[float]:
+    """Parse `Retry-After` header value, either delay seconds or an HTTP date."""
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def endpoint_key(url: str, base_url: str = "") -> str:
+    """
+    Get the circuit breaker key for a request URL.
+
+    The key is the path relative to the base URL without the query, so every
+    resource has its own circuit, eg. `/v2/actions/GITHUB_STAR_A_REPO/execute`.
+
+    :param url: Request URL, absolute or relative to the base URL
+    :param base_url: Base URL of the API, eg. `https://backend.composio.dev/api`
+    """
+    if base_url != "" and url.startswith(base_url):
+        url = url[len(base_url) :]
+    path = urlsplit(url).path
+    base_path = urlsplit(base_url).path.rstrip("/")
+    if base_path != "" and path.startswith(base_path + "/"):
+        path = path[len(base_path) :]
+    return "/" + path.strip("/")
+
+
+class CircuitBreaker:
+    """
+    Per endpoint circuit breaker.
+
+    The circuit for an endpoint opens after `failure_threshold` consecutive
+    failures and rejects requests for `reset_timeout` seconds. After that a
+    single trial request is allowed through, which closes the circuit on
+    success or opens it again on failure.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize circuit breaker.
+
+        :param failure_threshold: Number of consecutive failures to open a circuit
+        :param reset_timeout: Number of seconds to keep a circuit open
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures: t.Dict[str, int] = {}
+        self._opened_at: t.Dict[str, float] = {}
+        self._trial: t.Set[str] = set()
+
+    def before_request(self, endpoint: str) -> bool:
+        """
+        Check if a request to the endpoint is allowed.
+
+        :return: `True` if the request is the trial request for the endpoint,
+            which has to be followed by `record_success`, `record_failure` or
+            `release`.
+        :raises CircuitOpenError: If the circuit for the endpoint is open.
+        """
+        with self._lock:
+            opened_at = self._opened_at.get(endpoint)
+            if opened_at is None:
+                return False
+
+            retry_in = opened_at + self.reset_timeout - time.monotonic()
+            if retry_in > 0 or endpoint in self._trial:
+                raise CircuitOpenError(endpoint=endpoint, retry_in=max(retry_in, 0.0))
+            self._trial.add(endpoint)
+            return True
+
+    def release(self, endpoint: str) -> None:
+        """Allow a new trial request if the trial was interrupted."""
+        with self._lock:
+            self._trial.discard(endpoint)
+
+    def record_success(self, endpoint: str) -> None:
+        with self._lock:
+            self._failures.pop(endpoint, None)
+            self._opened_at.pop(endpoint, None)
+            self._trial.discard(endpoint)
+
+    def record_failure(self, endpoint: str) -> None:
+        with self._lock:
+            failures = self._failures.get(endpoint, 0) + 1
+            self._failures[endpoint] = failures
+            if endpoint in self._trial or failures >= self.failure_threshold:
+                self._opened_at[endpoint] = time.monotonic()
+            self._trial.discard(endpoint)
+
+    def open_circuits(self) -> t.List[str]:
+        """List of endpoints with an open circuit."""
+        with self._lock:
+            return sorted(self._opened_at)
+
+
+class HttpMetrics:
+    """Request metrics for the HTTP clients."""
+
+    def __init__(self, buckets: t.Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.rejected = 0
+        self._latency: t.Dict[str, t.List[int]] = {}
+
+    def observe(self, endpoint: str, latency: float) -> None:
+        """Record the latency of a request attempt."""
+        with self._lock:
+            self.requests += 1
+            histogram = self._latency.setdefault(
+                endpoint, [0] * (len(self.buckets) + 1)
+            )
+            histogram[bisect.bisect_left(self.buckets, latency)] += 1
+
+    def retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+
+    def reject(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    def latency(self, endpoint: str) -> t.Dict[str, int]:
+        """Latency histogram for an endpoint, keyed by the bucket upper bound."""
+        with self._lock:
+            histogram = self._latency.get(endpoint, [0] * (len(self.buckets) + 1))
+            return {
+                **{str(bound): count for bound, count in zip(self.buckets, histogram)},
+                "+Inf": histogram[-1],
+            }
+
+    def snapshot(self) -> t.Dict[str, t.Any]:
+        """Current values of the metrics."""
+        with self._lock:
+            endpoints = list(self._latency)
+            data: t.Dict[str, t.Any] = {
+                "requests": self.requests,
+                "retries": self.retries,
+                "failures": self.failures,
+                "rejected": self.rejected,
+            }
+        data["latency"] = {endpoint: self.latency(endpoint) for endpoint in endpoints}
+        return data
@@ -18,6 +18,7 @@ from pathlib import Path
 
 import typing_extensions as te
 from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
 
@@ -25,9 +26,8 @@ from composio import Action, App
 from composio.cli.context import get_context
 from composio.client.collections import ActionModel, AppModel
 from composio.client.enums.base import get_runtime_actions
-from composio.tools.base.abs import action_registry
 from composio.tools.env.base import ENV_ACCESS_TOKEN
-from composio.tools.local import load_local_tools
+from composio.tools.local import get_manifest, load_local_tools
 from composio.utils.logging import get as get_logger
 
 
@@ -116,6 +116,8 @@ def create_app() -> FastAPI:
     access_token = os.environ.get(ENV_ACCESS_TOKEN)
     tooldir = tempfile.TemporaryDirectory()
     app = FastAPI(on_shutdown=[tooldir.cleanup])
+    # Responses are only compressed for the clients accepting gzip encoding
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
     sys.path.append(tooldir.name)
     logger = get_logger()
 
@@ -203,7 +205,7 @@ def create_app() -> FastAPI:
     def _get_local_actions() -> t.List[ActionModel]:
         """Get list of all available actions."""
         return get_context().toolset.get_action_schemas(
-            actions=list(action_registry["local"])
+            actions=list(get_manifest()["actions"])
         )
 
     @app.get("/api/enums/actions", response_model=APIResponse[t.List[str]])
@@ -3,3 +3,4 @@ Composio user account storage helpers.
 """
 
 from .base import LocalStorage
+from .metadata import MetadataStore
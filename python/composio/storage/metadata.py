@@ -0,0 +1,203 @@
+"""
+Single file metadata store.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import typing as t
+from pathlib import Path
+
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS records (key TEXT PRIMARY KEY, data TEXT NOT NULL) WITHOUT ROWID"
+
+_MMAP_SIZE = 64 * 1024 * 1024
+"""Maximum number of bytes of the store file to memory map."""
+
+
+class MetadataStore:
+    """
+    Key-value store for JSON records, backed by a single SQLite file.
+
+    Lookups go through the primary key index and only decode the requested
+    record, so they do not require reading or parsing the whole file. Bulk
+    updates are written to a temporary file which is swapped in place
+    atomically, so readers never observe a partially written store.
+
+    Example:
+    ```python
+        store = MetadataStore(path=Path("actions.db"))
+        store.write({"GITHUB_STAR_REPO": {"name": "GITHUB_STAR_REPO"}})
+        print (store.get("GITHUB_STAR_REPO"))
+    ```
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize metadata store.
+
+        :param path: Path to the store file.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection: t.Optional[sqlite3.Connection] = None
+
+    def _connect(self, create: bool = False) -> t.Optional[sqlite3.Connection]:
+        """Open the store file, returns `None` if it does not exist."""
+        if self._connection is not None:
+            return self._connection
+
+        if not self.path.exists():
+            if not create:
+                return None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(
+            str(self.path),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        connection.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+        if create:
+            connection.execute(_SCHEMA)
+        self._connection = connection
+        return connection
+
+    def close(self) -> None:
+        """Close the store file."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def exists(self) -> bool:
+        """Check if the store file exists."""
+        return self.path.exists()
+
+    def get(self, key: str) -> t.Optional[t.Dict]:
+        """
+        Get record.
+
+        :param key: Record key
+        :return: Record or `None` if the record does not exist.
+        """
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return None
+            try:
+                row = connection.execute(
+                    "SELECT data FROM records WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.DatabaseError:
+                return None
+
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return False
+            try:
+                row = connection.execute(
+                    "SELECT 1 FROM records WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.DatabaseError:
+                return False
+        return row is not None
+
+    def keys(self) -> t.List[str]:
+        """List of record keys in sorted order."""
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return []
+            try:
+                rows = connection.execute(
+                    "SELECT key FROM records ORDER BY key"
+                ).fetchall()
+            except sqlite3.DatabaseError:
+                return []
+        return [key for (key,) in rows]
+
+    def put(self, key: str, record: t.Dict) -> None:
+        """
+        Insert or replace a single record.
+
+        :param key: Record key
+        :param record: JSON serialisable record
+        """
+        with self._lock:
+            connection = t.cast(sqlite3.Connection, self._connect(create=True))
+            connection.execute(
+                "INSERT OR REPLACE INTO records (key, data) VALUES (?, ?)",
+                (key, json.dumps(record, separators=(",", ":"))),
+            )
+
+    def write(self, records: t.Dict[str, t.Dict]) -> None:
+        """
+        Replace the contents of the store with `records` atomically.
+
+        :param records: Mapping of record keys to JSON serialisable records
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(
+            dir=self.path.parent,
+            prefix=f".{self.path.name}.",
+            suffix=".tmp",
+        )
+        os.close(fd)
+        try:
+            connection = sqlite3.connect(tmp)
+            with connection:
+                connection.execute(_SCHEMA)
+                connection.executemany(
+                    "INSERT OR REPLACE INTO records (key, data) VALUES (?, ?)",
+                    (
+                        (key, json.dumps(record, separators=(",", ":")))
+                        for key, record in sorted(records.items())
+                    ),
+                )
+            connection.close()
+            with self._lock:
+                if self._connection is not None:
+                    self._connection.close()
+                    self._connection = None
+                os.replace(tmp, self.path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def migrate(self, directory: Path) -> bool:
+        """
+        Migrate records from the legacy layout of one JSON file per record.
+
+        The migration only runs if the store does not exist yet, the legacy
+        directory is left as is.
+
+        :param directory: Legacy cache directory
+        :return: `True` if the records were migrated.
+        """
+        if self.exists() or not directory.is_dir():
+            return False
+
+        records = {}
+        for file in directory.iterdir():
+            if not file.is_file():
+                continue
+            try:
+                records[file.name] = json.loads(file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+
+        if len(records) == 0:
+            return False
+
+        self.write(records=records)
+        return True
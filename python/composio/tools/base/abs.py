@@ -1,5 +1,6 @@
 """Base abstractions."""
 
+import functools
 import hashlib
 import inspect
 import json
@@ -27,8 +28,42 @@ ToolRegistry = t.Dict[GroupID, t.Dict[str, "Tool"]]
 ActionsRegistry = t.Dict[GroupID, t.Dict[str, "Action"]]
 TriggersRegistry = t.Dict[GroupID, t.Dict[str, t.Any]]
 
-tool_registry: ToolRegistry = {"runtime": {}, "local": {}, "api": {}}
-action_registry: ActionsRegistry = {"runtime": {}, "local": {}, "api": {}}
+
+class _LocalRegistry(t.Dict[str, t.Any]):
+    """
+    Registry for the local tools which imports the module defining a tool or
+    an action when it's looked up for the first time.
+    """
+
+    def __init__(self, kind: t.Literal["tools", "actions"]) -> None:
+        super().__init__()
+        self.kind = kind
+
+    def __missing__(self, key: str) -> t.Any:
+        from composio.tools.local import (  # pylint: disable=import-outside-toplevel
+            manifest,
+        )
+
+        loaded = (
+            manifest.load_tool_module(app=key)
+            if self.kind == "tools"
+            else manifest.load_action_module(action=key)
+        )
+        if not loaded or not super().__contains__(key):
+            raise KeyError(key)
+        return super().__getitem__(key)
+
+
+tool_registry: ToolRegistry = {
+    "runtime": {},
+    "local": _LocalRegistry(kind="tools"),
+    "api": {},
+}
+action_registry: ActionsRegistry = {
+    "runtime": {},
+    "local": _LocalRegistry(kind="actions"),
+    "api": {},
+}
 trigger_registry: TriggersRegistry = {"runtime": {}, "local": {}, "api": {}}
 
 DEPRECATED_MARKER = "<<DEPRECATED use "
@@ -65,6 +100,33 @@ class InvalidClassDefinition(ComposioSDKError):
     """Raise when a class is not defined properly."""
 
 
+class FileModel(BaseModel):
+    name: str = Field(
+        ...,
+        description="File name, contains extension to indetify the file type",
+    )
+    content: bytes = Field(
+        ...,
+        description="File content in base64",
+    )
+
+
+class FieldDescriptor(t.NamedTuple):
+    """Request field metadata used for pre-processing requests."""
+
+    name: str
+    """Field name on the request model."""
+
+    alias: t.Optional[str]
+    """Alias used for the field in the request schema."""
+
+    file_readable: bool
+    """If `True`, file paths provided for the field are replaced by the file content."""
+
+    file_uploadable: bool
+    """If `True`, file paths provided for the field are uploaded as `FileModel`."""
+
+
 class ExecuteResponse(BaseModel):
     """Execute action response."""
 
@@ -89,9 +151,13 @@ class _Attributes:
 class _Request(t.Generic[ModelType]):
     """Request util."""
 
+    fields: t.Dict[str, FieldDescriptor]
+    """Field descriptors, keyed by both the field names and aliases."""
+
     def __init__(self, model: t.Type[ModelType]) -> None:
         """Initialize request model."""
         self.model = model
+        self.fields = {}
 
     def schema(self) -> t.Dict:
         """Build request schema."""
@@ -201,6 +267,56 @@ class _Response(t.Generic[ModelType]):
         return remove_json_ref(schema)
 
 
+@functools.lru_cache(maxsize=None)
+def _file_model_properties() -> t.Dict:
+    return FileModel.model_json_schema().get("properties", {})
+
+
+@functools.lru_cache(maxsize=None)
+def _is_file_model(annotation: t.Any) -> bool:
+    """Check if the annotation is a model with the same fields as `FileModel`."""
+    if t.get_origin(annotation) is t.Union:
+        args = [arg for arg in t.get_args(annotation) if arg is not type(None)]
+        return len(args) == 1 and _is_file_model(args[0])
+    if not (isinstance(annotation, type) and issubclass(annotation, BaseModel)):
+        return False
+    if annotation is FileModel:
+        return True
+    return (
+        annotation.model_json_schema().get("properties", {}) == _file_model_properties()
+    )
+
+
+def get_field_descriptors(model: t.Any) -> t.Dict[str, FieldDescriptor]:
+    """
+    Build field descriptors for a request model.
+
+    :param model: Request model class
+    :return: Field descriptors, keyed by both the field names and aliases.
+    """
+    if isinstance(model, BaseModel):
+        model = type(model)
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        return {}
+
+    fields = {}
+    for name, field in model.model_fields.items():
+        annotations = field.json_schema_extra
+        descriptor = FieldDescriptor(
+            name=name,
+            alias=field.alias,
+            file_readable=(
+                isinstance(annotations, dict)
+                and bool(annotations.get("file_readable", False))
+            ),
+            file_uploadable=_is_file_model(field.annotation),
+        )
+        fields[name] = descriptor
+        if field.alias is not None:
+            fields[field.alias] = descriptor
+    return fields
+
+
 class ActionBuilder:
     @staticmethod
     def get_generics(obj: t.Type["Action"]) -> t.Tuple[t.Any, t.Any]:
@@ -226,6 +342,11 @@ class ActionBuilder:
         setattr(obj, "request", _Request(request))
         setattr(obj, "response", _Response(response))
 
+    @staticmethod
+    def set_field_descriptors(obj: t.Type["Action"]) -> None:
+        """Precompute the request field descriptors for the action."""
+        obj.request.fields = get_field_descriptors(model=obj.request.model)
+
     @staticmethod
     def validate(name: str, obj: t.Type["Action"]) -> None:
         if getattr(getattr(obj, "execute"), "__isabstractmethod__", False):
@@ -291,6 +412,7 @@ class ActionMeta(type):
         cls = t.cast(t.Type["Action"], cls)
         ActionBuilder.validate(name=name, obj=cls)
         ActionBuilder.set_generics(name=name, obj=cls)
+        ActionBuilder.set_field_descriptors(obj=cls)
         ActionBuilder.set_metadata(obj=cls)
 
 
@@ -7,29 +7,30 @@ import typing as t
 from abc import abstractmethod
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 from composio.tools.base.abs import (
     Action,
     ActionRequest,
     ActionResponse,
+    FieldDescriptor,
+    FileModel,
     InvalidClassDefinition,
     Tool,
     ToolBuilder,
+    get_field_descriptors,
 )
 from composio.tools.base.exceptions import ExecutionFailed
 from composio.tools.env.host.workspace import Browsers, FileManagers, Shells
 
 
-class FileModel(BaseModel):
-    name: str = Field(
-        ...,
-        description="File name, contains extension to indetify the file type",
-    )
-    content: bytes = Field(
-        ...,
-        description="File content in base64",
-    )
+__all__ = (
+    "FileModel",
+    "LocalAction",
+    "LocalTool",
+    "LocalToolMeta",
+    "LocalToolMixin",
+)
 
 
 class LocalAction(  # pylint: disable=abstract-method
@@ -98,28 +99,30 @@ class LocalToolMixin(Tool):
         """Get collection of actions for the tool."""
 
     @classmethod
-    def _check_file_uploadable(cls, param: str, model: BaseModel) -> bool:
-        return (
-            model.model_json_schema()
-            .get("properties", {})
-            .get(param, {})
-            .get("allOf", [{}])[0]
-            .get("properties", {})
-            or model.model_json_schema()
-            .get("properties", {})
-            .get(param, {})
-            .get("properties", {})
-        ) == FileModel.model_json_schema().get("properties")
-
-    @classmethod
-    def _process_request(cls, request: t.Dict, model: BaseModel) -> t.Dict:
+    def _process_request(
+        cls,
+        request: t.Dict,
+        model: BaseModel,
+        fields: t.Optional[t.Dict[str, FieldDescriptor]] = None,
+    ) -> t.Dict:
         """Pre-process request for execution."""
+        if fields is None:
+            fields = get_field_descriptors(model=model)
+
         modified_request_data: t.Dict[str, t.Union[str, t.Dict[str, str]]] = {}
         for param, value in request.items():
-            annotations = t.cast(t.Dict, model.model_fields[param].json_schema_extra)
-            file_readable = (annotations or {}).get("file_readable", False)
-            if file_readable and isinstance(value, str) and os.path.isfile(value):
-                _content = Path(value).read_bytes()
+            descriptor = fields.get(param)
+            if (
+                descriptor is None
+                or not isinstance(value, str)
+                or not (descriptor.file_readable or descriptor.file_uploadable)
+                or not os.path.isfile(value)
+            ):
+                modified_request_data[param] = value
+                continue
+
+            _content = Path(value).read_bytes()
+            if descriptor.file_readable:
                 try:
                     _decoded = _content.decode("utf-8")
                 except UnicodeDecodeError:
@@ -127,18 +130,10 @@ class LocalToolMixin(Tool):
                 modified_request_data[param] = _decoded
                 continue
 
-            if (
-                cls._check_file_uploadable(param=param, model=model)
-                and isinstance(value, str)
-                and os.path.isfile(value)
-            ):
-                _content = Path(value).read_bytes()
-                modified_request_data[param] = {
-                    "name": os.path.basename(value),
-                    "content": base64.b64encode(_content).decode("utf-8"),
-                }
-                continue
-            modified_request_data[param] = value
+            modified_request_data[param] = {
+                "name": os.path.basename(value),
+                "content": base64.b64encode(_content).decode("utf-8"),
+            }
         return modified_request_data
 
     def execute(
@@ -171,6 +166,7 @@ class LocalToolMixin(Tool):
                     request=self._process_request(
                         request=params,
                         model=actcls.request.model,  # type: ignore
+                        fields=actcls.request.fields,
                     )
                 ),
                 metadata=metadata,
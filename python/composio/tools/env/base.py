@@ -3,10 +3,13 @@ import threading
 import typing as t
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from logging import DEBUG
 from pathlib import Path
 from uuid import uuid4
 
 import requests
+import typing_extensions as te
+from requests.adapters import HTTPAdapter
 
 from composio.client.enums import Action, ActionType, AppType, TagType
 from composio.constants import ENV_COMPOSIO_API_KEY, ENV_COMPOSIO_BASE_URL
@@ -59,21 +62,65 @@ class Sessionable(WithLogger, ABC):
     def teardown(self) -> None:
         """Teardown session."""
 
+    def reset(self) -> bool:
+        """
+        Reset session state so the session can be reused.
+
+        :return: `False` if the session cannot be reused.
+        """
+        return False
+
 
 SessionableType = t.TypeVar("SessionableType", bound=Sessionable)
 
 
+class PoolStats(te.TypedDict):
+    """Session pool statistics."""
+
+    hits: int
+    """Number of sessions served from the pool."""
+
+    misses: int
+    """Number of sessions created on demand."""
+
+    recycled: int
+    """Number of released sessions returned to the pool."""
+
+    hit_rate: float
+    """Ratio of the sessions served from the pool."""
+
+
 class SessionFactory(WithLogger, t.Generic[SessionableType]):
     """Factory abstraction."""
 
-    _session: t.Dict[str, SessionableType] = {}
+    _session: t.Dict[str, SessionableType]
     _recent: t.Optional[SessionableType] = None
-    _lock: threading.Lock = threading.Lock()
+    _lock: threading.Lock
 
-    def __init__(self, factory: t.Callable[[], SessionableType]) -> None:
-        """Creatte shell factory"""
+    def __init__(
+        self,
+        factory: t.Callable[[], SessionableType],
+        pool_size: int = 0,
+    ) -> None:
+        """
+        Create session factory.
+
+        :param factory: Callable for creating a new session.
+        :param pool_size: Number of sessions to keep set up in the background,
+            `new()` hands out a pooled session if one is available and
+            released sessions are reset and returned to the pool.
+        """
         super().__init__()
         self._factory = factory
+        self._session = {}
+        self._lock = threading.Lock()
+        self.pool_size = pool_size
+        self._pool: t.List[SessionableType] = []
+        self._filling = 0
+        self._closed = False
+        self._hits = 0
+        self._misses = 0
+        self._recycled = 0
 
     @property
     def recent(self) -> SessionableType:
@@ -94,12 +141,90 @@ class SessionFactory(WithLogger, t.Generic[SessionableType]):
 
     def new(self) -> SessionableType:
         """Create a new shell."""
-        session = self._factory()
-        session.setup()
+        session = self._checkout()
+        if session is None:
+            session = self._factory()
+            session.setup()
+        if self.pool_size > 0:
+            self.prewarm()
         self._session[session.id] = session
         self.recent = session
         return session
 
+    @property
+    def stats(self) -> PoolStats:
+        """Session pool statistics."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "recycled": self._recycled,
+                "hit_rate": self._hits / total if total else 0.0,
+            }
+
+    def _checkout(self) -> t.Optional[SessionableType]:
+        """Take a session from the pool."""
+        if self.pool_size == 0:
+            return None
+
+        with self._lock:
+            session = self._pool.pop(0) if self._pool else None
+            if session is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return session
+
+    def prewarm(self) -> None:
+        """Fill the session pool in the background."""
+        with self._lock:
+            if self._closed:
+                return
+            count = self.pool_size - len(self._pool) - self._filling
+            self._filling += max(count, 0)
+        for _ in range(count):
+            threading.Thread(target=self._fill, daemon=True).start()
+
+    def _fill(self) -> None:
+        """Set up a session and add it to the pool."""
+        try:
+            session = self._factory()
+            session.setup()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.debug(f"Error setting up pooled session: {e}")
+            with self._lock:
+                self._filling -= 1
+            return
+
+        with self._lock:
+            self._filling -= 1
+            if not self._closed and len(self._pool) < self.pool_size:
+                self._pool.append(session)
+                return
+        session.teardown()
+
+    def release(self, id: str) -> None:
+        """
+        Release a session, the session is reset and returned to the pool if
+        the pool has room or torn down otherwise.
+
+        :param id: ID of the session to release.
+        """
+        session = self._session.pop(id)
+        with self._lock:
+            if self._recent is session:
+                self._recent = None
+            reuse = not self._closed and len(self._pool) < self.pool_size
+
+        if reuse and session.reset():
+            with self._lock:
+                if not self._closed:
+                    self._pool.append(session)
+                    self._recycled += 1
+                    return
+        session.teardown()
+
     def get(self, id: t.Optional[str] = None) -> SessionableType:
         """Get shell instance."""
         if id is None or id == "":
@@ -115,10 +240,17 @@ class SessionFactory(WithLogger, t.Generic[SessionableType]):
 
     def teardown(self) -> None:
         """Stop all running shells."""
-        while len(self._session) > 0:
-            id = list(self._session.keys()).pop()
-            session = self._session.pop(id)
+        with self._lock:
+            self._closed = True
+            pool, self._pool = self._pool, []
+        if self.pool_size > 0:
+            self.logger.debug(f"Session pool stats: {self.stats}")
+
+        for session in pool:
             session.teardown()
+        # The factory is closed, so the released sessions are torn down
+        for id in list(self._session):
+            self.release(id=id)
         self._recent = None
 
 
@@ -141,6 +273,15 @@ class WorkspaceConfigType:
     persistent: bool = False
     """Set `True` to make this workspace persistent."""
 
+    http_pool_size: int = 10
+    """Number of keep-alive connections to the tooling server (Only applicable for remote workspace)."""
+
+    http_connect_timeout: float = 10.0
+    """Seconds to wait for a connection to the tooling server (Only applicable for remote workspace)."""
+
+    http_compression: bool = False
+    """Set `True` to request compressed responses from the tooling server (Only applicable for remote workspace)."""
+
 
 class Workspace(WithLogger, ABC):
     """Workspace abstraction for executing tools."""
@@ -220,6 +361,39 @@ class Workspace(WithLogger, ABC):
 class RemoteWorkspace(Workspace):
     """Remote workspace client."""
 
+    _session: t.Optional[requests.Session] = None
+
+    def __init__(self, config: WorkspaceConfigType):
+        """Initialize remote workspace."""
+        super().__init__(config=config)
+        self.http_pool_size = config.http_pool_size
+        self.http_connect_timeout = config.http_connect_timeout
+        self.http_compression = config.http_compression
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session keeping the connections to the tooling server alive."""
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self.http_pool_size,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update(
+                    {
+                        "x-api-key": self.access_token,
+                        "Accept-Encoding": (
+                            "gzip, deflate" if self.http_compression else "identity"
+                        ),
+                    }
+                )
+                self._session = session
+            return self._session
+
     def _request(
         self,
         endpoint: str,
@@ -229,16 +403,13 @@ class RemoteWorkspace(Workspace):
         log: bool = True,
     ) -> requests.Response:
         """Make request to the tooling server."""
-        response = requests.request(
+        response = self.session.request(
             url=f"{self.url}{endpoint}",
             method=method,
             json=json,
-            headers={
-                "x-api-key": self.access_token,
-            },
-            timeout=timeout,
+            timeout=(self.http_connect_timeout, timeout),
         )
-        if log:
+        if log and self.logger.isEnabledFor(DEBUG):
             self.logger.debug(
                 f"Making HTTP request on {self.id}\n"
                 f"Request: {method.upper()} {endpoint} @ {self.url}\n"
@@ -254,6 +425,13 @@ class RemoteWorkspace(Workspace):
             )
         return response
 
+    def teardown(self) -> None:
+        """Close the connections to the tooling server."""
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
     def _upload(self, action: Action) -> None:
         """Upload action instance to tooling server."""
         from composio.tools.base.abs import (  # pylint: disable=import-outside-toplevel
@@ -3,6 +3,9 @@
 EXIT_CODE = "exit_code"
 STDOUT = "stdout"
 STDERR = "stderr"
+CWD = "cwd"
+RUNNING = "running"
+TRUNCATED = "truncated"
 
 ECHO_EXIT_CODE = "echo $?"
 DEFAULT_IMAGE = "composio/composio"
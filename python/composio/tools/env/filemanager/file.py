@@ -1,15 +1,17 @@
 """Virtual file pointer implementation."""
 
+import os
 import re
-import subprocess
-import sys
 import typing as t
+from array import array
 from collections import deque
 from enum import Enum
+from itertools import accumulate
 from pathlib import Path
 
 import typing_extensions as te
 
+from composio.tools.env.filemanager import lint as linter
 from composio.utils.logging import WithLogger
 
 
@@ -52,12 +54,75 @@ class TextReplacement(te.TypedDict):
     error: te.NotRequired[str]
 
 
+class LineIndex:
+    """
+    Byte offsets of the lines in a file.
+
+    Lines end with LF, CRLF or CR, same as reading the file in text mode, the
+    last offset is the size of the file.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        """
+        Index the lines in the file content.
+
+        :param data: Content of the file.
+        """
+        self.offsets = array(
+            "Q", accumulate(map(len, data.splitlines(keepends=True)), initial=0)
+        )
+
+    def __len__(self) -> int:
+        """Number of lines."""
+        return len(self.offsets) - 1
+
+    def offset(self, line: int) -> int:
+        """Get the offset of a line, clamped to the bounds of the file."""
+        return self.offsets[min(max(line, 0), len(self))]
+
+    def lines(self, data: bytes, start: int, end: int, base: int = 0) -> t.List[str]:
+        """
+        Decode the lines from `start` to `end` with the line endings
+        translated to LF.
+
+        :param data: File content, starting at offset `base`.
+        :param start: Index of the first line.
+        :param end: Index after the last line.
+        :param base: Offset of `data` in the file.
+        """
+        start, end = min(max(start, 0), len(self)), min(max(end, 0), len(self))
+        lines = []
+        for lineno in range(start, end):
+            line = data[
+                self.offsets[lineno] - base : self.offsets[lineno + 1] - base
+            ].decode("utf-8")
+            if line.endswith("\r\n"):
+                line = line[:-2] + "\n"
+            elif line.endswith("\r"):
+                line = line[:-1] + "\n"
+            lines.append(line)
+        return lines
+
+
+def _numbered(data: bytes, index: LineIndex, start: int, end: int) -> t.Dict[int, str]:
+    """Get the lines from `start` to `end`, keyed by the line numbers."""
+    return {
+        lineno: line.rstrip("\n")
+        for lineno, line in enumerate(
+            index.lines(data=data, start=start, end=end),
+            start=start + 1,
+        )
+    }
+
+
 class File(WithLogger):
     """File object for file manager."""
 
     _start: int
     _end: int
     _history: deque  # TOFIX: Possible memory leak
+    _index: t.Optional[LineIndex]
+    _index_key: t.Optional[t.Tuple[int, int]]
 
     def __init__(
         self,
@@ -82,6 +147,43 @@ class File(WithLogger):
         self._window = window or 100
         self._history = deque(maxlen=10)  # Store last 10 versions
 
+        # Line offsets, rebuilt when the file changes
+        self._index = None
+        self._index_key = None
+
+    def _stat_key(self) -> t.Tuple[int, int]:
+        """Modification time and size of the file."""
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _line_index(self) -> LineIndex:
+        """Get the line index, indexing the file if it has changed."""
+        key = self._stat_key()
+        if self._index is None or self._index_key != key:
+            self._index = LineIndex(data=self.path.read_bytes())
+            self._index_key = key
+        return self._index
+
+    def _write_bytes(self, data: bytes) -> None:
+        """Write the file content and index it."""
+        self.path.write_bytes(data)
+        self._index = LineIndex(data=data)
+        self._index_key = self._stat_key()
+
+    def _write_text(self, text: str) -> None:
+        """Write the file content and invalidate the line index."""
+        self.path.write_text(text, encoding="utf-8")
+        self._index = None
+
+    def _read_lines(self, start: int, end: int) -> t.List[str]:
+        """Read the lines from `start` to `end`."""
+        index = self._line_index()
+        offset = index.offset(start)
+        with self.path.open("rb") as fp:
+            fp.seek(offset)
+            data = fp.read(index.offset(end) - offset)
+        return index.lines(data=data, start=start, end=end, base=offset)
+
     def scroll(
         self,
         lines: t.Optional[int] = None,
@@ -195,17 +297,7 @@ class File(WithLogger):
 
     def _iter_window(self) -> t.Iterable[str]:
         """Iter data from the current window."""
-        cursor = 0
-        with self.path.open("r") as fp:
-            while cursor < self._start:
-                _ = fp.readline()
-                cursor += 1
-            while cursor < self._end:
-                line = fp.readline()
-                if not line:
-                    break
-                yield line
-                cursor += 1
+        yield from self._read_lines(start=self._start, end=self._end)
 
     def _iter_file(self) -> t.Iterable[str]:
         """Iter data from the current file."""
@@ -225,28 +317,23 @@ class File(WithLogger):
 
     def read(self) -> t.Dict[int, str]:
         """Read data from file."""
-        cursor = 0
-        buffer = {}
-        with self.path.open("r") as fp:
-            while cursor < self._start:
-                _ = fp.readline()
-                cursor += 1
-            while cursor < self._end:
-                line = fp.readline()
-                if not line:
-                    break
-                buffer[cursor + 1] = line
-                cursor += 1
-        return buffer
+        start = max(self._start, 0)
+        return {
+            lineno: line
+            for lineno, line in enumerate(
+                self._read_lines(start=start, end=self._end),
+                start=start + 1,
+            )
+        }
 
     def write(self, text: str) -> None:
         """Write the given content to the file."""
         self._history.append(self.path.read_text(encoding="utf-8"))
-        self.path.write_text(text, encoding="utf-8")
+        self._write_text(text)
 
     def total_lines(self) -> int:
         """Total number of lines in the file."""
-        return sum(1 for _ in self._iter_file())
+        return len(self._line_index())
 
     def format_text(self, lines: t.Dict[int, str]) -> str:
         """Format the text to be written to the file."""
@@ -282,44 +369,29 @@ class File(WithLogger):
         """
         text = text + "\n"
         scope = scope or FileOperationScope.FILE
+        if scope == FileOperationScope.WINDOW:
+            start += max(self._start, 0)
+            end += max(self._start, 0)
         end = end - 1
-        # Store original content
-        original_content = self.path.read_text(encoding="utf-8")
-
-        # Run lint before edit
-        before_lint = self.lint()
-
-        cursor = 0
-        buffer = ""
-        replaced = ""
-        with self.path.open(mode="r") as fp:
-            if scope == FileOperationScope.WINDOW:
-                while cursor < self._start:
-                    _ = fp.readline()
-                    cursor += 1
-                cursor = 0
 
-            # Read lines before the edit
-            while cursor < (start - 1):
-                buffer += fp.readline()
-                cursor += 1
-
-            # Read lines to be replaced
-            if end > 0:
-                while cursor <= end:
-                    replaced += fp.readline()
-                    cursor += 1
-
-            # Add the new text
-            buffer += text
-
-            # Read the rest of the file
-            buffer += fp.read()
-
-        self.path.write_text(data=buffer, encoding="utf-8")
+        # Store original content
+        original = self.path.read_bytes()
+        original_index = LineIndex(data=original)
+
+        # Run lint before edit, cached by the content of the file
+        before_lint = self.lint(source=original.decode("utf-8", errors="replace"))
+
+        # Splice the new text in place of the replaced lines
+        stop = max(start - 1, end + 1) if end > 0 else start - 1
+        buffer = (
+            original[: original_index.offset(start - 1)]
+            + text.encode("utf-8")
+            + original[original_index.offset(stop) :]
+        )
+        self._write_bytes(data=buffer)
 
-        # Run lint after edit
-        after_lint = self.lint()
+        # Run lint after edit on the buffer we've just written
+        after_lint = self.lint(source=buffer.decode("utf-8", errors="replace"))
 
         self.logger.debug(f"Before lint: {before_lint}")
         self.logger.debug(f"After lint: {after_lint}")
@@ -334,7 +406,7 @@ class File(WithLogger):
             formatted_output = formatted_errors + self._show_file_modifications(
                 start=start,
                 end=end,
-                original_content=original_content,
+                original=original,
                 buffer=buffer,
                 text=text,
             )
@@ -344,52 +416,43 @@ class File(WithLogger):
                 "error": f"Edit reverted due to new lint errors:\n{formatted_output}",
             }
 
-        start_original = max(0, start - 5)
-        end_original = min(len(original_content.splitlines()), end + 5)
-
-        start_new = max(0, start - 5)
-        end_new = min(self.total_lines(), start + len(text.splitlines()) + 5)
-
         return {
             "replaced_text": self.format_text(
-                {
-                    x + 1: original_content.splitlines()[x]
-                    for x in range(start_original, end_original)
-                }
+                _numbered(
+                    data=original,
+                    index=original_index,
+                    start=max(0, start - 5),
+                    end=end + 5,
+                )
             ),
             "replaced_with": self.format_text(
-                {x + 1: buffer.splitlines()[x] for x in range(start_new, end_new)}
+                _numbered(
+                    data=buffer,
+                    index=t.cast(LineIndex, self._index),
+                    start=max(0, start - 5),
+                    end=start + len(text.splitlines()) + 5,
+                )
             ),
             "error": "",
         }
 
-    def lint(self) -> t.List[str]:
-        """Run lint on the file."""
-        if self.path.suffix == ".py":
-            venv_python = sys.executable
-            try:
-                result = subprocess.run(
-                    [
-                        venv_python,
-                        "-m",
-                        "flake8",
-                        "--isolated",
-                        "--select=E9,F821,F823,F831,F406,F407,F701,F702,F704,F706,E999,E902,E111,E112,E113",
-                        str(self.path),
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                lint_output = result.stdout
-            except subprocess.CalledProcessError as e:
-                # If flake8 returns a non-zero exit code, it will raise this exception
-                lint_output = e.stdout  # Use stdout for linting errors
-                if e.stderr:  # Check if there's any stderr output
-                    lint_output += f"\nError running flake8: {e.stderr}"
+    def lint(
+        self,
+        source: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> t.List[str]:
+        """
+        Run lint on the file.
 
-            return [line.strip() for line in lint_output.split("\n") if line.strip()]
-        return []
+        :param source: Content to lint instead of the file content.
+        :param backend: Lint backend, `pyflakes` or `flake8`.
+        :return: List of lint errors.
+        """
+        if self.path.suffix != ".py":
+            return []
+        if source is None:
+            source = self.path.read_bytes().decode("utf-8", errors="replace")
+        return linter.lint(source=source, path=str(self.path), backend=backend)
 
     def _compare_lint_results(
         self, before: t.List[str], after: t.List[str]
@@ -432,12 +495,12 @@ class File(WithLogger):
     ) -> str:
         """Format a single lint error."""
         formatted_output = ""
-        file_lines = self.path.read_text(encoding="utf-8").splitlines()
         for error in errors:
             parts = error.split(":", 3)
             if len(parts) >= 4:
                 file_path, line, column, message = parts
-                line_content = file_lines[int(line.strip()) - 1]
+                lineno = int(line.strip())
+                line_content = "".join(self._read_lines(start=lineno - 1, end=lineno))
                 formatted_output += f"- File: {file_path.strip()}, Line {line.strip()}, Column {column.strip()}: {message.strip()}\n"
                 formatted_output += f"  Error code line: {line_content.strip()}\n"
 
@@ -454,28 +517,31 @@ class File(WithLogger):
         self,
         start: int,
         end: int,
-        original_content: str,
-        buffer: str,
+        original: bytes,
+        buffer: bytes,
         text: str,
     ) -> str:
         """Show file modifications."""
         formatted_output = "\n"
 
-        start_new = max(0, start - 5)
-        end_new = min(self.total_lines(), start + len(text.splitlines()) + 5)
         replaced_with = self.format_text(
-            {x + 1: buffer.splitlines()[x] for x in range(start_new, end_new)}
+            _numbered(
+                data=buffer,
+                index=self._line_index(),
+                start=max(0, start - 5),
+                end=start + len(text.splitlines()) + 5,
+            )
         )
         formatted_output += f"How your edit would have looked...\n{replaced_with}\n"
 
-        self.path.write_text(data=original_content, encoding="utf-8")
-        start_original = max(0, start - 5)
-        end_original = min(self.total_lines(), end + 5)
+        self._write_bytes(data=original)
         replaced_text = self.format_text(
-            {
-                x + 1: original_content.splitlines()[x]
-                for x in range(start_original, end_original)
-            }
+            _numbered(
+                data=original,
+                index=self._line_index(),
+                start=max(0, start - 5),
+                end=end + 5,
+            )
         )
         formatted_output += f"The original code before your edit...\n{replaced_text}\n"
 
@@ -544,10 +610,10 @@ class File(WithLogger):
 
     def write_and_run_lint(self, text: str, start: int, end: int) -> TextReplacement:
         """Write and run lint on the file. If linting fails, revert the changes."""
-        older_file_text = self.path.read_text(encoding="utf-8")
+        older_file_content = self.path.read_bytes()
         write_response = self.edit(text=text, start=start, end=end)
         if write_response.get("error"):
-            self.path.write_text(data=older_file_text, encoding="utf-8")
+            self._write_bytes(data=older_file_content)
             return write_response
         return write_response
 
@@ -565,7 +631,7 @@ class File(WithLogger):
                 "replaced_with": "",
                 "error": "Error replacing given string, string not found",
             }
-        self.path.write_text(update, encoding="utf-8")
+        self._write_text(update)
         return {"replaced_text": string, "replaced_with": replacement}
 
     def undo(self) -> t.Optional[str]:
@@ -573,7 +639,7 @@ class File(WithLogger):
         if not self._history:
             return None
         previous_content = self._history.pop()
-        self.path.write_text(previous_content, encoding="utf-8")
+        self._write_text(previous_content)
         return previous_content
 
     def __str__(self) -> str:
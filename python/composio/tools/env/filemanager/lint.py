@@ -0,0 +1,264 @@
+"""
+Lint python sources for the errors which make an edit unusable.
+
+The checks run in-process on the in-memory source using `ast` and `pyflakes`,
+with the same error codes and output format as `flake8`. If `pyflakes` is not
+installed the source is linted by a `flake8` subprocess.
+"""
+
+import ast
+import functools
+import hashlib
+import importlib.util
+import re
+import subprocess
+import sys
+import threading
+import typing as t
+from collections import OrderedDict
+
+
+SELECT = (
+    "E9",
+    "F821",
+    "F823",
+    "F831",
+    "F406",
+    "F407",
+    "F701",
+    "F702",
+    "F704",
+    "F706",
+    "E999",
+    "E902",
+    "E111",
+    "E112",
+    "E113",
+)
+"""Error codes reported by the linter."""
+
+PYFLAKES_CODES = {
+    "ImportStarNotPermitted": "F406",
+    "FutureFeatureNotDefined": "F407",
+    "BreakOutsideLoop": "F701",
+    "ContinueOutsideLoop": "F702",
+    "YieldOutsideFunction": "F704",
+    "ReturnOutsideFunction": "F706",
+    "UndefinedName": "F821",
+    "UndefinedLocal": "F823",
+    "DuplicateArgument": "F831",
+}
+"""`pyflakes` messages reported by the linter and their `flake8` codes."""
+
+LINT_CACHE_SIZE = 64
+"""Number of lint results to keep in the cache."""
+
+BACKEND_PYFLAKES = "pyflakes"
+BACKEND_FLAKE8 = "flake8"
+
+_NOQA = re.compile(
+    r"#\s*noqa(?::[\s]?(?P<codes>[A-Z][0-9]+(?:[,\s]+[A-Z][0-9]+)*))?",
+    re.IGNORECASE,
+)
+
+_cache: t.OrderedDict[str, t.List[str]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _has_pyflakes() -> bool:
+    """Check if `pyflakes` is available."""
+    return importlib.util.find_spec("pyflakes") is not None
+
+
+def _is_ignored(code: str, line: str) -> bool:
+    """Check if the error is ignored using a `# noqa` comment on the line."""
+    match = _NOQA.search(line)
+    if match is None:
+        return False
+    codes = match.group("codes")
+    if codes is None:
+        return True
+    return any(code.startswith(c) for c in re.split(r"[,\s]+", codes.upper()))
+
+
+def _check_syntax(
+    source: str,
+) -> t.Tuple[t.Optional[ast.AST], t.List[t.Tuple[int, int, str]]]:
+    """Parse the source, reporting syntax errors."""
+    try:
+        return ast.parse(source), []
+    except SyntaxError as e:
+        row, column = (e.lineno or 1), (e.offset or 0)
+        if isinstance(e.args[1], tuple) and len(e.args[1]) > 2:
+            row, column = e.args[1][1:3]
+        return None, [(row, column, f"E999 {type(e).__name__}: {e.args[0]}")]
+    except ValueError as e:
+        # Null bytes in the source
+        return None, [(1, 0, f"E999 {type(e).__name__}: {e}")]
+
+
+def _check_pyflakes(tree: ast.AST, path: str) -> t.List[t.Tuple[int, int, str]]:
+    """Run the selected `pyflakes` checks on the syntax tree."""
+    from pyflakes.checker import Checker  # pylint: disable=import-outside-toplevel
+
+    errors = []
+    for message in Checker(tree, filename=path).messages:
+        code = PYFLAKES_CODES.get(type(message).__name__)
+        if code is None:
+            continue
+        text = message.message % message.message_args
+        errors.append((message.lineno, message.col, f"{code} {text}"))
+    return errors
+
+
+def _find_keyword(lines: t.List[str], keyword: str, start: int, end: int) -> int:
+    """Find the line between `start` and `end` which starts with `keyword`."""
+    for lineno in range(start + 1, end):
+        if lines[lineno - 1].lstrip().startswith(keyword):
+            return lineno
+    return 0
+
+
+def _line_starts(tree: ast.AST, lines: t.List[str]) -> t.Set[int]:
+    """Find the lines which start a statement or a clause of a statement."""
+    starts = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.stmt, ast.ExceptHandler)):
+            if not lines[node.lineno - 1][: node.col_offset].strip():
+                starts.add(node.lineno)
+        for decorator in getattr(node, "decorator_list", []):
+            starts.add(decorator.lineno)
+        for case in getattr(node, "cases", []):
+            starts.add(case.pattern.lineno)
+
+        # `else` and `finally` clauses are not nodes of the syntax tree
+        body = getattr(node, "handlers", None) or getattr(node, "body", None)
+        orelse = getattr(node, "orelse", None)
+        if orelse and body and isinstance(node.body, list):
+            starts.add(
+                _find_keyword(
+                    lines=lines,
+                    keyword="else",
+                    start=body[-1].end_lineno,
+                    end=orelse[0].lineno,
+                )
+            )
+        finalbody = getattr(node, "finalbody", None)
+        if finalbody:
+            starts.add(
+                _find_keyword(
+                    lines=lines,
+                    keyword="finally",
+                    start=(orelse or body)[-1].end_lineno,
+                    end=finalbody[0].lineno,
+                )
+            )
+    starts.discard(0)
+    return starts
+
+
+def _check_indentation(
+    tree: ast.AST, lines: t.List[str]
+) -> t.List[t.Tuple[int, int, str]]:
+    """
+    Check the indentation of the lines which start a statement.
+
+    Unexpected indentation and a missing indented block are syntax errors, so
+    once the source is parsed only `E111` from the `pycodestyle` indentation
+    checks can be reported, which saves tokenizing the source.
+    """
+    errors = []
+    for lineno in _line_starts(tree=tree, lines=lines):
+        line = lines[lineno - 1]
+        indent = line[: len(line) - len(line.lstrip(" \t"))]
+        if len(indent.expandtabs(8)) % 4:
+            errors.append(
+                (lineno, len(indent), "E111 indentation is not a multiple of 4")
+            )
+    return errors
+
+
+def lint_source(source: str, path: str) -> t.List[str]:
+    """
+    Lint the source in-process.
+
+    :param source: Python source to lint.
+    :param path: Path of the file, used in the reported errors.
+    :return: List of errors in `path:line:column: CODE message` format.
+    """
+    tree, errors = _check_syntax(source=source)
+    lines = source.splitlines(keepends=True)
+    if tree is not None:
+        errors += _check_pyflakes(tree=tree, path=path)
+        errors += _check_indentation(tree=tree, lines=lines)
+
+    output = []
+    for row, column, text in sorted(errors, key=lambda error: error[:2]):
+        line = lines[row - 1] if 0 < row <= len(lines) else ""
+        if _is_ignored(code=text.split()[0], line=line):
+            continue
+        output.append(f"{path}:{row}:{column + 1}: {text}")
+    return output
+
+
+def lint_flake8(source: str, path: str) -> t.List[str]:
+    """
+    Lint the source using a `flake8` subprocess.
+
+    :param source: Python source to lint.
+    :param path: Path of the file, used in the reported errors.
+    :return: List of errors in `path:line:column: CODE message` format.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "flake8",
+            "--isolated",
+            f"--select={','.join(SELECT)}",
+            f"--stdin-display-name={path}",
+            "-",
+        ],
+        input=source,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    output = result.stdout
+    if result.returncode != 0 and result.stderr:
+        output += f"\nError running flake8: {result.stderr}"
+    return [line.strip() for line in output.split("\n") if line.strip()]
+
+
+def lint(source: str, path: str, backend: t.Optional[str] = None) -> t.List[str]:
+    """
+    Lint the source, caching the result by the content hash.
+
+    :param source: Python source to lint.
+    :param path: Path of the file, used in the reported errors.
+    :param backend: `pyflakes` to lint in-process or `flake8` to lint using a
+        subprocess, defaults to `pyflakes` if it is installed.
+    :return: List of errors in `path:line:column: CODE message` format.
+    """
+    if backend is None:
+        backend = BACKEND_PYFLAKES if _has_pyflakes() else BACKEND_FLAKE8
+
+    key = hashlib.sha1(f"{backend}\0{path}\0{source}".encode("utf-8")).hexdigest()
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return list(_cache[key])
+
+    if backend == BACKEND_PYFLAKES:
+        errors = lint_source(source=source, path=path)
+    elif backend == BACKEND_FLAKE8:
+        errors = lint_flake8(source=source, path=path)
+    else:
+        raise ValueError(f"Invalid lint backend: {backend}")
+
+    with _cache_lock:
+        _cache[key] = errors
+        while len(_cache) > LINT_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return list(errors)
@@ -5,16 +5,32 @@ import re
 import subprocess
 import threading
 import typing as t
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from fnmatch import translate
+from itertools import islice
 from pathlib import Path
 
 import typing_extensions as te
 
 from composio.tools.env.base import Sessionable
 from composio.tools.env.filemanager.file import File
+from composio.tools.env.filemanager.search import (
+    IgnoreRules,
+    ListingCache,
+    get_index,
+    glob_regex,
+    parent_rules,
+    scan,
+    search_file,
+    walk,
+)
 from composio.tools.env.id import generate_id
 
 
+GREP_WORKERS = min(8, os.cpu_count() or 1)
+"""Number of threads searching files in parallel."""
+
 _active_manager: t.Optional["FileManager"] = None
 _manager_lock = threading.Lock()
 
@@ -52,6 +68,7 @@ class FileManager(Sessionable):
         super().__init__()
         self._id = generate_id()
         self._files = {}
+        self._listings = ListingCache()
         self.working_dir = Path(working_dir or "./").resolve()
 
     def setup(self) -> None:
@@ -192,6 +209,9 @@ class FileManager(Sessionable):
         recursive: bool = True,
         case_insensitive: bool = True,
         exclude: t.Optional[t.List[t.Union[str, Path]]] = None,
+        max_results: t.Optional[int] = None,
+        gitignore: bool = True,
+        index: bool = False,
     ) -> t.Dict[str, t.List[t.Tuple[int, str]]]:
         """
         Search for a word in files matching the given pattern.
@@ -201,6 +221,10 @@ class FileManager(Sessionable):
         :param recursive: If True, search recursively in subdirectories
         :param case_insensitive: If True, perform case-insensitive search (default is True)
         :param exclude: List of directory paths to exclude from the search
+        :param max_results: Stop searching after finding this many matching lines
+        :param gitignore: If True, skip the files ignored by `.gitignore` files
+        :param index: If True, use a persistent trigram index of the working
+            directory to skip the files which can't contain the word
         :return: A dictionary with file paths as keys and lists of (line number, line content) tuples as values
 
         Examples of patterns:
@@ -213,83 +237,90 @@ class FileManager(Sessionable):
         if pattern is None:
             pattern = self.working_dir
         else:
-            pattern = Path(pattern)
+            pattern = self.working_dir / Path(pattern)
 
         exclude_paths = [self.working_dir / Path(ex) for ex in (exclude or [])]
-
-        results: t.Dict[str, t.List[t.Tuple[int, str]]] = {}
-        paths_to_search: t.List[Path] = []
-        truncate_length = 1024
-
         if pattern.is_file():
-            paths_to_search = [pattern]
-        elif pattern.is_dir():
-            if recursive:
-                paths_to_search = list(pattern.rglob("*"))
-            else:
-                paths_to_search = list(pattern.glob("*"))
+            paths: t.Iterator[str] = iter([str(pattern)])
         else:
-            if recursive:
-                paths_to_search = list(self.working_dir.rglob(str(pattern)))
-            else:
-                paths_to_search = list(self.working_dir.glob(str(pattern)))
-
-        for file_path in paths_to_search:
-            # Skip if file is in an excluded directory
-            if any(ex in file_path.parents for ex in exclude_paths):
-                continue
-
-            if file_path.is_file() and not file_path.name.startswith("."):
-                try:
-                    with file_path.open("r", encoding="utf-8") as f:
-                        for i, line in enumerate(f, 1):
-                            if case_insensitive:
-                                word_lower = word.lower()
-                                if word_lower in line.lower():
-                                    rel_path = str(
-                                        file_path.relative_to(self.working_dir)
-                                    )
-                                    if rel_path not in results:
-                                        results[rel_path] = []
-                                    results[rel_path].append(
-                                        (
-                                            i,
-                                            (
-                                                line.strip()[:truncate_length] + "..."
-                                                if len(line.strip()) > truncate_length
-                                                else line.strip()
-                                            ),
-                                        )
-                                    )
-                            else:
-                                if word in line:
-                                    rel_path = str(
-                                        file_path.relative_to(self.working_dir)
-                                    )
-                                    if rel_path not in results:
-                                        results[rel_path] = []
-                                    results[rel_path].append(
-                                        (
-                                            i,
-                                            (
-                                                line.strip()[:truncate_length] + "..."
-                                                if len(line.strip()) > truncate_length
-                                                else line.strip()
-                                            ),
-                                        )
-                                    )
-                except UnicodeDecodeError:
-                    # Skip binary files
-                    pass
+            root, glob = pattern, None
+            if not pattern.is_dir():
+                root = self.working_dir
+                glob = glob_regex(
+                    pattern=str(pattern.relative_to(self.working_dir)),
+                    recursive=recursive,
+                )
+            entries = (
+                entry
+                for entry in walk(
+                    root=root,
+                    recursive=recursive or glob is not None,
+                    gitignore=gitignore,
+                    exclude=exclude_paths,
+                )
+                if not entry.name.startswith(".")
+                and (
+                    glob is None
+                    or glob.match(os.path.relpath(entry.path, root)) is not None
+                )
+            )
+            if index:
+                entries = get_index(root=self.working_dir).filter(
+                    entries=entries,
+                    word=word,
+                )
+            paths = (entry.path for entry in entries)
+
+        regex = re.compile(re.escape(word), re.IGNORECASE if case_insensitive else 0)
+        results: t.Dict[str, t.List[t.Tuple[int, str]]] = {}
+        num_matches = 0
+        with ThreadPoolExecutor(max_workers=GREP_WORKERS) as executor:
+            # Keep a bounded window of files in flight and collect the results
+            # in order, so the search can stop at `max_results`
+            pending: t.Deque[t.Tuple[str, Future]] = deque()
+            while True:
+                for path in islice(paths, GREP_WORKERS * 4 - len(pending)):
+                    future = executor.submit(
+                        search_file,
+                        path=path,
+                        regex=regex,
+                        limit=max_results,
+                    )
+                    pending.append((path, future))
+                if not pending:
+                    break
+
+                path, future = pending.popleft()
+                matches = future.result()
+                if not matches:
+                    continue
+                if max_results is not None:
+                    matches = matches[: max_results - num_matches]
+                results[self._relpath(path)] = matches
+                num_matches += len(matches)
+                if max_results is not None and num_matches >= max_results:
+                    self.logger.debug(f"Reached max results for {word} in {pattern}")
+                    for _, future in pending:
+                        future.cancel()
+                    break
+
+        if index:
+            get_index(root=self.working_dir).save()
 
         if not results:
             self.logger.debug(f'No matches found for "{word}" in {pattern}')
             return {}
 
-        num_matches: int = sum(len(matches) for matches in results.values())
         self.logger.debug(f'Found {num_matches} matches for "{word}" in {pattern}')
         return results
 
+    def _relpath(self, path: str) -> str:
+        """Get path relative to the working directory if it's inside it."""
+        try:
+            return str(Path(path).relative_to(self.working_dir))
+        except ValueError:
+            return path
+
     def find(
         self,
         pattern: str,
@@ -297,6 +328,7 @@ class FileManager(Sessionable):
         case_sensitive: bool = False,
         include: t.Optional[t.List[t.Union[str, Path]]] = None,
         exclude: t.Optional[t.List[t.Union[str, Path]]] = None,
+        gitignore: bool = True,
     ) -> t.List[str]:
         """
         Find files or directories matching the given pattern
@@ -312,75 +344,66 @@ class FileManager(Sessionable):
         :param case_sensitive: If set `True` the search will be case sensitive
         :param include: List of directories to search in
         :param exclude: List of directories to exclude from the search
+        :param gitignore: If set `True` the paths ignored by `.gitignore` files are skipped
         :return: List of file paths matching the search pattern
         """
-
         include_paths = [
             self.resolve_dir(dir) for dir in (include or [self.working_dir])
         ]
-        exclude_paths = [self.resolve_dir(dir) for dir in (exclude or [])] + [
-            self.resolve_dir(".git")
-        ]
-
+        exclude_paths = [self.resolve_dir(dir) for dir in (exclude or [])]
         if case_sensitive:
             regex = re.compile(translate(pattern))
         else:
             regex = re.compile(translate(pattern), re.IGNORECASE)
 
+        prefix = os.path.join(str(self.working_dir), "")
         matches = []
-
-        def search_recursive(directory: Path, current_depth: int):
-            if depth is not None and current_depth > depth:
-                return
-
-            try:
-                for item in directory.iterdir():
-                    if item.resolve() in exclude_paths or any(
-                        ex in item.resolve().parents for ex in exclude_paths
-                    ):
-                        continue
-
-                    relative_path = str(item.relative_to(self.working_dir))
-                    if regex.match(relative_path):
-                        matches.append(relative_path)
-
-                    if item.is_dir():
-                        search_recursive(item, current_depth + 1)
-            except PermissionError:
-                pass  # Skip directories we don't have permission to access
-
         for directory in include_paths:
-            search_recursive(directory, 0)
-
+            for entry in walk(
+                root=directory,
+                gitignore=gitignore,
+                exclude=exclude_paths,
+                depth=depth,
+                dirs=True,
+                cache=self._listings,
+            ):
+                if entry.path.startswith(prefix):
+                    relative_path = entry.path[len(prefix) :]
+                else:
+                    relative_path = os.path.relpath(entry.path, self.working_dir)
+                if regex.match(relative_path):
+                    matches.append(relative_path)
         return sorted(matches)
 
     def _tree(
         self,
-        directory: Path,
+        directory: str,
         level: int,
         depth: int,
-        exclude: t.List[Path],
-    ) -> str:
+        exclude: t.Set[str],
+        rules: t.List[IgnoreRules],
+    ) -> t.Iterator[str]:
         """Auxiliary method for creating working directory tree recursively."""
-        if (depth != -1 and level > depth) or directory in exclude:
-            return ""
-
-        tree = ""
-        for child in directory.iterdir():
-            if child.is_file():
-                tree += ("  |" * level) + "__ " + child.name + "\n"
-
-        for child in directory.iterdir():
-            if child.is_file():
-                continue
-            tree += ("  |" * level) + "__ " + child.name + "\n"
-            tree += self._tree(
-                directory=child,
-                level=level + 1,
-                depth=depth,
-                exclude=exclude,
-            )
-        return tree
+        files, dirs, rules = scan(
+            directory=directory,
+            rules=rules,
+            excluded=exclude,
+            cache=self._listings,
+        )
+        prefix = ("  |" * level) + "__ "
+        for child in files:
+            yield prefix + child.name + "\n"
+
+        for child in dirs:
+            yield prefix + child.name + "\n"
+            if depth == -1 or level < depth:
+                yield from self._tree(
+                    directory=child.path,
+                    level=level + 1,
+                    depth=depth,
+                    exclude=exclude,
+                    rules=rules,
+                )
 
     def tree(
         self,
@@ -393,11 +416,14 @@ class FileManager(Sessionable):
         :param depth: Max depth for the tree
         :param exclude: Exclude directories from the tree
         """
-        return self._tree(
-            directory=self.working_dir,
-            level=0,
-            depth=depth or -1,
-            exclude=list(map(Path, exclude or [])) + [Path(".git").resolve()],
+        return "".join(
+            self._tree(
+                directory=str(self.working_dir),
+                level=0,
+                depth=depth or -1,
+                exclude={str(self.resolve_dir(dir)) for dir in exclude or []},
+                rules=parent_rules(root=str(self.working_dir)),
+            )
         )
 
     def ls(self) -> t.List[t.Tuple[str, str]]:
@@ -0,0 +1,522 @@
+"""Search helpers for the file manager."""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import typing as t
+from array import array
+from pathlib import Path
+
+from composio.constants import LOCAL_CACHE_DIRECTORY
+
+
+DEFAULT_EXCLUDES = frozenset((".git", ".venv", "__pycache__", "node_modules"))
+"""Directory names which are never walked."""
+
+BINARY_SNIFF_SIZE = 8000
+"""Number of leading bytes checked for a `NUL` byte to detect binary files,
+same as `git`."""
+
+LINE_TRUNCATE_LENGTH = 1024
+"""Maximum length of a matched line in the search results."""
+
+INDEX_CACHE_PATH = LOCAL_CACHE_DIRECTORY / "search"
+"""Directory for the persistent trigram indexes."""
+
+_INDEX_VERSION = 1
+"""Version of the index cache format."""
+
+
+def _translate(pattern: str) -> str:
+    """Translate a glob pattern to a regular expression body, `**` matches
+    across directories and `*` and `?` don't match `/`."""
+    i, n, body = 0, len(pattern), ""
+    while i < n:
+        if pattern.startswith("**/", i):
+            body += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("**", i):
+            body += ".*"
+            i += 2
+        elif pattern[i] == "*":
+            body += "[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            body += "[^/]"
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2 :]:
+            end = pattern.index("]", i + 2)
+            chars = pattern[i + 1 : end]
+            if chars[0] == "!":
+                chars = "^" + chars[1:]
+            body += "[" + chars.replace("\\", "\\\\") + "]"
+            i = end + 1
+        elif pattern[i] == "\\" and i + 1 < n:
+            body += re.escape(pattern[i + 1])
+            i += 2
+        else:
+            body += re.escape(pattern[i])
+            i += 1
+    return body
+
+
+def glob_regex(pattern: str, recursive: bool = True) -> t.Pattern[str]:
+    """
+    Compile a glob pattern to match paths relative to the search directory.
+
+    :param pattern: Glob pattern, eg. `*.py`, `src/*.txt` or `**/*.md`
+    :param recursive: If `True` the pattern matches at any depth, same as
+        `Path.rglob`, otherwise only relative to the search directory.
+    """
+    prefix = "(?:.*/)?" if recursive else ""
+    return re.compile(f"^{prefix}{_translate(pattern)}$")
+
+
+class IgnoreRules:
+    """Rules from a `.gitignore` file, scoped to the directory of the file."""
+
+    def __init__(self, base: str, lines: t.Iterable[str]) -> None:
+        """
+        Parse ignore rules.
+
+        :param base: Directory the patterns are relative to.
+        :param lines: Lines of the ignore file.
+        """
+        self.base = base
+        self._prefix = len(base.rstrip(os.sep)) + 1
+        self.rules: t.List[t.Tuple[t.Pattern[str], bool, bool]] = []
+        for line in lines:
+            line = line.rstrip("\n")
+            if not line.endswith("\\ "):
+                line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+
+            negate = line.startswith("!")
+            if negate or line.startswith("\\!") or line.startswith("\\#"):
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+
+            # Patterns with a separator are relative to the ignore file
+            if "/" in line:
+                regex = f"^{_translate(line.lstrip('/'))}$"
+            else:
+                regex = f"^(?:.*/)?{_translate(line)}$"
+            self.rules.append((re.compile(regex), negate, dir_only))
+
+    @classmethod
+    def load(cls, directory: str) -> t.Optional["IgnoreRules"]:
+        """Load the rules from the `.gitignore` file in `directory`, if any."""
+        rules = []
+        for path in (
+            os.path.join(directory, ".gitignore"),
+            os.path.join(directory, ".git", "info", "exclude"),
+        ):
+            try:
+                with open(path, encoding="utf-8", errors="replace") as fp:
+                    rules += fp.readlines()
+            except OSError:
+                continue
+        return cls(base=directory, lines=rules) if rules else None
+
+    def match(self, path: str, is_dir: bool) -> t.Optional[bool]:
+        """
+        Match a path inside the base directory against the rules.
+
+        :return: `True` if the path is ignored, `False` if it's explicitly
+            included and `None` if no rule matches.
+        """
+        relpath = path[self._prefix :]
+        result = None
+        for regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(relpath):
+                result = not negate
+        return result
+
+
+def _is_ignored(rules: t.Sequence[IgnoreRules], path: str, is_dir: bool) -> bool:
+    """Check a path against the ignore rules, deeper rules take precedence."""
+    for ruleset in reversed(rules):
+        result = ruleset.match(path=path, is_dir=is_dir)
+        if result is not None:
+            return result
+    return False
+
+
+def parent_rules(root: str) -> t.List[IgnoreRules]:
+    """Load the ignore rules from the repository containing `root`, from the
+    top of the repository down to the parent of `root`."""
+    parents = []
+    directory = os.path.dirname(root)
+    while directory != os.path.dirname(directory):
+        parents.append(directory)
+        if os.path.isdir(os.path.join(directory, ".git")):
+            break
+        directory = os.path.dirname(directory)
+    else:
+        # Not in a repository
+        return []
+
+    rules = []
+    for directory in reversed(parents):
+        ruleset = IgnoreRules.load(directory=directory)
+        if ruleset is not None:
+            rules.append(ruleset)
+    return rules
+
+
+class ListingCache:
+    """
+    Directory listings and ignore rules, keyed by the modification time of
+    the directory and the ignore file.
+
+    Creating, deleting or renaming an entry updates the modification time of
+    the directory, so a cached listing is valid while the modification time
+    is unchanged. Entries are cached with their type, the other file
+    attributes may be stale.
+    """
+
+    def __init__(self) -> None:
+        """Initialize listing cache."""
+        self._listings: t.Dict[str, t.Tuple[int, t.List[os.DirEntry]]] = {}
+        self._rules: t.Dict[str, t.Tuple[int, t.Optional[IgnoreRules]]] = {}
+        self._lock = threading.Lock()
+
+    def listdir(self, directory: str) -> t.List[os.DirEntry]:
+        """List a directory, sorted by name."""
+        mtime = os.stat(directory).st_mtime_ns
+        with self._lock:
+            cached = self._listings.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        entries = _listdir(directory=directory)
+        with self._lock:
+            self._listings[directory] = (mtime, entries)
+        return entries
+
+    def rules(self, directory: str) -> t.Optional[IgnoreRules]:
+        """Get the ignore rules defined in a directory."""
+        mtime = 0
+        for path in (
+            os.path.join(directory, ".gitignore"),
+            os.path.join(directory, ".git", "info", "exclude"),
+        ):
+            try:
+                mtime = max(mtime, os.stat(path).st_mtime_ns)
+            except OSError:
+                continue
+
+        with self._lock:
+            cached = self._rules.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        rules = IgnoreRules.load(directory=directory) if mtime else None
+        with self._lock:
+            self._rules[directory] = (mtime, rules)
+        return rules
+
+
+def _listdir(directory: str) -> t.List[os.DirEntry]:
+    """List a directory, sorted by name."""
+    with os.scandir(directory) as it:
+        return sorted(it, key=lambda entry: entry.name)
+
+
+def _is_dir(entry: os.DirEntry) -> t.Optional[bool]:
+    """Check if an entry is a directory without following symlinks."""
+    try:
+        return entry.is_dir(follow_symlinks=False)
+    except OSError:
+        return None
+
+
+def scan(
+    directory: str,
+    rules: t.List[IgnoreRules],
+    excluded: t.Collection[str] = (),
+    cache: t.Optional[ListingCache] = None,
+    gitignore: bool = True,
+) -> t.Tuple[t.List[os.DirEntry], t.List[os.DirEntry], t.List[IgnoreRules]]:
+    """
+    Scan a directory, skipping the ignored and excluded entries.
+
+    :param directory: Directory to scan.
+    :param rules: Ignore rules from the parent directories.
+    :param excluded: Absolute paths of the directories to skip.
+    :param cache: Cache for the directory listings.
+    :param gitignore: If `True` skip the paths ignored by `.gitignore` files.
+    :return: The files, the directories and the ignore rules for the
+        subdirectories.
+    """
+    try:
+        if cache is None:
+            entries = _listdir(directory=directory)
+            ruleset = IgnoreRules.load(directory=directory) if gitignore else None
+        else:
+            entries = cache.listdir(directory=directory)
+            ruleset = cache.rules(directory=directory) if gitignore else None
+    except (PermissionError, FileNotFoundError, NotADirectoryError):
+        return [], [], rules
+
+    if ruleset is not None:
+        rules = [*rules, ruleset]
+
+    files, dirs = [], []
+    for entry in entries:
+        is_dir = _is_dir(entry=entry)
+        if is_dir is None:
+            continue
+        if is_dir and (entry.name in DEFAULT_EXCLUDES or entry.path in excluded):
+            continue
+        if gitignore and _is_ignored(rules=rules, path=entry.path, is_dir=is_dir):
+            continue
+        (dirs if is_dir else files).append(entry)
+    return files, dirs, rules
+
+
+def walk(
+    root: t.Union[str, Path],
+    recursive: bool = True,
+    gitignore: bool = True,
+    exclude: t.Optional[t.Sequence[t.Union[str, Path]]] = None,
+    depth: t.Optional[int] = None,
+    dirs: bool = False,
+    cache: t.Optional[ListingCache] = None,
+) -> t.Iterator[os.DirEntry]:
+    """
+    Walk a directory tree using `os.scandir`, yielding the entries in sorted
+    order. The ignored and excluded directories are not walked.
+
+    :param root: Directory to walk.
+    :param recursive: If `True` walk the subdirectories.
+    :param gitignore: If `True` skip the paths ignored by `.gitignore` files.
+    :param exclude: Directories to skip.
+    :param depth: Max depth to walk, the entries of `root` are at depth 0.
+    :param dirs: If `True` yield the directories along with the files.
+    :param cache: Cache for the directory listings.
+    """
+    excluded = {os.path.abspath(path) for path in exclude or []}
+    root = os.path.abspath(root)
+    if not recursive:
+        depth = 0
+
+    stack = [(root, parent_rules(root=root) if gitignore else [], 0)]
+    while stack:
+        directory, rules, level = stack.pop()
+        files, subdirs, rules = scan(
+            directory=directory,
+            rules=rules,
+            excluded=excluded,
+            cache=cache,
+            gitignore=gitignore,
+        )
+        yield from files
+        if dirs:
+            yield from subdirs
+        if depth is None or level < depth:
+            stack.extend((entry.path, rules, level + 1) for entry in reversed(subdirs))
+
+
+def search_file(
+    path: str,
+    regex: t.Pattern[str],
+    limit: t.Optional[int] = None,
+) -> t.List[t.Tuple[int, str]]:
+    """
+    Search a file for the lines matching `regex`.
+
+    :param path: Path of the file.
+    :param regex: Compiled search pattern.
+    :param limit: Maximum number of lines to return.
+    :return: List of `(line number, line)` tuples, empty for binary and
+        undecodable files.
+    """
+    try:
+        with open(path, "rb") as fp:
+            data = fp.read()
+    except OSError:
+        return []
+    if b"\0" in data[:BINARY_SNIFF_SIZE]:
+        return []
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return []
+
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    matches: t.List[t.Tuple[int, str]] = []
+    lineno, position, end = 1, 0, -1
+    for match in regex.finditer(text):
+        start = match.start()
+        if start <= end:
+            # Already reported this line
+            continue
+        lineno += text.count("\n", position, start)
+        position = start
+        begin = text.rfind("\n", 0, start) + 1
+        end = text.find("\n", start)
+        if end == -1:
+            end = len(text)
+        line = text[begin:end].strip()
+        if len(line) > LINE_TRUNCATE_LENGTH:
+            line = line[:LINE_TRUNCATE_LENGTH] + "..."
+        matches.append((lineno, line))
+        if limit is not None and len(matches) >= limit:
+            break
+    return matches
+
+
+def _trigrams(text: str) -> t.Set[int]:
+    """Get the trigrams of the lowercased UTF-8 encoded text."""
+    data = text.lower().encode("utf-8")
+    return {
+        (first << 16) | (second << 8) | third
+        for first, second, third in set(zip(data, data[1:], data[2:]))
+    }
+
+
+def _pack(trigrams: t.Iterable[int]) -> str:
+    """Pack trigrams for the index cache."""
+    return base64.b64encode(array("I", sorted(trigrams)).tobytes()).decode()
+
+
+def _unpack(data: str) -> t.FrozenSet[int]:
+    """Unpack trigrams from the index cache."""
+    trigrams = array("I")
+    trigrams.frombytes(base64.b64decode(data))
+    return frozenset(trigrams)
+
+
+class TrigramIndex:
+    """
+    Persistent trigram index for a directory.
+
+    Files are indexed by the trigrams of their lowercased content, a file can
+    contain a word only if it contains all of the trigrams of the word. The
+    files are reindexed when their modification time or size changes.
+    """
+
+    def __init__(self, root: t.Union[str, Path]) -> None:
+        """
+        Initialize trigram index.
+
+        :param root: Directory to index.
+        """
+        self.root = os.path.abspath(root)
+        self.path = (
+            INDEX_CACHE_PATH
+            / f"{hashlib.sha256(self.root.encode()).hexdigest()[:16]}.json"
+        )
+        self._files: t.Dict[str, t.Tuple[int, int, t.FrozenSet[int]]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load the index from the cache."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != _INDEX_VERSION or data.get("root") != self.root:
+            return
+        self._files = {
+            path: (mtime, size, _unpack(trigrams))
+            for path, (mtime, size, trigrams) in data["files"].items()
+        }
+
+    def save(self) -> None:
+        """Write the index to the cache if it has changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": _INDEX_VERSION,
+                "root": self.root,
+                "files": {
+                    path: [mtime, size, _pack(trigrams)]
+                    for path, (mtime, size, trigrams) in self._files.items()
+                },
+            }
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.path.parent, delete=False, encoding="utf-8"
+        ) as fp:
+            json.dump(data, fp)
+        os.replace(fp.name, self.path)
+
+    def _index(self, entry: os.DirEntry) -> t.Tuple[int, int, t.FrozenSet[int]]:
+        """Index a file, binary and undecodable files have no trigrams."""
+        stat = entry.stat()
+        trigrams: t.FrozenSet[int] = frozenset()
+        try:
+            with open(entry.path, "rb") as fp:
+                data = fp.read()
+            if b"\0" not in data[:BINARY_SNIFF_SIZE]:
+                trigrams = frozenset(_trigrams(data.decode("utf-8")))
+        except (OSError, UnicodeDecodeError):
+            pass
+        return stat.st_mtime_ns, stat.st_size, trigrams
+
+    def filter(
+        self, entries: t.Iterable[os.DirEntry], word: str
+    ) -> t.Iterator[os.DirEntry]:
+        """
+        Filter the files which may contain `word`, reindexing the files which
+        have changed since they were indexed.
+
+        :param entries: Files to filter.
+        :param word: Word to search for, words shorter than 3 characters or
+            with non ASCII characters match all of the files.
+        """
+        needles = _trigrams(word) if word.isascii() else set()
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            with self._lock:
+                cached = self._files.get(entry.path)
+            if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+                cached = self._index(entry=entry)
+                with self._lock:
+                    self._files[entry.path] = cached
+                    self._dirty = True
+            if needles <= cached[2]:
+                yield entry
+
+    def prune(self) -> None:
+        """Remove the deleted files from the index."""
+        with self._lock:
+            deleted = [path for path in self._files if not os.path.isfile(path)]
+            for path in deleted:
+                del self._files[path]
+            self._dirty = self._dirty or bool(deleted)
+
+
+_indexes: t.Dict[str, TrigramIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(root: t.Union[str, Path]) -> TrigramIndex:
+    """Get the trigram index for a directory, shared in the process."""
+    root = os.path.abspath(root)
+    with _indexes_lock:
+        if root not in _indexes:
+            _indexes[root] = TrigramIndex(root=root)
+        return _indexes[root]
@@ -3,17 +3,30 @@
 import os
 import re
 import select
+import shlex
+import signal
 import subprocess
+import threading
 import time
 import typing as t
+import uuid
 from abc import abstractmethod
+from collections import OrderedDict
 from pathlib import Path
 
 import paramiko
 
 from composio.tools.env.base import Sessionable
-from composio.tools.env.constants import ECHO_EXIT_CODE, EXIT_CODE, STDERR, STDOUT
+from composio.tools.env.constants import (
+    CWD,
+    EXIT_CODE,
+    RUNNING,
+    STDERR,
+    STDOUT,
+    TRUNCATED,
+)
 from composio.tools.env.id import generate_id
+from composio.utils.logging import WithLogger
 
 
 _ANSI_ESCAPE = re.compile(
@@ -32,20 +45,488 @@ _ANSI_ESCAPE = re.compile(
 )
 
 
+_ECHOED_SENTINEL = re.compile(rb"[^\n]*__COMPOSIO_ E[0-9a-f]{32}[^\n]*\n?")
+
 _DEV_SOURCE = Path("/home/user/.dev/bin/activate")
-_NOWAIT_CMDS = ("cd", "ls", "pwd")
+
+_MARKER = "__COMPOSIO_"
+"""Prefix for the command sentinels, the sentinels are printed as two separate
+`printf` arguments so echoed input never contains them."""
+
+_DEFAULT_TIMEOUT = 120.0
+
+_SNAPSHOT = (
+    '__composio_cwd="$PWD"; '
+    '__composio_env="$(declare -px)"; '
+    "__composio_names=\" $(compgen -e | tr '\\n' ' ') \""
+)
+"""Record the working directory and the exported variables of a set up shell,
+the snapshot is kept in unexported shell variables."""
+
+_RESTORE = (
+    'kill -9 $(jobs -p) 2>/dev/null; wait 2>/dev/null; cd "$__composio_cwd"; '
+    "for __composio_var in $(compgen -e); do "
+    '[[ "$__composio_names" == *" $__composio_var "* ]] '
+    '|| unset "$__composio_var"; done; '
+    'eval "$__composio_env" 2>/dev/null; true'
+)
+"""Kill the background jobs and restore the snapshot taken by `_SNAPSHOT`."""
+
+DEFAULT_TAIL_SIZE = 64 * 1024
+"""Number of bytes retained for each output stream of a streaming command."""
+
+MAX_STREAMS = 16
+"""Number of streaming command handles kept per shell."""
+
+
+class Sentinel:
+    """Unique start and end markers for a command."""
+
+    def __init__(self) -> None:
+        self.id = uuid.uuid4().hex
+        self.tag = f"{_MARKER}E{self.id}".encode()
+        self.start = re.compile(re.escape(f"{_MARKER}S{self.id}".encode()) + rb"\r?\n")
+        self.end = re.compile(re.escape(self.tag) + rb"(?: (-?\d+) ([^\r\n]*))?\r?\n")
+
+    def wrap(self, cmd: str, stderr: bool = False) -> str:
+        """
+        Wrap the command with the sentinels. The end sentinel carries the exit
+        code and the working directory after the command exits.
+
+        :param cmd: Command to wrap
+        :param stderr: Print the sentinels on `stderr` as well
+        """
+        start = f"printf '%s%s\\n' {_MARKER} S{self.id}"
+        end = f"printf '%s%s\\n' {_MARKER} E{self.id}"
+        return "; ".join(
+            (
+                start,
+                *((start + " >&2",) if stderr else ()),
+                # Restore the exit code of the previous command for `$?`
+                "__composio_status() { return ${1:-0}; }",
+                '__composio_status "$__composio_ec"',
+                f"eval {shlex.quote(cmd)}",
+                "__composio_ec=$?",
+                (
+                    f"printf '%s%s %s %s\\n' {_MARKER} E{self.id} "
+                    '"$__composio_ec" "$PWD"'
+                ),
+                *((end + " >&2",) if stderr else ()),
+            )
+        )
+
+    def interrupted(self) -> str:
+        """Command for printing the end sentinel of an interrupted command."""
+        return f"printf '%s%s %s %s\\n' {_MARKER} E{self.id} 130 \"$PWD\""
+
+
+class _Framer:
+    """Extracts the output of a command from a stream of output chunks."""
+
+    def __init__(self, sentinel: Sentinel) -> None:
+        self.sentinel = sentinel
+        self.buffer = b""
+        self.started = False
+        self.end: t.Optional[t.Match[bytes]] = None
+
+    def feed(self, data: bytes) -> bytes:
+        """Feed a chunk and return the command output which can be emitted."""
+        if self.end is not None:
+            return b""
+
+        self.buffer += data
+        if not self.started:
+            start = self.sentinel.start.search(self.buffer)
+            if start is None:
+                # Anything before the start sentinel is echoed input or
+                # leftover output, keep enough to match a split sentinel
+                self.buffer = self.buffer[-(len(self.sentinel.tag) + 2) :]
+                return b""
+            self.started = True
+            self.buffer = self.buffer[start.end() :]
+
+        self.end = self.sentinel.end.search(self.buffer)
+        if self.end is not None:
+            output, self.buffer = self.buffer[: self.end.start()], b""
+            return output
+
+        hold = self._hold()
+        output, self.buffer = self.buffer[:hold], self.buffer[hold:]
+        return output
+
+    def _hold(self) -> int:
+        """Index from which the buffer may contain an incomplete end sentinel."""
+        tag = self.sentinel.tag
+        index = self.buffer.find(tag)
+        if index != -1:
+            return index
+
+        for index in range(max(len(self.buffer) - len(tag), 0), len(self.buffer)):
+            if tag.startswith(self.buffer[index:]):
+                return index
+        return len(self.buffer)
+
+    @property
+    def done(self) -> bool:
+        return self.end is not None
+
+
+class _Tail:
+    """Bounded buffer retaining the tail of an output stream."""
+
+    def __init__(self, size: t.Optional[int]) -> None:
+        self.size = size
+        self.data = bytearray()
+        self.total = 0
+
+    def append(self, data: bytes) -> None:
+        self.data += data
+        self.total += len(data)
+        if self.size is not None and len(self.data) > self.size:
+            del self.data[: len(self.data) - self.size]
+
+    @property
+    def dropped(self) -> int:
+        """Number of bytes dropped from the head of the stream."""
+        return self.total - len(self.data)
+
+    def read(self, offset: int = 0) -> t.Tuple[bytes, int]:
+        """Read the retained data after `offset`, returns data and new offset."""
+        start = max(offset - self.dropped, 0)
+        return bytes(self.data[start:]), self.total
+
+
+class ShellStream(WithLogger):
+    """
+    Handle for a command running on a shell in streaming mode.
+
+    Output is drained from the shell in a background thread as it arrives and
+    only the last `tail_size` bytes of each stream are retained.
+    """
+
+    def __init__(
+        self,
+        shell: "Shell",
+        cmd: str,
+        sentinel: Sentinel,
+        tail_size: t.Optional[int] = DEFAULT_TAIL_SIZE,
+        framers: t.Optional[t.Dict[str, _Framer]] = None,
+    ) -> None:
+        """
+        Initialize streaming command handle.
+
+        :param shell: Shell running the command
+        :param cmd: Command string
+        :param sentinel: Sentinel the command was wrapped with
+        :param tail_size: Number of bytes to retain for each output stream,
+            set `None` to retain the entire output.
+        :param framers: Framers to continue reading the output with, if the
+            command was started in blocking mode.
+        """
+        super().__init__()
+        self.id = sentinel.id[:12]
+        self.cmd = cmd
+        self.exit_code: t.Optional[int] = None
+        self.cwd = ""
+        self._shell = shell
+        self._sentinel = sentinel
+        self._framers = framers or {
+            stream: _Framer(sentinel=sentinel) for stream in shell.output_streams
+        }
+        self._tails = {stream: _Tail(size=tail_size) for stream in (STDOUT, STDERR)}
+        self._offsets = {STDOUT: 0, STDERR: 0}
+        self._error: t.Optional[BaseException] = None
+        self._done = threading.Event()
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._pump, daemon=True)
+        self._thread.start()
+
+    def _pump(self) -> None:
+        """Read output from the shell until the command exits."""
+        try:
+            while not all(framer.done for framer in self._framers.values()):
+                for (
+                    stream,
+                    data,
+                ) in self._shell._recv(  # pylint: disable=protected-access
+                    timeout=0.5
+                ):
+                    output = self._framers[stream].feed(data)
+                    if not output:
+                        continue
+                    with self._cond:
+                        self._tails[stream].append(output)
+                        self._cond.notify_all()
+
+            end = t.cast(t.Match[bytes], self._framers[STDOUT].end)
+            exit_code, cwd = end.groups()
+            self.exit_code = int(exit_code)
+            self.cwd = cwd.decode(errors="replace")
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.debug(f"Error reading output for `{self.cmd}`: {e}")
+            self._error = e
+        finally:
+            with self._cond:
+                self._done.set()
+                self._cond.notify_all()
+
+    @property
+    def running(self) -> bool:
+        """Check if the command is still running."""
+        return not self._done.is_set()
+
+    @property
+    def dropped(self) -> t.Dict[str, int]:
+        """Number of bytes dropped from the head of each output stream."""
+        with self._cond:
+            return {stream: tail.dropped for stream, tail in self._tails.items()}
+
+    def __iter__(self) -> t.Iterator[t.Tuple[str, str]]:
+        """Yield `(stream, chunk)` tuples as the output arrives."""
+        offsets = {STDOUT: 0, STDERR: 0}
+        while True:
+            with self._cond:
+                done = self._done.is_set()
+                chunks = []
+                for stream, tail in self._tails.items():
+                    data, offsets[stream] = tail.read(offset=offsets[stream])
+                    if data:
+                        chunks.append((stream, self._shell.decode(data)))
+                if not chunks and not done:
+                    self._cond.wait(timeout=1.0)
+                    continue
+            yield from chunks
+            if done and not chunks:
+                return
+
+    def poll(self) -> t.Dict:
+        """
+        Get the output produced since the last `poll` call.
+
+        :return: Dictionary with `stdout`, `stderr`, `exit_code`, `cwd`,
+            `running` and `truncated` keys; `exit_code` is `None` while the
+            command is running and `truncated` has the number of bytes for each
+            stream dropped from the tail buffer since the last call.
+        """
+        with self._cond:
+            output: t.Dict[str, t.Any] = {TRUNCATED: {}}
+            for stream, tail in self._tails.items():
+                offset = self._offsets[stream]
+                output[TRUNCATED][stream] = max(tail.dropped - offset, 0)
+                data, self._offsets[stream] = tail.read(offset=offset)
+                output[stream] = self._shell.decode(data)
+            running = not self._done.is_set()
+
+        if self._error is not None:
+            raise self._error
+        return {
+            **output,
+            EXIT_CODE: self.exit_code,
+            CWD: self.cwd,
+            RUNNING: running,
+        }
+
+    def wait(self, timeout: t.Optional[float] = None) -> t.Dict:
+        """
+        Wait for the command to exit and return the remaining output.
+
+        :param timeout: Maximum time to wait in seconds
+        :raises TimeoutError: If the command is still running after `timeout`
+        """
+        if not self._done.wait(timeout=timeout):
+            raise TimeoutError(f"Command `{self.cmd}` is still running")
+        return self.poll()
+
+    def cancel(self, timeout: float = 5.0) -> t.Dict:
+        """
+        Interrupt the command and return the remaining output.
+
+        :param timeout: Time to wait for the command to exit after the
+            interrupt before killing it.
+        """
+        # The interrupt is repeated since the command may not have started
+        # its processes yet
+        deadline = time.monotonic() + timeout
+        while self.running and time.monotonic() < deadline:
+            self._shell._interrupt(  # pylint: disable=protected-access
+                sentinel=self._sentinel
+            )
+            self._done.wait(timeout=0.5)
+
+        if self.running:
+            self._shell._interrupt(  # pylint: disable=protected-access
+                sentinel=self._sentinel,
+                force=True,
+            )
+            self._done.wait(timeout=timeout)
+        return self.poll()
 
 
 class Shell(Sessionable):
     """Abstract shell session."""
 
+    output_streams: t.Tuple[str, ...] = (STDOUT, STDERR)
+    """Output streams carrying the sentinels."""
+
+    def __init__(self) -> None:
+        """Initialize shell."""
+        super().__init__()
+        self._active: t.Optional[ShellStream] = None
+        self._streams: "OrderedDict[str, ShellStream]" = OrderedDict()
+
     def sanitize_command(self, cmd: str) -> bytes:
         """Prepare command string."""
         return (cmd.rstrip() + "\n").encode()
 
     @abstractmethod
+    def _write(self, cmd: str) -> None:
+        """Write command to the shell."""
+
+    @abstractmethod
+    def _recv(self, timeout: float) -> t.List[t.Tuple[str, bytes]]:
+        """
+        Receive the available output, waiting up to `timeout` seconds.
+
+        :return: List of `(stream, data)` tuples
+        :raises RuntimeError: If the shell exited
+        """
+
+    @abstractmethod
+    def _interrupt(self, sentinel: Sentinel, force: bool = False) -> None:
+        """Interrupt the running command."""
+
+    def decode(self, data: bytes) -> str:
+        """Decode command output."""
+        return data.decode(errors="replace")
+
+    def _setup_cmd(self, environment: t.Dict, *cmds: str) -> str:
+        """
+        Build the setup command, the environment is exported in a single
+        command and the state of the shell is recorded for `reset()`.
+        """
+        setup = []
+        # Load development environment if available
+        if _DEV_SOURCE.exists():
+            setup.append(f"source {_DEV_SOURCE}")
+        if environment:
+            setup.append(
+                "export "
+                + " ".join(f"{key}={value}" for key, value in environment.items())
+            )
+        return "; ".join([*setup, *cmds, _SNAPSHOT])
+
+    def reset(self) -> bool:
+        """
+        Cancel the running commands, kill the background jobs and restore the
+        working directory and the exported variables to the state after setup.
+
+        Unexported variables, functions and aliases are kept.
+        """
+        try:
+            for stream in self._streams.values():
+                if stream.running:
+                    stream.cancel()
+            self._wait_active(timeout=_DEFAULT_TIMEOUT)
+            self._streams.clear()
+            return self.exec(cmd=_RESTORE)[EXIT_CODE] == 0
+        except (RuntimeError, TimeoutError, OSError) as e:
+            self.logger.debug(f"Error resetting shell {self.id}: {e}")
+            return False
+
+    def _wait_active(self, timeout: float) -> None:
+        """Wait for the active streaming command to exit."""
+        if self._active is not None and self._active.running:
+            self._active.wait(timeout=timeout)
+        self._active = None
+
     def exec(self, cmd: str, wait: bool = True) -> t.Dict:
-        """Execute command on container."""
+        """
+        Execute command on the shell.
+
+        The output, exit code and working directory are read in a single round
+        trip, using the sentinels the command is wrapped with.
+
+        :param cmd: Command to execute
+        :param wait: Set `False` to return the output available right away and
+            keep the command running in the background.
+        """
+        if not wait:
+            stream = self.stream(cmd=cmd)
+            try:
+                return stream.wait(timeout=0.1)
+            except TimeoutError:
+                return {**stream.poll(), EXIT_CODE: 0}
+
+        self._wait_active(timeout=_DEFAULT_TIMEOUT)
+        sentinel = Sentinel()
+        framers = {stream: _Framer(sentinel=sentinel) for stream in self.output_streams}
+        buffer: t.Dict[str, t.List[bytes]] = {STDOUT: [], STDERR: []}
+        self._write(cmd=sentinel.wrap(cmd=cmd, stderr=STDERR in framers))
+
+        deadline = time.monotonic() + _DEFAULT_TIMEOUT
+        while not all(framer.done for framer in framers.values()):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # Keep draining the output so the next command can run after
+                # this one exits
+                self._active = ShellStream(
+                    shell=self,
+                    cmd=cmd,
+                    sentinel=sentinel,
+                    tail_size=0,
+                    framers=framers,
+                )
+                raise TimeoutError(
+                    "Timeout reached while reading from shell.\nCurrent "
+                    f"buffer: {buffer}"
+                )
+            for stream, data in self._recv(timeout=remaining):
+                buffer[stream].append(framers[stream].feed(data))
+
+        exit_code, cwd = t.cast(t.Match[bytes], framers[STDOUT].end).groups()
+        return {
+            STDOUT: self.decode(b"".join(buffer[STDOUT])),
+            STDERR: self.decode(b"".join(buffer[STDERR])),
+            EXIT_CODE: int(exit_code),
+            CWD: cwd.decode(errors="replace"),
+        }
+
+    def stream(
+        self,
+        cmd: str,
+        tail_size: t.Optional[int] = DEFAULT_TAIL_SIZE,
+    ) -> ShellStream:
+        """
+        Execute command in streaming mode.
+
+        :param cmd: Command to execute
+        :param tail_size: Number of bytes to retain for each output stream
+        :return: Handle for reading the output incrementally, waiting for or
+            cancelling the command.
+        """
+        self._wait_active(timeout=_DEFAULT_TIMEOUT)
+        sentinel = Sentinel()
+        self._write(cmd=sentinel.wrap(cmd=cmd, stderr=STDERR in self.output_streams))
+        self._active = ShellStream(
+            shell=self,
+            cmd=cmd,
+            sentinel=sentinel,
+            tail_size=tail_size,
+        )
+        self._streams[self._active.id] = self._active
+        for sid in list(self._streams)[:-MAX_STREAMS]:
+            if not self._streams[sid].running:
+                del self._streams[sid]
+        return self._active
+
+    def get_stream(self, id: str) -> ShellStream:
+        """
+        Get streaming command handle.
+
+        :param id: ID of the streaming command
+        :raises KeyError: If no command with the ID was started on this shell
+        """
+        return self._streams[id]
 
 
 # TODO: Execute in a virtual environment
@@ -75,84 +556,23 @@ class HostShell(Shell):
         self.logger.debug(
             "Initial data from session: %s - %s",
             self.id,
-            self._read(wait=False),
+            self.exec(cmd=self._setup_cmd(self.environment)),
         )
 
-        # Load development environment if available
-        if _DEV_SOURCE.exists():
-            self.logger.debug("Loading development environment")
-            self.exec(f"source {_DEV_SOURCE}")
-
-        # Setup environment
-        for key, value in self.environment.items():
-            self.exec(f"export {key}={value}")
-            time.sleep(0.05)
-
-    def _has_command_exited(self, cmd: str) -> bool:
-        """Waif for command to exit."""
-        _cmd, *_ = cmd.split(" ")
-        if _cmd in _NOWAIT_CMDS:
-            time.sleep(0.3)
-            return True
-
-        output = subprocess.run(  # pylint: disable=subprocess-run-check
-            ["ps", "-e"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        ).stdout.decode()
-        return all(_cmd.lstrip().rstrip() not in output for _cmd in cmd.split("&&"))
-
-    def _get_exit_code(self) -> int:
-        """Get exit code of the last process."""
-        self._write(ECHO_EXIT_CODE)
-        *_, exit_code = self._read(wait=False).get(STDOUT).strip().split("\n")  # type: ignore
-        if len(exit_code) == 0:
-            return 0
-        return int(exit_code)
-
-    def _read(
-        self,
-        cmd: t.Optional[str] = None,
-        wait: bool = True,
-        timeout: float = 120.0,
-    ) -> t.Dict:
-        """Read data from a subprocess with a timeout."""
-        stderr = t.cast(t.IO[str], self._process.stderr).fileno()
-        stdout = t.cast(t.IO[str], self._process.stdout).fileno()
-        buffer = {stderr: b"", stdout: b""}
-        if wait and cmd is None:
-            raise ValueError("`cmd` cannot be `None` when `wait` is set to `True`")
-
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            if wait and not self._has_command_exited(cmd=str(cmd)):
-                time.sleep(0.5)
-                continue
-
-            readables, _, _ = select.select([stderr, stdout], [], [], 0.1)
-            if not readables:
-                break
-            for fd in readables:
-                data = os.read(fd, 4096)
-                if data:
-                    buffer[fd] += data
-            time.sleep(0.05)
-
-        if self._process.poll() is not None:
-            raise RuntimeError(
-                f"Subprocess exited unexpectedly.\nCurrent buffer: {buffer}"
-            )
-
-        if time.time() >= end_time:
-            raise TimeoutError(
-                "Timeout reached while reading from subprocess.\nCurrent "
-                f"buffer: {buffer}"
-            )
-
-        return {
-            STDOUT: buffer[stdout].decode(),
-            STDERR: buffer[stderr].decode(),
+    def _recv(self, timeout: float) -> t.List[t.Tuple[str, bytes]]:
+        """Read the available output from `stdout` and `stderr`."""
+        fds = {
+            t.cast(t.IO[str], self._process.stdout).fileno(): STDOUT,
+            t.cast(t.IO[str], self._process.stderr).fileno(): STDERR,
         }
+        readables, _, _ = select.select(list(fds), [], [], timeout)
+        chunks = []
+        for fd in readables:
+            data = os.read(fd, 65536)
+            if not data:
+                raise RuntimeError("Subprocess exited unexpectedly")
+            chunks.append((fds[fd], data))
+        return chunks
 
     def _write(self, cmd: str) -> None:
         """Write command to shell."""
@@ -163,13 +583,32 @@ class HostShell(Shell):
         except BrokenPipeError as e:
             raise RuntimeError(str(e)) from e
 
-    def exec(self, cmd: str, wait: bool = True) -> t.Dict:  # type: ignore
-        """Execute command on container."""
-        self._write(cmd=cmd)
-        return {
-            **self._read(cmd=cmd, wait=wait),
-            EXIT_CODE: self._get_exit_code(),
-        }
+    def _children(self) -> t.List[int]:
+        """Get the process IDs of the commands running on the shell."""
+        children = Path(f"/proc/{self._process.pid}/task/{self._process.pid}/children")
+        if children.exists():
+            return [int(pid) for pid in children.read_text().split()]
+
+        output = subprocess.run(  # pylint: disable=subprocess-run-check
+            ["pgrep", "-P", str(self._process.pid)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        ).stdout.decode()
+        return [int(pid) for pid in output.split()]
+
+    def _interrupt(self, sentinel: Sentinel, force: bool = False) -> None:
+        """Interrupt the running command by signalling its process group."""
+        sig = signal.SIGKILL if force else signal.SIGINT
+        for pid in self._children():
+            try:
+                # Jobs run in their own process group with job control enabled
+                pgid = os.getpgid(pid)
+                if pgid != os.getpgid(0):
+                    os.killpg(pgid, sig)
+                else:
+                    os.kill(pid, sig)
+            except ProcessLookupError:
+                continue
 
     def teardown(self) -> None:
         """Stop and remove the running shell."""
@@ -179,6 +618,8 @@ class HostShell(Shell):
 class SSHShell(Shell):
     """Interactive shell over SSH session."""
 
+    output_streams = (STDOUT,)
+
     def __init__(
         self, client: paramiko.SSHClient, environment: t.Optional[t.Dict] = None
     ) -> None:
@@ -192,90 +633,39 @@ class SSHShell(Shell):
     def setup(self) -> None:
         """Invoke shell."""
         self.logger.debug(f"Setting up shell: {self.id}")
+        self.exec(cmd=self._setup_cmd(self.environment, "cd ~/", "export PS1=''"))
 
-        # Load development environment if available
-        if _DEV_SOURCE.exists():
-            self.logger.debug("Loading development environment")
-            self.exec(f"source {_DEV_SOURCE}")
-
-        # Setup environment
-        for key, value in self.environment.items():
-            self._send(f"export {key}={value}")
-            time.sleep(0.05)
-            self._read()
-
-        # CD to user dir
-        self.exec(cmd="cd ~/ && export PS1=''")
-
-    def _send(self, buffer: str, stdin: t.Optional[str] = None) -> None:
-        """Send buffer to shell."""
-        if stdin is None:
-            self.channel.sendall(f"{buffer}\n".encode("utf-8"))
-            time.sleep(0.05)
-            return
-
-        self.channel.send(f"{buffer}\n".encode("utf-8"))
-        self.channel.sendall(f"{stdin}\n".encode("utf-8"))
-        time.sleep(0.05)
-
-    def _read(self) -> str:
-        """Read buffer from shell."""
-        output = b""
-        while self.channel.recv_ready():
-            output += self.channel.recv(512)
-        while self.channel.recv_stderr_ready():
-            output += self.channel.recv_stderr(512)
-        return _ANSI_ESCAPE.sub(b"", output).decode(encoding="utf-8")
-
-    def _wait(self, cmd: str) -> None:
-        """Wait for the command to execute."""
-        _cmd, *_rest = cmd.split(" ")
-        if _cmd in _NOWAIT_CMDS or len(_rest) == 0:
-            time.sleep(0.3)
-            return
-
-        while True:
-            _, stdout, _ = self.client.exec_command(command="ps -eo command")
-            if all(
-                not line.lstrip().rstrip().endswith(cmd)
-                for line in stdout.read().decode().split("\n")
-            ):
-                return
-            time.sleep(0.3)
-
-    def _exit_status(self) -> int:
-        """Wait for the command to execute."""
-        self._send(buffer="echo $?")
-        try:
-            output = self._read().split("\n")
-            if len(output) == 1:
-                return int(output[0].lstrip().rstrip())
-            return int(output[1].lstrip().rstrip())
-        except ValueError:
-            return 1
-
-    def _sanitize_output(self, output: str) -> str:
-        """Clean the output."""
-        lines = list(map(lambda x: x.rstrip(), output.split("\r\n")))
-        clean = "\n".join(lines[1:])
-        if clean.startswith("\r"):
-            clean = clean[1:]
-        return clean.replace("(.dev)\n", "")
-
-    def exec(self, cmd: str, wait: bool = True) -> t.Dict:
-        """Execute a command and return output and exit code."""
-        output = ""
-        for _cmd in cmd.split(" && "):
-            self._send(buffer=_cmd)
-            if wait:
-                self._wait(cmd=_cmd)
-            output += self._sanitize_output(output=self._read())
-
-        return {
-            STDOUT: output,
-            STDERR: "",
-            EXIT_CODE: str(self._exit_status()),
-        }
+    def _write(self, cmd: str) -> None:
+        """
+        Send command to shell.
+
+        The command is sent on a single line, so the echoed input always
+        precedes the start sentinel and is dropped from the output.
+        """
+        self.channel.sendall(f"{cmd}\n".encode("utf-8"))
+
+    def _recv(self, timeout: float) -> t.List[t.Tuple[str, bytes]]:
+        """Read the available output from the channel."""
+        readables, _, _ = select.select([self.channel], [], [], timeout)
+        if not readables:
+            return []
+
+        data = self.channel.recv(65536)
+        if not data:
+            raise RuntimeError("SSH channel closed unexpectedly")
+        return [(STDOUT, data)]
+
+    def _interrupt(self, sentinel: Sentinel, force: bool = False) -> None:
+        """Interrupt the running command by sending `Ctrl+C`."""
+        self.channel.sendall(b"\x03")
+        # Interactive shells abort the rest of the command line on `Ctrl+C`,
+        # so print the end sentinel again
+        self._write(cmd=sentinel.interrupted())
+
+    def decode(self, data: bytes) -> str:
+        """Decode command output from the pseudo terminal."""
+        data = _ECHOED_SENTINEL.sub(b"", _ANSI_ESCAPE.sub(b"", data))
+        return data.decode(encoding="utf-8", errors="replace").replace("\r\n", "\n")
 
     def teardown(self) -> None:
         """Close the SSH channel."""
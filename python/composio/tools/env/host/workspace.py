@@ -62,6 +62,9 @@ class Config(WorkspaceConfigType):
     ssh: t.Optional[SSHConfig] = None
     """SSH configuration for creating interactive shell sessions."""
 
+    shell_pool_size: int = 1
+    """Number of shells to keep set up in the background, set `0` to disable pooling."""
+
 
 class HostWorkspace(Workspace):
     """Host workspace implementation."""
@@ -76,6 +79,7 @@ class HostWorkspace(Workspace):
         """Initialize host workspace."""
         super().__init__(config=config)
         self.ssh_config = config.ssh or {}
+        self.shell_pool_size = config.shell_pool_size
         # TODO: Make this configurable
         self._working_dir = None
 
@@ -117,7 +121,7 @@ class HostWorkspace(Workspace):
     def shells(self) -> Shells:
         """Active shell session."""
         if self._shells is None:
-            self._shells = Shells(self._create_shell)
+            self._shells = Shells(self._create_shell, pool_size=self.shell_pool_size)
         return self._shells
 
     def _create_filemanager(self) -> FileManager:
@@ -148,51 +152,44 @@ class HostWorkspace(Workspace):
         actions: t.Optional[t.Sequence[ActionType]] = None,
         tags: t.Optional[t.Sequence[TagType]] = None,
     ) -> None:
-        from composio.tools.base.abs import (  # pylint: disable=import-outside-toplevel
-            action_registry,
-            tool_registry,
+        from composio.tools.local import (  # pylint: disable=import-outside-toplevel
+            get_manifest,
         )
         from composio.utils.pypi import (  # pylint: disable=import-outside-toplevel
             add_package_to_installed_list,
             check_if_package_is_intalled,
         )
 
-        missing: t.Dict[str, t.Set[str]] = {}
+        # The requirements are read from the manifest so the tool modules,
+        # which may import the missing dependencies, are not imported
+        manifest = get_manifest()
+        requires: t.Dict[str, t.List[str]] = {}
         apps = apps or []
         for app in map(App, apps):
-            if not app.is_local:
-                continue
-
-            for dependency in tool_registry["local"][app.slug].requires or []:
-                if check_if_package_is_intalled(dependency):
-                    continue
-                if app.slug not in missing:
-                    missing[app.slug] = set()
-                missing[app.slug].add(dependency)
+            if app.is_local and app.slug in manifest["tools"]:
+                requires[app.slug] = manifest["tools"][app.slug]["requires"]
 
         actions = actions or []
         for action in map(Action, actions):
-            if not action.is_local or action.is_runtime:
-                continue
-
-            for dependency in action_registry["local"][action.slug].requires or []:
-                if check_if_package_is_intalled(dependency):
-                    continue
-                if action.slug not in missing:
-                    missing[action.slug] = set()
-                missing[action.slug].add(dependency)
+            if action.is_local and not action.is_runtime:
+                entry = manifest["actions"].get(action.slug)
+                if entry is not None:
+                    requires[action.slug] = entry["requires"]
 
         # TODO: Create CRUD object
         tags = tags or []
-        for action in map(Action, action_registry["local"]):
-            if not any(tag in action.tags for tag in tags):
-                continue
-            for dependency in action_registry["local"][action.slug].requires or []:
+        for slug, entry in manifest["actions"].items():
+            if any(tag in entry["tags"] for tag in tags):
+                requires[slug] = entry["requires"]
+
+        missing: t.Dict[str, t.Set[str]] = {}
+        for enum, dependencies in requires.items():
+            for dependency in dependencies:
                 if check_if_package_is_intalled(dependency):
                     continue
-                if action.slug not in missing:
-                    missing[action.slug] = set()
-                missing[action.slug].add(dependency)
+                if enum not in missing:
+                    missing[enum] = set()
+                missing[enum].add(dependency)
 
         if len(missing) == 0:
             return
@@ -236,15 +233,14 @@ class HostWorkspace(Workspace):
         metadata: dict,
     ) -> t.Dict:
         """Execute action in host workspace."""
-        from composio.tools.local import (  # pylint: disable=import-outside-toplevel
-            load_local_tools,
+        from composio.tools.base.abs import (  # pylint: disable=import-outside-toplevel
+            tool_registry,
         )
 
-        registry = load_local_tools()
         tool = (
-            registry["runtime"][action.app.upper()]
+            tool_registry["runtime"][action.app.upper()]
             if action.is_runtime
-            else registry["local"][action.app.upper()]
+            else tool_registry["local"][action.app.upper()]
         )
         return tool.execute(
             action=action.slug,
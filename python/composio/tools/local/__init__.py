@@ -1,20 +1,31 @@
 """Local tools."""
 
 import importlib
-from pathlib import Path
 
 from composio.tools.base.abs import ToolRegistry, tool_registry
+from composio.tools.local.manifest import TOOLS_PATH, get_manifest
 
 
-TOOLS_PATH = Path(__file__).parent
+_loaded = False
 
 
 def load_local_tools() -> ToolRegistry:
-    for tooldef in TOOLS_PATH.glob("**/tool.py"):
-        importlib.import_module(
-            "composio.tools.local."
-            + ".".join(tooldef.relative_to(TOOLS_PATH).parent.parts)
-            + ".tool"
-        )
+    """
+    Import all of the local tool modules.
 
+    Use this only when all of the local tools are required, looking up a tool
+    or an action in the registry imports the module defining it on demand.
+    """
+    global _loaded
+    if not _loaded:
+        for module in get_manifest()["modules"]:
+            importlib.import_module(module)
+        _loaded = True
     return tool_registry
+
+
+__all__ = (
+    "TOOLS_PATH",
+    "get_manifest",
+    "load_local_tools",
+)
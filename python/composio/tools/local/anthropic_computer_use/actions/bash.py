@@ -74,14 +74,17 @@ class BashCommand(LocalAction[BashRequest, BashResponse]):
         """Execute a bash command."""
         try:
             if "firefox" not in request.command:
-                output = self.shells.get(id=request.session_id).exec(
-                    cmd=request.command
-                )
+                shell = self.shells.get(id=request.session_id)
+                if request.restart:
+                    # The released shell is reset and returned to the pool
+                    self.shells.release(id=shell.id)
+                    shell = self.shells.new()
+                output = shell.exec(cmd=request.command)
                 return BashResponse(
                     stdout=output[STDOUT],
                     stderr=output[STDERR],
                     exit_code=output[EXIT_CODE],
-                    session_id=request.session_id,
+                    session_id=shell.id,
                 )
 
             output = self.shells.new().exec(cmd=request.command, wait=False)
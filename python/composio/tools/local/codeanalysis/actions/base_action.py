@@ -3,7 +3,8 @@ import os
 from abc import abstractmethod
 from typing import Dict, List, Optional
 
-from composio.tools.local.codeanalysis.constants import CODE_MAP_CACHE, FQDN_FILE
+from composio.tools.local.codeanalysis import index
+from composio.tools.local.codeanalysis.constants import FQDN_FILE
 
 
 class BaseCodeAnalysisAction:
@@ -16,8 +17,10 @@ class BaseCodeAnalysisAction:
     def execute(self, request, metadata):
         pass
 
-    def load_fqdn_cache(self, repo_name: str):
-        self.fqdn_cache_file = os.path.join(CODE_MAP_CACHE, repo_name, FQDN_FILE)
+    def load_fqdn_cache(self, repo_dir: str):
+        self.fqdn_cache_file = os.path.join(
+            index.cache_dir(repo_dir, create=False), FQDN_FILE
+        )
         if not os.path.exists(self.fqdn_cache_file):
             raise FileNotFoundError(
                 f"FQDN cache file not found: {self.fqdn_cache_file}"
@@ -1,17 +1,19 @@
 import json
 import os
-import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
 from composio.tools.base.exceptions import ExecutionFailed
 from composio.tools.base.local import LocalAction
+from composio.tools.local.codeanalysis import index, tool_utils
 from composio.tools.local.codeanalysis.constants import (
-    CODE_MAP_CACHE,
+    FQDN_BATCHES_PER_WORKER,
     FQDN_FILE,
+    FQDN_PARALLEL_THRESHOLD,
     TREE_SITTER_FOLDER,
 )
 from composio.tools.local.codeanalysis.tool_utils import retry_handler
@@ -43,6 +45,118 @@ class CreateCodeMapResponse(BaseModel):
     )
 
 
+@retry_handler(max_attempts=2, delay=1)
+def fetch_file_fqdns(file_absolute_path: str, repo_dir: str) -> list:
+    """
+    Process a Python file to find the Fully Qualified Domain Names (FQDNs) of various entities.
+
+    This function analyzes the file to find FQDNs of:
+    * Global classes
+    * Global functions
+    * Immediate member functions of global classes
+    * Global variables
+
+    Args:
+        file_absolute_path (str): The absolute path of the Python file to process.
+        repo_dir (str): The absolute path of the repository.
+
+    Returns:
+        list: A list of dictionaries containing FQDN information for each entity.
+    """
+    from composio.tools.local.codeanalysis import lsp_helper, tree_sitter_related
+
+    # Fetch the script object for the file
+    script_obj = lsp_helper.fetch_script_obj_for_file_in_repo(
+        file_path=file_absolute_path, repo_path=repo_dir
+    )
+
+    # Fetch class and function definition nodes
+    class_function_nodes = (
+        tree_sitter_related.fetch_class_and_function_nodes_defn_identifiers(
+            file_absolute_path
+        )
+    )
+
+    # Fetch references within the script
+    candidate_references = lsp_helper.fetch_and_filter(
+        script_obj=script_obj,
+        clickable_nodes=class_function_nodes,
+        file_path=file_absolute_path,
+        allowed_types=["class", "function"],
+        reference=True,
+    )
+
+    global_scope_references = lsp_helper.fetch_and_filter(
+        script_obj=script_obj,
+        clickable_nodes=class_function_nodes,
+        file_path=file_absolute_path,
+        allowed_types=["class", "function"],
+        reference=True,
+        only_global_scope=True,
+    )
+
+    # Ensure global scope references are a subset of all references
+    all_candidate_fqdns = {ref["global_fqdn"] for ref in candidate_references}
+    if not all(
+        ref["global_fqdn"] in all_candidate_fqdns for ref in global_scope_references
+    ):
+        raise ValueError("Global scope references not a subset of all references")
+
+    fqdns_arr = lsp_helper.fetch_global_and_nested_fqdns(
+        candidate_references, global_scope_references
+    )
+
+    # Handle global variables
+    left_sided_identifiers = (
+        tree_sitter_related.find_left_side_identifiers_of_assignments(
+            file_absolute_path
+        )
+    )
+
+    global_variables_fqdns = lsp_helper.fetch_and_filter(
+        script_obj=script_obj,
+        clickable_nodes=left_sided_identifiers,
+        file_path=file_absolute_path,
+        allowed_types=["variable"],
+        reference=False,
+        only_global_scope=True,
+    )
+
+    fqdns_arr.extend(global_variables_fqdns)
+
+    return fqdns_arr
+
+
+def fetch_fqdns_batch(
+    repo_dir: str, rel_paths: List[str]
+) -> List[Tuple[str, Optional[list], str]]:
+    """
+    Process a batch of Python files, used as the task of the FQDN worker processes.
+
+    Args:
+        repo_dir (str): The absolute path of the repository.
+        rel_paths (List[str]): Paths of the files, relative to the repository.
+
+    Returns:
+        List[Tuple[str, Optional[list], str]]: The path, the FQDNs and the error
+            for every file, the FQDNs are None if the file failed to process.
+    """
+    from composio.tools.local.codeanalysis import lsp_helper
+
+    results: List[Tuple[str, Optional[list], str]] = []
+    for rel_path in rel_paths:
+        try:
+            fqdns = fetch_file_fqdns(
+                file_absolute_path=os.path.join(repo_dir, rel_path),
+                repo_dir=repo_dir,
+            )
+            results.append((rel_path, fqdns, ""))
+        except Exception as e:
+            lsp_helper.clear_cache()
+            results.append((rel_path, None, str(e)))
+    return results
+
+
 class CreateCodeMap(LocalAction[CreateCodeMapRequest, CreateCodeMapResponse]):
     """
     Use this to create a code map for a repository by indexing and analyzing its contents.
@@ -59,7 +173,8 @@ class CreateCodeMap(LocalAction[CreateCodeMapRequest, CreateCodeMapResponse]):
     Output:
     - result: Status message indicating success or failure of the indexing process
 
-    Note: This action may take some time to complete for large codebases.
+    Note: This action may take some time to complete for large codebases, later runs
+    only re-index the files changed since the previous run.
     """
 
     display_name = "Create index"
@@ -77,25 +192,42 @@ class CreateCodeMap(LocalAction[CreateCodeMapRequest, CreateCodeMapResponse]):
         self.REPO_DIR = os.path.normpath(os.path.abspath(metadata["dir_to_index_path"]))
         self.failed_files: list[str] = []
 
+        self.save_dir = index.cache_dir(self.REPO_DIR)
+        os.makedirs(TREE_SITTER_FOLDER, exist_ok=True)
+        self.fqdn_cache_file = os.path.join(self.save_dir, FQDN_FILE)
+        self.index = index.CodeIndex(self.REPO_DIR, self.save_dir)
+        self.changes = self.index.diff(
+            tool_utils.find_python_files(
+                self.REPO_DIR,
+                filter_test_files=True,
+                filter_out_unreadable_files=True,
+            )
+        )
+
         status = self.check_status(self.REPO_DIR)
-        if status["status"] == Status.COMPLETED:
+        if (
+            status["status"] == Status.COMPLETED
+            and self.index.exists
+            and not self.changes
+        ):
+            # Records the stat of the files which were touched but not changed
+            self.index.save()
             return CreateCodeMapResponse(
                 result=f"Indexing already exists for {metadata['dir_to_index_path']}"
             )
 
-        if status["status"] in [Status.NOT_STARTED, Status.FAILED]:
-            status = self._update_status(self.REPO_DIR, Status.LOADING_FQDNS)
-
-        repo_name = os.path.basename(self.REPO_DIR)
-        self.save_dir = f"{CODE_MAP_CACHE}/{repo_name}"
-        os.makedirs(self.save_dir, exist_ok=True)
-        os.makedirs(TREE_SITTER_FOLDER, exist_ok=True)
-        self.fqdn_cache_file = os.path.join(self.save_dir, FQDN_FILE)
+        # The manifest is saved once both of the stages complete, so the
+        # changes of a failed run are processed again by both of them
+        status = self._update_status(self.REPO_DIR, Status.LOADING_FQDNS)
 
         self._process(status, metadata)
 
         return CreateCodeMapResponse(
-            result=f"Indexing completed for {metadata['dir_to_index_path']}"
+            result=(
+                f"Indexing completed for {metadata['dir_to_index_path']}, "
+                f"{len(self.changes.added)} added, {len(self.changes.changed)} "
+                f"changed and {len(self.changes.deleted)} deleted files"
+            )
         )
 
     def _process(self, status: Dict[str, Any], metadata: Dict[str, Any]) -> None:
@@ -120,7 +252,7 @@ class CreateCodeMap(LocalAction[CreateCodeMapRequest, CreateCodeMapResponse]):
         try:
             if status["status"] == Status.LOADING_FQDNS:
                 if metadata["create_fqdn"]:
-                    self.load_all_fqdns()
+                    self.load_all_fqdns(workers=metadata.get("fqdn_workers", 0))
                 status = self._update_status(self.REPO_DIR, Status.LOADING_INDEX)
             if status["status"] == Status.LOADING_INDEX:
                 self.create_index(metadata["is_python"])
@@ -133,10 +265,10 @@ class CreateCodeMap(LocalAction[CreateCodeMapRequest, CreateCodeMapResponse]):
 
     def create_index(self, is_python: bool):
         """
-        Create an index of the Python files in the repository.
+        Update the index of the Python files in the repository.
 
-        This method processes all Python files in the repository, chunks their content,
-        and creates a vector store from the chunks.
+        This method chunks the added and changed files, removes the chunks of the
+        changed and deleted files from the vector store and adds the new chunks.
 
         Raises:
             IOError: If there's an error reading any of the Python files.
@@ -144,16 +276,18 @@ class CreateCodeMap(LocalAction[CreateCodeMapRequest, CreateCodeMapResponse]):
         """
         from tqdm.auto import tqdm
 
-        from composio.tools.local.codeanalysis import chunker, embedder, tool_utils
+        from composio.tools.local.codeanalysis import chunker, embedder
 
-        python_files = tool_utils.find_python_files(self.REPO_DIR)
         chunking = chunker.Chunking(self.REPO_DIR)
         chunks, metadatas, ids = [], [], []
         num_lines = {}
 
-        for file in tqdm(
-            python_files, total=len(python_files), desc="Processing files"
+        for rel_path in tqdm(
+            self.changes.pending,
+            total=len(self.changes.pending),
+            desc="Processing files",
         ):
+            file = os.path.join(self.REPO_DIR, rel_path)
             with open(file, "r", encoding="utf-8") as f:
                 file_content = f.read()
 
@@ -164,19 +298,38 @@ class CreateCodeMap(LocalAction[CreateCodeMapRequest, CreateCodeMapResponse]):
             chunks.extend(chunk)
             metadatas.extend(metadata)
             ids.extend(id)
+            self.index.set_chunks(rel_path, id)
 
         documents = chunker.construct_chunks(chunks, metadatas, ids, num_lines)
 
-        embedder.get_vector_store_from_chunks(self.REPO_DIR, documents, ids, metadatas)
-        logger.info(f"Successfully created index for {len(python_files)} files.")
-        shutil.rmtree(TREE_SITTER_FOLDER)
+        embedder.get_vector_store_from_chunks(
+            self.REPO_DIR,
+            documents,
+            ids,
+            metadatas,
+            deleted_ids=self.index.chunks(self.changes.stale),
+            overwrite=not self.index.exists,
+        )
+        self.index.save()
+        logger.info(
+            f"Successfully updated index for {len(self.changes.pending)} files, "
+            f"removed {len(self.changes.deleted)} files."
+        )
 
-    def load_all_fqdns(self):
+    def load_all_fqdns(self, workers: int = 0):
         """
-        Load all Fully Qualified Domain Names (FQDNs) from the repository.
+        Update the Fully Qualified Domain Names (FQDNs) of the repository.
+
+        This method drops the FQDNs of the changed and deleted files from the cache
+        file, extracts the FQDNs of the added and changed files and stores them.
 
-        This method processes all Python files in the repository, extracts FQDNs,
-        and stores them in a cache file.
+        The FQDNs of every processed file are streamed to a partial cache file, so
+        a run which crashes is resumed from the files it has already processed.
+
+        Args:
+            workers (int, optional): Number of worker processes to extract the
+                FQDNs with, 1 to extract them in this process. Defaults to the
+                number of CPUs if there are enough files to process.
 
         Raises:
             IOError: If there's an error reading or writing files.
@@ -184,110 +337,115 @@ class CreateCodeMap(LocalAction[CreateCodeMapRequest, CreateCodeMapResponse]):
         """
         from tqdm.auto import tqdm
 
-        from composio.tools.local.codeanalysis import lsp_helper, tool_utils
-
-        python_file_paths = sorted(
-            tool_utils.find_python_files(
-                self.REPO_DIR,
-                filter_test_files=True,
-                filter_out_unreadable_files=True,
-            )
-        )
-
         self.all_fqdns_df = {}
-        for file_path in tqdm(python_file_paths, desc="Processing Python files"):
-            rel_path = os.path.relpath(file_path, self.REPO_DIR)
-            try:
-                self.all_fqdns_df[rel_path] = self.process_python_file_fqdns(
-                    file_absolute_path=file_path
-                )
-            except Exception as e:
-                lsp_helper.clear_cache()
-                logger.error(f"Failed to process FQDNs for file {file_path}: {e}")
-
+        if self.index.exists and os.path.exists(self.fqdn_cache_file):
+            with open(self.fqdn_cache_file, "r", encoding="utf-8") as f:
+                self.all_fqdns_df = json.load(f)
+
+        for rel_path in self.changes.stale:
+            self.all_fqdns_df.pop(rel_path, None)
+
+        partial_file = f"{self.fqdn_cache_file}.partial"
+        processed = self._load_partial_fqdns(partial_file)
+        self.all_fqdns_df.update(processed)
+        pending = [
+            rel_path for rel_path in self.changes.pending if rel_path not in processed
+        ]
+
+        if workers <= 0:
+            workers = 1
+            if len(pending) >= FQDN_PARALLEL_THRESHOLD:
+                workers = os.cpu_count() or 1
+
+        with open(partial_file, "a", encoding="utf-8") as stream, tqdm(
+            total=len(pending), desc="Processing Python files"
+        ) as progress:
+            for results in self._fetch_fqdns(pending, workers=workers):
+                for rel_path, fqdns, error in results:
+                    if fqdns is None:
+                        logger.error(
+                            f"Failed to process FQDNs for file {rel_path}: {error}"
+                        )
+                        continue
+                    self.all_fqdns_df[rel_path] = fqdns
+                    stream.write(
+                        json.dumps(
+                            {
+                                "path": rel_path,
+                                "hash": self.index.content_hash(rel_path),
+                                "fqdns": fqdns,
+                            }
+                        )
+                        + "\n"
+                    )
+                stream.flush()
+                progress.update(len(results))
+
+        # Sorted so the cache file does not depend on the order the workers finish in
+        self.all_fqdns_df = dict(sorted(self.all_fqdns_df.items()))
         with open(self.fqdn_cache_file, "w", encoding="utf-8") as f:
             json.dump(self.all_fqdns_df, f, indent=4)
+        os.remove(partial_file)
+
+    def _load_partial_fqdns(self, partial_file: str) -> Dict[str, list]:
+        """Load the FQDNs of the pending files processed by a previous run."""
+        processed: Dict[str, list] = {}
+        if not os.path.exists(partial_file):
+            return processed
+
+        pending = set(self.changes.pending)
+        with open(partial_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Last line of a crashed run may be truncated
+                    continue
+                if entry["path"] in pending and entry[
+                    "hash"
+                ] == self.index.content_hash(entry["path"]):
+                    processed[entry["path"]] = entry["fqdns"]
+        return processed
+
+    def _fetch_fqdns(
+        self, rel_paths: List[str], workers: int
+    ) -> Iterator[List[Tuple[str, Optional[list], str]]]:
+        """Extract the FQDNs of the files, yielding the results of every batch."""
+        if workers <= 1:
+            for rel_path in sorted(rel_paths):
+                yield fetch_fqdns_batch(self.REPO_DIR, [rel_path])
+            return
+
+        batches = tool_utils.batch_by_size(
+            [os.path.join(self.REPO_DIR, rel_path) for rel_path in rel_paths],
+            num_batches=workers * FQDN_BATCHES_PER_WORKER,
+        )
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    fetch_fqdns_batch,
+                    self.REPO_DIR,
+                    [os.path.relpath(path, self.REPO_DIR) for path in batch],
+                )
+                for batch in batches
+            ]
+            for future in as_completed(futures):
+                yield future.result()
 
-    @retry_handler(max_attempts=2, delay=1)
     def process_python_file_fqdns(self, file_absolute_path: str) -> list:
         """
         Process a Python file to find the Fully Qualified Domain Names (FQDNs) of various entities.
 
-        This function analyzes the file to find FQDNs of:
-        * Global classes
-        * Global functions
-        * Immediate member functions of global classes
-        * Global variables
-
         Args:
             file_absolute_path (str): The absolute path of the Python file to process.
 
         Returns:
             list: A list of dictionaries containing FQDN information for each entity.
         """
-        from composio.tools.local.codeanalysis import lsp_helper, tree_sitter_related
-
-        # Fetch the script object for the file
-        script_obj = lsp_helper.fetch_script_obj_for_file_in_repo(
-            file_path=file_absolute_path, repo_path=self.REPO_DIR
-        )
-
-        # Fetch class and function definition nodes
-        class_function_nodes = (
-            tree_sitter_related.fetch_class_and_function_nodes_defn_identifiers(
-                file_absolute_path
-            )
+        return fetch_file_fqdns(
+            file_absolute_path=file_absolute_path, repo_dir=self.REPO_DIR
         )
 
-        # Fetch references within the script
-        candidate_references = lsp_helper.fetch_and_filter(
-            script_obj=script_obj,
-            clickable_nodes=class_function_nodes,
-            file_path=file_absolute_path,
-            allowed_types=["class", "function"],
-            reference=True,
-        )
-
-        global_scope_references = lsp_helper.fetch_and_filter(
-            script_obj=script_obj,
-            clickable_nodes=class_function_nodes,
-            file_path=file_absolute_path,
-            allowed_types=["class", "function"],
-            reference=True,
-            only_global_scope=True,
-        )
-
-        # Ensure global scope references are a subset of all references
-        all_candidate_fqdns = {ref["global_fqdn"] for ref in candidate_references}
-        if not all(
-            ref["global_fqdn"] in all_candidate_fqdns for ref in global_scope_references
-        ):
-            raise ValueError("Global scope references not a subset of all references")
-
-        fqdns_arr = lsp_helper.fetch_global_and_nested_fqdns(
-            candidate_references, global_scope_references
-        )
-
-        # Handle global variables
-        left_sided_identifiers = (
-            tree_sitter_related.find_left_side_identifiers_of_assignments(
-                file_absolute_path
-            )
-        )
-
-        global_variables_fqdns = lsp_helper.fetch_and_filter(
-            script_obj=script_obj,
-            clickable_nodes=left_sided_identifiers,
-            file_path=file_absolute_path,
-            allowed_types=["variable"],
-            reference=False,
-            only_global_scope=True,
-        )
-
-        fqdns_arr.extend(global_variables_fqdns)
-
-        return fqdns_arr
-
     def _update_status(
         self,
         repo_path: str,
@@ -1,4 +1,3 @@
-import os
 from typing import Dict, List
 
 from pydantic import BaseModel, Field
@@ -47,9 +46,8 @@ class GetClassInfo(
         self, request: GetClassInfoRequest, metadata: Dict
     ) -> GetClassInfoResponse:
         CreateCodeMap().execute(CreateCodeMapRequest(), metadata)
-        repo_name = os.path.basename(metadata["dir_to_index_path"])
 
-        self.load_fqdn_cache(repo_name)
+        self.load_fqdn_cache(metadata["dir_to_index_path"])
         query_class_name = request.class_name
 
         matching_fqdns = self.get_matching_items(query_class_name, "class")
@@ -1,4 +1,3 @@
-import os
 from typing import Dict, Optional
 
 from pydantic import BaseModel, Field
@@ -54,9 +53,8 @@ class GetMethodSignature(
         self, request: GetMethodSignatureRequest, metadata: Dict
     ) -> GetMethodSignatureResponse:
         CreateCodeMap().execute(CreateCodeMapRequest(), metadata)
-        repo_name = os.path.basename(metadata["dir_to_index_path"])
 
-        self.load_fqdn_cache(repo_name)
+        self.load_fqdn_cache(metadata["dir_to_index_path"])
         method_artefacts = self.get_method_artefacts(
             query_class_name=request.class_name,
             query_method_name=request.method_name,
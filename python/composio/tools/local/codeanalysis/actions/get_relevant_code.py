@@ -1,4 +1,3 @@
-import os
 from typing import Dict
 
 from pydantic import BaseModel, Field
@@ -45,13 +44,17 @@ class GetRelevantCode(LocalAction[GetRelevantCodeRequest, GetRelevantCodeRespons
     def execute(
         self, request: GetRelevantCodeRequest, metadata: Dict
     ) -> GetRelevantCodeResponse:
-        CreateCodeMap().execute(CreateCodeMapRequest(), metadata)
         from composio.tools.local.codeanalysis import (  # pylint: disable=import-outside-toplevel
             embedder,
         )
 
-        repo_name = os.path.basename(metadata["dir_to_index_path"])
-        vector_store = embedder.get_vector_store(repo_name, overwrite=False)
+        # Load the model while the index is brought up to date
+        embedder.warmup()
+        CreateCodeMap().execute(CreateCodeMapRequest(), metadata)
+
+        vector_store = embedder.get_vector_store(
+            metadata["dir_to_index_path"], overwrite=False
+        )
         query = request.query
         results = embedder.get_topn_chunks_from_query(vector_store, query, top_n=5)
         sep = "\n" + "=" * 100 + "\n"
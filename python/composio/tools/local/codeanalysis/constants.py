@@ -7,3 +7,9 @@ FQDN_FILE = "fqdn_cache.json"
 DEEPLAKE_FOLDER = "deeplake"
 TREE_SITTER_FOLDER = os.path.join(CODE_MAP_CACHE, "tree_sitter_cache")
 EMBEDDER = "sentence-transformers/all-mpnet-base-v2"
+INDEX_FILE = "index.json"
+INDEX_HISTORY = 3
+FQDN_PARALLEL_THRESHOLD = 32
+FQDN_BATCHES_PER_WORKER = 4
+QUERY_CACHE_SIZE = 256
+QUERY_BATCH_SIZE = 32
@@ -1,22 +1,40 @@
 import os
-from typing import Any, Dict, List
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from deeplake.core.vectorstore.deeplake_vectorstore import DeepLakeVectorStore
-from sentence_transformers import SentenceTransformer
 
+from composio.tools.local.codeanalysis import index
 from composio.tools.local.codeanalysis.constants import (
-    CODE_MAP_CACHE,
     DEEPLAKE_FOLDER,
     EMBEDDER,
+    QUERY_BATCH_SIZE,
+    QUERY_CACHE_SIZE,
 )
 
 
-def get_vector_store(repo_name: str, overwrite: bool = True) -> DeepLakeVectorStore:
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+
+_vector_stores: Dict[str, DeepLakeVectorStore] = {}
+_vector_stores_lock = threading.Lock()
+
+_model: Optional["SentenceTransformer"] = None
+_model_lock = threading.Lock()
+
+
+def get_vector_store(repo_dir: str, overwrite: bool = False) -> DeepLakeVectorStore:
     """
     Get or create a DeepLakeVectorStore for the given repository.
 
+    The vector store is kept open for the lifetime of the process, opening it
+    again is only required to overwrite it.
+
     Args:
-        repo_path (str): Path to the repository.
+        repo_dir (str): Path to the repository.
         overwrite (bool, optional): Whether to overwrite existing vector store. Defaults to False.
 
     Returns:
@@ -26,20 +44,24 @@ def get_vector_store(repo_name: str, overwrite: bool = True) -> DeepLakeVectorSt
         ValueError: If repo_path is empty or None.
         OSError: If there's an issue creating or accessing the vector store.
     """
-    if not repo_name:
+    if not repo_dir:
         raise ValueError("Repository path cannot be empty or None")
 
     try:
-        repo_name = os.path.basename(repo_name)
-
-        deeplake_repo_path = os.path.join(CODE_MAP_CACHE, repo_name, DEEPLAKE_FOLDER)
-
-        deeplake_vector_store = DeepLakeVectorStore(
-            path=deeplake_repo_path,
-            overwrite=overwrite,
-            read_only=False,
-            ingestion_batch_size=1000,
+        deeplake_repo_path = os.path.join(
+            index.cache_dir(repo_dir, create=overwrite), DEEPLAKE_FOLDER
         )
+        with _vector_stores_lock:
+            if not overwrite and deeplake_repo_path in _vector_stores:
+                return _vector_stores[deeplake_repo_path]
+
+            deeplake_vector_store = DeepLakeVectorStore(
+                path=deeplake_repo_path,
+                overwrite=overwrite,
+                read_only=False,
+                ingestion_batch_size=1000,
+            )
+            _vector_stores[deeplake_repo_path] = deeplake_vector_store
 
         return deeplake_vector_store
 
@@ -47,9 +69,43 @@ def get_vector_store(repo_name: str, overwrite: bool = True) -> DeepLakeVectorSt
         raise OSError(f"Failed to create or access vector store: {str(e)}") from e
 
 
+def get_model() -> "SentenceTransformer":
+    """
+    Get the embedding model, loaded once per process.
+
+    Returns:
+        SentenceTransformer: The embedding model.
+    """
+    global _model  # pylint: disable=global-statement
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                from sentence_transformers import (  # pylint: disable=import-outside-toplevel
+                    SentenceTransformer,
+                )
+
+                _model = SentenceTransformer(EMBEDDER)
+    return _model
+
+
+def warmup() -> Optional[threading.Thread]:
+    """
+    Load the embedding model in the background.
+
+    Returns:
+        Optional[threading.Thread]: The thread loading the model, None if the model
+            is already loaded.
+    """
+    if _model is not None:
+        return None
+    thread = threading.Thread(target=get_model, daemon=True)
+    thread.start()
+    return thread
+
+
 class Embedding:
     def __init__(self):
-        self.model = SentenceTransformer(EMBEDDER)
+        self.model = get_model()
 
     def compute(self, texts: List[str]) -> List[List[float]]:
         """
@@ -76,20 +132,112 @@ class Embedding:
             raise RuntimeError(f"Failed to compute embeddings: {str(e)}") from e
 
 
+class QueryEncoder:
+    """
+    Encode search queries with the shared embedding model.
+
+    Embeddings of recent queries are cached. Queries submitted while a batch is
+    being encoded are coalesced and encoded together in the next batch.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = QUERY_CACHE_SIZE,
+        max_batch_size: int = QUERY_BATCH_SIZE,
+    ) -> None:
+        self.cache_size = cache_size
+        self.max_batch_size = max_batch_size
+        self._cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._pending: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._encoding = False
+
+    def encode(self, query: str) -> List[float]:
+        """
+        Get the embedding of the query.
+
+        Args:
+            query (str): The query to embed.
+
+        Returns:
+            List[float]: The embedding of the query.
+        """
+        with self._lock:
+            if query in self._cache:
+                self._cache.move_to_end(query)
+                return self._cache[query]
+            future = self._pending.get(query)
+            if future is None:
+                future = self._pending[query] = Future()
+            leader = not self._encoding
+            self._encoding = True
+
+        # The first caller encodes batches until no queries are pending, the
+        # others wait for their query to be encoded in one of those batches
+        if leader:
+            self._drain()
+        return future.result()
+
+    def _drain(self) -> None:
+        """Encode the pending queries in batches."""
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._encoding = False
+                    return
+                batch = []
+                while self._pending and len(batch) < self.max_batch_size:
+                    batch.append(self._pending.popitem(last=False))
+
+            try:
+                embeddings = (
+                    get_model()
+                    .encode(
+                        [query for query, _ in batch],
+                        batch_size=self.max_batch_size,
+                        show_progress_bar=False,
+                        convert_to_numpy=True,
+                    )
+                    .tolist()
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                for _, future in batch:
+                    future.set_exception(
+                        RuntimeError(f"Failed to compute embeddings: {str(e)}")
+                    )
+                continue
+
+            with self._lock:
+                for (query, future), embedding in zip(batch, embeddings):
+                    self._cache[query] = embedding
+                    self._cache.move_to_end(query)
+                    future.set_result(embedding)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+
+query_encoder = QueryEncoder()
+
+
 def get_vector_store_from_chunks(
-    repo_name: str,
+    repo_dir: str,
     documents: List[str],
     ids: List[str],
     metadatas: List[Dict[str, Any]],
+    deleted_ids: Optional[List[str]] = None,
+    overwrite: bool = True,
 ) -> DeepLakeVectorStore:
     """
     Create or update a vector store with the given documents, ids, and metadata.
 
     Args:
-        repo_path (str): Path to the repository.
+        repo_dir (str): Path to the repository.
         documents (List[str]): List of document texts to be embedded.
         ids (List[str]): List of unique identifiers for each document.
         metadatas (List[Dict[str, Any]]): List of metadata dictionaries for each document.
+        deleted_ids (List[str], optional): Identifiers of the documents to remove
+            from the vector store before adding the new documents.
+        overwrite (bool, optional): Whether to overwrite existing vector store. Defaults to True.
 
     Returns:
         DeepLakeVectorStore: The updated vector store.
@@ -102,7 +250,12 @@ def get_vector_store_from_chunks(
         raise ValueError("Input lists must have the same length")
 
     try:
-        vector_store = get_vector_store(repo_name)
+        vector_store = get_vector_store(repo_dir, overwrite=overwrite)
+        if deleted_ids and not overwrite:
+            vector_store.delete(ids=deleted_ids)
+        if not documents:
+            return vector_store
+
         embed_model = Embedding()
         embeddings = embed_model.compute(documents)
 
@@ -111,6 +264,7 @@ def get_vector_store_from_chunks(
         for i in range(0, len(documents), batch_size):
             batch_end = min(i + batch_size, len(documents))
             vector_store.add(
+                id=ids[i:batch_end],
                 text=ids[i:batch_end],
                 embedding=embeddings[i:batch_end],
                 metadata=metadatas[i:batch_end],
@@ -144,8 +298,7 @@ def get_topn_chunks_from_query(
     if not isinstance(vector_store, DeepLakeVectorStore):
         raise ValueError("vector_store must be an instance of DeepLakeVectorStore")
     try:
-        embed_model = Embedding()
-        query_embedding = embed_model.compute([query])[0]
+        query_embedding = query_encoder.encode(query)
         results = vector_store.search(embedding=query_embedding, k=top_n)
         return results
     except Exception as e:
@@ -0,0 +1,224 @@
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+from typing import Dict, List, NamedTuple, Optional
+
+from composio.tools.local.codeanalysis.constants import (
+    CODE_MAP_CACHE,
+    INDEX_FILE,
+    INDEX_HISTORY,
+)
+
+
+def git_head(repo_dir: str) -> str:
+    """
+    Get the commit checked out in the repository.
+
+    Args:
+        repo_dir (str): Path to the repository.
+
+    Returns:
+        str: The commit hash, or an empty string if the directory is not a git repository.
+    """
+    try:
+        return subprocess.run(
+            ["git", "-C", repo_dir, "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _latest(directory: str) -> Optional[str]:
+    """Get the most recently updated index in the directory."""
+    if not os.path.isdir(directory):
+        return None
+    indexes = [
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if os.path.isfile(os.path.join(directory, name, INDEX_FILE))
+    ]
+    if not indexes:
+        return None
+    return max(
+        indexes, key=lambda path: os.path.getmtime(os.path.join(path, INDEX_FILE))
+    )
+
+
+def cache_dir(repo_dir: str, create: bool = True) -> str:
+    """
+    Get the cache directory for the repository.
+
+    The cache is keyed by the absolute path of the repository and the commit
+    checked out in it. A cache for a new commit is seeded with the most recent
+    index of the repository, so only the files changed since are re-indexed.
+
+    Args:
+        repo_dir (str): Path to the repository.
+        create (bool, optional): Whether to create the cache if it does not exist.
+            If False, the most recent index of the repository is used instead.
+
+    Returns:
+        str: Path to the cache directory.
+    """
+    repo_dir = os.path.normpath(os.path.abspath(repo_dir))
+    repo_key = hashlib.sha1(repo_dir.encode("utf-8")).hexdigest()[:12]
+    base = os.path.join(CODE_MAP_CACHE, f"{os.path.basename(repo_dir)}-{repo_key}")
+    path = os.path.join(base, git_head(repo_dir)[:12] or "worktree")
+    if os.path.isdir(path):
+        return path
+
+    latest = _latest(base)
+    if not create:
+        return latest or path
+
+    if latest is None:
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    shutil.copytree(latest, path)
+    indexes = sorted(
+        (os.path.join(base, name) for name in os.listdir(base)),
+        key=os.path.getmtime,
+        reverse=True,
+    )
+    for stale in indexes[INDEX_HISTORY:]:
+        if stale != path:
+            shutil.rmtree(stale, ignore_errors=True)
+    return path
+
+
+class Changes(NamedTuple):
+    """Files changed since the repository was last indexed, relative to the repository."""
+
+    added: List[str]
+    changed: List[str]
+    deleted: List[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.deleted)
+
+    @property
+    def stale(self) -> List[str]:
+        """Files with entries to remove from the index."""
+        return self.changed + self.deleted
+
+    @property
+    def pending(self) -> List[str]:
+        """Files to (re-)process."""
+        return self.added + self.changed
+
+
+class CodeIndex:
+    """
+    Manifest of the content hashes of the indexed files.
+
+    Every file is recorded with its content hash and the IDs of the vector
+    store rows created from it, the stat of the file is used to skip hashing
+    files which have not been modified.
+    """
+
+    def __init__(self, repo_dir: str, save_dir: str):
+        self.repo_dir = os.path.normpath(os.path.abspath(repo_dir))
+        self.path = os.path.join(save_dir, INDEX_FILE)
+        self.files: Dict[str, Dict] = {}
+        if os.path.isfile(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.files = json.load(f)["files"]
+        self._pending: Dict[str, Dict] = {}
+
+    @property
+    def exists(self) -> bool:
+        """Whether the repository has been indexed before."""
+        return os.path.isfile(self.path)
+
+    def diff(self, file_paths: List[str]) -> Changes:
+        """
+        Compare the files against the manifest.
+
+        Args:
+            file_paths (List[str]): Absolute paths of the files to index.
+
+        Returns:
+            Changes: The added, changed and deleted files.
+        """
+        added, changed = [], []
+        self._pending = {}
+        for file_path in file_paths:
+            rel_path = os.path.relpath(file_path, self.repo_dir)
+            stat = os.stat(file_path)
+            entry = self.files.get(rel_path)
+            if (
+                entry is not None
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and entry["size"] == stat.st_size
+            ):
+                self._pending[rel_path] = entry
+                continue
+
+            with open(file_path, "rb") as f:
+                content_hash = hashlib.sha256(f.read()).hexdigest()
+            self._pending[rel_path] = {
+                "hash": content_hash,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "chunks": [] if entry is None else entry["chunks"],
+            }
+            if entry is None:
+                added.append(rel_path)
+            elif entry["hash"] != content_hash:
+                changed.append(rel_path)
+
+        deleted = sorted(set(self.files) - set(self._pending))
+        return Changes(added=added, changed=changed, deleted=deleted)
+
+    def content_hash(self, rel_path: str) -> str:
+        """
+        Get the content hash of a file compared in the last `diff`.
+
+        Args:
+            rel_path (str): Path of the file, relative to the repository.
+
+        Returns:
+            str: The SHA256 hash of the file content.
+        """
+        return self._pending[rel_path]["hash"]
+
+    def chunks(self, rel_paths: List[str]) -> List[str]:
+        """
+        Get the IDs of the vector store rows created from the files.
+
+        Args:
+            rel_paths (List[str]): Paths of the files, relative to the repository.
+
+        Returns:
+            List[str]: The IDs of the rows.
+        """
+        return [
+            chunk_id
+            for rel_path in rel_paths
+            if rel_path in self.files
+            for chunk_id in self.files[rel_path]["chunks"]
+        ]
+
+    def set_chunks(self, rel_path: str, chunk_ids: List[str]) -> None:
+        """
+        Record the IDs of the vector store rows created from the file.
+
+        Args:
+            rel_path (str): Path of the file, relative to the repository.
+            chunk_ids (List[str]): The IDs of the rows.
+        """
+        self._pending[rel_path]["chunks"] = chunk_ids
+
+    def save(self) -> None:
+        """Save the manifest with the files compared in the last `diff`."""
+        self.files = self._pending
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"repo_dir": self.repo_dir, "files": self.files}, f)
+        os.replace(tmp_path, self.path)
@@ -13,10 +13,53 @@ from composio.tools.local.codeanalysis import tree_sitter_related
 # pylint: disable=unused-argument,unspecified-encoding,unused-variable
 
 
+_projects: Dict[str, jedi.Project] = {}
+_environment: Optional[jedi.api.environment.Environment] = None
+_cache_pid = os.getpid()
+
+
 def clear_cache():
     jedi.cache.clear_time_caches()
 
 
+def _check_pid() -> None:
+    """Drop the cached objects inherited from the parent in a forked worker process."""
+    global _environment, _cache_pid  # pylint: disable=global-statement
+    if _cache_pid != os.getpid():
+        _projects.clear()
+        _environment = None
+        _cache_pid = os.getpid()
+
+
+def get_project(repo_path: str) -> jedi.Project:
+    """
+    Get the Jedi project for a repository, cached for the lifetime of the process.
+
+    The project caches the sys path it resolves with the environment, reusing it
+    with a cached environment saves querying the interpreter for every file.
+
+    Args:
+        repo_path (str): The path of the repository.
+
+    Returns:
+        jedi.Project: The project object for the repository.
+    """
+    _check_pid()
+    repo_path = os.path.normpath(os.path.abspath(repo_path))
+    if repo_path not in _projects:
+        _projects[repo_path] = jedi.Project(repo_path)
+    return _projects[repo_path]
+
+
+def get_environment() -> jedi.api.environment.Environment:
+    """Get the Jedi environment for the current interpreter, cached for the lifetime of the process."""
+    global _environment  # pylint: disable=global-statement
+    _check_pid()
+    if _environment is None:
+        _environment = jedi.create_environment(sys.executable, safe=False)
+    return _environment
+
+
 def fetch_script_obj_for_file_in_repo(file_path: str, repo_path: str) -> jedi.Script:
     """
     Fetches the Jedi script object for a file in a repository.
@@ -33,8 +76,8 @@ def fetch_script_obj_for_file_in_repo(file_path: str, repo_path: str) -> jedi.Sc
         RuntimeError: If there is an error creating the Jedi environment or script object.
     """
     try:
-        project_obj = jedi.Project(repo_path)
-        environment_obj = jedi.create_environment(sys.executable, safe=False)
+        project_obj = get_project(repo_path)
+        environment_obj = get_environment()
 
         _project_obj_path = os.path.normpath(os.path.abspath(str(project_obj.path)))
         _file_path = os.path.normpath(os.path.abspath(file_path))
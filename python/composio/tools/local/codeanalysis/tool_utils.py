@@ -1,9 +1,10 @@
 import hashlib
+import heapq
 import os
 import sys
 import time
 from functools import wraps
-from typing import Optional
+from typing import List, Optional
 
 
 def is_test_file(file_path: str) -> bool:
@@ -122,6 +123,29 @@ def fetch_hash(message) -> str:
     return hex_dig
 
 
+def batch_by_size(file_paths: List[str], num_batches: int) -> List[List[str]]:
+    """
+    Split files into batches with roughly the same total size.
+
+    Files are assigned largest first to the batch with the smallest total size,
+    so a few large files do not end up in the same batch.
+
+    Args:
+        file_paths (List[str]): Paths of the files to split.
+        num_batches (int): Number of batches to split the files into.
+
+    Returns:
+        List[List[str]]: The non-empty batches, largest first.
+    """
+    sizes = {file_path: os.path.getsize(file_path) for file_path in file_paths}
+    heap = [(0, i, []) for i in range(max(num_batches, 1))]  # type: ignore
+    for file_path in sorted(file_paths, key=lambda path: (-sizes[path], path)):
+        total, i, batch = heapq.heappop(heap)
+        batch.append(file_path)
+        heapq.heappush(heap, (total + sizes[file_path], i, batch))
+    return [batch for _, _, batch in sorted(heap, reverse=True) if batch]
+
+
 def retry_handler(max_attempts=3, delay=1):
     def decorator(func):
         @wraps(func)
@@ -71,7 +71,8 @@ class FindFile(LocalAction[FindFileRequest, FindFileResponse]):
     4. CSV files like "data001.csv", "data002.csv": "data???.csv"
     5. "main.js" in "src" and subdirs: "src/**/main.js"
 
-    Note: The search automatically excludes the '.git' directory.
+    Note: The search automatically excludes the '.git', '.venv' and 'node_modules'
+    directories and the paths ignored by '.gitignore'.
 
     Returns:
     - A list of file paths relative to the working directory that match the search pattern.
@@ -35,6 +35,10 @@ class SearchWordRequest(BaseFileRequest):
         default=None,
         description="List of directories to exclude from the search",
     )
+    max_results: int = Field(
+        default=1000,
+        description="Stop the search after finding this many matching lines",
+    )
 
 
 class SearchWordResponse(BaseFileResponse):
@@ -67,7 +71,8 @@ class SearchWord(LocalAction[SearchWordRequest, SearchWordResponse]):
     4. Search for 'important' in a specific file:
        pattern: "/path/to/specific/file.txt", word: "important"
 
-    Note: The search will skip binary files and hidden files (those starting with a dot).
+    Note: The search will skip binary files, hidden files (those starting with a dot)
+    and files ignored by `.gitignore`.
 
     Raises:
         - ValueError: If the word to search for is empty.
@@ -85,6 +90,7 @@ class SearchWord(LocalAction[SearchWordRequest, SearchWordResponse]):
                 recursive=request.recursive,
                 case_insensitive=request.case_insensitive,
                 exclude=request.exclude,  # type: ignore
+                max_results=request.max_results,
             )
             num_files: int = len(results)
             if num_files > 100:
@@ -101,6 +107,14 @@ class SearchWord(LocalAction[SearchWordRequest, SearchWordResponse]):
                     results={},
                     message=f'No files matched for "{request.word}" in {request.pattern}".',
                 )
+            if sum(map(len, results.values())) >= request.max_results:
+                return SearchWordResponse(
+                    results=results,
+                    message=(
+                        f"Warning: Stopped the search after {request.max_results} "
+                        "matches. Consider narrowing your search."
+                    ),
+                )
             return SearchWordResponse(results=results)
         except ValueError as e:
             return SearchWordResponse(error=f"Invalid search parameters: {str(e)}")
@@ -3,7 +3,7 @@ import typing as t
 from composio.client.enums import Action, ActionType, App, AppType, Tag, TagType
 from composio.tools.base.abs import Action as LocalActionType
 from composio.tools.base.abs import Tool as LocalToolType
-from composio.tools.base.abs import action_registry
+from composio.tools.base.abs import action_registry, tool_registry
 from composio.utils.logging import WithLogger
 
 
@@ -34,13 +34,16 @@ class LocalClient(WithLogger):
         tags: t.Optional[t.Sequence[TagType]] = None,
     ) -> t.List[t.Dict]:
         """Get action schemas for given parameters."""
-        tools = cls.tools()
         apps = t.cast(t.List[App], [App(app) for app in apps or []])
         actions = t.cast(t.List[Action], [Action(action) for action in actions or []])
         action_schemas: t.List[t.Dict] = []
 
+        # Tool modules are imported on lookup, so only the tools required
+        # for the given apps and actions are loaded
         for app in apps:
-            action_schemas += [action.schema() for action in tools[app.slug].actions()]
+            action_schemas += [
+                action.schema() for action in tool_registry["local"][app.slug].actions()
+            ]
 
         for action in actions:
             action_schemas.append(action_registry["local"][action.slug].schema())
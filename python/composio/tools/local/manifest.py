@@ -0,0 +1,253 @@
+"""
+Registry index for the local tools.
+
+The manifest records the tool modules in the tools tree along with the
+metadata for the tools, actions and triggers they define. This allows looking
+up local tools without globbing the tools tree or importing the tool modules,
+which are imported lazily when they're actually needed.
+
+The manifest shipped with the package is generated by `scripts/build_manifest.py`,
+if it's stale at runtime the rebuilt manifest is cached in the user's cache
+directory instead.
+"""
+
+import importlib
+import json
+import os
+import tempfile
+import threading
+import typing as t
+from pathlib import Path
+
+import typing_extensions as te
+
+from composio.constants import LOCAL_CACHE_DIRECTORY
+from composio.tools.base.abs import tool_registry, trigger_registry
+from composio.utils.logging import get as get_logger
+
+
+TOOLS_PATH = Path(__file__).parent
+
+MANIFEST_PATH = TOOLS_PATH / "manifest.json"
+"""Path to the manifest shipped with the package."""
+
+MANIFEST_CACHE_PATH = LOCAL_CACHE_DIRECTORY / "local_tools.json"
+"""Path to the manifest rebuilt at runtime if the shipped manifest is stale."""
+
+MTIME_TOLERANCE = 1.0
+"""Seconds a tool module can be newer than the manifest without invalidating
+it, to account for the order in which files are written on install."""
+
+
+class ToolEntry(te.TypedDict):
+    """Manifest entry for a local tool."""
+
+    name: str
+    module: str
+    description: str
+    requires: t.List[str]
+    actions: t.List[str]
+
+
+class ActionEntry(te.TypedDict):
+    """Manifest entry for a local action."""
+
+    name: str
+    app: str
+    tool: str
+    tags: t.List[str]
+    no_auth: bool
+    requires: t.List[str]
+
+
+class TriggerEntry(te.TypedDict):
+    """Manifest entry for a local trigger."""
+
+    name: str
+    app: str
+    tool: str
+
+
+class Manifest(te.TypedDict):
+    """Local tools manifest."""
+
+    modules: t.List[str]
+    tools: t.Dict[str, ToolEntry]
+    actions: t.Dict[str, ActionEntry]
+    triggers: t.Dict[str, TriggerEntry]
+
+
+_manifest: t.Optional[Manifest] = None
+_building = False
+_lock = threading.RLock()
+
+
+def _scan() -> t.Tuple[t.List[str], float]:
+    """Scan the tools tree for tool modules and the latest modification time."""
+    modules = []
+    mtime = 0.0
+    for root, dirs, files in os.walk(TOOLS_PATH):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for file in files:
+            if not file.endswith(".py"):
+                continue
+            path = Path(root, file)
+            mtime = max(mtime, path.stat().st_mtime)
+            if file == "tool.py":
+                modules.append(
+                    "composio.tools.local."
+                    + ".".join(path.relative_to(TOOLS_PATH).parent.parts)
+                    + ".tool"
+                )
+    return sorted(modules), mtime
+
+
+def build_manifest(modules: t.Optional[t.List[str]] = None) -> Manifest:
+    """
+    Build the manifest by importing the tool modules.
+
+    :param modules: Tool modules to import, defaults to the modules found in
+        the tools tree.
+    """
+    modules = modules if modules is not None else _scan()[0]
+    for module in modules:
+        importlib.import_module(module)
+
+    manifest = Manifest(modules=modules, tools={}, actions={}, triggers={})
+    for enum, tool in sorted(tool_registry["local"].items()):
+        module = type(tool).__module__
+        if module not in modules:
+            continue
+
+        manifest["tools"][enum] = ToolEntry(
+            name=tool.name,
+            module=module,
+            description=tool.description,
+            requires=list(tool.requires or []),
+            actions=sorted(action.enum for action in tool.actions()),
+        )
+        for action in tool.actions():
+            manifest["actions"][action.enum] = ActionEntry(
+                name=action.name,
+                app=enum,
+                tool=tool.name,
+                tags=list(action.tags()),
+                no_auth=action.no_auth,
+                requires=sorted(action.requires or []),
+            )
+
+        for trigger_enum, trigger in trigger_registry["local"].items():
+            if trigger.tool == tool.name:
+                manifest["triggers"][trigger_enum] = TriggerEntry(
+                    name=trigger.name,
+                    app=enum,
+                    tool=tool.name,
+                )
+    return manifest
+
+
+def _read(path: Path, modules: t.List[str], mtime: float) -> t.Optional[Manifest]:
+    """Read the manifest from `path`, returns `None` if it's missing or stale."""
+    try:
+        if path.stat().st_mtime + MTIME_TOLERANCE < mtime:
+            return None
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("modules") != modules:
+        return None
+    return manifest
+
+
+def write_manifest(manifest: Manifest, path: Path) -> None:
+    """
+    Write the manifest to `path` atomically.
+
+    :param manifest: Manifest to write.
+    :param path: Path to write the manifest to.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w",
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        delete=False,
+        encoding="utf-8",
+    ) as file:
+        file.write(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    os.chmod(file.name, 0o644)
+    os.replace(file.name, path)
+
+
+def _write(manifest: Manifest) -> None:
+    """Cache the rebuilt manifest, the shipped manifest is never modified."""
+    try:
+        write_manifest(manifest=manifest, path=MANIFEST_CACHE_PATH)
+    except OSError as e:
+        get_logger().debug(
+            f"Error writing local tools manifest to {MANIFEST_CACHE_PATH}: {e}"
+        )
+
+
+def get_manifest() -> Manifest:
+    """
+    Get the local tools manifest.
+
+    The manifest is validated against the tools tree once per process, and
+    rebuilt if a tool module was added, removed or modified after it was
+    generated.
+    """
+    global _manifest, _building
+    if _manifest is not None:
+        return _manifest
+
+    with _lock:
+        if _manifest is not None:
+            return _manifest
+
+        # Tool modules being imported while building the manifest may look
+        # up local tools, which are registered in the tool registry anyway
+        if _building:
+            return Manifest(modules=[], tools={}, actions={}, triggers={})
+
+        modules, mtime = _scan()
+        manifest = _read(MANIFEST_PATH, modules, mtime) or _read(
+            MANIFEST_CACHE_PATH, modules, mtime
+        )
+        if manifest is None:
+            _building = True
+            try:
+                manifest = build_manifest(modules=modules)
+            finally:
+                _building = False
+            _write(manifest=manifest)
+        _manifest = manifest
+    return _manifest
+
+
+def load_tool_module(app: str) -> bool:
+    """
+    Import the module defining the local tool `app`.
+
+    :param app: Tool enum, eg. `FILETOOL`
+    :return: `False` if the tool is not in the manifest.
+    """
+    entry = get_manifest()["tools"].get(app)
+    if entry is None:
+        return False
+    importlib.import_module(entry["module"])
+    return True
+
+
+def load_action_module(action: str) -> bool:
+    """
+    Import the module defining the local action `action`.
+
+    :param action: Action enum, eg. `FILETOOL_OPEN_FILE`
+    :return: `False` if the action is not in the manifest.
+    """
+    entry = get_manifest()["actions"].get(action)
+    if entry is None:
+        return False
+    return load_tool_module(app=entry["app"])
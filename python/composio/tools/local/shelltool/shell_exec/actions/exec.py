@@ -5,7 +5,15 @@ import typing as t
 from pydantic import BaseModel, Field
 
 from composio.tools.base.local import LocalAction
-from composio.tools.env.constants import EXIT_CODE, STDERR, STDOUT
+from composio.tools.env.constants import (
+    CWD,
+    EXIT_CODE,
+    RUNNING,
+    STDERR,
+    STDOUT,
+    TRUNCATED,
+)
+from composio.tools.env.host.shell import Shell, ShellStream
 
 
 class ShellRequest(BaseModel):
@@ -27,6 +35,20 @@ class ShellExecRequest(ShellRequest):
         ...,
         description="Command to be executed.",
     )
+    stream: bool = Field(
+        default=False,
+        description=(
+            "Set `true` for long running commands like test runs or builds. "
+            "The command keeps running in the background, the output produced "
+            "in `wait_time` seconds is returned along with a `command_id` "
+            "which can be used to read the rest of the output using "
+            "`SHELLTOOL_GET_COMMAND_OUTPUT`"
+        ),
+    )
+    wait_time: float = Field(
+        default=10.0,
+        description="Seconds to wait for output when `stream` is set to `true`",
+    )
 
 
 class ShellExecResponse(BaseModel):
@@ -48,6 +70,42 @@ class ShellExecResponse(BaseModel):
         default="",
         description="Current shell's working directory",
     )
+    running: bool = Field(
+        default=False,
+        description="Whether the command is still running, only in streaming mode",
+    )
+    command_id: str = Field(
+        default="",
+        description=(
+            "ID of the command for reading the rest of the output, "
+            "only in streaming mode"
+        ),
+    )
+    shell_id: str = Field(
+        default="",
+        description="ID of the shell where the command is running",
+    )
+
+
+def format_output(output: t.Dict, stream: str) -> str:
+    """Format streamed output, noting the output dropped from the tail buffer."""
+    truncated = output[TRUNCATED][stream]
+    if truncated == 0:
+        return output[stream]
+    return f"[... {truncated} bytes of output truncated ...]\n{output[stream]}"
+
+
+def stream_response(shell: Shell, handle: ShellStream, output: t.Dict) -> t.Dict:
+    """Build response fields for the output of a streaming command."""
+    return {
+        "stdout": format_output(output=output, stream=STDOUT),
+        "stderr": format_output(output=output, stream=STDERR),
+        "exit_code": -1 if output[RUNNING] else output[EXIT_CODE],
+        "current_shell_pwd": "" if output[RUNNING] else f"Currently in {output[CWD]}",
+        "running": output[RUNNING],
+        "command_id": handle.id,
+        "shell_id": shell.id,
+    }
 
 
 class ExecCommand(LocalAction[ShellExecRequest, ShellExecResponse]):
@@ -77,12 +135,23 @@ class ExecCommand(LocalAction[ShellExecRequest, ShellExecResponse]):
         """Execute a shell command."""
         shell = self.shells.get(id=request.shell_id)
         self.logger.debug(f"Executing {request.cmd} @ {shell}")
+        if request.stream:
+            handle = shell.stream(cmd=request.cmd)
+            try:
+                output = handle.wait(timeout=request.wait_time)
+            except TimeoutError:
+                output = handle.poll()
+            return ShellExecResponse(
+                **stream_response(shell=shell, handle=handle, output=output)
+            )
 
         output = shell.exec(cmd=request.cmd)
         self.logger.debug(output)
+        cwd = output.get(CWD) or shell.exec(cmd="pwd")[STDOUT].strip()
         return ShellExecResponse(
             stdout=output[STDOUT],
             stderr=output[STDERR],
             exit_code=int(output[EXIT_CODE]),
-            current_shell_pwd=f"Currently in {shell.exec(cmd='pwd')[STDOUT].strip()}",
+            current_shell_pwd=f"Currently in {cwd}",
+            shell_id=shell.id,
         )
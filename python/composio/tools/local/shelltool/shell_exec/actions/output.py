@@ -0,0 +1,100 @@
+"""Tool for reading the output of streaming shell commands."""
+
+import typing as t
+
+from pydantic import BaseModel, Field
+
+from composio.tools.base.local import LocalAction
+from composio.tools.local.shelltool.shell_exec.actions.exec import (
+    ShellRequest,
+    stream_response,
+)
+
+
+class GetCommandOutputRequest(ShellRequest):
+    """Get command output request."""
+
+    command_id: str = Field(
+        ...,
+        description=(
+            "ID of the command, returned by `SHELLTOOL_EXEC_COMMAND` "
+            "when executed with `stream` set to `true`"
+        ),
+    )
+    operation: t.Literal["poll", "wait", "cancel"] = Field(
+        default="poll",
+        description=(
+            "`poll` returns the output produced since the last read, `wait` "
+            "waits for the command to finish for at most `timeout` seconds "
+            "and `cancel` interrupts the command"
+        ),
+    )
+    timeout: float = Field(
+        default=30.0,
+        description="Seconds to wait for the command to finish, used with `wait`",
+    )
+
+
+class GetCommandOutputResponse(BaseModel):
+    """Get command output response."""
+
+    stdout: str = Field(
+        ...,
+        description="Output captured since the last read",
+    )
+    stderr: str = Field(
+        ...,
+        description="Errors captured since the last read",
+    )
+    exit_code: int = Field(
+        ...,
+        description="Exit code of the command, -1 if the command is still running",
+    )
+    running: bool = Field(
+        ...,
+        description="Whether the command is still running",
+    )
+    current_shell_pwd: str = Field(
+        default="",
+        description="Current shell's working directory",
+    )
+    command_id: str = Field(
+        default="",
+        description="ID of the command",
+    )
+    shell_id: str = Field(
+        default="",
+        description="ID of the shell where the command is running",
+    )
+
+
+class GetCommandOutput(LocalAction[GetCommandOutputRequest, GetCommandOutputResponse]):
+    """
+    Read the output of a command started using `SHELLTOOL_EXEC_COMMAND` with
+    `stream` set to `true`.
+
+    Every read returns only the output produced since the previous read, use
+    `wait` to block until the command finishes and `cancel` to interrupt a
+    command which is stuck or no longer required.
+    """
+
+    _tags = ["workspace", "shell"]
+
+    def execute(
+        self, request: GetCommandOutputRequest, metadata: t.Dict
+    ) -> GetCommandOutputResponse:
+        """Read the output of a streaming command."""
+        shell = self.shells.get(id=request.shell_id)
+        handle = shell.get_stream(id=request.command_id)
+        if request.operation == "cancel":
+            output = handle.cancel()
+        elif request.operation == "wait":
+            try:
+                output = handle.wait(timeout=request.timeout)
+            except TimeoutError:
+                output = handle.poll()
+        else:
+            output = handle.poll()
+        return GetCommandOutputResponse(
+            **stream_response(shell=shell, handle=handle, output=output)
+        )
@@ -5,7 +5,7 @@ import typing as t
 from pydantic import BaseModel, Field
 
 from composio.tools.base.local import LocalAction
-from composio.tools.env.constants import STDERR, STDOUT
+from composio.tools.env.constants import CWD, STDERR, STDOUT
 from composio.tools.local.shelltool.shell_exec.actions.exec import ShellRequest
 
 
@@ -43,7 +43,8 @@ class TestCommand(LocalAction[TestExecRequest, TestExecResponse]):
         shell.exec(cmd="python -m pip install -e .")
         output = shell.exec(cmd=f"{command}")
         self.logger.debug(output)
+        cwd = output.get(CWD) or shell.exec(cmd="pwd")[STDOUT].strip()
         return TestExecResponse(
             test_response=output[STDERR],
-            current_shell_pwd=f"Currently in {shell.exec(cmd='pwd')[STDOUT].strip()}",
+            current_shell_pwd=f"Currently in {cwd}",
         )
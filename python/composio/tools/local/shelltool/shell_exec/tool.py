@@ -5,6 +5,7 @@ import typing as t
 from composio.tools.base.local import LocalAction, LocalTool
 from composio.tools.local.shelltool.shell_exec.actions.exec import ExecCommand
 from composio.tools.local.shelltool.shell_exec.actions.new import CreateShell
+from composio.tools.local.shelltool.shell_exec.actions.output import GetCommandOutput
 from composio.tools.local.shelltool.shell_exec.actions.spawn import SpawnProcess
 from composio.tools.local.shelltool.shell_exec.actions.test import TestCommand
 
@@ -19,6 +20,7 @@ class Shelltool(LocalTool, autoload=True):
         """Returns list of actions."""
         return [
             ExecCommand,
+            GetCommandOutput,
             CreateShell,
             SpawnProcess,
             TestCommand,
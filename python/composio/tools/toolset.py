@@ -2,6 +2,7 @@
 Composio SDK tools.
 """
 
+import asyncio
 import base64
 import binascii
 import hashlib
@@ -10,11 +11,13 @@ import inspect
 import itertools
 import json
 import os
+import threading
 import time
 import typing as t
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from functools import wraps
+from functools import partial, wraps
 from importlib.util import find_spec
 from pathlib import Path
 
@@ -23,6 +26,7 @@ from pydantic import BaseModel
 
 from composio import Action, ActionType, App, AppType, TagType
 from composio.client import Composio, Entity
+from composio.client.aio import AsyncComposio
 from composio.client.collections import (
     AUTH_SCHEMES,
     ActionModel,
@@ -42,8 +46,18 @@ from composio.client.collections import (
     TriggerModel,
     TriggerSubscription,
 )
+from composio.client.dispatcher import (
+    DISPATCHER_QUEUE_SIZE,
+    DISPATCHER_WORKERS,
+    OverflowPolicy,
+)
 from composio.client.enums import TriggerType
 from composio.client.enums.base import EnumStringNotFound
+from composio.client.enums.index import (
+    blend_rankings,
+    get_action_index,
+    get_search_index,
+)
 from composio.client.exceptions import ComposioClientError, HTTPError, NoItemsFound
 from composio.constants import (
     DEFAULT_ENTITY_ID,
@@ -62,7 +76,7 @@ from composio.tools.env.base import (
     WorkspaceConfigType,
 )
 from composio.tools.env.factory import HostWorkspaceConfig, WorkspaceFactory
-from composio.tools.local import load_local_tools
+from composio.tools.local import get_manifest
 from composio.tools.local.handler import LocalClient
 from composio.utils.enums import get_enum_key
 from composio.utils.logging import LogIngester, LogLevel, WithLogger
@@ -100,6 +114,41 @@ class ProcessorsType(te.TypedDict):
     """Schema processors"""
 
 
+class ActionCall(te.TypedDict):
+    """Action call for executing a batch of actions."""
+
+    action: ActionType
+    """Action to execute."""
+
+    params: t.Dict
+    """Parameters for executing the action."""
+
+    entity_id: te.NotRequired[t.Optional[str]]
+    """Entity ID to execute the action on."""
+
+    connected_account_id: te.NotRequired[t.Optional[str]]
+    """Connection ID for executing the remote action."""
+
+    metadata: te.NotRequired[t.Optional[t.Dict]]
+    """Metadata for executing local action."""
+
+    text: te.NotRequired[t.Optional[str]]
+    """Extra text to use for generating function calling metadata."""
+
+
+DEFAULT_MAX_CONCURRENCY = 8
+"""Default number of actions to execute concurrently in a batch."""
+
+
+def _is_remote(action: ActionType) -> bool:
+    """Check if an action is executed using the Composio API."""
+    try:
+        action = Action(action)
+        return not (action.is_local or action.is_runtime)
+    except ComposioSDKError:
+        return False
+
+
 def _check_agentops() -> bool:
     """Check if AgentOps is installed and initialized."""
     if find_spec("agentops") is None:
@@ -151,8 +200,8 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
 
     _custom_auth: t.Dict[App, CustomAuthObject]
 
-    _connected_accounts: t.Optional[t.List[ConnectedAccountModel]] = None
     _remote_client: t.Optional[Composio] = None
+    _remote_async_client: t.Optional[AsyncComposio] = None
     _workspace: t.Optional[Workspace] = None
 
     _runtime: str = "composio"
@@ -307,13 +356,11 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
         self._workspace_config = workspace_config
         self._local_client = LocalClient()
         self._custom_auth = {}
+        self._workspace_lock = threading.Lock()
 
         if len(kwargs) > 0:
             self.logger.info(f"Extra kwargs while initializing toolset: {kwargs}")
 
-        self.logger.debug("Loading local tools")
-        load_local_tools()
-
         self._connected_account_ids = self._validating_connection_ids(
             connected_account_ids=connected_account_ids or {}
         )
@@ -392,12 +439,28 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
         self._remote_client.local = self._local_client
         return self._remote_client
 
+    @property
+    def async_client(self) -> AsyncComposio:
+        """Async client sharing the configuration of `client`."""
+        if self._remote_async_client is None:
+            self._remote_async_client = AsyncComposio(client=self.client)
+        return self._remote_async_client
+
     @property
     def workspace(self) -> Workspace:
         """Workspace for this toolset instance."""
         if self._workspace is not None:
             return self._workspace
 
+        # Actions executed concurrently should share a single workspace
+        with self._workspace_lock:
+            return self._get_or_create_workspace()
+
+    def _get_or_create_workspace(self) -> Workspace:
+        """Get the workspace, creating it if it does not exist yet."""
+        if self._workspace is not None:
+            return self._workspace
+
         if self._workspace_id is not None:
             self._workspace = WorkspaceFactory.get(id=self._workspace_id)
             return self._workspace
@@ -437,22 +500,30 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
 
     def check_connected_account(self, action: ActionType) -> None:
         """Check if connected account is required and if required it exists or not."""
-        action = load_action(self.client, action)
+        if not isinstance(action, Action):
+            action = load_action(self.client, action)
+
         if action.no_auth or action.is_runtime:
             return
 
         if App(action.app) in self._custom_auth:
             return
 
-        if self._connected_accounts is None:
-            self._connected_accounts = t.cast(
-                t.List[ConnectedAccountModel],
-                self.client.connected_accounts.get(),
+        if self.client.connection_resolver.get(app=action.app) is None:
+            raise ComposioSDKError(
+                f"No connected account found for app `{action.app}`; "
+                f"Run `composio add {action.app.lower()}` to fix this"
             )
 
-        if action.app not in [
-            connection.appUniqueId for connection in self._connected_accounts
-        ]:
+    async def _acheck_connected_account(self, action: Action) -> None:
+        """Async version of `check_connected_account`."""
+        if action.no_auth or action.is_runtime:
+            return
+
+        if App(action.app) in self._custom_auth:
+            return
+
+        if await self.async_client.connected_accounts.latest(app=action.app) is None:
             raise ComposioSDKError(
                 f"No connected account found for app `{action.app}`; "
                 f"Run `composio add {action.app.lower()}` to fix this"
@@ -514,7 +585,47 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
             text=text,
             auth=auth,
         )
+        return self._process_remote_output(
+            action=action,
+            output=output,
+            entity_id=entity_id,
+        )
+
+    async def _aexecute_remote(
+        self,
+        action: Action,
+        params: t.Dict,
+        entity_id: str = DEFAULT_ENTITY_ID,
+        connected_account_id: t.Optional[str] = None,
+        session_id: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+    ) -> t.Dict:
+        """Execute a remote action using the async client."""
+        auth = self._custom_auth.get(App(action.app))
+        if auth is None:
+            await self._acheck_connected_account(action=action)
+
+        output = await self.async_client.get_entity(id=entity_id).execute(
+            action=action,
+            params=params,
+            connected_account_id=connected_account_id,
+            session_id=session_id,
+            text=text,
+            auth=auth,
+        )
+        return self._process_remote_output(
+            action=action,
+            output=output,
+            entity_id=entity_id,
+        )
 
+    def _process_remote_output(
+        self,
+        action: Action,
+        output: t.Dict,
+        entity_id: str = DEFAULT_ENTITY_ID,
+    ) -> t.Dict:
+        """Write the output or the files in the output of a remote action."""
         if self.output_in_file:
             return self._write_to_file(
                 action=action,
@@ -744,20 +855,12 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
         :param connected_account_id: Connection ID for executing the remote action
         :return: Output object from the function call
         """
-        action = Action(action)
-        params = self._serialize_execute_params(param=params)
-        if processors is not None:
-            self._merge_processors(processors)
-
-        if not action.is_runtime:
-            params = self._process_request(action=action, request=params)
-            metadata = self._add_metadata(action=action, metadata=metadata)
-            connected_account_id = connected_account_id or self._get_connected_account(
-                action=action
-            )
-
-        self.logger.info(
-            f"Executing `{action.slug}` with {params=} and {metadata=} {connected_account_id=}"
+        action, params, metadata, connected_account_id = self._prepare_execute(
+            action=action,
+            params=params,
+            metadata=metadata,
+            connected_account_id=connected_account_id,
+            processors=processors,
         )
         response = (
             self._execute_local(
@@ -776,6 +879,95 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
                 session_id=self.workspace.id,
             )
         )
+        return self._finish_execute(action=action, params=params, response=response)
+
+    async def aexecute_action(
+        self,
+        action: ActionType,
+        params: dict,
+        metadata: t.Optional[t.Dict] = None,
+        entity_id: t.Optional[str] = None,
+        connected_account_id: t.Optional[str] = None,
+        text: t.Optional[str] = None,
+        *,
+        processors: t.Optional[ProcessorsType] = None,
+    ) -> t.Dict:
+        """
+        Execute an action on a given entity without blocking the event loop.
+
+        Remote actions are executed using the async client, local actions are
+        executed on the default executor of the running loop.
+
+        :param action: Action to execute
+        :param params: The parameters to pass to the action
+        :param entity_id: The ID of the entity to execute the action on. Defaults to "default"
+        :param text: Extra text to use for generating function calling metadata
+        :param metadata: Metadata for executing local action
+        :param connected_account_id: Connection ID for executing the remote action
+        :return: Output object from the function call
+        """
+        action, params, metadata, connected_account_id = self._prepare_execute(
+            action=action,
+            params=params,
+            metadata=metadata,
+            connected_account_id=connected_account_id,
+            processors=processors,
+        )
+        loop = asyncio.get_running_loop()
+        if action.is_local:
+            response = await loop.run_in_executor(
+                None,
+                partial(
+                    self._execute_local,
+                    action=action,
+                    params=params,
+                    metadata=metadata,
+                    entity_id=entity_id,
+                ),
+            )
+        else:
+            # Creating the workspace may block, so resolve it off the loop
+            workspace = await loop.run_in_executor(None, lambda: self.workspace)
+            response = await self._aexecute_remote(
+                action=action,
+                params=params,
+                entity_id=entity_id or self.entity_id,
+                connected_account_id=connected_account_id,
+                text=text,
+                session_id=workspace.id,
+            )
+        return self._finish_execute(action=action, params=params, response=response)
+
+    def _prepare_execute(
+        self,
+        action: ActionType,
+        params: t.Dict,
+        metadata: t.Optional[t.Dict],
+        connected_account_id: t.Optional[str],
+        processors: t.Optional[ProcessorsType],
+    ) -> t.Tuple[Action, t.Dict, t.Optional[t.Dict], t.Optional[str]]:
+        """Serialize and pre-process the request for executing an action."""
+        action = Action(action)
+        params = self._serialize_execute_params(param=params)
+        if processors is not None:
+            self._merge_processors(processors)
+
+        if not action.is_runtime:
+            params = self._process_request(action=action, request=params)
+            metadata = self._add_metadata(action=action, metadata=metadata)
+            connected_account_id = connected_account_id or self._get_connected_account(
+                action=action
+            )
+
+        self.logger.info(
+            f"Executing `{action.slug}` with {params=} and {metadata=} {connected_account_id=}"
+        )
+        return action, params, metadata, connected_account_id
+
+    def _finish_execute(
+        self, action: Action, params: t.Dict, response: t.Dict
+    ) -> t.Dict:
+        """Post-process the response for an executed action."""
         response = (
             response
             if action.is_runtime
@@ -784,6 +976,70 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
         self.logger.info(f"Got {response=} from {action=} with {params=}")
         return response
 
+    def execute_actions(
+        self,
+        calls: t.Sequence[ActionCall],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> t.List[t.Dict]:
+        """
+        Execute a batch of independent actions.
+
+        Remote actions are executed concurrently. Local and runtime actions
+        share the workspace, so they are executed one at a time in the order
+        of the calls, alongside the remote actions. The outputs are returned
+        in the same order as the calls. If a call fails, its output is an
+        error response and the rest of the batch is not affected.
+
+        :param calls: List of action calls to execute
+        :param max_concurrency: Maximum number of actions to execute at once
+        :return: List of output objects from the action calls
+        """
+
+        def _execute(call: ActionCall) -> t.Dict:
+            try:
+                return self.execute_action(
+                    action=call["action"],
+                    params=call["params"],
+                    metadata=call.get("metadata"),
+                    entity_id=call.get("entity_id"),
+                    connected_account_id=call.get("connected_account_id"),
+                    text=call.get("text"),
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.logger.error(f"Error executing `{call['action']}`: {e}")
+                return {
+                    "data": None,
+                    "error": str(e),
+                    "successful": False,
+                }
+
+        outputs: t.List[t.Dict] = [{} for _ in calls]
+
+        def _execute_in_order(indices: t.List[int]) -> None:
+            for index in indices:
+                outputs[index] = _execute(call=calls[index])
+
+        remote: t.List[int] = []
+        local: t.List[int] = []
+        for index, call in enumerate(calls):
+            (remote if _is_remote(action=call["action"]) else local).append(index)
+
+        tasks = [[index] for index in remote]
+        if len(local) > 0:
+            tasks.append(local)
+
+        if len(tasks) <= 1 or max_concurrency <= 1:
+            _execute_in_order(indices=list(range(len(calls))))
+            return outputs
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(tasks))
+        ) as executor:
+            futures = [executor.submit(_execute_in_order, task) for task in tasks]
+            for future in futures:
+                future.result()
+        return outputs
+
     @t.overload
     def execute_request(
         self,
@@ -1001,30 +1257,79 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
         )
         return action_item
 
-    def create_trigger_listener(self, timeout: float = 15.0) -> TriggerSubscription:
-        """Create trigger subscription."""
-        return self.client.triggers.subscribe(timeout=timeout)
+    def create_trigger_listener(
+        self,
+        timeout: float = 15.0,
+        workers: int = DISPATCHER_WORKERS,
+        queue_size: int = DISPATCHER_QUEUE_SIZE,
+        overflow: OverflowPolicy = "block",
+    ) -> TriggerSubscription:
+        """
+        Create trigger subscription.
+
+        :param timeout: Seconds to wait for the connection.
+        :param workers: Number of threads running the callbacks.
+        :param queue_size: Number of events waiting for a worker before the
+            overflow policy applies.
+        :param overflow: `block`, `drop_oldest` or `spill`, see `EventDispatcher`.
+        :return: Trigger subscription object.
+        """
+        return self.client.triggers.subscribe(
+            timeout=timeout,
+            workers=workers,
+            queue_size=queue_size,
+            overflow=overflow,
+        )
 
     def find_actions_by_use_case(
         self,
         *apps: AppType,
         use_case: str,
+        search: t.Literal["local", "remote", "blend"] = "remote",
+        limit: t.Optional[int] = None,
     ) -> t.List[Action]:
         """
         Find actions by specified use case.
 
         :param apps: List of apps to search.
         :param use_case: String describing the use case.
+        :param search: `remote` to rank the actions using the API, `local` to
+            rank the actions using the search index built by `composio apps
+            update` and `blend` to merge both rankings. The local search falls
+            back to the API if there is no index or no action matches.
+        :param limit: Maximum number of actions to return.
         :return: A list of actions matching the relevant use case.
         """
+        if search not in ("local", "remote", "blend"):
+            raise ComposioSDKError(f"Invalid use case search mode: {search}")
+
+        local: t.List[str] = []
+        if search != "remote":
+            index = get_search_index(actions=Action.iter())
+            if index is not None:
+                local = [
+                    slug
+                    for slug, _ in index.search(
+                        query=use_case,
+                        apps=[App(app).slug for app in apps],
+                        limit=limit,
+                    )
+                ]
+            if search == "local" and len(local) > 0:
+                return [Action(slug, warn=False) for slug in local]
+
         actions = self.client.actions.get(
             apps=[App(app) for app in apps],
             use_case=use_case,
             allow_all=True,
+            limit=limit,
         )
-        return [
-            Action(value=get_enum_key(name=action.name).lower()) for action in actions
-        ]
+        ranking = [get_enum_key(name=action.name) for action in actions]
+        if search == "blend":
+            ranking = blend_rankings(local, ranking)
+            if limit is not None:
+                ranking = ranking[:limit]
+        return [Action(value=slug.lower()) for slug in ranking]
 
     def find_actions_by_tags(
         self,
@@ -1050,6 +1355,10 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
                 )
             )
 
+        index = get_action_index(actions=Action.iter())
+        if index is not None:
+            return [Action(slug, warn=False) for slug in index.get_actions(tags=tags)]
+
         actions = []
         for action in Action.all():
             if any(tag in action.tags for tag in tags):
@@ -1151,13 +1460,20 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
             apps = [a for a in apps if a.no_auth is no_auth]
 
         if include_local:
-            for app in tool_registry["local"].values():
+            local = {
+                enum: (tool.name, tool.description)
+                for enum, tool in tool_registry["local"].items()
+            }
+            for enum, entry in get_manifest()["tools"].items():
+                local.setdefault(enum, (entry["name"], entry["description"]))
+
+            for name, description in local.values():
                 apps.append(
                     AppModel(
-                        name=app.name,
-                        key=app.name,
-                        appId=app.name,
-                        description=app.description,
+                        name=name,
+                        key=name,
+                        appId=name,
+                        description=description,
                         categories=["local"],
                         meta={},
                         no_auth=True,
@@ -1432,6 +1748,9 @@ class ComposioToolSet(WithLogger):  # pylint: disable=too-many-public-methods
                 )
                 integration_id = integration.id
 
+        self.client.connection_resolver.invalidate(
+            entity_id=entity_id or self.entity_id
+        )
         return self.client.connected_accounts.initiate(
             integration_id=integration_id,
             entity_id=entity_id or self.entity_id,
@@ -3,17 +3,25 @@ Logging utilities.
 """
 
 import atexit
+import gzip
+import json
 import logging
 import os
+import random
 import threading
+import time
 import typing as t
 from enum import Enum
-from queue import Empty, Queue
+from queue import Empty, Full, Queue
 
 from composio.constants import ENV_COMPOSIO_LOGGING_LEVEL
 from composio.exceptions import ApiKeyNotProvidedError
 
 
+if t.TYPE_CHECKING:
+    from composio.client.http import HttpClient
+
+
 _DEFAULT_FORMAT = "[%(asctime)s][%(levelname)s] %(message)s"
 _DEFAULT_LOGGER_NAME = "composio"
 
@@ -97,6 +105,9 @@ class _VerbosityWrapper:
     def error(self, msg, *args, **kwargs):
         self.logger.error(msg, *args, **kwargs)
 
+    def isEnabledFor(self, level: int) -> bool:  # pylint: disable=invalid-name
+        return self.logger.isEnabledFor(level)
+
 
 def _parse_log_level_from_env(default: int) -> int:
     """Parse log level from environment."""
@@ -171,8 +182,87 @@ class WithLogger:
         return t.cast(logging.Logger, self._logger)
 
 
+ENV_COMPOSIO_LOGS_SAMPLE_RATE = "COMPOSIO_LOGS_SAMPLE_RATE"
+"""
+Environment variable for the fraction of successful executions to ship logs for.
+"""
+
+ENV_COMPOSIO_LOGS_COMPRESS = "COMPOSIO_LOGS_COMPRESS"
+"""
+Environment variable for enabling gzip compression of shipped logs.
+"""
+
+ENV_COMPOSIO_LOGS_BATCH_REQUESTS = "COMPOSIO_LOGS_BATCH_REQUESTS"
+"""
+Environment variable for shipping each batch of logs as a JSON array in one
+request, only enable it for a logs endpoint which accepts arrays.
+"""
+
+OverflowPolicy = t.Literal["drop_oldest", "drop_newest", "block"]
+
+
+def _parse_sample_rate_from_env() -> float:
+    """Parse log sample rate from environment."""
+    value = os.environ.get(ENV_COMPOSIO_LOGS_SAMPLE_RATE)
+    if value is None:
+        return 1.0
+
+    try:
+        return float(value)
+    except ValueError:
+        get().warning(
+            f"Invalid value {value!r} for `{ENV_COMPOSIO_LOGS_SAMPLE_RATE}`, "
+            "expected a number between 0 and 1, shipping all logs"
+        )
+        return 1.0
+
+
 class LogIngester:
-    def __init__(self) -> None:
+    """
+    Background shipper for action execution logs.
+
+    Records are queued without blocking the caller and shipped in batches,
+    once `batch_size` records are queued or `flush_interval` seconds after
+    the first record of a batch. The batches are shipped over a connection
+    pool of their own so they do not compete with the API requests of the
+    SDK, one record per request unless `batch_requests` is enabled.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 1000,
+        overflow: OverflowPolicy = "drop_oldest",
+        block_timeout: float = 0.1,
+        max_payload_size: int = 16 * 1024,
+        sample_rate: t.Optional[float] = None,
+        compress: t.Optional[bool] = None,
+        batch_requests: t.Optional[bool] = None,
+        flush_timeout: float = 2.0,
+    ) -> None:
+        """
+        Initialize log ingester.
+
+        :param batch_size: Maximum number of records to ship at once
+        :param flush_interval: Maximum number of seconds a record waits for
+            the batch to fill up
+        :param max_queue_size: Maximum number of records waiting to be shipped
+        :param overflow: What to do when the queue is full, drop the oldest
+            record, drop the new record or block the caller for up to
+            `block_timeout` seconds before dropping the new record
+        :param block_timeout: Number of seconds to block when `overflow` is
+            set to `block`
+        :param max_payload_size: Maximum size of the serialised request and
+            response payloads, larger payloads are truncated
+        :param sample_rate: Fraction of successful executions to ship logs
+            for, errors are always shipped
+        :param compress: Set `True` to gzip the request bodies
+        :param batch_requests: Set `True` to ship each batch as a JSON array
+            in a single request, the logs endpoint must accept arrays
+        :param flush_timeout: Number of seconds to spend shipping the queued
+            records when the interpreter exits
+        """
         from composio import Composio  # pylint: disable=import-outside-toplevel
 
         try:
@@ -180,7 +270,30 @@ class LogIngester:
         except ApiKeyNotProvidedError:
             return
 
-        self._queue = Queue[t.Dict]()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.max_payload_size = max_payload_size
+        self.sample_rate = (
+            sample_rate if sample_rate is not None else _parse_sample_rate_from_env()
+        )
+        self.compress = (
+            compress
+            if compress is not None
+            else os.environ.get(ENV_COMPOSIO_LOGS_COMPRESS, "false") == "true"
+        )
+        self.batch_requests = (
+            batch_requests
+            if batch_requests is not None
+            else os.environ.get(ENV_COMPOSIO_LOGS_BATCH_REQUESTS, "false") == "true"
+        )
+        self.flush_timeout = flush_timeout
+        self.stats = {"queued": 0, "sent": 0, "dropped": 0, "failed": 0}
+        self._stats_lock = threading.Lock()
+
+        self._http: t.Optional["HttpClient"] = None
+        self._queue = Queue[t.Dict](maxsize=max_queue_size)
         self._event = threading.Event()
         self._thread = threading.Thread(target=self._wait, daemon=True)
         self._thread.start()
@@ -203,34 +316,179 @@ class LogIngester:
         if not hasattr(self, "_queue"):
             return
 
-        self._queue.put_nowait(
-            item={
+        if not is_error and random.random() >= self.sample_rate:
+            return
+
+        self._put(
+            record={
                 "connectionId": connection_id,
                 "providerName": provider_name,
                 "actionName": action_name,
-                "request": request,
-                "response": response,
+                "request": self._truncate(request),
+                "response": self._truncate(response),
                 "isError": is_error,
                 "sessionId": session_id,
             }
         )
 
-    def _push(self, record: t.Dict) -> None:
-        """Push log to server."""
-        self._client.logs.push(record=record)
+    def _count(self, stat: str, value: int = 1) -> None:
+        """Update a stat, records are queued and shipped on different threads."""
+        with self._stats_lock:
+            self.stats[stat] += value
+
+    def _put(self, record: t.Dict) -> None:
+        """Queue record, applying the overflow policy if the queue is full."""
+        try:
+            if self.overflow == "block":
+                self._queue.put(item=record, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(item=record)
+            self._count("queued")
+            return
+        except Full:
+            pass
+
+        self._count("dropped")
+        if self.overflow != "drop_oldest":
+            return
+
+        try:
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self._queue.put_nowait(item=record)
+            self._count("queued")
+        except (Empty, Full):
+            pass
+
+    def _truncate(self, payload: t.Any) -> t.Any:
+        """Truncate the payload if its serialised form is too large."""
+        if self.max_payload_size < 0:
+            return payload
+
+        try:
+            serialised = json.dumps(payload, default=str)
+        except (TypeError, ValueError):
+            serialised = str(payload)
+
+        if len(serialised) <= self.max_payload_size:
+            return payload
+
+        return {
+            "truncated": True,
+            "size": len(serialised),
+            "preview": serialised[: self.max_payload_size],
+        }
+
+    def _session(self) -> "HttpClient":
+        """HTTP client dedicated to shipping logs."""
+        if self._http is None:
+            from composio.client.http import (  # pylint: disable=import-outside-toplevel
+                HttpClient,
+            )
+
+            self._http = HttpClient(
+                base_url=self._client.base_url,
+                api_key=self._client.api_key,
+                runtime=self._client.runtime,
+                timeout=10.0,
+            )
+        return self._http
+
+    def _push(self, payload: t.Union[t.Dict, t.List[t.Dict]]) -> bool:
+        """
+        Push logs to server.
+
+        :param payload: A log record, or a batch of records if
+            `batch_requests` is enabled
+        :return: `True` if the server accepted the logs.
+        """
+        url = str(self._client.logs.endpoint)
+        if not self.compress:
+            response = self._session().post(url=url, json=payload)
+        else:
+            response = self._session().post(
+                url=url,
+                data=gzip.compress(json.dumps(payload, default=str).encode("utf-8")),
+                headers={
+                    "Content-Type": "application/json",
+                    "Content-Encoding": "gzip",
+                },
+            )
+        return 200 <= response.status_code < 300
+
+    def _next_batch(self, timeout: float) -> t.List[t.Dict]:
+        """Wait for the next batch of records."""
+        try:
+            batch = [self._queue.get(timeout=timeout)]
+        except Empty:
+            return []
+
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0 or self._event.is_set():
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except Empty:
+                break
+        return batch
+
+    def _flush(self, batch: t.List[t.Dict], deadline: t.Optional[float] = None) -> None:
+        """Ship a batch of records."""
+        payloads: t.List[t.Union[t.Dict, t.List[t.Dict]]]
+        payloads = [batch] if self.batch_requests else list(batch)
+        try:
+            for payload in payloads:
+                size = len(payload) if isinstance(payload, list) else 1
+                if deadline is not None and time.monotonic() > deadline:
+                    self._count("dropped", size)
+                    continue
+                try:
+                    accepted = self._push(payload=payload)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    accepted = False
+                self._count("sent" if accepted else "failed", size)
+        finally:
+            for _ in batch:
+                self._queue.task_done()
 
     def _wait(self) -> None:
         """Wait for the logs."""
         while not self._event.is_set():
-            try:
-                self._push(record=self._queue.get(timeout=0.5))
-            except Empty:
-                continue
+            batch = self._next_batch(timeout=0.5)
+            if len(batch) > 0:
+                self._flush(batch=batch)
+
+        deadline = time.monotonic() + self.flush_timeout
+        while time.monotonic() < deadline:
+            batch = self._next_batch(timeout=0.0)
+            if len(batch) == 0:
+                break
+            self._flush(batch=batch, deadline=deadline)
+
+    def flush(self, timeout: t.Optional[float] = None) -> bool:
+        """
+        Wait for the queued records to be shipped.
+
+        :param timeout: Maximum number of seconds to wait
+        :return: `True` if the queue was emptied in time.
+        """
+        if not hasattr(self, "_queue"):
+            return True
+
+        deadline = time.monotonic() + (timeout or self.flush_timeout)
+        while time.monotonic() < deadline:
+            if self._queue.unfinished_tasks == 0:
+                return True
+            time.sleep(0.01)
+        return self._queue.unfinished_tasks == 0
 
     def _teardown(self) -> None:
-        """Teardown the logging client."""
+        """Ship the queued records within the flush deadline and stop."""
         self._event.set()
-        self._thread.join()
+        self._thread.join(timeout=self.flush_timeout + self.flush_interval)
 
 
 get_logger = get
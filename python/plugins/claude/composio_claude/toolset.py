@@ -166,14 +166,15 @@ class ComposioToolSet(
         :param entity_id: Entity ID to use for executing function calls.
         :return: A list of output objects from the function calls.
         """
-        outputs = []
         entity_id = self.validate_entity_id(entity_id or self.entity_id)
-        for content in llm_response.content:
-            if isinstance(content, (ToolUseBlock, BetaToolUseBlock)):
-                outputs.append(
-                    self.execute_tool_call(
-                        tool_call=content,
-                        entity_id=entity_id or self.entity_id,
-                    )
-                )
-        return outputs
+        return self.execute_actions(
+            calls=[
+                {
+                    "action": content.name,
+                    "params": t.cast(t.Dict, content.input),
+                    "entity_id": entity_id or self.entity_id,
+                }
+                for content in llm_response.content
+                if isinstance(content, (ToolUseBlock, BetaToolUseBlock))
+            ]
+        )
@@ -17,9 +17,19 @@ from vertexai.generative_models import (
 from composio import Action, ActionType, AppType, TagType
 from composio.constants import DEFAULT_ENTITY_ID
 from composio.tools import ComposioToolSet as BaseComposioToolSet
+from composio.tools.toolset import ActionCall
 from composio.utils.shared import json_schema_to_model
 
 
+def convert_map_composite(obj: t.Any) -> t.Any:
+    """Convert the function call arguments from protobuf maps to dicts."""
+    if isinstance(obj, MapComposite):
+        return {k: convert_map_composite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [convert_map_composite(item) for item in obj]
+    return obj
+
+
 class ComposioToolset(
     BaseComposioToolSet,
     runtime="google_ai",
@@ -170,19 +180,9 @@ class ComposioToolset(
         :return: Object containing output data from the function call.
         """
         entity_id = self.validate_entity_id(entity_id or self.entity_id)
-
-        def convert_map_composite(obj):
-            if isinstance(obj, MapComposite):
-                return {k: convert_map_composite(v) for k, v in obj.items()}
-            if isinstance(obj, (list, tuple)):
-                return [convert_map_composite(item) for item in obj]
-            return obj
-
-        args = convert_map_composite(function_call.args)
-
         return self.execute_action(
             action=Action(value=function_call.name),
-            params=args,
+            params=convert_map_composite(function_call.args),
             entity_id=entity_id,
         )
 
@@ -194,20 +194,25 @@ class ComposioToolset(
         """
         Handle response from Google AI Python Gemini model.
 
+        The function calls are executed as a batch using `execute_actions`.
+
         :param response: Generation response from the Gemini model.
         :param entity_id: Entity ID to use for executing the function call.
-        :return: A list of output objects from the function calls.
+        :return: A list of output objects from the function calls, in order.
         """
         entity_id = self.validate_entity_id(entity_id or self.entity_id)
-        outputs = []
+        calls: t.List[ActionCall] = []
         for candidate in response.candidates:
             if isinstance(candidate.content, Content) and candidate.content.parts:
                 for part in candidate.content.parts:
                     if isinstance(part, Part) and part.function_call:
-                        outputs.append(
-                            self.execute_function_call(
-                                function_call=part.function_call,
-                                entity_id=entity_id,
-                            )
+                        calls.append(
+                            {
+                                "action": Action(value=part.function_call.name),
+                                "params": convert_map_composite(
+                                    part.function_call.args
+                                ),
+                                "entity_id": entity_id,
+                            }
                         )
-        return outputs
+        return self.execute_actions(calls=calls)
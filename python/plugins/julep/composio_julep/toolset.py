@@ -1,10 +1,12 @@
 import json
+import typing as t
 
 from julep import Client
 from julep.api.types import ChatResponse
 
 from composio import Action
 from composio.constants import DEFAULT_ENTITY_ID
+from composio.tools.toolset import ActionCall
 
 from composio_openai import ComposioToolSet as BaseComposioToolSet
 
@@ -33,23 +35,30 @@ class ComposioToolSet(
         :param entity_id: Entity ID to use for executing function calls.
         :return: A list of output objects from the function calls.
         """
-        outputs = []
+        outputs: t.List[t.Any] = []
         entity_id = self.validate_entity_id(entity_id or self.entity_id)
         while response.finish_reason == "tool_calls":
+            calls: t.List[ActionCall] = []
+            positions = []
             for _responses in response.response:
                 for _response in _responses:
                     try:
                         tool_function = json.loads(_response.content)  # type: ignore
-                        outputs.append(
-                            self.execute_action(
-                                action=Action(value=tool_function["name"]),
-                                params=json.loads(tool_function["arguments"]),
-                                entity_id=entity_id or self.entity_id,
-                            )
+                        calls.append(
+                            {
+                                "action": Action(value=tool_function["name"]),
+                                "params": json.loads(tool_function["arguments"]),
+                                "entity_id": entity_id or self.entity_id,
+                            }
                         )
+                        positions.append(len(outputs))
+                        outputs.append(None)
                     except json.JSONDecodeError:
                         outputs.append(_response.content)
 
+            for position, output in zip(positions, self.execute_actions(calls=calls)):
+                outputs[position] = output
+
             response = julep_client.sessions.chat(  # submit the tool call
                 session_id=session_id,
                 messages=[{"role": "assistant", "content": json.dumps(outputs)}],  # type: ignore
@@ -195,18 +195,32 @@ class ComposioToolSet(
         :return: A list of output objects from the function calls.
         """
         entity_id = self.validate_entity_id(entity_id or self.entity_id)
-        outputs = []
+        tool_calls = []
         if response.choices:
             for choice in response.choices:
                 if choice.message.tool_calls:
-                    for tool_call in choice.message.tool_calls:
-                        outputs.append(
-                            self.execute_tool_call(
-                                tool_call=tool_call,
-                                entity_id=entity_id or self.entity_id,
-                            )
-                        )
-        return outputs
+                    tool_calls.extend(choice.message.tool_calls)
+        return self._execute_tool_calls(
+            tool_calls=tool_calls,
+            entity_id=entity_id or self.entity_id,
+        )
+
+    def _execute_tool_calls(
+        self,
+        tool_calls: t.Sequence[ChatCompletionMessageToolCall],
+        entity_id: str,
+    ) -> t.List[t.Dict]:
+        """Execute a batch of tool calls concurrently."""
+        return self.execute_actions(
+            calls=[
+                {
+                    "action": tool_call.function.name,
+                    "params": json.loads(tool_call.function.arguments),
+                    "entity_id": entity_id,
+                }
+                for tool_call in tool_calls
+            ]
+        )
 
     def handle_assistant_tool_calls(
         self,
@@ -214,20 +228,20 @@ class ComposioToolSet(
         entity_id: t.Optional[str] = None,
     ) -> t.List:
         """Wait and handle assistant function calls"""
-        tool_outputs = []
-        for tool_call in t.cast(
+        tool_calls = t.cast(
             RequiredAction, run.required_action
-        ).submit_tool_outputs.tool_calls:
-            tool_response = self.execute_tool_call(
-                tool_call=t.cast(ChatCompletionMessageToolCall, tool_call),
-                entity_id=entity_id or self.entity_id,
-            )
-            tool_output = {
+        ).submit_tool_outputs.tool_calls
+        tool_responses = self._execute_tool_calls(
+            tool_calls=t.cast(t.List[ChatCompletionMessageToolCall], tool_calls),
+            entity_id=entity_id or self.entity_id,
+        )
+        return [
+            {
                 "tool_call_id": tool_call.id,
                 "output": json.dumps(tool_response),
             }
-            tool_outputs.append(tool_output)
-        return tool_outputs
+            for tool_call, tool_response in zip(tool_calls, tool_responses)
+        ]
 
     def wait_and_handle_assistant_tool_calls(
         self,
@@ -0,0 +1,178 @@
+"""
+Benchmark for executing actions concurrently with the sync and async clients.
+
+Usage:
+    python scripts/benchmarks/async_client.py [--calls 200] [--latency 50] [--workers 8]
+
+Starts a local mock of the Composio API which responds to action executions
+after a fixed latency, then executes `--calls` actions using the sync client
+on a thread pool of `--workers` threads and using the async client with
+`asyncio.gather`. Reports the throughput and the latency percentiles for both.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from composio.client import Composio
+from composio.client.aio import AsyncComposio
+from composio.client.cache import schema_cache
+from composio.client.enums import Action
+
+
+ACCOUNT = {
+    "id": "account",
+    "status": "ACTIVE",
+    "createdAt": "2024-01-01T00:00:00.000Z",
+    "updatedAt": "2024-01-01T00:00:00.000Z",
+    "appUniqueId": "github",
+    "appName": "github",
+    "integrationId": "integration",
+    "clientUniqueUserId": "default",
+    "connectionParams": {},
+}
+
+SCHEMA = {
+    "name": "GITHUB_STAR_A_REPOSITORY_FOR_THE_AUTHENTICATED_USER",
+    "appName": "github",
+    "appId": "github",
+    "tags": [],
+    "parameters": {
+        "properties": {"owner": {"type": "string"}},
+        "title": "Request",
+        "type": "object",
+    },
+    "response": {"properties": {}, "title": "Response", "type": "object"},
+}
+
+
+def _make_server(latency: float) -> ThreadingHTTPServer:
+    """Create mock API server which responds after `latency` seconds."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, data: t.Dict) -> None:
+            time.sleep(latency)
+            body = json.dumps(data).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:  # pylint: disable=invalid-name
+            if self.path.startswith("/v1/connectedAccounts"):
+                return self._reply({"items": [ACCOUNT]})
+            return self._reply({})
+
+        def do_POST(self) -> None:  # pylint: disable=invalid-name
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            return self._reply({"data": body["input"], "successful": True})
+
+        def log_message(self, *args: t.Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def _report(name: str, total: float, latencies: t.List[float]) -> None:
+    latencies = sorted(latencies)
+    print(f"{name}")
+    print(f"  total:      {total * 1000:.2f}ms")
+    print(f"  throughput: {len(latencies) / total:.2f} calls/s")
+    print(f"  p50:        {statistics.median(latencies) * 1000:.2f}ms")
+    print(f"  p95:        {latencies[int(len(latencies) * 0.95) - 1] * 1000:.2f}ms")
+
+
+def _run_sync(client: Composio, action: Action, calls: int, workers: int) -> None:
+    entity = client.get_entity()
+
+    def _execute(i: int) -> float:
+        start = time.perf_counter()
+        entity.execute(action=action, params={"owner": str(i)})
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        latencies = list(executor.map(_execute, range(calls)))
+    _report(
+        name=f"sync client ({workers} threads)",
+        total=time.perf_counter() - start,
+        latencies=latencies,
+    )
+
+
+async def _run_async(client: AsyncComposio, action: Action, calls: int) -> None:
+    entity = client.get_entity()
+
+    async def _execute(i: int) -> float:
+        start = time.perf_counter()
+        await entity.execute(action=action, params={"owner": str(i)})
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(_execute(i) for i in range(calls)))
+    _report(
+        name=f"async client (max {client.max_connections} connections)",
+        total=time.perf_counter() - start,
+        latencies=list(latencies),
+    )
+    await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=50, help="Latency in ms")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--connections", type=int, default=100)
+    args = parser.parse_args()
+
+    server = _make_server(latency=args.latency / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Cache the schema so only the execution requests are measured
+    schema_cache.set(slug=SCHEMA["name"], schema=SCHEMA, version=base_url)
+    action = mock.MagicMock(
+        spec=Action,
+        slug=SCHEMA["name"],
+        app="github",
+        is_local=False,
+        no_auth=False,
+    )
+    print(
+        f"Executing {args.calls} actions against a mock server "
+        f"with {args.latency:.0f}ms latency"
+    )
+    try:
+        client = Composio(api_key="api-key", base_url=base_url)
+        _run_sync(client=client, action=action, calls=args.calls, workers=args.workers)
+        asyncio.run(
+            _run_async(
+                client=AsyncComposio(
+                    client=client,
+                    max_connections=args.connections,
+                    max_connections_per_host=args.connections,
+                ),
+                action=action,
+                calls=args.calls,
+            )
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark for editing python files with the lint check.
+
+Usage:
+    python scripts/benchmarks/file_edit.py [--edits 50] [--lines 2000]
+
+Writes a python module with `--lines` lines and applies `--edits` edits to
+it using `File.edit`, which lints the file before and after every edit,
+reporting the number of edits per second with the in-process `pyflakes`
+linter and with the `flake8` subprocess.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from composio.tools.env.filemanager import lint as linter
+from composio.tools.env.filemanager.file import File
+
+
+def _module(lines: int) -> str:
+    return "import os\n\n\n" + "".join(
+        f"def function_{i}(value):\n    return os.path.join(value, '{i}')\n\n\n"
+        for i in range(lines // 4)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--edits", type=int, default=50)
+    parser.add_argument("--lines", type=int, default=2000)
+    args = parser.parse_args()
+
+    for backend in (linter.BACKEND_FLAKE8, linter.BACKEND_PYFLAKES):
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            linter, "_has_pyflakes", return_value=backend == linter.BACKEND_PYFLAKES
+        ):
+            path = Path(tmp, "module.py")
+            path.write_text(_module(lines=args.lines))
+            file = File(path=path, workdir=Path(tmp))
+
+            start = time.perf_counter()
+            for i in range(args.edits):
+                line = 5 + (i * 4) % (args.lines - 8)
+                output = file.edit(
+                    text=f"    return os.path.join(value, 'edit {i}')",
+                    start=line,
+                    end=line + 1,
+                )
+                assert output["error"] == "", output["error"]
+            elapsed = time.perf_counter() - start
+
+        print(f"{backend}")
+        print(f"  edits/s:    {args.edits / elapsed:.2f}")
+        print(f"  per edit:   {elapsed / args.edits * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark for walking a large tree with `FileManager.find` and `tree`.
+
+Usage:
+    python scripts/benchmarks/filemanager_walk.py [--files 200000] [--path PATH]
+
+Generates a synthetic repository with `--files` files, 60% of them in the
+source tree and the rest split between `node_modules`, `.venv` and an ignored
+`build` directory, or walks an existing tree at `--path`. Reports the time
+for `find` and `tree` with a cold and a warm listing cache.
+"""
+
+import argparse
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+from composio.tools.env.filemanager.manager import FileManager
+
+
+def _generate(root: Path, files: int) -> None:
+    (root / ".gitignore").write_text("build/\n*.log\n")
+    layout = (
+        ("src", 0.6),
+        ("node_modules", 0.2),
+        (".venv/lib/site-packages", 0.1),
+        ("build", 0.1),
+    )
+    for top, share in layout:
+        count = int(files * share)
+        for i in range(count):
+            directory = root / top / f"pkg{i % 200}" / f"mod{i % 10}"
+            if i < 2000:
+                directory.mkdir(parents=True, exist_ok=True)
+            (directory / f"file{i}.py").touch()
+
+
+def _time(name: str, call: t.Callable[[], t.Any]) -> None:
+    start = time.perf_counter()
+    result = call()
+    elapsed = time.perf_counter() - start
+    size = len(result) if isinstance(result, list) else result.count("\n")
+    print(f"{name:<16} {elapsed * 1000:>10.2f}ms {size:>8} entries")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=200000)
+    parser.add_argument("--path", type=str, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(args.path or tmp)
+        if args.path is None:
+            start = time.perf_counter()
+            _generate(root=root, files=args.files)
+            print(f"Generated tree in {time.perf_counter() - start:.2f}s")
+
+        manager = FileManager(working_dir=str(root))
+        _time("find, cold", lambda: manager.find(pattern="*file1*.py"))
+        _time("find, warm", lambda: manager.find(pattern="*file1*.py"))
+        _time("find, depth=2", lambda: manager.find(pattern="*", depth=2))
+        _time("tree, warm", manager.tree)
+        _time("tree, depth=2", lambda: manager.tree(depth=2))
+
+
+if __name__ == "__main__":
+    main()
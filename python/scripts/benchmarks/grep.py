@@ -0,0 +1,76 @@
+"""
+Benchmark for searching a word in a directory tree with `FileManager.grep`.
+
+Usage:
+    python scripts/benchmarks/grep.py [--files 20000] [--path PATH]
+
+Generates a tree of `--files` source files, a `node_modules` directory, an
+ignored build directory and binary files, or searches an existing tree at
+`--path`. Reports the search time with the full scan, with `max_results` and
+with the trigram index, cold and warm.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from composio.tools.env.filemanager import search
+from composio.tools.env.filemanager.manager import FileManager
+
+
+WORD = "needle_in_the_haystack"
+
+
+def _generate(root: Path, files: int) -> None:
+    (root / ".gitignore").write_text("build/\n")
+    for i in range(files):
+        directory = root / f"pkg{i % 100}" / f"mod{i % 7}"
+        directory.mkdir(parents=True, exist_ok=True)
+        lines = [
+            f"def function_{j}(value):\n    return value * {j}\n" for j in range(40)
+        ]
+        if i % 1000 == 0:
+            lines.append(f"{WORD} = True\n")
+        (directory / f"file{i}.py").write_text("".join(lines))
+    for directory in ("node_modules/pkg", "build"):
+        (root / directory).mkdir(parents=True, exist_ok=True)
+        for i in range(files // 10):
+            (root / directory / f"file{i}.js").write_text(f"{WORD}\n" * 100)
+    for i in range(files // 100):
+        (root / f"blob{i}.bin").write_bytes(os.urandom(64 * 1024))
+
+
+def _time(name: str, manager: FileManager, **kwargs) -> None:
+    start = time.perf_counter()
+    results = manager.grep(word=WORD, **kwargs)
+    elapsed = time.perf_counter() - start
+    matches = sum(map(len, results.values()))
+    print(f"{name:<24} {elapsed * 1000:>10.2f}ms {matches:>8} matches")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=20000)
+    parser.add_argument("--path", type=str, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory() as cache:
+        root = Path(args.path or tmp)
+        if args.path is None:
+            _generate(root=root, files=args.files)
+
+        manager = FileManager(working_dir=str(root))
+        with mock.patch.object(search, "INDEX_CACHE_PATH", Path(cache)):
+            _time("scan", manager)
+            _time("scan, max_results=5", manager, max_results=5)
+            _time("index, cold", manager, index=True)
+            _time("index, warm", manager, index=True)
+            with mock.patch.object(search, "_indexes", {}):
+                _time("index, from disk", manager, index=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark for the cold start time of `import composio`.
+
+Usage:
+    python scripts/benchmarks/import_time.py [--runs 5] [--top 10] [--budget 500]
+
+Runs `python -X importtime -c "import composio"` in fresh interpreters and
+reports the median cumulative import time along with the slowest modules.
+Exits with a non-zero status if the median exceeds the budget (in ms), which
+makes it usable as a regression check in CI.
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import typing as t
+
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)")
+
+
+def _run_once(module: str) -> t.Dict[str, t.Tuple[int, int]]:
+    """Import `module` in a fresh interpreter and parse the import times."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, _, name = match.groups()
+        # Modules imported from inside a partially initialized package are
+        # reported more than once, keep the outermost entry.
+        if name in times and times[name][1] >= int(cumulative_us):
+            continue
+        times[name] = (max(int(self_us), 0), int(cumulative_us))
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="composio")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=None, help="Budget in ms")
+    args = parser.parse_args()
+
+    # Warm up the bytecode cache so the first run is not an outlier.
+    _run_once(module=args.module)
+
+    runs = [_run_once(module=args.module) for _ in range(args.runs)]
+    totals = [run[args.module][1] / 1000 for run in runs]
+    median = statistics.median(totals)
+
+    print(f"`import {args.module}` over {args.runs} runs")
+    print(f"  median: {median:.2f}ms")
+    print(f"  min:    {min(totals):.2f}ms")
+    print(f"  max:    {max(totals):.2f}ms")
+    print(f"Slowest modules by self time (median of {args.runs} runs)")
+    self_times = {
+        name: statistics.median(run.get(name, (0, 0))[0] for run in runs) / 1000
+        for name in runs[0]
+        if name != args.module
+    }
+    for name, self_ms in sorted(self_times.items(), key=lambda x: -x[1])[: args.top]:
+        print(f"  {self_ms:8.2f}ms  {name}")
+
+    if args.budget is not None and median > args.budget:
+        print(f"Import time {median:.2f}ms exceeds the budget of {args.budget}ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
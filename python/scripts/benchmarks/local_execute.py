@@ -0,0 +1,117 @@
+"""
+Micro-benchmark for the per call overhead of executing local actions.
+
+Usage:
+    python scripts/benchmarks/local_execute.py [--calls 10000] [--params 8]
+
+Executes a no-op local action with `--params` request parameters through
+`Tool.execute` and reports the mean time per call, along with the time spent
+pre-processing the request using the precomputed field descriptors and
+using JSON schema generation for every parameter.
+"""
+
+import argparse
+import time
+import typing as t
+
+from pydantic import BaseModel, Field, create_model
+
+from composio.tools.base.abs import FileModel
+from composio.tools.base.local import LocalAction, LocalTool, LocalToolMixin
+
+
+class Response(BaseModel):
+    ok: bool = Field(..., description="Always `True`")
+
+
+def _build_tool(params: int) -> t.Tuple[t.Type[LocalTool], t.Type[LocalAction]]:
+    """Build a tool with a single no-op action with `params` parameters."""
+    request = create_model(  # type: ignore
+        "Request",
+        **{
+            f"param_{i}": (str, Field("", description=f"Parameter {i}"))
+            for i in range(params)
+        },
+    )
+
+    class NoopAction(LocalAction[request, Response]):  # type: ignore
+        def execute(self, request: BaseModel, metadata: t.Dict) -> Response:
+            return Response(ok=True)
+
+    class BenchmarkTool(LocalTool):
+        logo = ""
+
+        @classmethod
+        def actions(cls) -> t.List[t.Type[LocalAction]]:
+            return [NoopAction]
+
+    return BenchmarkTool, NoopAction
+
+
+def _schema_check(param: str, model: t.Type[BaseModel]) -> bool:
+    """File parameter check using JSON schema generation for every call."""
+    return (
+        model.model_json_schema()
+        .get("properties", {})
+        .get(param, {})
+        .get("allOf", [{}])[0]
+        .get("properties", {})
+        or model.model_json_schema()
+        .get("properties", {})
+        .get(param, {})
+        .get("properties", {})
+    ) == FileModel.model_json_schema().get("properties")
+
+
+def _timeit(func: t.Callable[[], t.Any], calls: int) -> float:
+    """Mean time per call in microseconds."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=10000)
+    parser.add_argument("--params", type=int, default=8)
+    args = parser.parse_args()
+
+    tool, action = _build_tool(params=args.params)
+    instance = tool()
+    params = {f"param_{i}": "value" for i in range(args.params)}
+    metadata = {
+        "_shells": lambda: None,
+        "_browsers": lambda: None,
+        "_filemanagers": lambda: None,
+    }
+    model = action.request.model
+
+    def _execute() -> None:
+        response = instance.execute(action.enum, params=params, metadata=metadata)
+        assert response["successful"], response
+
+    def _descriptors() -> None:
+        LocalToolMixin._process_request(  # pylint: disable=protected-access
+            request=params,
+            model=model,  # type: ignore
+            fields=action.request.fields,
+        )
+
+    def _schema() -> None:
+        for param in params:
+            _schema_check(param=param, model=model)  # type: ignore
+
+    print(f"Local action with {args.params} parameters, {args.calls} calls")
+    print(f"  Tool.execute:                 {_timeit(_execute, args.calls):10.2f}us")
+    print(
+        f"  pre-process (descriptors):    {_timeit(_descriptors, args.calls):10.2f}us"
+    )
+    print(
+        "  pre-process (schema per call):"
+        f" {_timeit(_schema, max(args.calls // 10, 1)):10.2f}us"
+    )
+
+
+if __name__ == "__main__":
+    main()
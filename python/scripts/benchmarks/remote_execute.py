@@ -0,0 +1,102 @@
+"""
+Benchmark for executing actions on a remote workspace.
+
+Usage:
+    python scripts/benchmarks/remote_execute.py [--calls 500] [--port 8765]
+        [--health]
+
+Starts the tooling server on `--port` in a background thread and executes
+`MATHEMATICAL_CALCULATOR` `--calls` times using `RemoteWorkspace._request`,
+reporting the requests per second with a new connection for every request
+and with the pooled keep-alive session. The tooling server executes actions
+using the Composio API, so `COMPOSIO_API_KEY` needs to be set; with `--health`
+the health check endpoint is polled instead.
+"""
+
+import argparse
+import threading
+import time
+from unittest import mock
+
+import requests
+import uvicorn
+
+from composio import Action
+from composio.server.api import create_app
+from composio.tools.env.base import RemoteWorkspace, WorkspaceConfigType
+
+
+class BenchmarkWorkspace(RemoteWorkspace):
+    """Remote workspace for a tooling server which is already running."""
+
+    def setup(self) -> None:
+        pass
+
+
+def _serve(port: int) -> uvicorn.Server:
+    server = uvicorn.Server(
+        uvicorn.Config(app=create_app(), port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    deadline = time.time() + 30.0
+    while not server.started:
+        if time.time() > deadline:
+            raise TimeoutError("Timed out while waiting for the tooling server")
+        time.sleep(0.1)
+    return server
+
+
+def _run(workspace: RemoteWorkspace, calls: int, health: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        if health:
+            assert workspace._request(endpoint="", method="get").status_code == 200
+            continue
+
+        response = workspace.execute_action(
+            action=Action.MATHEMATICAL_CALCULATOR,
+            request_data={"operation": "6 * 7"},
+            metadata={},
+        )
+        assert response["result"] == "42", response
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--health", action="store_true")
+    args = parser.parse_args()
+
+    server = _serve(port=args.port)
+    workspace = BenchmarkWorkspace(
+        config=WorkspaceConfigType(
+            composio_api_key="benchmark",
+            composio_base_url="http://localhost",
+        )
+    )
+    workspace.url = f"http://localhost:{args.port}/api"
+    try:
+        # A new session for every request, the same as `requests.request`
+        with mock.patch.object(
+            BenchmarkWorkspace,
+            "session",
+            new_callable=mock.PropertyMock,
+            side_effect=requests.Session,
+        ):
+            elapsed = _run(workspace=workspace, calls=args.calls, health=args.health)
+        print("requests.request")
+        print(f"  requests/s: {args.calls / elapsed:.2f}")
+
+        _run(workspace=workspace, calls=10, health=args.health)
+        elapsed = _run(workspace=workspace, calls=args.calls, health=args.health)
+        print("pooled session")
+        print(f"  requests/s: {args.calls / elapsed:.2f}")
+    finally:
+        workspace.teardown()
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
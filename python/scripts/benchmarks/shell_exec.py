@@ -0,0 +1,84 @@
+"""
+Benchmark for executing trivial commands on the host shell.
+
+Usage:
+    python scripts/benchmarks/shell_exec.py [--calls 500] [--shells 5]
+
+Sets up a `HostShell` and executes `--calls` trivial commands, reporting the
+number of commands per second and the latency percentiles. Every command is
+a single round trip, the exit code and the working directory are read from
+the end sentinel the command is wrapped with.
+
+Then checks out and releases `--shells` shells from a `SessionFactory` with
+and without a pool of prewarmed shells, reporting the checkout latency and
+the pool hit rate.
+"""
+
+import argparse
+import statistics
+import time
+import typing as t
+
+from composio.tools.env.base import SessionFactory
+from composio.tools.env.host.shell import HostShell, Shell
+
+
+COMMANDS = ("true", "pwd", "echo composio", "cd /tmp", "ls /")
+
+ENVIRONMENT = {f"COMPOSIO_BENCHMARK_{i}": str(i) for i in range(6)}
+
+
+def _report(name: str, latencies: t.List[float]) -> None:
+    latencies = sorted(latencies)
+    print(f"{name}")
+    print(f"  commands/s: {len(latencies) / sum(latencies):.2f}")
+    print(f"  p50:        {statistics.median(latencies) * 1000:.2f}ms")
+    print(f"  p95:        {latencies[int(len(latencies) * 0.95) - 1] * 1000:.2f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--shells", type=int, default=5)
+    args = parser.parse_args()
+
+    shell = HostShell()
+    start = time.perf_counter()
+    shell.setup()
+    print(f"Shell setup: {(time.perf_counter() - start) * 1000:.2f}ms")
+
+    try:
+        for cmd in COMMANDS:
+            latencies = []
+            for _ in range(args.calls):
+                start = time.perf_counter()
+                output = shell.exec(cmd=cmd)
+                latencies.append(time.perf_counter() - start)
+                assert output["exit_code"] == 0, output
+            _report(name=f"`{cmd}` x {args.calls}", latencies=latencies)
+    finally:
+        shell.teardown()
+
+    for pool_size in (0, 1):
+        shells = SessionFactory[Shell](
+            lambda: HostShell(environment=ENVIRONMENT),
+            pool_size=pool_size,
+        )
+        latencies = []
+        try:
+            for _ in range(args.shells):
+                start = time.perf_counter()
+                session = shells.new()
+                latencies.append(time.perf_counter() - start)
+                session.exec(cmd="cd /tmp && export COMPOSIO_BENCHMARK_0=changed")
+                shells.release(id=session.id)
+                # Think time between the shells, lets the pool refill
+                time.sleep(2.0)
+        finally:
+            shells.teardown()
+        _report(name=f"Shell checkout, pool size {pool_size}", latencies=latencies)
+        print(f"  hit rate:   {shells.stats['hit_rate']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
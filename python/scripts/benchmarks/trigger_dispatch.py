@@ -0,0 +1,88 @@
+"""
+Benchmark for dispatching a burst of trigger events to the callbacks.
+
+Usage:
+    python scripts/benchmarks/trigger_dispatch.py [--events 2000] [--callbacks 4]
+        [--delay 0.002] [--workers 8]
+
+Replays `--events` events from a local thread standing in for the pusher
+socket, with `--callbacks` callbacks taking `--delay` seconds each, reporting
+the time the socket thread is blocked and the events handled per second.
+"""
+
+import argparse
+import json
+import threading
+import time
+
+from composio.client import Composio
+from composio.client.collections import TriggerEventData, TriggerSubscription
+
+
+def _event(n: int) -> str:
+    return json.dumps(
+        {
+            "appName": "github",
+            "payload": {"n": n},
+            "originalPayload": {},
+            "metadata": {
+                "id": f"trigger_{n % 4}",
+                "connectionId": "connection",
+                "triggerName": "GITHUB_COMMIT_EVENT",
+                "triggerData": "",
+                "triggerConfig": {},
+                "connection": {
+                    "id": "connection",
+                    "integrationId": "integration",
+                    "clientUniqueUserId": "default",
+                    "status": "ACTIVE",
+                },
+            },
+        }
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--callbacks", type=int, default=4)
+    parser.add_argument("--delay", type=float, default=0.002)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    subscription = TriggerSubscription(
+        Composio.get_latest(),
+        workers=args.workers,
+        queue_size=args.events,
+    )
+    for i in range(args.callbacks):
+
+        def _callback(event: TriggerEventData) -> None:
+            time.sleep(args.delay)
+
+        subscription.callback(filters={"trigger_id": f"trigger_{i}"})(_callback)
+
+    events = [_event(n) for n in range(args.events)]
+    busy = []
+
+    def _socket() -> None:
+        start = time.perf_counter()
+        for event in events:
+            subscription.dispatch_event(event)
+        busy.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    thread = threading.Thread(target=_socket)
+    thread.start()
+    thread.join()
+    subscription.dispatcher.join()
+    elapsed = time.perf_counter() - start
+    subscription.dispatcher.stop(wait=True)
+
+    print(f"socket busy:  {busy[0] * 1000:.2f}ms")
+    print(f"events/s:     {args.events / elapsed:.2f}")
+    print(f"stats:        {subscription.dispatcher.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Script for building the local tools manifest shipped with the package.
+
+Usage:
+    python scripts/build_manifest.py [--check]
+
+Imports the tool modules in the tools tree and writes the manifest to
+`composio/tools/local/manifest.json`. Run it after adding, removing or
+modifying a local tool and before building the package. With `--check` the
+manifest is not written, instead the script exits with a non-zero status if
+the shipped manifest is out of date, which makes it usable as a CI check.
+"""
+
+import argparse
+import json
+import sys
+
+from composio.tools.local.manifest import MANIFEST_PATH, build_manifest, write_manifest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with a non-zero status if the shipped manifest is out of date",
+    )
+    args = parser.parse_args()
+
+    manifest = build_manifest()
+    if not args.check:
+        write_manifest(manifest=manifest, path=MANIFEST_PATH)
+        print(f"Wrote {len(manifest['tools'])} tools to {MANIFEST_PATH}")
+        return 0
+
+    try:
+        shipped = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        shipped = None
+
+    if shipped != json.loads(json.dumps(manifest)):
+        print(f"{MANIFEST_PATH} is out of date, run `python scripts/build_manifest.py`")
+        return 1
+    print(f"{MANIFEST_PATH} is up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
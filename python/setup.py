@@ -7,6 +7,7 @@ from pathlib import Path
 
 from setuptools import find_packages, setup
 
+
 COMPOSIO = Path(__file__).parent.resolve() / "composio"
 
 
@@ -49,6 +50,7 @@ core_requirements = [
     "pyperclip>=1.8.2,<2",
     # Workspace dependencies
     "paramiko>=3.4.1",  # Host workspace
+    "pyflakes",  # Linting edits in the file manager
     # Tooling server dependencies
     "fastapi",
     "uvicorn",
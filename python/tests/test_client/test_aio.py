@@ -0,0 +1,128 @@
+"""
+Test async client.
+"""
+
+import asyncio
+import json
+import threading
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+
+from composio.client import Composio
+from composio.client.aio import AsyncComposio
+from composio.client.cache import SchemaCache
+from composio.client.enums import Action
+from composio.client.exceptions import NoItemsFound
+
+from tests.test_client.test_cache import SCHEMA
+
+
+ACCOUNT = {
+    "id": "account",
+    "status": "ACTIVE",
+    "createdAt": "2024-01-01T00:00:00.000Z",
+    "updatedAt": "2024-01-01T00:00:00.000Z",
+    "appUniqueId": "github",
+    "appName": "github",
+    "integrationId": "integration",
+    "clientUniqueUserId": "default",
+    "connectionParams": {},
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requests: t.List[t.Tuple[str, str]] = []
+
+    def _reply(self, data: t.Dict) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        self.requests.append(("GET", self.path))
+        if self.path.startswith("/v1/connectedAccounts"):
+            return self._reply({"items": [ACCOUNT]})
+        if self.path.startswith("/v2/actions"):
+            return self._reply({"items": [SCHEMA]})
+        return self._reply({})
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        self.requests.append(("POST", self.path))
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        return self._reply({"data": body["input"], "successful": True})
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+@pytest.fixture(name="server")
+def _server() -> t.Iterator[str]:
+    _Handler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _action() -> Action:
+    action = mock.MagicMock(
+        slug=SCHEMA["name"],
+        app="github",
+        is_local=False,
+        no_auth=False,
+    )
+    # Passes the `isinstance` check without loading the enum members for a spec
+    action.__class__ = Action
+    return action
+
+
+def test_execute_concurrently(server: str) -> None:
+    """Test executing actions concurrently with the async client."""
+    client = AsyncComposio(client=Composio(api_key="api-key", base_url=server))
+    action = _action()
+
+    async def _run() -> t.List[t.Dict]:
+        async with client:
+            entity = client.get_entity()
+            return await asyncio.gather(
+                *(
+                    entity.execute(action=action, params={"owner": str(i)})
+                    for i in range(10)
+                )
+            )
+
+    with mock.patch(
+        "composio.client.aio.schema_cache", new=SchemaCache(persist=False)
+    ), mock.patch(
+        "composio.client.collections.schema_cache", new=SchemaCache(persist=False)
+    ):
+        results = asyncio.run(_run())
+
+    assert [result["data"]["owner"] for result in results] == [
+        str(i) for i in range(10)
+    ]
+    gets = [path for method, path in _Handler.requests if method == "GET"]
+    assert len([path for path in gets if "connectedAccounts" in path]) == 1
+    assert client.sync.connection_resolver.get(app="github", entity_id="default")
+
+
+def test_missing_connection(server: str) -> None:
+    """Test missing connected accounts raise `NoItemsFound`."""
+    client = AsyncComposio(client=Composio(api_key="api-key", base_url=server))
+
+    async def _run() -> None:
+        async with client:
+            await client.get_entity().get_connection(app="slack")
+
+    with pytest.raises(NoItemsFound):
+        asyncio.run(_run())
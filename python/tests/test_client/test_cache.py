@@ -0,0 +1,126 @@
+"""
+Test schema cache.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from composio.client import Composio
+from composio.client.cache import ConnectionResolver, SchemaCache
+from composio.client.collections import Actions, ConnectedAccountModel
+
+
+SCHEMA = {
+    "name": "GITHUB_STAR_A_REPOSITORY_FOR_THE_AUTHENTICATED_USER",
+    "appName": "github",
+    "appId": "github",
+    "tags": [],
+    "parameters": {
+        "properties": {"owner": {"type": "string"}, "repo": {"type": "string"}},
+        "title": "Request",
+        "type": "object",
+    },
+    "response": {"properties": {}, "title": "Response", "type": "object"},
+}
+
+
+def test_schema_cache() -> None:
+    """Test cache hits, misses and invalidation."""
+    cache = SchemaCache(ttl=60.0, persist=False)
+    assert cache.get(slug="ACTION") is None
+
+    cache.set(slug="ACTION", schema=SCHEMA)
+    schema = cache.get(slug="ACTION")
+    assert schema == SCHEMA
+
+    schema["name"] = "MODIFIED"
+    assert cache.get(slug="ACTION") == SCHEMA
+    assert cache.get(slug="ACTION", version="http://localhost") is None
+    assert cache.has_no_file_params(slug="ACTION")
+
+    cache.invalidate(slug="ACTION")
+    assert cache.get(slug="ACTION") is None
+    assert cache.stats() == {"hits": 2, "misses": 3, "size": 0}
+
+
+def test_schema_cache_ttl() -> None:
+    """Test expired schemas are not returned."""
+    cache = SchemaCache(ttl=0.0, persist=False)
+    cache.set(slug="ACTION", schema=SCHEMA)
+    with mock.patch("time.time", return_value=2e10):
+        assert cache.get(slug="ACTION") is None
+    assert cache.has_no_file_params(slug="ACTION")
+
+
+def test_schema_cache_persistence() -> None:
+    """Test persisting schemas on the disk."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = Path(tempdir, "schemas.json")
+        SchemaCache(path=path, persist=True).set(slug="ACTION", schema=SCHEMA)
+        assert path.exists()
+        assert SchemaCache(path=path, persist=True).get(slug="ACTION") == SCHEMA
+
+
+def test_execute_skips_schema_lookup() -> None:
+    """Test `Actions.execute` does not fetch schemas for cached actions."""
+    cache = SchemaCache(persist=False)
+    client = mock.MagicMock(spec=Composio, base_url="http://localhost")
+    actions = Actions(client=client)
+    action = mock.MagicMock(
+        slug=SCHEMA["name"],
+        app="github",
+        is_local=False,
+        no_auth=False,
+    )
+    params = {"owner": "composiohq", "repo": "composio"}
+    with mock.patch(
+        "composio.client.collections.schema_cache", new=cache
+    ), mock.patch.object(
+        actions, "get", return_value=[Actions.model(**SCHEMA)]
+    ) as get, mock.patch.object(
+        actions, "_raise_if_required"
+    ):
+        actions.execute(action=action, params=params, connected_account="account")
+        assert get.call_count == 1
+
+        cache.set(slug=action.slug, schema=SCHEMA, version=client.base_url)
+        actions.execute(action=action, params=params, connected_account="account")
+        assert get.call_count == 1
+
+
+def _account(id: str, app: str, created_at: str) -> ConnectedAccountModel:
+    return ConnectedAccountModel(
+        id=id,
+        status="ACTIVE",
+        createdAt=created_at,
+        updatedAt=created_at,
+        appUniqueId=app,
+        appName=app,
+        integrationId="integration",
+        connectionParams={},  # type: ignore
+    )
+
+
+def test_connection_resolver() -> None:
+    """Test connected account resolution."""
+    client = mock.MagicMock()
+    client.connected_accounts.get.return_value = [
+        _account(id="old", app="github", created_at="2024-01-01T00:00:00.000Z"),
+        _account(id="new", app="github", created_at="2024-06-01T00:00:00.000Z"),
+        _account(id="slack", app="slack", created_at="2024-01-01T00:00:00.000Z"),
+    ]
+    resolver = ConnectionResolver(client=client, ttl=60.0)
+
+    account = resolver.get(app="GITHUB", entity_id="default")
+    assert account is not None and account.id == "new"
+    assert resolver.get(app="slack", entity_id="default") is not None
+    assert resolver.get(app="notion", entity_id="default") is None
+    client.connected_accounts.get.assert_called_once_with(
+        entity_ids=["default"],
+        active=True,
+    )
+
+    resolver.invalidate(entity_id="default")
+    assert resolver.get(app="github", entity_id="default") is not None
+    assert client.connected_accounts.get.call_count == 2
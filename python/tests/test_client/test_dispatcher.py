@@ -0,0 +1,250 @@
+"""
+Test trigger event dispatcher.
+"""
+
+import json
+import threading
+import time
+import typing as t
+
+import pytest
+
+from composio.client import Composio
+from composio.client.collections import TriggerEventData, TriggerSubscription
+from composio.client.dispatcher import ChunkBuffer, EventDispatcher, FilterIndex
+from composio.exceptions import ComposioSDKError
+
+
+def _event(trigger_id: str, connection_id: str = "connection", **payload) -> str:
+    return json.dumps(
+        {
+            "appName": "github",
+            "payload": payload,
+            "originalPayload": {},
+            "metadata": {
+                "id": trigger_id,
+                "connectionId": connection_id,
+                "triggerName": "GITHUB_COMMIT_EVENT",
+                "triggerData": "",
+                "triggerConfig": {},
+                "connection": {
+                    "id": connection_id,
+                    "integrationId": "integration",
+                    "clientUniqueUserId": "default",
+                    "status": "ACTIVE",
+                },
+            },
+        }
+    )
+
+
+class _LocalChannel:
+    """Stand-in for the pusher channel, replaying events from a socket thread."""
+
+    def __init__(self) -> None:
+        self._callbacks: t.Dict[str, t.Callable[[str], None]] = {}
+
+    def bind(self, event_name: str, callback: t.Callable[[str], None]) -> None:
+        self._callbacks[event_name] = callback
+
+    def replay(self, events: t.List[t.Tuple[str, str]]) -> float:
+        """Replay the events, returning the seconds the socket thread was busy."""
+        elapsed = []
+
+        def _socket() -> None:
+            start = time.perf_counter()
+            for event_name, event in events:
+                self._callbacks[event_name](event)
+            elapsed.append(time.perf_counter() - start)
+
+        thread = threading.Thread(target=_socket)
+        thread.start()
+        thread.join()
+        return elapsed[0]
+
+
+def test_filter_index() -> None:
+    """Test matching the callback filters."""
+    index = FilterIndex(fields=["trigger_id", "app_name"])
+    index.add(filters={"trigger_id": "trigger_1"})
+    index.add(filters={})
+    index.add(filters={"trigger_id": "trigger_2", "app_name": "github"})
+    index.add(filters={"app_name": "slack"})
+
+    assert index.match({"trigger_id": "trigger_1", "app_name": "github"}) == [0, 1]
+    assert index.match({"trigger_id": "trigger_2", "app_name": "github"}) == [1, 2]
+    assert index.match({"trigger_id": "trigger_2", "app_name": "slack"}) == [1, 3]
+    assert FilterIndex(fields=["app_name"]).match({"app_name": "slack"}) == []
+
+
+def test_chunk_buffer() -> None:
+    """Test reassembling chunked events out of order."""
+    buffer = ChunkBuffer()
+    assert buffer.add(event_id="a", index=2, chunk="ld", final=True) is None
+    assert buffer.add(event_id="b", index=0, chunk="other", final=True) == "other"
+    assert buffer.add(event_id="a", index=0, chunk="hel", final=False) is None
+    assert buffer.add(event_id="a", index=1, chunk="lo wor", final=False) == (
+        "hello world"
+    )
+    assert len(buffer) == 0
+    assert buffer.size == 0
+    assert buffer.stats["completed"] == 2
+
+    # Chunks past the final chunk are dropped along with the event
+    assert buffer.add(event_id="c", index=0, chunk="x", final=True) == "x"
+    assert buffer.add(event_id="d", index=1, chunk="y", final=True) is None
+    assert buffer.add(event_id="d", index=2, chunk="z", final=False) is None
+    assert buffer.stats["dropped"] == 1
+    assert len(buffer) == 0
+
+
+def test_chunk_buffer_limits() -> None:
+    """Test expiring and evicting incomplete events."""
+    now = [0.0]
+    buffer = ChunkBuffer(ttl=10.0, max_size=100, clock=lambda: now[0])
+    buffer.add(event_id="a", index=0, chunk="a" * 20, final=False)
+    now[0] = 5.0
+    buffer.add(event_id="b", index=0, chunk="b" * 20, final=False)
+    now[0] = 11.0
+    buffer.add(event_id="c", index=0, chunk="c" * 40, final=False)
+    assert buffer.stats["expired"] == 1
+    assert len(buffer) == 2
+
+    # The oldest event is evicted to make room
+    buffer.add(event_id="d", index=0, chunk="d" * 40, final=False)
+    assert buffer.stats["evicted"] == 1
+    assert buffer.size <= 100
+    assert buffer.add(event_id="b", index=1, chunk="b", final=True) is None
+
+    # An event larger than the buffer is dropped, as is an absurd index
+    assert buffer.add(event_id="e", index=0, chunk="e" * 101, final=True) is None
+    assert buffer.add(event_id="f", index=10**9, chunk="f", final=True) is None
+    assert buffer.stats["dropped"] == 2
+    assert buffer.add(event_id="d", index=1, chunk="d", final=True) == "d" * 41
+
+
+def test_dispatcher_order_and_errors() -> None:
+    """Test events are handled in order and handler errors are counted."""
+    handled = []
+
+    def _handler(event: str) -> None:
+        if event == "error":
+            raise ValueError(event)
+        handled.append(event)
+
+    dispatcher = EventDispatcher(handler=_handler, workers=1, queue_size=4)
+    for i in range(10):
+        dispatcher.submit(event=str(i))
+    dispatcher.submit(event="error")
+    assert dispatcher.join(timeout=5)
+    assert handled == [str(i) for i in range(10)]
+    assert dispatcher.stats["handled"] == 10
+    assert dispatcher.stats["failed"] == 1
+    dispatcher.stop(wait=True)
+
+    # Submitting restarts the workers
+    dispatcher.submit(event="10")
+    assert dispatcher.join(timeout=5)
+    assert handled[-1] == "10"
+
+    with pytest.raises(ComposioSDKError):
+        EventDispatcher(handler=_handler, overflow="unknown")  # type: ignore
+
+
+@pytest.mark.parametrize(
+    ("overflow", "expected"),
+    (
+        ("block", [str(i) for i in range(8)]),
+        ("drop_oldest", ["0", "5", "6", "7"]),
+        ("spill", [str(i) for i in range(8)]),
+    ),
+)
+def test_dispatcher_overflow(overflow: str, expected: t.List[str]) -> None:
+    """Test the overflow policies with a busy worker."""
+    handled = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def _handler(event: str) -> None:
+        started.set()
+        release.wait(timeout=5)
+        handled.append(event)
+
+    dispatcher = EventDispatcher(
+        handler=_handler,
+        workers=1,
+        queue_size=3,
+        overflow=overflow,  # type: ignore
+    )
+    dispatcher.submit(event="0")
+    assert started.wait(timeout=5)
+    producer = threading.Thread(
+        target=lambda: [dispatcher.submit(event=str(i)) for i in range(1, 8)]
+    )
+    producer.start()
+    producer.join(timeout=0.5)
+    # The producer waits for room in the queue with the `block` policy
+    assert producer.is_alive() == (overflow == "block")
+
+    release.set()
+    producer.join(timeout=5)
+    assert dispatcher.join(timeout=5)
+    assert handled == expected
+    assert dispatcher.stats["dropped"] == (4 if overflow == "drop_oldest" else 0)
+    assert dispatcher.stats["spilled"] == (4 if overflow == "spill" else 0)
+    dispatcher.stop(wait=True)
+
+
+def test_trigger_subscription_load() -> None:
+    """Test replaying a burst of events does not block the socket thread."""
+    subscription = TriggerSubscription(
+        Composio.get_latest(),
+        workers=8,
+        queue_size=64,
+        overflow="spill",
+    )
+    channel = _LocalChannel()
+    channel.bind("trigger_to_client", subscription.dispatch_event)
+    channel.bind("chunked-trigger_to_client", subscription.handle_chunked_events)
+
+    received: t.Dict[str, t.List[int]] = {"trigger_1": [], "trigger_2": []}
+    lock = threading.Lock()
+
+    def _record(event: TriggerEventData) -> None:
+        time.sleep(0.005)
+        with lock:
+            received[event.metadata.id].append(event.payload["n"])
+
+    subscription.callback(filters={"trigger_id": "trigger_1"})(_record)
+    subscription.callback(filters={"trigger_id": "trigger_2"})(_record)
+
+    events = []
+    for n in range(400):
+        event = _event(trigger_id=f"trigger_{n % 2 + 1}", n=n)
+        if n % 10:
+            events.append(("trigger_to_client", event))
+            continue
+        for index, start in enumerate(range(0, len(event), 64)):
+            events.append(
+                (
+                    "chunked-trigger_to_client",
+                    json.dumps(
+                        {
+                            "id": f"chunked_{n}",
+                            "index": index,
+                            "chunk": event[start : start + 64],
+                            "final": start + 64 >= len(event),
+                        }
+                    ),
+                )
+            )
+
+    busy = channel.replay(events=events)
+    assert subscription.dispatcher.join(timeout=30)
+    subscription.dispatcher.stop(wait=True)
+
+    # Handling the events inline would take at least 400 * 5ms
+    assert busy < 1.0
+    assert sorted(received["trigger_1"]) == list(range(0, 400, 2))
+    assert sorted(received["trigger_2"]) == list(range(1, 400, 2))
+    assert subscription.dispatcher.stats["handled"] == 400
@@ -2,6 +2,8 @@
 Test the auto-generate Enum
 """
 
+import typing as t
+from pathlib import Path
 from typing import Dict, List
 from unittest import mock
 
@@ -10,6 +12,14 @@ from pydantic import BaseModel
 
 from composio import action
 from composio.client.enums import Action, App, Tag, Trigger, base
+from composio.client.enums import index as enum_index
+from composio.client.enums.index import (
+    ActionIndex,
+    SearchIndex,
+    blend_rankings,
+    fingerprint,
+    tokenize,
+)
 from composio.exceptions import ComposioSDKError
 from composio.tools.base.local import LocalAction, LocalTool
 
@@ -142,3 +152,111 @@ def test_get_actions() -> None:
     for act in App.GITHUB.get_actions(tags=["repo"]):
         assert act.app == "github"
         assert "repo" in act.tags
+
+
+def test_action_index(tmp_path: Path) -> None:
+    """Test looking up actions using the action index."""
+    actions = [
+        "ZOHO_BOOKS_CREATE_INVOICE",
+        "ZOHO_GET_USER",
+        "ZOOM_CREATE_MEETING",
+        "ZOHOBOOKS_LIST",
+    ]
+    tags = {"ZOHO_GET_USER": ["users"], "ZOOM_CREATE_MEETING": ["meetings", "users"]}
+    index = ActionIndex.build(
+        actions=actions,
+        apps=["ZOHO", "ZOHO_BOOKS", "ZOOM"],
+        tags=lambda slug: tags.get(slug, []),
+    )
+    index.save(path=tmp_path / "index.json")
+    index = t.cast(ActionIndex, ActionIndex.load(path=tmp_path / "index.json"))
+
+    assert index.get_actions(app="ZOHO") == [
+        "ZOHO_BOOKS_CREATE_INVOICE",
+        "ZOHO_GET_USER",
+    ]
+    assert index.get_actions(app="ZOHOBOOKS") == ["ZOHOBOOKS_LIST"]
+    assert index.get_actions(tags=["users"]) == ["ZOHO_GET_USER", "ZOOM_CREATE_MEETING"]
+    assert index.get_actions(app="ZOOM", tags=["users"]) == ["ZOOM_CREATE_MEETING"]
+    assert index.get_actions(app="ZOOM", tags=["missing"]) == []
+    assert index.get_tags(app="ZOOM") == ["meetings", "users"]
+    assert index.fingerprint == fingerprint(actions=sorted(actions))
+
+
+def test_get_actions_with_index() -> None:
+    """Test `App.get_actions` uses the action index if it is up to date."""
+    index = ActionIndex.build(
+        actions=Action.iter(),
+        apps=App.iter(),
+        tags=lambda slug: ["repo"] if "_REPO" in slug else [],
+    )
+    with mock.patch.object(enum_index, "_index", index), mock.patch.object(
+        enum_index, "_index_valid", None
+    ), mock.patch.object(ActionIndex, "load", return_value=index):
+        assert list(App.GITHUB.get_actions()) == list(
+            action for action in Action.all() if action.slug.startswith("GITHUB_")
+        )
+        actions = list(App.GITHUB.get_actions(tags=["repo"]))
+        assert actions and all("_REPO" in action.slug for action in actions)
+        assert "repo" in App.GITHUB.get_tags()
+
+    # Stale index is not used
+    with mock.patch.object(enum_index, "_index", None), mock.patch.object(
+        enum_index, "_index_valid", None
+    ), mock.patch.object(ActionIndex, "load", return_value=index):
+        assert enum_index.get_action_index(actions=["GITHUB_STAR_REPO"]) is None
+
+
+def test_search_index(tmp_path: Path) -> None:
+    """Test ranking actions by use case using the search index."""
+    index = SearchIndex.build(
+        documents={
+            "GMAIL_SEND_EMAIL": "Send email Sends an email to the recipients "
+            "recipient_email subject body",
+            "GMAIL_FETCH_EMAILS": "Fetch emails Fetches the emails in the inbox "
+            "max_results labelIds",
+            "SLACK_SENDS_A_MESSAGE_TO_A_SLACK_CHANNEL": "Send message Posts a "
+            "message to a channel channel text",
+            "GITHUB_CREATE_AN_ISSUE": "Create an issue Creates an issue in a "
+            "repository owner repo title body",
+        }
+    )
+    index.save(path=tmp_path / "search.json")
+    index = t.cast(SearchIndex, SearchIndex.load(path=tmp_path / "search.json"))
+
+    assert tokenize("sendEmail to RECIPIENTS") == ["send", "email", "recipient"]
+    assert [slug for slug, _ in index.search(query="send an email")] == [
+        "GMAIL_SEND_EMAIL",
+        "GMAIL_FETCH_EMAILS",
+        "SLACK_SENDS_A_MESSAGE_TO_A_SLACK_CHANNEL",
+    ]
+    assert [slug for slug, _ in index.search(query="sending", limit=1)] == [
+        "GMAIL_SEND_EMAIL",
+    ]
+    assert [
+        slug for slug, _ in index.search(query="send a message", apps=["SLACK"])
+    ] == ["SLACK_SENDS_A_MESSAGE_TO_A_SLACK_CHANNEL"]
+    assert index.search(query="issues", apps=["GMAIL"]) == []
+    assert index.search(query="unknown words") == []
+
+
+def test_blend_rankings() -> None:
+    """Test merging local and remote rankings."""
+    assert blend_rankings(["A", "B", "C"], ["C", "D"]) == ["C", "A", "B", "D"]
+    assert blend_rankings([], ["B", "A"]) == ["B", "A"]
+
+
+def test_lazy_members() -> None:
+    """Test enum members are materialized on the first attribute access."""
+    assert "ZOOM_TSP" not in Tag.__dict__
+    assert "ZOOM_TSP" in dir(Tag)
+    member = Tag.ZOOM_TSP
+    assert isinstance(member, Tag)
+    assert Tag.__dict__["ZOOM_TSP"] is member
+    assert member == Tag("zoom_tsp")
+
+    with pytest.raises(AttributeError):
+        _ = Tag.ZOOM_NOT_A_TAG
+
+    with pytest.raises(AttributeError):
+        member.value_ = "zoom"  # type: ignore
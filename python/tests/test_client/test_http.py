@@ -0,0 +1,216 @@
+"""
+Test HTTP client retries and circuit breaker.
+"""
+
+import asyncio
+import threading
+import typing as t
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+import requests
+
+from composio.client.http import AsyncHttpClient, HttpClient
+from composio.client.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    endpoint_key,
+    parse_retry_after,
+)
+
+
+class _FaultInjector(BaseHTTPRequestHandler):
+    """Responds with the queued faults for a path before succeeding."""
+
+    faults: t.Dict[str, t.List[t.Tuple[int, t.Dict[str, str]]]] = {}
+    hits: t.Dict[str, int] = {}
+
+    def _handle(self) -> None:
+        path = self.path.split("?")[0]
+        self.hits[path] = self.hits.get(path, 0) + 1
+        if "Content-Length" in self.headers:
+            self.rfile.read(int(self.headers["Content-Length"]))
+
+        faults = self.faults.get(path, [])
+        status, headers = faults.pop(0) if len(faults) > 0 else (200, {})
+        body = b"{}"
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = _handle
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+@pytest.fixture(name="server")
+def _server() -> t.Iterator[str]:
+    _FaultInjector.faults = {}
+    _FaultInjector.hits = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FaultInjector)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(base_url: str, **kwargs: t.Any) -> HttpClient:
+    return HttpClient(
+        base_url=base_url,
+        api_key="api-key",
+        retry_policy=RetryPolicy(max_retries=3, backoff_factor=0.001),
+        **kwargs,
+    )
+
+
+def test_retry_policy() -> None:
+    """Test retry decisions and backoff delays."""
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0, jitter=False)
+    assert policy.should_retry_status(method="get", status_code=502)
+    assert not policy.should_retry_status(method="post", status_code=502)
+    assert policy.should_retry_status(method="post", status_code=429)
+    assert not policy.should_retry_status(method="get", status_code=404)
+    assert policy.should_retry_error(method="post", connect=True)
+    assert not policy.should_retry_error(method="post", connect=False)
+    assert [policy.backoff(attempt=i) for i in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+    assert policy.backoff(attempt=1, retry_after="2") == 2.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("invalid") is None
+
+
+def test_retry_on_server_errors(server: str) -> None:
+    """Test idempotent requests are retried on server errors."""
+    _FaultInjector.faults["/v1/apps"] = [(503, {}), (502, {})]
+    client = _client(server)
+    assert client.get(url="/v1/apps").status_code == 200
+    assert _FaultInjector.hits["/v1/apps"] == 3
+    assert client.metrics.snapshot()["retries"] == 2
+
+
+def test_post_is_not_retried_on_server_errors(server: str) -> None:
+    """Test non idempotent requests are only retried if not processed."""
+    _FaultInjector.faults["/v1/execute"] = [(500, {})]
+    client = _client(server)
+    assert client.post(url="/v1/execute", json={}).status_code == 500
+    assert _FaultInjector.hits["/v1/execute"] == 1
+
+    _FaultInjector.faults["/v1/execute"] = [(429, {"Retry-After": "0"})]
+    assert client.post(url="/v1/execute", json={}).status_code == 200
+    assert _FaultInjector.hits["/v1/execute"] == 3
+
+
+def test_circuit_breaker(server: str) -> None:
+    """Test the circuit opens after repeated failures and closes on recovery."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.1)
+    client = _client(server, circuit_breaker=breaker)
+    _FaultInjector.faults["/v1/apps"] = [(500, {})] * 8
+    assert client.get(url="/v1/apps").status_code == 500
+    assert client.get(url="/v1/apps").status_code == 500
+    assert breaker.open_circuits() == ["/v1/apps"]
+
+    with pytest.raises(CircuitOpenError):
+        client.get(url="/v1/apps")
+    assert _FaultInjector.hits["/v1/apps"] == 8
+
+    # Other endpoints are not affected
+    assert client.get(url="/v1/integrations").status_code == 200
+
+    threading.Event().wait(0.2)
+    assert client.get(url="/v1/apps").status_code == 200
+    assert breaker.open_circuits() == []
+    assert client.metrics.snapshot()["rejected"] == 1
+
+
+def test_circuit_breaker_trial_errors(server: str) -> None:
+    """Test a trial request failing with any error does not leave the circuit stuck."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    client = _client(server, circuit_breaker=breaker)
+    _FaultInjector.faults["/v1/apps"] = [(500, {})] * 4
+    assert client.get(url="/v1/apps").status_code == 500
+
+    threading.Event().wait(0.2)
+    with mock.patch.object(
+        requests.Session, "request", side_effect=requests.TooManyRedirects
+    ), pytest.raises(requests.TooManyRedirects):
+        client.get(url="/v1/apps")
+    assert breaker.open_circuits() == ["/v1/apps"]
+
+    threading.Event().wait(0.2)
+    with mock.patch.object(
+        requests.Session, "request", side_effect=KeyboardInterrupt
+    ), pytest.raises(KeyboardInterrupt):
+        client.get(url="/v1/apps")
+    assert client.get(url="/v1/apps").status_code == 200
+    assert breaker.open_circuits() == []
+
+
+def test_endpoint_key() -> None:
+    """Test the circuit breaker keys are relative to the base URL."""
+    base_url = "https://backend.composio.dev/api"
+    assert (
+        endpoint_key(url="/v2/actions/GITHUB_STAR_A_REPO/execute", base_url=base_url)
+        == "/v2/actions/GITHUB_STAR_A_REPO/execute"
+    )
+    assert endpoint_key(url=f"{base_url}/v1/apps?a=1", base_url=base_url) == "/v1/apps"
+    assert endpoint_key(url="http://localhost/api/v1/apps/", base_url="/api") == (
+        "/v1/apps"
+    )
+
+
+def test_connection_errors_are_retried() -> None:
+    """Test connection errors are retried for all methods."""
+    client = _client("http://127.0.0.1:1")
+    with pytest.raises(requests.ConnectionError):
+        client.post(url="/v1/execute", json={})
+    metrics = client.metrics.snapshot()
+    assert metrics["retries"] == 3
+    assert metrics["failures"] == 1
+    assert sum(metrics["latency"]["/v1/execute"].values()) == 4
+
+
+def test_async_client_retries(server: str) -> None:
+    """Test the async client shares the retry behaviour."""
+    _FaultInjector.faults["/v1/apps"] = [(503, {"Retry-After": "0"})]
+    client = AsyncHttpClient(
+        base_url=server,
+        api_key="api-key",
+        retry_policy=RetryPolicy(backoff_factor=0.001),
+    )
+
+    async def _run() -> int:
+        async with client:
+            return (await client.get(url="/v1/apps")).status_code
+
+    assert asyncio.run(_run()) == 200
+    assert _FaultInjector.hits["/v1/apps"] == 2
+
+
+def test_async_client_event_loops(server: str) -> None:
+    """Test the connection pool of a previous event loop is released."""
+    client = AsyncHttpClient(base_url=server, api_key="api-key")
+    sessions = []
+
+    async def _run() -> int:
+        response = await client.get(url="/v1/apps")
+        sessions.append(client._session)
+        return response.status_code
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        assert asyncio.run(_run()) == 200
+        assert asyncio.run(_run()) == 200
+
+    first, second = sessions
+    assert first is not second
+    assert first.closed and first.connector is None
+    assert not second.closed
+    asyncio.run(client.close())
@@ -0,0 +1,44 @@
+"""
+Test metadata store.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+from composio.storage.metadata import MetadataStore
+
+
+def test_metadata_store() -> None:
+    """Test `MetadataStore` object."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = MetadataStore(path=Path(temp_dir, "actions.db"))
+        assert store.get("ACTION") is None
+        assert "ACTION" not in store
+
+        store.write(records={"ACTION": {"name": "action"}, "OTHER": {"name": "other"}})
+        assert store.get("ACTION") == {"name": "action"}
+        assert store.keys() == ["ACTION", "OTHER"]
+
+        store.put(key="NEW", record={"name": "new"})
+        assert "NEW" in store
+
+        store.write(records={"REPLACED": {"name": "replaced"}})
+        assert store.keys() == ["REPLACED"]
+        assert list(Path(temp_dir).iterdir()) == [Path(temp_dir, "actions.db")]
+        store.close()
+
+
+def test_metadata_store_migration() -> None:
+    """Test migrating from one JSON file per record."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        legacy = Path(temp_dir, "actions")
+        legacy.mkdir()
+        for name in ("ACTION", "OTHER"):
+            (legacy / name).write_text(json.dumps({"name": name}), encoding="utf-8")
+
+        store = MetadataStore(path=Path(temp_dir, "actions.db"))
+        assert store.migrate(directory=legacy)
+        assert store.get("OTHER") == {"name": "OTHER"}
+        assert not store.migrate(directory=legacy)
+        store.close()
@@ -1,10 +1,12 @@
 """Test local tools abstraction."""
 
+import typing as t
 from typing import Dict, List
 
 from pydantic import BaseModel, Field
 
-from composio.tools.base.local import LocalAction, LocalTool
+from composio.tools.base.abs import FileModel
+from composio.tools.base.local import LocalAction, LocalTool, LocalToolMixin
 
 
 class Request(BaseModel):
@@ -52,3 +54,33 @@ class TestLocalTool:
 
         assert not response["successful"]
         assert "Following fields are missing: {'name'}" in response["error"]
+
+
+class FileRequest(BaseModel):
+    text: str = Field(
+        ..., description="Text content", json_schema_extra={"file_readable": True}
+    )
+    upload: t.Optional[FileModel] = Field(None, description="File to upload")
+    note: str = Field("", alias="comment", description="Note")
+
+
+class FileAction(LocalAction[FileRequest, Response]):
+    def execute(self, request: FileRequest, metadata: Dict) -> Response:
+        return Response(message=request.text)
+
+
+def test_field_descriptors(tmp_path) -> None:
+    """Test file parameter descriptors are computed when the action is built."""
+    fields = FileAction.request.fields
+    assert fields["text"].file_readable and not fields["text"].file_uploadable
+    assert fields["upload"].file_uploadable
+    assert fields["comment"] is fields["note"]
+
+    path = tmp_path / "file.txt"
+    path.write_text("hello")
+    request = LocalToolMixin._process_request(  # pylint: disable=protected-access
+        request={"text": str(path), "comment": str(path)},
+        model=FileRequest,  # type: ignore
+        fields=fields,
+    )
+    assert request == {"text": "hello", "comment": str(path)}
@@ -1,6 +1,9 @@
 """Test workspace abstractions."""
 
+import threading
+import time
 import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Dict
 from unittest import mock
 
@@ -9,6 +12,7 @@ import pytest
 from composio.client.enums import Action, ActionType, AppType, TagType
 from composio.exceptions import ComposioSDKError
 from composio.tools.env.base import (
+    RemoteWorkspace,
     SessionFactory,
     Sessionable,
     Workspace,
@@ -75,3 +79,146 @@ def test_sessionable() -> None:
         match="No session of type SomeSessionable found with ID: id",
     ):
         assert factory.get(id="id")
+
+
+def test_session_pool() -> None:
+    ready = threading.Event()
+    ready.set()
+
+    class SomeSessionable(Sessionable):
+        def __init__(self) -> None:
+            super().__init__()
+            self._id = generate_id()
+            self.torn_down = False
+
+        def setup(self) -> None:
+            ready.wait()
+
+        def teardown(self) -> None:
+            self.torn_down = True
+
+        def reset(self) -> bool:
+            return True
+
+    def _wait_for_pool(size: int) -> None:
+        deadline = time.monotonic() + 5.0
+        while len(factory._pool) < size and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(factory._pool) == size
+
+    factory = SessionFactory(factory=SomeSessionable, pool_size=2)
+    first = factory.new()
+    _wait_for_pool(size=2)
+
+    second = factory.new()
+    _wait_for_pool(size=2)
+    assert factory.stats == {"hits": 1, "misses": 1, "recycled": 0, "hit_rate": 0.5}
+
+    # Released sessions are returned to the pool only if it has room
+    factory.release(id=second.id)
+    assert second.torn_down
+
+    ready.clear()
+    factory.new()
+    factory.release(id=first.id)
+    assert not first.torn_down
+    assert first in factory._pool
+    assert factory.stats["recycled"] == 1
+    ready.set()
+
+    factory.teardown()
+    assert first.torn_down
+
+
+def test_session_pool_reuse() -> None:
+    """Test a released session is reset and handed out again."""
+    created = []
+
+    class SomeSessionable(Sessionable):
+        def __init__(self) -> None:
+            super().__init__()
+            self._id = generate_id()
+            self.resets = 0
+            self.torn_down = False
+            created.append(self)
+
+        def setup(self) -> None:
+            pass
+
+        def teardown(self) -> None:
+            self.torn_down = True
+
+        def reset(self) -> bool:
+            self.resets += 1
+            return True
+
+    factory = SessionFactory(factory=SomeSessionable, pool_size=1)
+    with mock.patch.object(factory, "prewarm"):
+        session = factory.new()
+        factory.release(id=session.id)
+        assert factory.new() is session
+
+    assert session.resets == 1
+    assert len(created) == 1
+    assert factory.stats == {"hits": 1, "misses": 1, "recycled": 1, "hit_rate": 0.5}
+
+    # Sessions checked out when the factory is torn down are not recycled
+    factory.teardown()
+    assert session.torn_down
+    assert session.resets == 1
+
+
+def test_remote_workspace_session() -> None:
+    """Test remote workspace requests reuse a pooled connection."""
+    clients = []
+    headers = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # pylint: disable=invalid-name
+            clients.append(self.client_address)
+            headers.append(dict(self.headers))
+            body = b'{"data": {}, "error": null}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: t.Any) -> None:
+            pass
+
+    class TestWorkspace(RemoteWorkspace):
+        def setup(self) -> None:
+            pass
+
+        def teardown(self) -> None:
+            super().teardown()
+
+    server = ThreadingHTTPServer(("localhost", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        workspace = TestWorkspace(
+            config=WorkspaceConfigType(
+                composio_api_key="api-key",
+                composio_base_url="http://localhost",
+            )
+        )
+        workspace.url = f"http://localhost:{server.server_address[1]}/api"
+        for _ in range(5):
+            assert workspace._request(endpoint="", method="get").status_code == 200
+
+        # All of the requests are made on the same connection
+        assert len(set(clients)) == 1
+        assert headers[0]["x-api-key"] == workspace.access_token
+        assert headers[0]["Accept-Encoding"] == "identity"
+
+        workspace.teardown()
+        assert workspace._session is None
+        workspace._request(endpoint="", method="get")
+        assert len(set(clients)) == 2
+        workspace.teardown()
+    finally:
+        server.shutdown()
+        server.server_close()
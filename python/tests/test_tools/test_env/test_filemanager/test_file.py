@@ -0,0 +1,49 @@
+"""Test file manager file."""
+
+from pathlib import Path
+
+from composio.tools.env.filemanager.file import File, FileOperationScope, LineIndex
+
+
+def test_line_index() -> None:
+    data = b"one\r\ntwo\rthree\nfour"
+    index = LineIndex(data=data)
+    assert len(index) == 4
+    assert list(index.offsets) == [0, 5, 9, 15, 19]
+    assert index.lines(data=data, start=1, end=10) == ["two\n", "three\n", "four"]
+    assert index.lines(data=data[5:9], start=1, end=2, base=5) == ["two\n"]
+    assert len(LineIndex(data=b"")) == 0
+
+
+def test_window_read(tmp_path: Path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(1, 301)))
+    file = File(path=path, workdir=tmp_path, window=3)
+    assert file.total_lines() == 300
+
+    file.goto(line=100)
+    assert file.read() == {101: "line 101\n", 102: "line 102\n", 103: "line 103\n"}
+
+    # Index is rebuilt when the file is changed outside of the file object
+    path.write_text("first\nsecond\n")
+    file.goto(line=1)
+    assert file.total_lines() == 2
+    assert file.read() == {2: "second\n"}
+
+
+def test_edit(tmp_path: Path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"".join(f"line {i}\r\n".encode() for i in range(1, 21)))
+    file = File(path=path, workdir=tmp_path, window=5)
+
+    file.edit(text="new 2\nnew 3", start=2, end=3)
+    assert path.read_bytes().startswith(b"line 1\r\nnew 2\nnew 3\nline 4\r\n")
+    assert file.total_lines() == 20
+
+    # Window edits are relative to the window and keep the lines above it
+    file.goto(line=10)
+    file.edit(text="new 11", start=1, end=1, scope=FileOperationScope.WINDOW)
+    lines = path.read_text().splitlines()
+    assert lines[9:12] == ["line 10", "new 11", "line 12"]
+    assert lines[0] == "line 1"
+    assert len(lines) == 20
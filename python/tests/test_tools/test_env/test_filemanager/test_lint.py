@@ -0,0 +1,90 @@
+"""Test file manager linter."""
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from composio.tools.env.filemanager import lint as linter
+from composio.tools.env.filemanager.file import File
+
+
+SOURCES = {
+    "clean": "import os\n\n\ndef f(a):\n    return os.path.join(a, 'b')\n",
+    "names": (
+        "def f(a, a):\n"
+        "    return undefined\n"
+        "def g():\n"
+        "    x = x + 1\n"
+        "    return x  # noqa: E111\n"
+        "print(missing)  # noqa\n"
+    ),
+    "outside": "break\ncontinue\nreturn 1\nyield 2\nfrom os import *\n",
+    "future": "from __future__ import unknown_feature\n",
+    "indent": "def f():\n   x = 1\n   return x\nif 1:\n  pass\n",
+    "clauses": (
+        "class A:\n"
+        "  @property\n"
+        "  def f(self):\n"
+        "      try:\n"
+        "        x = 1; y = 2\n"
+        "      except ValueError:\n"
+        "        pass\n"
+        "      else:\n"
+        "        pass\n"
+        "      # comment\n"
+        "      finally:\n"
+        "        pass\n"
+        "      for i in range(2):\n"
+        "          pass\n"
+        "      else:\n"
+        "          pass\n"
+        "      if x:\n"
+        "          pass\n"
+        "      elif y:\n"
+        "          pass\n"
+        "      else:\n"
+        "          pass\n"
+        "      match x:\n"
+        "        case 1:\n"
+        "            pass\n"
+        "      return (1,\n"
+        "         2)\n"
+        "if True:\n"
+        "\tx = 1\n"
+    ),
+    "syntax": "def f(:\n    pass\n",
+    "indentation": "if True:\n    x = 1\n  y = 2\n",
+}
+
+
+@pytest.mark.parametrize("name", SOURCES)
+def test_lint_matches_flake8(name: str) -> None:
+    source = SOURCES[name]
+    assert linter.lint_source(source=source, path="file.py") == linter.lint_flake8(
+        source=source, path="file.py"
+    )
+
+
+def test_lint_cache() -> None:
+    source = "print(undefined_name_for_cache)\n"
+    with mock.patch.object(
+        linter, "lint_source", wraps=linter.lint_source
+    ) as lint_source:
+        errors = linter.lint(source=source, path="cached.py")
+        assert linter.lint(source=source, path="cached.py") == errors
+        lint_source.assert_called_once()
+    assert errors == [
+        "cached.py:1:7: F821 undefined name 'undefined_name_for_cache'",
+    ]
+
+
+def test_edit_reports_new_lint_errors(tmp_path: Path) -> None:
+    path = tmp_path / "file.py"
+    path.write_text("def f():\n    return undefined\n")
+    file = File(path=path, workdir=tmp_path)
+
+    # Existing errors are ignored
+    assert file.edit(text="    x = 1", start=2, end=2)["error"] == ""
+    output = file.edit(text="    return missing", start=3, end=3)
+    assert "F821 undefined name 'missing'" in output["error"]
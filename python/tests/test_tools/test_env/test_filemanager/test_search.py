@@ -0,0 +1,123 @@
+"""Test file manager search."""
+
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from composio.tools.env.filemanager import search
+from composio.tools.env.filemanager.manager import FileManager
+from composio.tools.env.filemanager.search import IgnoreRules, glob_regex
+
+
+@pytest.fixture(name="tree")
+def _tree(tmp_path: Path) -> Path:
+    for path, content in {
+        ".gitignore": "build/\n*.log\n!keep.log\n",
+        "src/main.py": "import os\nFOO = 1\r\nfoo()\n",
+        "src/pkg/README.md": "# Foo\n",
+        "keep.log": "foo\n",
+        "drop.log": "foo\n",
+        "build/main.py": "foo\n",
+        "node_modules/pkg/index.js": "foo\n",
+        ".hidden": "foo\n",
+    }.items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(content)
+    (tmp_path / "data.bin").write_bytes(b"foo\0")
+    return tmp_path
+
+
+def test_ignore_rules() -> None:
+    rules = IgnoreRules(
+        base="/repo",
+        lines=["# comment", "*.pyc", "/dist", "docs/**/*.html", "out/", "!keep.pyc"],
+    )
+    assert rules.match("/repo/a/b.pyc", is_dir=False) is True
+    assert rules.match("/repo/a/keep.pyc", is_dir=False) is False
+    assert rules.match("/repo/dist", is_dir=True) is True
+    assert rules.match("/repo/a/dist", is_dir=True) is None
+    assert rules.match("/repo/docs/a/b/c.html", is_dir=False) is True
+    assert rules.match("/repo/docs/c.html", is_dir=False) is True
+    assert rules.match("/repo/out", is_dir=False) is None
+    assert rules.match("/repo/a/out", is_dir=True) is True
+
+
+def test_glob_regex() -> None:
+    assert glob_regex("*.py").match("a/b.py")
+    assert glob_regex("src/*.txt").match("src/a.txt")
+    assert not glob_regex("src/*.txt").match("src/a/b.txt")
+    assert glob_regex("**/*.md").match("a.md")
+    assert not glob_regex("*.py", recursive=False).match("a/b.py")
+
+
+def test_grep(tree: Path) -> None:
+    manager = FileManager(working_dir=str(tree))
+    assert manager.grep(word="foo") == {
+        "keep.log": [(1, "foo")],
+        os.path.join("src", "main.py"): [(2, "FOO = 1"), (3, "foo()")],
+        os.path.join("src", "pkg", "README.md"): [(1, "# Foo")],
+    }
+    assert manager.grep(word="foo", case_insensitive=False, pattern="*.py") == {
+        os.path.join("src", "main.py"): [(3, "foo()")],
+    }
+    assert os.path.join("build", "main.py") in manager.grep(word="foo", gitignore=False)
+    assert manager.grep(word="foo", recursive=False) == {"keep.log": [(1, "foo")]}
+
+    results = manager.grep(word="foo", max_results=2)
+    assert sum(map(len, results.values())) == 2
+
+
+def test_grep_index(tree: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+    manager = FileManager(working_dir=str(tree))
+    with mock.patch.object(
+        search, "INDEX_CACHE_PATH", tmp_path_factory.mktemp("index")
+    ), mock.patch.object(search, "_indexes", {}):
+        assert manager.grep(word="foo", index=True) == manager.grep(word="foo")
+        assert manager.grep(word="bar", index=True) == {}
+
+        # Index is persisted and changed files are reindexed
+        search._indexes.clear()  # pylint: disable=protected-access
+        (tree / "src" / "main.py").write_text("bar = 1\n")
+        os.utime(tree / "src" / "main.py", ns=(0, 0))
+        assert manager.grep(word="bar", index=True) == {
+            os.path.join("src", "main.py"): [(1, "bar = 1")],
+        }
+
+
+def test_find(tree: Path) -> None:
+    manager = FileManager(working_dir=str(tree))
+    assert manager.find(pattern="*.py") == [os.path.join("src", "main.py")]
+    assert manager.find(pattern="*.py", gitignore=False) == [
+        os.path.join("build", "main.py"),
+        os.path.join("src", "main.py"),
+    ]
+    assert manager.find(pattern="src*", depth=0) == ["src"]
+    assert manager.find(pattern="*.md", exclude=["src/pkg"]) == []
+
+    # Listings are invalidated when the directory changes
+    (tree / "src" / "new.py").write_text("")
+    assert os.path.join("src", "new.py") in manager.find(pattern="*.py")
+
+
+def test_tree(tree: Path) -> None:
+    manager = FileManager(working_dir=str(tree))
+    assert manager.tree() == (
+        "__ .gitignore\n"
+        "__ .hidden\n"
+        "__ data.bin\n"
+        "__ keep.log\n"
+        "__ src\n"
+        "  |__ main.py\n"
+        "  |__ pkg\n"
+        "  |  |__ README.md\n"
+    )
+    assert manager.tree(depth=1, exclude=["src/pkg"]) == (
+        "__ .gitignore\n"
+        "__ .hidden\n"
+        "__ data.bin\n"
+        "__ keep.log\n"
+        "__ src\n"
+        "  |__ main.py\n"
+    )
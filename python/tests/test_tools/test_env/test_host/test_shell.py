@@ -1,4 +1,9 @@
-from composio.tools.env.host.shell import HostShell
+import os
+import pty
+import subprocess
+from unittest import mock
+
+from composio.tools.env.host.shell import HostShell, SSHShell
 
 
 def test_host_shell() -> None:
@@ -17,3 +22,129 @@ def test_host_shell_with_env() -> None:
 
     assert output["exit_code"] == 0
     assert output["stdout"] == "John Doe\n"
+
+
+def test_host_shell_exit_code_and_cwd() -> None:
+    shell = HostShell()
+    shell.setup()
+    output = shell.exec(cmd="cd /tmp && ls /nonexistent")
+
+    assert output["exit_code"] == 2
+    assert output["cwd"] == "/tmp"
+    assert output["stdout"] == ""
+    assert "No such file or directory" in output["stderr"]
+
+    # `$?` still refers to the previous command
+    assert shell.exec(cmd="echo $?")["stdout"] == "2\n"
+
+
+def test_host_shell_incomplete_command() -> None:
+    shell = HostShell()
+    shell.setup()
+    output = shell.exec(cmd="echo 'unbalanced")
+
+    assert output["exit_code"] != 0
+    assert shell.exec(cmd="printf 'one\\ntwo'")["stdout"] == "one\ntwo"
+
+
+def test_ssh_shell() -> None:
+    """Test SSH shell protocol over a pseudo terminal which echoes input."""
+
+    class _Channel:
+        def __init__(self) -> None:
+            self.master, slave = pty.openpty()
+            self.process = subprocess.Popen(  # pylint: disable=consider-using-with
+                ["/bin/bash", "--norc", "-i"],
+                stdin=slave,
+                stdout=slave,
+                stderr=slave,
+                start_new_session=True,
+                env={"PATH": os.environ["PATH"], "TERM": "dumb"},
+            )
+            os.close(slave)
+
+        def fileno(self) -> int:
+            return self.master
+
+        def recv(self, size: int) -> bytes:
+            return os.read(self.master, size)
+
+        def sendall(self, data: bytes) -> None:
+            os.write(self.master, data)
+
+        def close(self) -> None:
+            self.process.kill()
+            os.close(self.master)
+
+    client = mock.MagicMock()
+    client.invoke_shell.return_value = _Channel()
+    shell = SSHShell(client=client, environment={"NAME": "'John Doe'"})
+    shell.setup()
+    try:
+        assert shell.exec(cmd="echo $NAME")["stdout"] == "John Doe\n"
+
+        output = shell.exec(cmd="cd /tmp && cat <<EOF\nline\nEOF\nfalse")
+        assert output["stdout"] == "line\n"
+        assert output["exit_code"] == 1
+        assert output["cwd"] == "/tmp"
+    finally:
+        shell.teardown()
+
+
+def test_host_shell_stream() -> None:
+    shell = HostShell()
+    shell.setup()
+    try:
+        stream = shell.stream(cmd="echo one && sleep 0.5 && echo two >&2 && (exit 3)")
+        assert shell.get_stream(id=stream.id) is stream
+
+        output = stream.wait(timeout=10.0)
+        assert output["running"] is False
+        assert output["exit_code"] == 3
+        assert output["stdout"] == "one\n"
+        assert output["stderr"] == "two\n"
+
+        # Output is returned only once
+        assert stream.poll()["stdout"] == ""
+        assert shell.exec(cmd="echo $?")["stdout"] == "3\n"
+    finally:
+        shell.teardown()
+
+
+def test_host_shell_stream_tail_and_cancel() -> None:
+    shell = HostShell()
+    shell.setup()
+    try:
+        stream = shell.stream(cmd="seq 1 10000", tail_size=16)
+        output = stream.wait(timeout=10.0)
+        assert output["stdout"] == "9998\n9999\n10000\n"[-16:]
+        assert output["truncated"]["stdout"] == len(
+            "".join(f"{i}\n" for i in range(1, 10001))
+        ) - len(output["stdout"])
+
+        stream = shell.stream(cmd="sleep 30")
+        assert stream.poll()["running"] is True
+        output = stream.cancel()
+        assert output["running"] is False
+        assert output["exit_code"] == 130
+
+        # Shell is still usable after cancelling
+        assert shell.exec(cmd="echo alive")["stdout"] == "alive\n"
+    finally:
+        shell.teardown()
+
+
+def test_host_shell_reset() -> None:
+    shell = HostShell(environment={"NAME": "'John Doe'"})
+    shell.setup()
+    try:
+        cwd = shell.exec(cmd="pwd")["cwd"]
+        shell.exec(cmd="cd /tmp; export NAME=changed NEW=value; sleep 30 &")
+        shell.stream(cmd="sleep 30")
+
+        assert shell.reset()
+        output = shell.exec(cmd='echo "$NAME ${NEW:-unset}" && jobs')
+        assert output["stdout"] == "John Doe unset\n"
+        assert output["cwd"] == cwd
+    finally:
+        shell.teardown()
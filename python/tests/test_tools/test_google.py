@@ -0,0 +1,59 @@
+"""
+Test the Google AI toolset.
+"""
+
+from unittest import mock
+
+import pytest
+
+from composio import Action
+
+
+pytest.importorskip("composio_google")
+generative_models = pytest.importorskip("vertexai.generative_models")
+
+from composio_google import ComposioToolset  # noqa: E402
+
+
+def test_handle_response() -> None:
+    """Test the function calls are executed as a batch, in order."""
+    toolset = ComposioToolset(api_key="api-key")
+    response = generative_models.GenerationResponse.from_dict(
+        {
+            "candidates": [
+                {
+                    "content": {
+                        "role": "model",
+                        "parts": [
+                            {
+                                "function_call": {
+                                    "name": Action.FILETOOL_LIST_FILES.name,
+                                    "args": {},
+                                }
+                            },
+                            {
+                                "function_call": {
+                                    "name": Action.SHELLTOOL_EXEC_COMMAND.name,
+                                    "args": {"cmd": "ls", "env": {"A": ["B"]}},
+                                }
+                            },
+                        ],
+                    }
+                }
+            ]
+        }
+    )
+    with mock.patch.object(
+        toolset, "execute_actions", return_value=[{"successful": True}] * 2
+    ) as execute_actions:
+        outputs = toolset.handle_response(response=response)
+
+    assert outputs == [{"successful": True}] * 2
+    calls = execute_actions.call_args.kwargs["calls"]
+    assert [call["action"] for call in calls] == [
+        Action.FILETOOL_LIST_FILES,
+        Action.SHELLTOOL_EXEC_COMMAND,
+    ]
+    assert calls[0]["params"] == {}
+    assert calls[1]["params"] == {"cmd": "ls", "env": {"A": ["B"]}}
+    assert isinstance(calls[1]["params"]["env"], dict)
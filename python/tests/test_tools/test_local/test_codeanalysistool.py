@@ -1,5 +1,16 @@
 import json
+import os
+import subprocess
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
 
+import pytest
+
+from composio.tools.local.codeanalysis import index, tool_utils
 from composio.tools.local.codeanalysis.actions.create_codemap import (
     CreateCodeMap,
     CreateCodeMapRequest,
@@ -20,6 +31,7 @@ from composio.tools.local.codeanalysis.actions.get_relevant_code import (
     GetRelevantCode,
     GetRelevantCodeRequest,
 )
+from composio.tools.local.codeanalysis.constants import INDEX_FILE
 
 from tests.conftest import ROOT_DIR
 
@@ -135,3 +147,225 @@ class TestCodeAnalysisTool:
         )
         assert "How to update apps?" in str(response.result)
         assert "Chunk" in str(response.result)
+
+
+def test_code_index_changes(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.py").write_text("a = 1\n")
+    (repo / "b.py").write_text("b = 1\n")
+    files = [str(repo / "a.py"), str(repo / "b.py")]
+
+    code_index = index.CodeIndex(str(repo), str(tmp_path))
+    assert not code_index.exists
+    assert code_index.diff(files) == (["a.py", "b.py"], [], [])
+    code_index.set_chunks("a.py", [f"{repo / 'a.py'}:0:1"])
+    code_index.save()
+
+    code_index = index.CodeIndex(str(repo), str(tmp_path))
+    assert not code_index.diff(files)
+
+    (repo / "a.py").write_text("a = 2\n")
+    (repo / "b.py").unlink()
+    (repo / "c.py").write_text("c = 1\n")
+    files = [str(repo / "a.py"), str(repo / "c.py")]
+    changes = code_index.diff(files)
+    assert changes == (["c.py"], ["a.py"], ["b.py"])
+    assert code_index.chunks(changes.stale) == [f"{repo / 'a.py'}:0:1"]
+
+    # Touching a file without changing it is not a change
+    code_index.save()
+    os.utime(repo / "c.py", (0, 0))
+    assert not index.CodeIndex(str(repo), str(tmp_path)).diff(files)
+
+
+def test_cache_dir(tmp_path: Path) -> None:
+    first, second = tmp_path / "first" / "repo", tmp_path / "second" / "repo"
+    for repo in (first, second):
+        repo.mkdir(parents=True)
+        subprocess.run(["git", "init", "-q", str(repo)], check=True)
+
+    with mock.patch.object(index, "CODE_MAP_CACHE", str(tmp_path / "cache")):
+        # Repositories with the same name do not collide
+        assert index.cache_dir(str(first)) != index.cache_dir(str(second))
+
+        path = index.cache_dir(str(first))
+        Path(path, INDEX_FILE).write_text('{"files": {}}')
+        subprocess.run(
+            [
+                *("git", "-C", str(first), "-c", "user.name=test"),
+                *("-c", "user.email=test@example.com", "commit", "-q"),
+                *("--allow-empty", "-m", "commit"),
+            ],
+            check=True,
+        )
+
+        # Cache for a new commit is seeded with the previous index
+        assert index.cache_dir(str(first), create=False) == path
+        head = index.cache_dir(str(first))
+        assert head != path
+        assert Path(head, INDEX_FILE).read_text() == '{"files": {}}'
+
+
+def test_batch_by_size(tmp_path: Path) -> None:
+    sizes = {"a.py": 900, "b.py": 500, "c.py": 400, "d.py": 300, "e.py": 100}
+    for name, size in sizes.items():
+        (tmp_path / name).write_text("x" * size)
+
+    batches = tool_utils.batch_by_size(
+        [str(tmp_path / name) for name in sizes], num_batches=2
+    )
+    assert [[Path(path).name for path in batch] for batch in batches] == [
+        ["a.py", "d.py"],
+        ["b.py", "c.py", "e.py"],
+    ]
+    assert tool_utils.batch_by_size([str(tmp_path / "a.py")], num_batches=4) == [
+        [str(tmp_path / "a.py")]
+    ]
+
+
+def test_partial_fqdns_are_resumed(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for name in ("a.py", "b.py", "c.py"):
+        (repo / name).write_text(f"{name[0]} = 1\n")
+
+    create_codemap = CreateCodeMap()
+    create_codemap.REPO_DIR = str(repo)
+    create_codemap.index = index.CodeIndex(str(repo), str(tmp_path))
+    create_codemap.changes = create_codemap.index.diff(
+        [str(repo / name) for name in ("a.py", "b.py", "c.py")]
+    )
+
+    partial_file = tmp_path / "fqdn_cache.json.partial"
+    partial_file.write_text(
+        json.dumps(
+            {
+                "path": "a.py",
+                "hash": create_codemap.index.content_hash("a.py"),
+                "fqdns": [{"global_fqdn": "a"}],
+            }
+        )
+        + "\n"
+        + json.dumps({"path": "b.py", "hash": "outdated", "fqdns": []})
+        + "\n"
+        + '{"path": "c.py", "ha'
+    )
+    assert create_codemap._load_partial_fqdns(  # pylint: disable=protected-access
+        str(partial_file)
+    ) == {"a.py": [{"global_fqdn": "a"}]}
+
+
+class _Model:
+    """Embedding model stub, optionally blocks until `gate` is set."""
+
+    def __init__(
+        self,
+        gate: t.Optional[threading.Event] = None,
+        error: t.Optional[Exception] = None,
+    ) -> None:
+        self.gate = gate
+        self.error = error
+        self.calls: t.List[t.List[str]] = []
+        self.started = threading.Event()
+
+    def encode(self, texts: t.List[str], **_: t.Any) -> mock.Mock:
+        self.calls.append(list(texts))
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait(timeout=5.0)
+        if self.error is not None:
+            raise self.error
+        return mock.Mock(tolist=lambda: [[float(len(text))] for text in texts])
+
+
+def _wait_for_pending(encoder: t.Any, count: int) -> None:
+    deadline = time.monotonic() + 5.0
+    while len(encoder._pending) < count:  # pylint: disable=protected-access
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_query_encoder_coalesces_queries() -> None:
+    from composio.tools.local.codeanalysis import (  # pylint: disable=import-outside-toplevel
+        embedder,
+    )
+
+    model = _Model(gate=threading.Event())
+    encoder = embedder.QueryEncoder()
+    with mock.patch.object(
+        embedder, "get_model", return_value=model
+    ), ThreadPoolExecutor() as executor:
+        first = executor.submit(encoder.encode, "a")
+        assert model.started.wait(timeout=5.0)
+
+        # Queries submitted while a batch is encoded are encoded together
+        rest = [executor.submit(encoder.encode, query) for query in ("bb", "ccc")]
+        _wait_for_pending(encoder, count=2)
+        model.gate.set()
+
+        assert first.result() == [1.0]
+        assert [future.result() for future in rest] == [[2.0], [3.0]]
+    assert model.calls == [["a"], ["bb", "ccc"]]
+
+
+def test_query_encoder_cache() -> None:
+    from composio.tools.local.codeanalysis import (  # pylint: disable=import-outside-toplevel
+        embedder,
+    )
+
+    model = _Model()
+    encoder = embedder.QueryEncoder(cache_size=2)
+    with mock.patch.object(embedder, "get_model", return_value=model):
+        for query in ("a", "bb", "a", "ccc", "a", "bb"):
+            assert encoder.encode(query) == [float(len(query))]
+
+    # `a` is a hit both times, `bb` is evicted as the least recently used
+    assert model.calls == [["a"], ["bb"], ["ccc"], ["bb"]]
+
+
+def test_query_encoder_error() -> None:
+    from composio.tools.local.codeanalysis import (  # pylint: disable=import-outside-toplevel
+        embedder,
+    )
+
+    model = _Model(gate=threading.Event(), error=ValueError("model error"))
+    encoder = embedder.QueryEncoder()
+    with mock.patch.object(
+        embedder, "get_model", return_value=model
+    ), ThreadPoolExecutor() as executor:
+        futures = [executor.submit(encoder.encode, "a")]
+        assert model.started.wait(timeout=5.0)
+        futures += [executor.submit(encoder.encode, query) for query in ("bb", "ccc")]
+        _wait_for_pending(encoder, count=2)
+        model.gate.set()
+
+        for future in futures:
+            with pytest.raises(RuntimeError, match="model error"):
+                future.result()
+
+        # Failed queries are not cached and are encoded again
+        with pytest.raises(RuntimeError, match="model error"):
+            encoder.encode("a")
+    assert model.calls == [["a"], ["bb", "ccc"], ["a"]]
+
+
+def test_get_vector_store_is_reused(tmp_path: Path) -> None:
+    from composio.tools.local.codeanalysis import (  # pylint: disable=import-outside-toplevel
+        embedder,
+    )
+
+    with mock.patch.object(embedder, "_vector_stores", {}), mock.patch.object(
+        embedder.index, "cache_dir", return_value=str(tmp_path)
+    ), mock.patch.object(
+        embedder, "DeepLakeVectorStore", side_effect=lambda **_: mock.Mock()
+    ) as vector_store:
+        first = embedder.get_vector_store("repo")
+        assert embedder.get_vector_store("repo") is first
+        assert vector_store.call_count == 1
+
+        second = embedder.get_vector_store("repo", overwrite=True)
+        assert second is not first
+        assert embedder.get_vector_store("repo") is second
+        assert vector_store.call_count == 2
+        assert vector_store.call_args.kwargs["overwrite"] is True
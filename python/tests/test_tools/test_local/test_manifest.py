@@ -0,0 +1,106 @@
+"""Test local tools manifest."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from composio.tools.base.abs import action_registry, tool_registry
+from composio.tools.local import load_local_tools, manifest
+
+
+def test_manifest_matches_registry() -> None:
+    """Test the manifest indexes all of the tools in the tools tree."""
+    index = manifest.get_manifest()
+    load_local_tools()
+    for enum, tool in tool_registry["local"].items():
+        if type(tool).__module__ not in index["modules"]:
+            continue
+
+        assert index["tools"][enum]["name"] == tool.name
+        assert index["tools"][enum]["actions"] == sorted(
+            action.enum for action in tool.actions()
+        )
+        for action in tool.actions():
+            assert index["actions"][action.enum]["app"] == enum
+            assert index["actions"][action.enum]["tags"] == action.tags()
+
+
+def test_stale_manifest_is_rebuilt(tmp_path: Path) -> None:
+    """Test the manifest is rebuilt if the tools tree changes."""
+    path = tmp_path / "manifest.json"
+    cache = tmp_path / "cache.json"
+    path.write_text(json.dumps({"modules": [], "tools": {}}))
+    with mock.patch.object(manifest, "_manifest", None), mock.patch.object(
+        manifest, "MANIFEST_PATH", path
+    ), mock.patch.object(manifest, "MANIFEST_CACHE_PATH", cache):
+        index = manifest.get_manifest()
+        assert "composio.tools.local.filetool.tool" in index["modules"]
+        assert json.loads(cache.read_text()) == index
+
+    # The shipped manifest is never rewritten at runtime
+    assert json.loads(path.read_text()) == {"modules": [], "tools": {}}
+
+    # Valid manifest is read without importing the tool modules
+    with mock.patch.object(manifest, "_manifest", None), mock.patch.object(
+        manifest, "MANIFEST_PATH", path
+    ), mock.patch.object(manifest, "MANIFEST_CACHE_PATH", cache), mock.patch.object(
+        manifest, "build_manifest"
+    ) as build:
+        assert manifest.get_manifest() == index
+        build.assert_not_called()
+
+    # Manifest older than the tool modules is rebuilt
+    os.utime(cache, (0, 0))
+    with mock.patch.object(manifest, "_manifest", None), mock.patch.object(
+        manifest, "MANIFEST_PATH", path
+    ), mock.patch.object(manifest, "MANIFEST_CACHE_PATH", cache), mock.patch.object(
+        manifest, "build_manifest", return_value=index
+    ) as build:
+        manifest.get_manifest()
+        build.assert_called_once()
+
+
+def test_lazy_lookup() -> None:
+    """Test looking up a local tool imports only the module defining it."""
+    script = (
+        "import sys\n"
+        "from composio.tools.base.abs import tool_registry\n"
+        "from composio.tools.local import get_manifest\n"
+        "get_manifest()\n"
+        "tool_registry['local']['MATHEMATICAL']\n"
+        "print([m for m in sys.modules if m.startswith('composio.tools.local.')"
+        " and m.endswith('.tool')])\n"
+    )
+    output = subprocess.check_output([sys.executable, "-c", script], text=True)
+    assert "['composio.tools.local.mathematical.tool']" in output
+
+    with pytest.raises(KeyError):
+        action_registry["local"]["MATHEMATICAL_SOME_MISSING_ACTION"]
+
+
+def test_missing_dependencies_from_manifest() -> None:
+    """Test the dependencies are checked without importing the tool modules."""
+    script = (
+        "import sys\n"
+        "from unittest import mock\n"
+        "from composio.tools.env.host.workspace import HostWorkspace\n"
+        "with mock.patch(\n"
+        "    'composio.utils.pypi.check_if_package_is_intalled', return_value=True\n"
+        ") as check:\n"
+        "    HostWorkspace.check_for_missing_dependencies(\n"
+        "        mock.MagicMock(),\n"
+        "        apps=['BROWSER_TOOL'],\n"
+        "        actions=['ANTHROPIC_COMPUTER'],\n"
+        "        tags=['bash'],\n"
+        "    )\n"
+        "print(sorted({call.args[0] for call in check.call_args_list}))\n"
+        "print([m for m in sys.modules if m.startswith('composio.tools.local.')"
+        " and m.endswith('.tool')])\n"
+    )
+    output = subprocess.check_output([sys.executable, "-c", script], text=True)
+    assert "['playwright', 'pyautogui']\n[]" in output
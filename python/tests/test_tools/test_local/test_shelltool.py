@@ -14,6 +14,10 @@ from composio.tools.local.shelltool.shell_exec.actions.new import (
     CreateShell,
     ShellCreateRequest,
 )
+from composio.tools.local.shelltool.shell_exec.actions.output import (
+    GetCommandOutput,
+    GetCommandOutputRequest,
+)
 from composio.tools.local.shelltool.shell_exec.actions.spawn import (
     SpawnProcess,
     SpawnRequest,
@@ -65,6 +69,29 @@ class TestShelltool:
         assert "No such file or directory" in response.stderr
         assert response.exit_code != 0
 
+    def test_exec_command_stream(self, shell_factory):
+        exec_action = ExecCommand()
+        exec_action._shells = lambda: shell_factory
+        response = exec_action.execute(
+            ShellExecRequest(
+                cmd="echo start && sleep 1 && echo done", stream=True, wait_time=0.2
+            ),
+            {},
+        )
+        assert response.running
+        assert response.exit_code == -1
+        assert response.command_id != ""
+
+        output_action = GetCommandOutput()
+        output_action._shells = lambda: shell_factory
+        output = output_action.execute(
+            GetCommandOutputRequest(command_id=response.command_id, operation="wait"),
+            {},
+        )
+        assert not output.running
+        assert output.exit_code == 0
+        assert (response.stdout + output.stdout) == "start\ndone\n"
+
     def test_exec_command_with_environment_variable(self, shell_factory):
         exec_action = ExecCommand()
         exec_action._shells = lambda: shell_factory
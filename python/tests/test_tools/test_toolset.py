@@ -9,9 +9,12 @@ from unittest import mock
 import pytest
 
 from composio import Action, App
+from composio.client.enums.index import SearchIndex
 from composio.exceptions import ApiKeyNotProvidedError, ComposioSDKError
 from composio.tools.base.abs import action_registry, tool_registry
 from composio.tools.base.runtime import action as custom_action
+from composio.tools.env.constants import STDOUT
+from composio.tools.env.factory import WorkspaceType
 from composio.tools.toolset import ComposioToolSet
 from composio.utils.pypi import reset_installed_list
 
@@ -47,6 +50,43 @@ def test_find_actions_by_tags() -> None:
         assert action.app in ("github", "slack", "slackbot")
 
 
+def test_find_actions_by_use_case() -> None:
+    """Test `ComposioToolSet.find_actions_by_use_case` search modes."""
+    toolset = ComposioToolSet()
+    index = SearchIndex.build(
+        documents={
+            "GITHUB_STAR_A_REPOSITORY_FOR_THE_AUTHENTICATED_USER": "Star a repo",
+            "GITHUB_LIST_REPOSITORIES_STARRED_BY_THE_AUTHENTICATED_USER": "List "
+            "repositories starred by the user",
+        }
+    )
+    remote = mock.MagicMock()
+    remote.name = "GITHUB_LIST_REPOSITORIES_STARRED_BY_THE_AUTHENTICATED_USER"
+    with mock.patch(
+        "composio.tools.toolset.get_search_index", return_value=index
+    ), mock.patch.object(toolset.client.actions, "get", return_value=[remote]) as get:
+        assert toolset.find_actions_by_use_case(
+            App.GITHUB, use_case="star repo", search="local"
+        ) == [
+            Action.GITHUB_STAR_A_REPOSITORY_FOR_THE_AUTHENTICATED_USER,
+            Action.GITHUB_LIST_REPOSITORIES_STARRED_BY_THE_AUTHENTICATED_USER,
+        ]
+        get.assert_not_called()
+
+        # The API is used by default
+        assert toolset.find_actions_by_use_case(App.GITHUB, use_case="star repo") == [
+            Action.GITHUB_LIST_REPOSITORIES_STARRED_BY_THE_AUTHENTICATED_USER
+        ]
+        assert toolset.find_actions_by_use_case(
+            App.GITHUB, use_case="star repo", search="blend", limit=1
+        ) == [Action.GITHUB_LIST_REPOSITORIES_STARRED_BY_THE_AUTHENTICATED_USER]
+
+        # No matches in the local index
+        assert toolset.find_actions_by_use_case(
+            App.SLACK, use_case="star repo", search="local"
+        ) == [Action.GITHUB_LIST_REPOSITORIES_STARRED_BY_THE_AUTHENTICATED_USER]
+
+
 def test_uninitialize_app() -> None:
     """Test if the usage of an app without connected account raises error or not."""
     with pytest.raises(
@@ -301,3 +341,57 @@ def test_execute_action() -> None:
     toolset = ComposioToolSet()
     response = toolset.execute_action(Action.HACKERNEWS_GET_FRONTPAGE, {})
     assert response["successfull"]
+
+
+def test_execute_actions() -> None:
+    """Test executing a batch of actions concurrently."""
+    toolset = ComposioToolSet()
+    executed = []
+
+    def _execute_action(action: Action, params: dict, **_) -> dict:
+        executed.append(action)
+        if params.get("fail"):
+            raise ComposioSDKError("Failed")
+        return {"data": params, "error": None, "successful": True}
+
+    with mock.patch.object(toolset, "execute_action", side_effect=_execute_action):
+        outputs = toolset.execute_actions(
+            calls=[
+                {"action": Action.FILETOOL_LIST_FILES, "params": {}},
+                {"action": Action.SHELLTOOL_EXEC_COMMAND, "params": {"cmd": "ls"}},
+                {"action": Action.FILETOOL_LIST_FILES, "params": {}},
+                {"action": Action.SHELLTOOL_EXEC_COMMAND, "params": {"fail": True}},
+                {"action": Action.SHELLTOOL_EXEC_COMMAND, "params": {"cmd": "ls"}},
+            ],
+            max_concurrency=4,
+        )
+
+    assert [output["successful"] for output in outputs] == [
+        True,
+        True,
+        True,
+        False,
+        True,
+    ]
+    assert outputs[1]["data"] == {"cmd": "ls"}
+    assert outputs[3]["error"] == "Failed"
+    assert executed.count(Action.FILETOOL_LIST_FILES) == 2
+    assert executed.count(Action.SHELLTOOL_EXEC_COMMAND) == 3
+
+
+def test_execute_actions_on_shell() -> None:
+    """Test executing a batch of shell actions on the same workspace."""
+    toolset = ComposioToolSet(api_key="api-key", workspace_config=WorkspaceType.Host())
+    with mock.patch.object(
+        toolset, "_try_get_github_access_token_for_current_entity", return_value=None
+    ):
+        outputs = toolset.execute_actions(
+            calls=[
+                {
+                    "action": Action.SHELLTOOL_EXEC_COMMAND,
+                    "params": {"cmd": f"sleep 0.1; echo {i}"},
+                }
+                for i in range(3)
+            ],
+        )
+    assert [output["data"][STDOUT].strip() for output in outputs] == ["0", "1", "2"]
@@ -1,9 +1,12 @@
+import gzip
+import json
 from logging import Logger
 from unittest import mock
 
 import pytest
 
 from composio import ComposioToolSet
+from composio.utils.logging import LogIngester
 
 
 @pytest.mark.parametrize(
@@ -22,3 +25,137 @@ def test_log_verbosity(verbosity: int, size: int):
     toolset = ComposioToolSet(verbosity_level=verbosity)
     with mock.patch.object(Logger, "info", new=_assert):
         toolset.logger.info("-" * 2048)
+
+
+def _ingester(**kwargs) -> LogIngester:
+    with mock.patch("composio.Composio.get_latest"):
+        return LogIngester(**kwargs)
+
+
+def _log(ingester: LogIngester, index: int, is_error: bool = False) -> None:
+    ingester.log(
+        connection_id=None,
+        provider_name="github",
+        action_name=f"ACTION_{index}",
+        request={},
+        response={},
+        is_error=is_error,
+        session_id=None,
+    )
+
+
+def test_log_ingester_batches():
+    """Test records are shipped in the background and flushed."""
+    ingester = _ingester(batch_size=3, flush_interval=0.05)
+    with mock.patch.object(ingester, "_push", return_value=True) as push:
+        for index in range(5):
+            _log(ingester, index)
+        assert ingester.flush(timeout=5.0)
+
+    records = [call.kwargs["payload"] for call in push.call_args_list]
+    assert [record["actionName"] for record in records] == [
+        f"ACTION_{index}" for index in range(5)
+    ]
+    assert ingester.stats["sent"] == 5
+
+
+def test_log_ingester_batch_requests():
+    """Test each batch is shipped in one request when enabled."""
+    ingester = _ingester(batch_size=3, flush_interval=0.05, batch_requests=True)
+    with mock.patch.object(ingester, "_push", return_value=True) as push:
+        for index in range(5):
+            _log(ingester, index)
+        assert ingester.flush(timeout=5.0)
+
+    batches = [call.kwargs["payload"] for call in push.call_args_list]
+    assert [len(batch) for batch in batches] == [3, 2]
+    assert [record["actionName"] for batch in batches for record in batch] == [
+        f"ACTION_{index}" for index in range(5)
+    ]
+    assert ingester.stats["sent"] == 5
+
+
+def test_log_ingester_server_error():
+    """Test records rejected by the server are counted as failed."""
+    ingester = _ingester(batch_size=3, flush_interval=0.05)
+    ingester._client.logs.endpoint = "/v1/logs"
+    with mock.patch.object(ingester, "_session") as session:
+        session.return_value.post.side_effect = [
+            mock.Mock(status_code=200),
+            mock.Mock(status_code=500),
+            mock.Mock(status_code=201),
+        ]
+        for index in range(3):
+            _log(ingester, index)
+        assert ingester.flush(timeout=5.0)
+
+    assert ingester.stats["sent"] == 2
+    assert ingester.stats["failed"] == 1
+
+
+def test_log_ingester_overflow():
+    """Test the drop policies for a full queue."""
+    with mock.patch.object(LogIngester, "_wait"):
+        ingester = _ingester(max_queue_size=2, overflow="drop_oldest")
+        for index in range(3):
+            _log(ingester, index)
+        assert [r["actionName"] for r in ingester._queue.queue] == [
+            "ACTION_1",
+            "ACTION_2",
+        ]
+
+        ingester = _ingester(max_queue_size=2, overflow="drop_newest")
+        for index in range(3):
+            _log(ingester, index)
+        assert [r["actionName"] for r in ingester._queue.queue] == [
+            "ACTION_0",
+            "ACTION_1",
+        ]
+        assert ingester.stats["dropped"] == 1
+
+
+def test_log_ingester_sampling_and_truncation():
+    """Test successful executions are sampled and large payloads truncated."""
+    with mock.patch.object(LogIngester, "_wait"):
+        ingester = _ingester(sample_rate=0.0, max_payload_size=32)
+        _log(ingester, 0)
+        _log(ingester, 1, is_error=True)
+        ingester.log(
+            connection_id=None,
+            provider_name="github",
+            action_name="ACTION_2",
+            request={"data": "-" * 64},
+            response={},
+            is_error=True,
+            session_id=None,
+        )
+
+    first, second = ingester._queue.queue
+    assert first["actionName"] == "ACTION_1"
+    assert second["request"]["truncated"] is True
+    assert len(second["request"]["preview"]) == 32
+
+
+def test_log_ingester_compression():
+    """Test records are gzipped when compression is enabled."""
+    with mock.patch.object(LogIngester, "_wait"):
+        ingester = _ingester(compress=True)
+    ingester._client.logs.endpoint = "/v1/logs"
+    with mock.patch.object(ingester, "_session") as session:
+        session.return_value.post.return_value.status_code = 200
+        assert ingester._push(payload={"actionName": "ACTION"})
+
+    kwargs = session.return_value.post.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(kwargs["data"])) == {"actionName": "ACTION"}
+
+
+def test_log_ingester_invalid_sample_rate(monkeypatch: pytest.MonkeyPatch):
+    """Test a malformed sample rate in the environment ships all logs."""
+    monkeypatch.setenv("COMPOSIO_LOGS_SAMPLE_RATE", "half")
+    with mock.patch.object(LogIngester, "_wait"):
+        assert _ingester().sample_rate == 1.0
+
+    monkeypatch.setenv("COMPOSIO_LOGS_SAMPLE_RATE", "0.25")
+    with mock.patch.object(LogIngester, "_wait"):
+        assert _ingester().sample_rate == 0.25